@@ -1,10 +1,12 @@
 import logging
 
+import numpy as np
 import scipy.sparse as sp
 
 from pySDC.core.Errors import UnlockError
 from pySDC.helpers.pysdc_helper import FrozenClass
 from pySDC.core.Lagrange import LagrangeApproximation
+from pySDC.core.Level import StackedNodes
 
 
 # short helper class to add params as attributes
@@ -21,13 +23,23 @@ class base_transfer(object):
     """
     Standard base_transfer class
 
+    If both levels store the values at the nodes contiguously (level parameter `stacked_nodes`), the transfer acts on
+    all nodes at once: the interpolation in collocation is a single matrix product and the spatial transfer is called
+    once for the stacked nodes. The fine part of the FAS correction is then computed with the precomputed product of
+    the restriction in collocation and the fine quadrature matrix.
+
     Attributes:
         logger: custom logger for sweeper-related logging
         params(__Pars): parameter object containing the custom parameters passed by the user
         fine (pySDC.Level.level): reference to the fine level
         coarse (pySDC.Level.level): reference to the coarse level
+        Pcoll (numpy.ndarray): prolongation matrix in collocation
+        Rcoll (numpy.ndarray): restriction matrix in collocation
+        RcollQ (numpy.ndarray): restriction in collocation of the fine quadrature, i.e. Rcoll times fine Qmat
     """
 
+    _transfer_matrices = {}  # interpolation matrices shared between instances with the same nodes
+
     def __init__(self, fine_level, coarse_level, base_transfer_params, space_transfer_class, space_transfer_params):
         """
         Initialization routine
@@ -59,6 +71,8 @@ class base_transfer(object):
             self.Pcoll = self.get_transfer_matrix_Q(fine_grid, coarse_grid)
             self.Rcoll = self.get_transfer_matrix_Q(coarse_grid, fine_grid)
 
+        self.RcollQ = self.Rcoll @ self.fine.sweep.coll.Qmat[1:, 1:]
+
         # set up spatial transfer
         self.space_transfer = space_transfer_class(
             fine_prob=self.fine.prob, coarse_prob=self.coarse.prob, params=space_transfer_params
@@ -69,6 +83,9 @@ class base_transfer(object):
         """
         Helper routine to quickly define transfer matrices from a coarse set
         to a fine set of nodes (fully Lagrangian)
+
+        The matrices are memoized and shared between all transfer objects with the same nodes, so they are read-only.
+
         Args:
             f_nodes: fine nodes (size nF)
             c_nodes: coarse nodes (size nC)
@@ -76,8 +93,26 @@ class base_transfer(object):
         Returns:
             matrix containing the interpolation weights (shape (nF, nC))
         """
-        approx = LagrangeApproximation(c_nodes)
-        return approx.getInterpolationMatrix(f_nodes)
+        key = (tuple(f_nodes), tuple(c_nodes))
+        if key not in base_transfer._transfer_matrices.keys():
+            approx = LagrangeApproximation(c_nodes)
+            matrix = approx.getInterpolationMatrix(f_nodes)
+            matrix.flags.writeable = False
+            base_transfer._transfer_matrices[key] = matrix
+        return base_transfer._transfer_matrices[key]
+
+    @staticmethod
+    def _is_stacked(nodes):
+        """
+        Check if values at the nodes are stored contiguously
+
+        Args:
+            nodes (list): values at the nodes
+
+        Returns:
+            bool: True if the values are stored in a contiguous array
+        """
+        return isinstance(nodes, StackedNodes) and nodes.stacked
 
     def restrict(self):
         """
@@ -102,6 +137,10 @@ class base_transfer(object):
         if not F.status.unlocked:
             raise UnlockError('fine level is still locked, cannot use data from there')
 
+        if SF.stacked_integrand is not None and isinstance(G.u, StackedNodes) and isinstance(G.f, StackedNodes):
+            self.restrict_stacked()
+            return None
+
         # restrict fine values in space
         tmp_u = []
         for m in range(1, SF.coll.num_nodes + 1):
@@ -164,6 +203,62 @@ class base_transfer(object):
 
         return None
 
+    def restrict_stacked(self):
+        """
+        Space-time restriction routine for contiguously stored values at the nodes
+
+        Same as `restrict`, but the values are first restricted in collocation with a single matrix product, such that
+        only the coarse nodes need to be restricted in space, which is done with a single call to the spatial transfer.
+        The fine integral is not computed on the fine nodes, but directly restricted using the precomputed product of
+        the restriction in collocation and the fine quadrature matrix.
+        """
+
+        # get data for easier access
+        F = self.fine
+        G = self.coarse
+
+        PG = G.prob
+
+        SF = F.sweep
+        SG = G.sweep
+
+        # restrict fine values in collocation and then in space
+        G.u[0] = self.space_transfer.restrict(F.u[0])
+        uFG = np.tensordot(self.Rcoll, F.u.data[1:], axes=1)
+        G.u[1:] = list(self.space_transfer.restrict_stacked(F.u.typed(uFG)))
+
+        # re-evaluate f on coarse level
+        G.f[0] = PG.eval_f(G.u[0], G.time)
+        for m in range(1, SG.coll.num_nodes + 1):
+            G.f[m] = PG.eval_f(G.u[m], G.time + G.dt * SG.coll.nodes[m - 1])
+
+        # build fine level tau correction part, restricted in collocation with the fused matrix, then in space
+        tauFG = np.tensordot(F.dt * self.RcollQ, SF.stacked_integrand, axes=1)
+        tau = self.space_transfer.restrict_stacked(F.u.typed(tauFG))
+
+        # subtract coarse level tau correction part
+        if SG.stacked_integrand is not None:
+            tau = tau - np.tensordot(G.dt * SG.coll.Qmat[1:, 1:], SG.stacked_integrand, axes=1)
+        else:
+            tau = tau - np.stack([np.asarray(me) for me in SG.integrate()])
+
+        if F.tau[0] is not None:
+            # restrict possible tau correction from fine in collocation and space
+            tau_F = np.tensordot(self.Rcoll, np.stack([np.asarray(me) for me in F.tau]), axes=1)
+            tau += self.space_transfer.restrict_stacked(F.u.typed(tau_F))
+
+        G.tau[:] = G.u.wrap(tau)
+
+        # save u and rhs evaluations for interpolation
+        for m in range(1, SG.coll.num_nodes + 1):
+            G.uold[m] = PG.dtype_u(G.u[m])
+            G.fold[m] = PG.dtype_f(G.f[m])
+
+        # works as a predictor
+        G.status.unlocked = True
+
+        return None
+
     def prolong(self):
         """
         Space-time prolongation routine
@@ -186,16 +281,21 @@ class base_transfer(object):
             raise UnlockError('coarse level is still locked, cannot use data from there')
 
         # build coarse correction
+        if self._is_stacked(F.u) and self._is_stacked(G.u):
+            # interpolate values in space first and then in collocation for all nodes at once
+            dG = np.stack([np.asarray(me) for me in G.uold[1:]])
+            dG = self.space_transfer.prolong_stacked(G.u.typed(G.u.data[1:] - dG))
+            F.u.data[1:] += np.tensordot(self.Pcoll, dG, axes=1)
+        else:
+            # interpolate values in space first
+            tmp_u = []
+            for m in range(1, SG.coll.num_nodes + 1):
+                tmp_u.append(self.space_transfer.prolong(G.u[m] - G.uold[m]))
 
-        # interpolate values in space first
-        tmp_u = []
-        for m in range(1, SG.coll.num_nodes + 1):
-            tmp_u.append(self.space_transfer.prolong(G.u[m] - G.uold[m]))
-
-        # interpolate values in collocation
-        for n in range(1, SF.coll.num_nodes + 1):
-            for m in range(SG.coll.num_nodes):
-                F.u[n] += self.Pcoll[n - 1, m] * tmp_u[m]
+            # interpolate values in collocation
+            for n in range(1, SF.coll.num_nodes + 1):
+                for m in range(SG.coll.num_nodes):
+                    F.u[n] += self.Pcoll[n - 1, m] * tmp_u[m]
 
         # re-evaluate f on fine level
         for m in range(1, SF.coll.num_nodes + 1):
@@ -222,6 +322,17 @@ class base_transfer(object):
         if not G.status.unlocked:
             raise UnlockError('coarse level is still locked, cannot use data from there')
 
+        # the values at the fine nodes are modified in-place, so a stored quadrature of them is not valid anymore
+        SF.reset_quadrature()
+
+        if all(self._is_stacked(me) for me in [F.u, F.f, G.u, G.f]):
+            # interpolate values in space first and then in collocation for all nodes at once
+            for fine, coarse, old in [(F.u, G.u, G.uold), (F.f, G.f, G.fold)]:
+                dG = np.stack([np.asarray(me) for me in old[1:]])
+                dG = self.space_transfer.prolong_stacked(coarse.typed(coarse.data[1:] - dG))
+                fine.data[1:] += np.tensordot(self.Pcoll, dG, axes=1)
+            return None
+
         # build coarse correction
 
         # interpolate values in space first
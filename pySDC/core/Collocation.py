@@ -61,8 +61,13 @@ class CollBase(object):
         delta_m (numpy.ndarray): array of distances between nodes
         right_is_node (bool): flag to indicate whether right point is collocation node
         left_is_node (bool): flag to indicate whether left point is collocation node
+
+    The arrays are computed only once for identical parameters and shared between all collocation objects, e.g. of
+    different steps in the same run. They are read-only, so make a copy if you want to modify them.
     """
 
+    _registry = {}  # arrays shared between instances with identical parameters
+
     def __init__(self, num_nodes=None, tleft=0, tright=1, node_type='LEGENDRE', quad_type=None, **kwargs):
         """
         Initialization routine for a collocation object
@@ -103,12 +108,71 @@ class CollBase(object):
         self.left_is_node = self.quad_type in ['LOBATTO', 'RADAU-LEFT']
         self.right_is_node = self.quad_type in ['LOBATTO', 'RADAU-RIGHT']
 
+        # arrays are shared only for this class, since derived classes may compute them differently
+        self._registry_key = (num_nodes, tleft, tright, node_type, quad_type) if type(self) is CollBase else None
+        try:
+            hash(self._registry_key)
+        except TypeError:
+            self._registry_key = None
+        self._set_arrays()
+
+    def _set_arrays(self):
+        """
+        Set nodes, weights and integration matrices, either from the registry or by computing them
+        """
+        key = self._registry_key
+        if key is not None and key in self._registry.keys():
+            self.nodes, self.weights, self.Qmat, self.Smat, self.delta_m = self._registry[key]
+            return
+
         self.nodes = self._getNodes
-        self.weights = self._getWeights(tleft, tright)
+        self.weights = self._getWeights(self.tleft, self.tright)
         self.Qmat = self._gen_Qmatrix
         self.Smat = self._gen_Smatrix
         self.delta_m = self._gen_deltas
 
+        if key is not None:
+            arrays = (self.nodes, self.weights, self.Qmat, self.Smat, self.delta_m)
+            for me in arrays:
+                me.flags.writeable = False
+            self._registry[key] = arrays
+
+    def __getstate__(self):
+        """
+        Leave out shared arrays when pickling, which keeps them shared when copying, e.g. the steps in the controller
+        """
+        state = self.__dict__.copy()
+        if self._registry_key is not None:
+            for name in ['nodes', 'weights', 'Qmat', 'Smat', 'delta_m']:
+                state.pop(name)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if self._registry_key is not None:
+            self._set_arrays()
+
+    @property
+    def Qmat_eig(self):
+        """
+        Eigendecomposition Q = V diag(D) V^-1 of the collocation matrix without the row and column of the initial
+        conditions. It is computed only once and shared like the other arrays for identical parameters.
+
+        Returns:
+            numpy.ndarray: eigenvalues D
+            numpy.ndarray: matrix V with the eigenvectors as columns
+            numpy.ndarray: inverse V^-1 of the matrix of eigenvectors
+        """
+        if self._registry_key is None:
+            if getattr(self, '_Qmat_eig', None) is None:
+                self._Qmat_eig = self._gen_Qmat_eig
+            return self._Qmat_eig
+
+        key = ('eig', *self._registry_key)
+        if key not in self._registry.keys():
+            self._registry[key] = self._gen_Qmat_eig
+        return self._registry[key]
+
     @staticmethod
     def evaluate(weights, data):
         """
@@ -220,6 +284,20 @@ class CollBase(object):
 
         return S
 
+    @property
+    def _gen_Qmat_eig(self):
+        """
+        Compute the eigendecomposition of the collocation matrix
+
+        Returns:
+            tuple: eigenvalues, eigenvectors and inverse of the eigenvectors
+        """
+        D, V = np.linalg.eig(self.Qmat[1:, 1:])
+        eig = (D, V, np.linalg.inv(V))
+        for me in eig:
+            me.flags.writeable = False
+        return eig
+
     @property
     def _gen_deltas(self):
         """
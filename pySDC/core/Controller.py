@@ -5,6 +5,7 @@ import numpy as np
 
 from pySDC.core.BaseTransfer import base_transfer
 from pySDC.helpers.pysdc_helper import FrozenClass
+from pySDC.helpers.stats_helper import IndexedStats
 from pySDC.implementations.convergence_controller_classes.check_convergence import CheckConvergence
 from pySDC.implementations.hooks.default_hook import DefaultHooks
 
@@ -334,9 +335,9 @@ class controller(object):
         Return the merged stats from all hooks
 
         Returns:
-            dict: Merged stats from all hooks
+            IndexedStats: Merged stats from all hooks
         """
-        stats = {}
+        stats = IndexedStats()
         for hook in self.hooks:
-            stats = {**stats, **hook.return_stats()}
+            stats.update(hook.return_stats())
         return stats
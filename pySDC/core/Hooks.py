@@ -1,6 +1,8 @@
 import logging
 from collections import namedtuple
 
+from pySDC.helpers.stats_helper import IndexedStats
+
 
 # metadata with defaults
 meta_data = {
@@ -28,7 +30,7 @@ class hooks(object):
     Attributes:
         logger: logger instance for output
         __num_restarts (int): number of restarts of the current step
-        __stats (dict): dictionary for gathering the statistics of a run
+        __stats (IndexedStats): dictionary for gathering the statistics of a run
         entry (namedtuple): statistics entry containing all information to identify the value
     """
 
@@ -44,7 +46,7 @@ class hooks(object):
         self.logger = logging.getLogger('hooks')
 
         # create statistics and entry elements
-        self.__stats = {}
+        self.__stats = IndexedStats()
 
     def add_to_stats(self, value, **kwargs):
         """
@@ -90,7 +92,7 @@ class hooks(object):
         Getter for the stats
 
         Returns:
-            dict: stats
+            IndexedStats: stats
         """
         return self.__stats
 
@@ -98,7 +100,7 @@ class hooks(object):
         """
         Function to reset the stats for multiple runs
         """
-        self.__stats = {}
+        self.__stats = IndexedStats()
 
     def pre_setup(self, step, level_number):
         """
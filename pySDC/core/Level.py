@@ -1,3 +1,5 @@
+import numpy as np
+
 from pySDC.helpers.pysdc_helper import FrozenClass
 
 
@@ -9,6 +11,7 @@ class _Pars(FrozenClass):
         self.restol = -1.0
         self.nsweeps = 1
         self.residual_type = 'full_abs'
+        self.stacked_nodes = False
         for k, v in params.items():
             setattr(self, k, v)
         # freeze class, no further attributes allowed from this point
@@ -17,6 +20,127 @@ class _Pars(FrozenClass):
         self.dt_initial = self.dt * 1.0 if self.dt is not None else None
 
 
+class StackedNodes(list):
+    """
+    List of values at the nodes which are stored as views into one contiguous array of shape `(num_nodes, *shape)`.
+
+    The contiguous array is allocated when the first array-like value is assigned, using its shape, dtype and type.
+    Afterwards, assigning a value to a node copies the data into the array instead of rebinding the list entry, such
+    that the values at all nodes can be processed at once, e.g. by `numpy.tensordot`. Reading a single node returns a
+    view with the same type as the assigned values, while reading a slice returns copies. This mirrors the semantics of
+    a plain list, where assigning to a node rebinds the entry and leaves previously read values untouched.
+
+    If the assigned values are not numpy arrays, the container behaves like a plain list.
+
+    Attributes:
+        data (numpy.ndarray): Contiguous array holding the values at all nodes or None if not allocated yet
+    """
+
+    def __init__(self, num_nodes):
+        """
+        Initialization routine
+
+        Args:
+            num_nodes (int): Number of entries in the list
+        """
+        super().__init__([None] * num_nodes)
+        self.data = None
+        self._views = None
+
+    @property
+    def stacked(self):
+        """
+        Returns:
+            bool: Whether the values are stored in one contiguous array
+        """
+        return self.data is not None
+
+    def typed(self, array):
+        """
+        Get a view of an array of stacked values with the same type and attributes as the values stored here, such that
+        rows of the view behave like the values at single nodes.
+
+        Args:
+            array (numpy.ndarray): Array with the stacked values along the first axis
+
+        Returns:
+            numpy.ndarray: View of the array
+        """
+        like = self._views[0]
+        view = array.view(type(like))
+        view.__dict__.update(like.__dict__)
+        return view
+
+    def wrap(self, array):
+        """
+        Get views into rows of an array with the same type and attributes as the values stored here.
+
+        Args:
+            array (numpy.ndarray): Array with the stacked values along the first axis
+
+        Returns:
+            list: Views of the rows of the array
+        """
+        like = self._views[0]
+        views = []
+        for row in array:
+            view = row.view(type(like))
+            view.__dict__.update(like.__dict__)
+            views.append(view)
+        return views
+
+    def _allocate(self, value, dtype):
+        """
+        Allocate the contiguous array, keeping values that have been stored before.
+
+        Args:
+            value (numpy.ndarray): Value to take shape, type and attributes from
+            dtype (numpy.dtype): Data type of the array
+        """
+        data = np.zeros((len(self), *value.shape), dtype=dtype)
+        if self.data is not None:
+            data[:] = self.data
+        self.data = data
+
+        like = value if self._views is None else self._views[0]
+        self._views = []
+        for row in self.data:
+            view = row.view(type(like))
+            view.__dict__.update(like.__dict__)
+            self._views.append(view)
+
+        for i in range(len(self)):
+            if list.__getitem__(self, i) is not None:
+                list.__setitem__(self, i, self._views[i])
+
+    def __getitem__(self, key):
+        if isinstance(key, slice) and self.stacked:
+            return [None if me is None else me.copy() for me in super().__getitem__(key)]
+        return super().__getitem__(key)
+
+    def __setitem__(self, key, value):
+        if isinstance(key, slice):
+            indices = range(len(self))[key]
+            value = list(value)
+            if len(indices) != len(value):
+                raise ValueError(f'Cannot assign {len(value)} values to {len(indices)} nodes')
+            for i, me in zip(indices, value):
+                self[i] = me
+            return None
+
+        i = range(len(self))[key]
+        if value is None or not (self.stacked or isinstance(value, np.ndarray)):
+            return super().__setitem__(i, value)
+
+        if not self.stacked:
+            self._allocate(value, value.dtype)
+        elif not np.can_cast(value.dtype, self.data.dtype, casting='safe'):
+            self._allocate(value, np.result_type(value.dtype, self.data.dtype))
+
+        self._views[i][...] = value
+        return super().__setitem__(i, self._views[i])
+
+
 # short helper class to bundle all status variables
 class _Status(FrozenClass):
     """
@@ -48,9 +172,9 @@ class level(FrozenClass):
         status (__Status): status object
         level_index (int): custom string naming this level
         uend: dof values at the right end point of the interval
-        u (list of dtype_u): dof values at the nodes
+        u (list of dtype_u): dof values at the nodes, stored contiguously if the level parameter `stacked_nodes` is set
         uold (list of dtype_u): copy of dof values for saving data during restriction)
-        f (list of dtype_f): RHS values at the nodes
+        f (list of dtype_f): RHS values at the nodes, stored contiguously if the level parameter `stacked_nodes` is set
         fold (list of dtype_f): copy of RHS values for saving data during restriction
         tau (list of dtype_u): FAS correction, allocated via step class if necessary
     """
@@ -81,9 +205,9 @@ class level(FrozenClass):
 
         # empty data at the nodes, the right end point and tau
         self.uend = None
-        self.u = [None] * (self.sweep.coll.num_nodes + 1)
+        self.u = self._get_node_storage()
         self.uold = [None] * (self.sweep.coll.num_nodes + 1)
-        self.f = [None] * (self.sweep.coll.num_nodes + 1)
+        self.f = self._get_node_storage()
         self.fold = [None] * (self.sweep.coll.num_nodes + 1)
 
         self.tau = [None] * self.sweep.coll.num_nodes
@@ -113,12 +237,24 @@ class level(FrozenClass):
 
         # all data back to None
         self.uend = None
-        self.u = [None] * (self.sweep.coll.num_nodes + 1)
+        self.u = self._get_node_storage()
         self.uold = [None] * (self.sweep.coll.num_nodes + 1)
-        self.f = [None] * (self.sweep.coll.num_nodes + 1)
+        self.f = self._get_node_storage()
         self.fold = [None] * (self.sweep.coll.num_nodes + 1)
         self.tau = [None] * self.sweep.coll.num_nodes
 
+    def _get_node_storage(self):
+        """
+        Get an empty container for the values at the initial condition and the collocation nodes
+
+        Returns:
+            list or StackedNodes: plain list or contiguous storage, depending on the level parameters
+        """
+        if self.params.stacked_nodes:
+            return StackedNodes(self.sweep.coll.num_nodes + 1)
+        else:
+            return [None] * (self.sweep.coll.num_nodes + 1)
+
     @property
     def sweep(self):
         """
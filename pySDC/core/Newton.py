@@ -0,0 +1,264 @@
+"""
+Description
+-----------
+
+Module containing a Newton solver that can be shared by the `solve_system` implementations of nonlinear problems
+"""
+
+import numpy as np
+import scipy.sparse as sp
+from scipy.linalg import lu_factor, lu_solve
+from scipy.sparse.linalg import gmres, splu
+
+from pySDC.core.Problem import WorkCounter
+from pySDC.helpers.problem_helper import FactorizationCache
+
+
+class NewtonSolver(object):
+    r"""
+    Newton solver for the nonlinear systems
+
+    .. math::
+        G(u) = u - factor \cdot f(u, t) - rhs = 0
+
+    arising in implicit sweeps. The Jacobian :math:`J_G = I - factor \cdot J_f` is assembled from the Jacobian
+    :math:`J_f` of the right-hand side, which is supplied by the problem as a dense or sparse matrix.
+
+    In simplified Newton mode, :math:`J_f` is frozen and reused across Newton iterations, nodes, sweeps and steps until
+    convergence degrades, i.e. the residual is reduced by less than `max_contraction` in one iteration. Only then is a
+    new Jacobian evaluated. Factorizations of :math:`J_G` are cached with the factor and the age of the Jacobian as key,
+    such that switching between nodes does not require refactorization as long as the Jacobian is frozen.
+
+    Alternatively, the linear systems can be solved with GMRES. Its relative tolerance can be fixed, proportional to
+    the Newton residual or chosen with the Eisenstat-Walker forcing term [1]_.
+
+    Attributes:
+        eval_f (callable): Function evaluating the right-hand side as `eval_f(u, t)`
+        jacobian (callable): Function evaluating the Jacobian of the right-hand side as `jacobian(u, t)`
+        simplified (bool): Freeze the Jacobian until convergence degrades
+        max_contraction (float): Maximal ratio of subsequent Newton residuals before a frozen Jacobian is renewed
+        direct_solver (bool): Solve the linear systems with LU decompositions or with GMRES
+        forcing (str or float): Choice of the tolerance for GMRES: None for a fixed tolerance, a number for a tolerance
+            proportional to the Newton residual or 'Eisenstat-Walker'
+        min_lintol (float): Minimal tolerance for GMRES
+        min_iter (int): Minimal number of Newton iterations
+        preconditioner (callable): Function returning a preconditioner for GMRES as `preconditioner(factor)`
+        rhs_counter (pySDC.core.Problem.WorkCounter): Counter for right-hand side evaluations of the problem, which is
+            decremented for evaluations inside Newton such that they count into the Newton iterations only
+        factorizations (pySDC.helpers.problem_helper.FactorizationCache): Cache for LU decompositions and
+            preconditioners
+        work_counters (dict): Counters for Newton iterations ('newton'), Jacobian evaluations ('jacobian'),
+            factorizations ('factorization') and GMRES iterations ('linear')
+        niter (int): Number of Newton iterations in the last solve
+        residual (float): Residual after the last solve
+        converged (bool): Whether the last solve reached the tolerance
+
+    References
+    ----------
+    .. [1] S. C. Eisenstat and H. F. Walker. Choosing the forcing terms in an inexact Newton method.
+        SIAM Journal on Scientific Computing, 17(1) (1996).
+    """
+
+    def __init__(
+        self,
+        eval_f,
+        jacobian,
+        simplified=False,
+        max_contraction=0.5,
+        direct_solver=True,
+        forcing=None,
+        min_lintol=1e-12,
+        min_iter=0,
+        preconditioner=None,
+        rhs_counter=None,
+        cache_size=8,
+    ):
+        """
+        Initialization routine
+
+        Args:
+            eval_f (callable): Function evaluating the right-hand side as `eval_f(u, t)`
+            jacobian (callable): Function evaluating the Jacobian of the right-hand side as `jacobian(u, t)`
+            simplified (bool): Freeze the Jacobian until convergence degrades
+            max_contraction (float): Maximal ratio of subsequent Newton residuals before a frozen Jacobian is renewed
+            direct_solver (bool): Solve the linear systems with LU decompositions or with GMRES
+            forcing (str or float): None, a number or 'Eisenstat-Walker' for the choice of the GMRES tolerance
+            min_lintol (float): Minimal tolerance for GMRES
+            min_iter (int): Minimal number of Newton iterations
+            preconditioner (callable): Function returning a preconditioner for GMRES as `preconditioner(factor)`
+            rhs_counter (pySDC.core.Problem.WorkCounter): Counter for right-hand side evaluations of the problem
+            cache_size (int): Maximal number of stored factorizations
+        """
+        if forcing not in [None, 'Eisenstat-Walker'] and not isinstance(forcing, (int, float)):
+            raise ValueError(f'Unknown forcing term {forcing!r} for the linear solver')
+
+        self.eval_f = eval_f
+        self.jacobian = jacobian
+        self.simplified = simplified
+        self.max_contraction = max_contraction
+        self.direct_solver = direct_solver
+        self.forcing = forcing
+        self.min_lintol = min_lintol
+        self.min_iter = min_iter
+        self.preconditioner = preconditioner
+        self.rhs_counter = rhs_counter
+        self.factorizations = FactorizationCache(size=cache_size)
+
+        self.work_counters = {
+            'newton': WorkCounter(),
+            'jacobian': WorkCounter(),
+            'factorization': self.factorizations.misses,
+        }
+        if not direct_solver:
+            self.work_counters['linear'] = WorkCounter()
+
+        self.niter = 0
+        self.residual = np.inf
+        self.converged = False
+
+        self._J = None
+        self._age = 0
+        self._eta = None
+
+    def reset(self):
+        """
+        Discard the frozen Jacobian and all factorizations, e.g. when the problem has changed
+        """
+        self._J = None
+        self.factorizations.clear()
+
+    def update_jacobian(self, u, t):
+        """
+        Evaluate and store a new Jacobian of the right-hand side
+
+        Args:
+            u (numpy.ndarray): Flattened solution to linearize around
+            t (float): Current time
+        """
+        self._J = self.jacobian(u, t)
+        self._age += 1
+        self.work_counters['jacobian']()
+
+    def _get_system_matrix(self, factor):
+        if sp.issparse(self._J):
+            return sp.identity(self._J.shape[0], format='csc', dtype=self._J.dtype) - factor * self._J
+        return np.eye(self._J.shape[0], dtype=np.result_type(self._J, float)) - factor * np.asarray(self._J)
+
+    def _factorize(self, factor):
+        A = self._get_system_matrix(factor)
+        return splu(sp.csc_matrix(A)) if sp.issparse(A) else lu_factor(A)
+
+    def get_lintol(self, lintol, res, res_old):
+        """
+        Get the relative tolerance for GMRES according to the forcing term
+
+        Args:
+            lintol (float): Fixed tolerance
+            res (float): Current Newton residual
+            res_old (float): Newton residual of the previous iteration
+
+        Returns:
+            float: Relative tolerance for GMRES
+        """
+        if self.forcing is None:
+            return lintol
+        elif self.forcing == 'Eisenstat-Walker':
+            # choice 2 of Eisenstat and Walker with safeguards
+            gamma, alpha, eta_max = 0.9, 2.0, 0.9
+            if self._eta is None or not np.isfinite(res_old):
+                eta = 0.5
+            else:
+                eta = gamma * (res / res_old) ** alpha
+                if gamma * self._eta**alpha > 0.1:
+                    eta = max(eta, gamma * self._eta**alpha)
+            self._eta = min(eta, eta_max)
+            return max(self._eta, self.min_lintol)
+        else:
+            return max(res * self.forcing, self.min_lintol)
+
+    def solve_linear(self, G, factor, lintol, liniter):
+        """
+        Solve the linearized system with the current Jacobian
+
+        Args:
+            G (numpy.ndarray): Residual of the nonlinear system
+            factor (float): Factor in front of the right-hand side
+            lintol (float): Relative tolerance for GMRES
+            liniter (int): Maximal number of GMRES iterations
+
+        Returns:
+            numpy.ndarray: Newton update
+        """
+        if self.direct_solver:
+            lu = self.factorizations.get((factor, self._age), lambda: self._factorize(factor))
+            return lu.solve(G) if hasattr(lu, 'solve') else lu_solve(lu, G)
+
+        M = None
+        if self.preconditioner is not None:
+            M = self.factorizations.get(('preconditioner', factor), lambda: self.preconditioner(factor))
+        delta, _ = gmres(
+            self._get_system_matrix(factor),
+            G,
+            x0=np.zeros_like(G),
+            M=M,
+            tol=lintol,
+            maxiter=liniter,
+            atol=0,
+            callback=self.work_counters['linear'],
+        )
+        return delta
+
+    def solve(self, rhs, factor, u0, t, tol, maxiter, lintol=1e-8, liniter=99):
+        r"""
+        Solve :math:`u - factor \cdot f(u, t) = rhs`. Tolerances are passed for every solve since they may be adapted
+        during the run, e.g. by convergence controllers.
+
+        Args:
+            rhs (numpy.ndarray): Right-hand side of the nonlinear system
+            factor (float): Factor in front of the right-hand side, e.g. the step size times an entry of the
+                preconditioner
+            u0 (numpy.ndarray): Initial guess
+            t (float): Current time
+            tol (float): Tolerance for the residual in the maximum norm
+            maxiter (int): Maximal number of Newton iterations
+            lintol (float): Fixed relative tolerance for GMRES
+            liniter (int): Maximal number of GMRES iterations
+
+        Returns:
+            numpy.ndarray: Flattened solution
+        """
+        u = np.array(u0, dtype=float).flatten()
+        rhs = np.asarray(rhs).flatten()
+
+        self.niter = 0
+        self.converged = False
+        self._eta = None
+        res_old = np.inf
+
+        while True:
+            G = u - factor * np.asarray(self.eval_f(u, t)).flatten() - rhs
+            if self.rhs_counter is not None:
+                self.rhs_counter.decrement()
+            res = np.linalg.norm(G, np.inf)
+
+            if (res <= tol and self.niter >= self.min_iter) or np.isnan(res):
+                self.converged = bool(res <= tol)
+                break
+            if self.niter >= maxiter:
+                break
+
+            # renew the Jacobian unless we are allowed to keep a frozen one that still gives good convergence
+            if not self.simplified or self._J is None or res > self.max_contraction * res_old:
+                self.update_jacobian(u, t)
+
+            delta = self.solve_linear(G, factor, self.get_lintol(lintol, res, res_old), liniter)
+            if not np.isfinite(delta).all():
+                break
+
+            u -= delta
+            res_old = res
+            self.niter += 1
+            self.work_counters['newton']()
+
+        self.residual = res
+        return u
@@ -8,6 +8,8 @@ Module containing the base Problem class for pySDC
 """
 
 import logging
+import threading
+import time
 
 from pySDC.core.Common import RegisterParams
 
@@ -23,22 +25,123 @@ class WorkCounter(object):
     >>> count = WorkCounter()  # => niter = 0
     >>> count()                # => niter = 1
     >>> count()                # => niter = 2
+
+    Incrementing and decrementing is thread-safe, such that problems can be used from multiple threads, e.g. when
+    solving at the nodes concurrently.
     """
 
+    _lock = threading.Lock()  # shared between all counters, which keeps them picklable
+
     def __init__(self):
         self.niter = 0
 
     def __call__(self, *args, **kwargs):
         # *args and **kwargs are necessary for gmres
-        self.niter += 1
+        with self._lock:
+            self.niter += 1
 
     def decrement(self):
-        self.niter -= 1
+        with self._lock:
+            self.niter -= 1
 
     def __str__(self):
         return f'{self.niter}'
 
 
+class WorkTimer(WorkCounter):
+    """
+    Work counter that additionally accumulates the wall clock time spent in a block of code. Use it as a context
+    manager, which increments `niter` on entering and adds the elapsed time to `time` on leaving, e.g.
+
+    >>> timer = WorkTimer()
+    >>> with timer:
+    ...     do_something()  # => niter = 1, time = time spent in do_something
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.time = 0.0
+        self._start = None
+
+    def __enter__(self):
+        self()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *args):
+        self.time += time.perf_counter() - self._start
+
+    def __str__(self):
+        return f'{self.niter} ({self.time:.2e}s)'
+
+
+class BufferPool(object):
+    """
+    Pool of temporary data variables that can be borrowed and given back to avoid allocating new memory every time a
+    temporary is needed, e.g. for every node in every sweep.
+
+    Only give back variables that are not referenced anywhere else anymore, as they will be handed out again.
+
+    Attributes:
+        allocations (WorkCounter): Counts how many new variables had to be allocated because the pool was empty
+    """
+
+    def __init__(self, dtype, init, max_size=16):
+        """
+        Args:
+            dtype (type): Type of the variables in the pool
+            init: Argument to instantiate the variables
+            max_size (int): Maximum number of variables to keep in the pool
+        """
+        self.dtype = dtype
+        self.init = init
+        self.max_size = max_size
+        self.allocations = WorkCounter()
+        self._pool = []
+        self._signature = None
+
+    def borrow(self, val=None):
+        """
+        Get a variable from the pool or allocate a new one if the pool is empty
+
+        Args:
+            val: Value to fill the variable with. The content is undefined if this is None.
+
+        Returns:
+            A variable of the type of the pool
+        """
+        if self._pool:
+            me = self._pool.pop()
+            if val is not None:
+                me[...] = val
+            return me
+
+        self.allocations()
+        me = self.dtype(self.init) if val is None else self.dtype(self.init, val=val)
+        if hasattr(me, 'shape') and hasattr(me, 'dtype'):
+            self._signature = (me.shape, me.dtype)
+        return me
+
+    def give_back(self, me):
+        """
+        Return a variable to the pool. Only array-like variables are reused. Variables that do not match the pool,
+        e.g. because they have been upcast to complex numbers, are discarded.
+
+        Args:
+            me: The variable which is no longer used
+        """
+        if type(me) is not self.dtype or len(self._pool) >= self.max_size:
+            return
+        if self._signature is None or self._signature != (getattr(me, 'shape', None), getattr(me, 'dtype', None)):
+            return
+        if any(me is other for other in self._pool):
+            return
+        self._pool.append(me)
+
+    def __len__(self):
+        return len(self._pool)
+
+
 class ptype(RegisterParams):
     """
     Prototype class for problems, just defines the attributes essential to get started.
@@ -56,6 +159,9 @@ class ptype(RegisterParams):
     ----------
     logger: logging.Logger
         custom logger for problem-related logging.
+    buffers : dict
+        Pools of temporary variables of type `dtype_u` and `dtype_f` that can be borrowed with `borrow_u` and
+        `borrow_f` and given back with `give_back`.
     """
 
     logger = logging.getLogger('problem')
@@ -65,6 +171,7 @@ class ptype(RegisterParams):
     def __init__(self, init):
         self.work_counters = {}  # Dictionary to store WorkCounter objects
         self.init = init  # Initialization parameter to instantiate data types
+        self.buffers = {}  # Pools of temporary data variables
 
     @property
     def u_init(self):
@@ -76,6 +183,76 @@ class ptype(RegisterParams):
         """Generate a data variable for RHS"""
         return self.dtype_f(self.init)
 
+    def _get_buffer_pool(self, dtype):
+        if dtype not in self.buffers.keys():
+            self.buffers[dtype] = BufferPool(dtype, self.init)
+        return self.buffers[dtype]
+
+    def borrow_u(self, val=None):
+        """
+        Borrow a temporary variable of type `dtype_u` from the buffer pool. Give it back with `give_back` once it is
+        not needed anymore.
+
+        Args:
+            val: Value to fill the variable with. The content is undefined if this is None.
+
+        Returns:
+            dtype_u: The temporary variable
+        """
+        return self._get_buffer_pool(self.dtype_u).borrow(val=val)
+
+    def borrow_f(self, val=None):
+        """
+        Borrow a temporary variable of type `dtype_f` from the buffer pool. Give it back with `give_back` once it is
+        not needed anymore.
+
+        Args:
+            val: Value to fill the variable with. The content is undefined if this is None.
+
+        Returns:
+            dtype_f: The temporary variable
+        """
+        return self._get_buffer_pool(self.dtype_f).borrow(val=val)
+
+    def give_back(self, *args):
+        """
+        Return temporary variables to the buffer pool of their type. They must not be referenced anywhere else.
+
+        Args:
+            args: The variables that are not needed anymore
+        """
+        for me in args:
+            if type(me) in self.buffers.keys():
+                self.buffers[type(me)].give_back(me)
+
+    @staticmethod
+    def accumulate(me, other):
+        """
+        Add `other` to `me`. For array-like data types, the result is written into the memory of `me`, also if in-place
+        arithmetic of the data type is switched off, such that borrowed variables keep their memory. Otherwise, e.g. if
+        the sum needs a different data type, the result is a new variable, so always use the returned value.
+
+        Args:
+            me: The variable to add to
+            other: The summand
+
+        Returns:
+            The sum
+        """
+        import numpy as np
+
+        if not isinstance(me, np.ndarray):
+            me += other
+            return me
+
+        # plain array views bypass the ufunc override of the data type, which may ignore the output argument
+        target = me.view(np.ndarray)
+        summand = other.view(np.ndarray) if isinstance(other, np.ndarray) else other
+        if np.result_type(target, summand) != target.dtype or np.broadcast(target, summand).shape != target.shape:
+            return me + other
+        np.add(target, summand, out=target)
+        return me
+
     @classmethod
     def get_default_sweeper_class(cls):
         raise NotImplementedError(f'No default sweeper class implemented for {cls} problem!')
@@ -102,7 +279,20 @@ class ptype(RegisterParams):
         """Default mass matrix : identity"""
         return u
 
-    def generate_scipy_reference_solution(self, eval_rhs, t, u_init=None, t_init=None, **kwargs):
+    def get_linear_operator(self):
+        r"""
+        Constant matrix :math:`A` if the right-hand side is linear, i.e. :math:`f(u, t) = A u`. For problems with a
+        split right-hand side, :math:`A` describes the implicit part and the remaining parts must not depend on
+        :math:`u`. Sweepers can use this to precompute the sweep, see the sweeper parameter ``matrix_sweep``.
+
+        Returns
+        -------
+        A : scipy.sparse matrix or None
+            The linear operator acting on the flattened solution or None if the problem is not of this form.
+        """
+        return None
+
+    def generate_scipy_reference_solution(self, eval_rhs, t, u_init=None, t_init=None, use_cache=True, **kwargs):
         """
         Compute a reference solution using `scipy.solve_ivp` with very small tolerances.
         Keep in mind that scipy needs the solution to be a one dimensional array. If you are solving something higher
@@ -113,11 +303,16 @@ class ptype(RegisterParams):
         problems and to accelerate that you can pass a function that evaluates the Jacobian with arguments `jac(t, u)`
         as `jac=jac`.
 
+        Solutions starting from the initial conditions of the problem are cached, such that subsequent solutions are
+        obtained by integrating only from the closest solution computed before, see `pySDC.helpers.reference_solution`.
+        This assumes that the right hand side depends only on the registered parameters of the problem.
+
         Args:
             eval_rhs (function): Function evaluate the full right hand side. Must have signature `eval_rhs(float: t, numpy.1darray: u)`
             t (float): current time
             u_init (pySDC.implementations.problem_classes.Lorenz.dtype_u): initial conditions for getting the exact solution
             t_init (float): the starting time
+            use_cache (bool): whether to use the cache for solutions starting from the initial conditions
 
         Returns:
             numpy.ndarray: Reference solution
@@ -130,10 +325,15 @@ class ptype(RegisterParams):
             'rtol': 100 * np.finfo(float).eps,
             **kwargs,
         }
+        from_initial_conditions = u_init is None and t_init is None
         u_init = self.u_exact(t=0) if u_init is None else u_init * 1.0
         t_init = 0 if t_init is None else t_init
 
         u_shape = u_init.shape
+        if use_cache and from_initial_conditions and t >= t_init:
+            from pySDC.helpers.reference_solution import Reference_cache
+
+            return Reference_cache.get(self, eval_rhs, t, np.asarray(u_init), t0=t_init, **kwargs).reshape(u_shape)
         return solve_ivp(eval_rhs, (t_init, t), u_init.flatten(), **kwargs).y[:, -1].reshape(u_shape)
 
     def get_fig(self):
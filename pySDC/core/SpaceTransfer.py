@@ -1,5 +1,7 @@
 import logging
 
+import numpy as np
+
 from pySDC.helpers.pysdc_helper import FrozenClass
 
 
@@ -63,3 +65,29 @@ class space_transfer(object):
             G: the coarse level data (easier to access than via the coarse attribute)
         """
         raise NotImplementedError('ERROR: space_transfer has to implement prolong(self, G)')
+
+    def restrict_stacked(self, F):
+        """
+        Restriction in space of the values at multiple nodes at once. This default implementation restricts one node
+        after the other, but derived classes can override it to restrict all nodes with a single operation.
+
+        Args:
+            F: the fine level data at multiple nodes, stacked along the first axis
+
+        Returns:
+            numpy.ndarray: the coarse level data at the nodes, stacked along the first axis
+        """
+        return np.stack([np.asarray(self.restrict(me)) for me in F])
+
+    def prolong_stacked(self, G):
+        """
+        Prolongation in space of the values at multiple nodes at once. This default implementation prolongs one node
+        after the other, but derived classes can override it to prolong all nodes with a single operation.
+
+        Args:
+            G: the coarse level data at multiple nodes, stacked along the first axis
+
+        Returns:
+            numpy.ndarray: the fine level data at the nodes, stacked along the first axis
+        """
+        return np.stack([np.asarray(self.prolong(me)) for me in G])
@@ -1,15 +1,20 @@
 import logging
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 import scipy as sp
 import scipy.linalg
 import scipy.optimize as opt
+import scipy.sparse
+from scipy.sparse.linalg import splu
 
 from pySDC.core.Errors import ParameterError
-from pySDC.core.Level import level
+from pySDC.core.Level import level, StackedNodes
 from pySDC.core.Collocation import CollBase
 from pySDC.helpers.pysdc_helper import FrozenClass
+from pySDC.helpers.problem_helper import FactorizationCache
+from pySDC.helpers.qdelta_cache import Qdelta_cache
 
 
 # short helper class to add params as attributes
@@ -18,6 +23,9 @@ class _Pars(FrozenClass):
         self.do_coll_update = False
         self.initial_guess = 'spread'  # default value (see also below)
         self.skip_residual_computation = ()  # gain performance at the cost of correct residual output
+        self.fuse_residual = False  # reuse the quadrature from the residual in the next sweep
+        self.matrix_sweep = False  # use precomputed sweep operators for problems with a constant linear operator
+        self.num_threads = 1  # number of threads for independent computations at the nodes
 
         for k, v in pars.items():
             if k != 'collocation_class':
@@ -30,12 +38,18 @@ class sweeper(object):
     """
     Base abstract sweeper class
 
+    Independent computations at the nodes can be distributed to threads with `map_nodes`, see the parameter
+    `num_threads`. The thread pools are shared between all sweepers.
+
     Attributes:
         logger: custom logger for sweeper-related logging
         params (__Pars): parameter object containing the custom parameters passed by the user
         coll (pySDC.Collocation.CollBase): collocation object
+        sweep_solvers (pySDC.helpers.problem_helper.FactorizationCache): precomputed solvers for sweeps over all nodes
     """
 
+    _thread_pools = {}  # thread pools shared between all sweepers with the same number of threads
+
     def __init__(self, params):
         """
         Initialization routine for the base sweeper
@@ -76,9 +90,50 @@ class sweeper(object):
         # This will be set as soon as the sweeper is instantiated at the level
         self.__level = None
 
+        # quadrature QF(u) left over from the computation of the residual, see `get_quadrature`
+        self._quadrature = None
+
+        # solvers for linear problems, see `get_sweep_solver`
+        self.sweep_solvers = FactorizationCache(size=4)
+
         self.parallelizable = False
 
     def get_Qdelta_implicit(self, coll, qd_type):
+        """
+        Get the implicit preconditioner. The matrices are memoized for identical collocation and type of
+        preconditioner and can be stored on disk, see `pySDC.helpers.qdelta_cache`.
+
+        Args:
+            coll (pySDC.core.Collocation.CollBase): Collocation object
+            qd_type (str): Type of the preconditioner
+
+        Returns:
+            numpy.ndarray: The preconditioner
+        """
+
+        def compute():
+            parallelizable = self.parallelizable
+            self.parallelizable = False
+            QDmat = self.compute_Qdelta_implicit(coll, qd_type)
+            parallelizable, self.parallelizable = self.parallelizable, parallelizable
+            return QDmat, parallelizable
+
+        QDmat, parallelizable = Qdelta_cache.get(Qdelta_cache.get_key(coll, qd_type), compute)
+        self.parallelizable = self.parallelizable or parallelizable
+        return QDmat
+
+    def compute_Qdelta_implicit(self, coll, qd_type):
+        """
+        Compute the implicit preconditioner without using the cache
+
+        Args:
+            coll (pySDC.core.Collocation.CollBase): Collocation object
+            qd_type (str): Type of the preconditioner
+
+        Returns:
+            numpy.ndarray: The preconditioner
+        """
+
         def rho(x):
             return max(abs(np.linalg.eigvals(np.eye(m) - np.diag([x[i] for i in range(m)]).dot(coll.Qmat[1:, 1:]))))
 
@@ -481,15 +536,31 @@ class sweeper(object):
         # compute the residual for each node
 
         # build QF(u)
-        res_norm = []
         res = self.integrate()
+        fuse = self.params.fuse_residual and not self.stacked
+        if fuse:
+            # keep QF(u) for the next sweep and compute the residual in new variables
+            self.cache_quadrature(res)
+            res = list(res)
         for m in range(self.coll.num_nodes):
-            res[m] += L.u[0] - L.u[m + 1]
+            if fuse:
+                res[m] = res[m] + (L.u[0] - L.u[m + 1])
+            else:
+                res[m] += L.u[0] - L.u[m + 1]
             # add tau if associated
             if L.tau[m] is not None:
                 res[m] += L.tau[m]
-            # use abs function from data type here
-            res_norm.append(abs(res[m]))
+
+        # use abs function from data type here, with a single reduction for all norms if the data type allows it
+        if L.params.residual_type in ['full_rel', 'last_rel']:
+            res_norm = self.compute_norms(res + [L.u[0]])
+            u0_norm = res_norm.pop()
+        else:
+            res_norm = self.compute_norms(res)
+
+        # the residuals are not needed anymore and can be reused as temporaries, except for views into stacked storage
+        if not self.stacked:
+            L.prob.give_back(*res)
 
         # find maximal residual over the nodes
         if L.params.residual_type == 'full_abs':
@@ -497,9 +568,9 @@ class sweeper(object):
         elif L.params.residual_type == 'last_abs':
             L.status.residual = res_norm[-1]
         elif L.params.residual_type == 'full_rel':
-            L.status.residual = max(res_norm) / abs(L.u[0])
+            L.status.residual = max(res_norm) / u0_norm
         elif L.params.residual_type == 'last_rel':
-            L.status.residual = res_norm[-1] / abs(L.u[0])
+            L.status.residual = res_norm[-1] / u0_norm
         else:
             raise ParameterError(
                 f'residual_type = {L.params.residual_type} not implemented, choose '
@@ -511,6 +582,170 @@ class sweeper(object):
 
         return None
 
+    @staticmethod
+    def compute_norms(values):
+        """
+        Compute the norms of a number of values. Data types can provide a static method `batched_abs` to compute the
+        norms of many values at once, e.g. with a single reduction in parallel, which is used if all values have the
+        same type.
+
+        Args:
+            values (list): The values
+
+        Returns:
+            list: Norms of the values
+        """
+        batched_abs = getattr(type(values[0]), 'batched_abs', None)
+        if batched_abs is not None and all(type(me) is type(values[0]) for me in values):
+            return batched_abs(values)
+        return [abs(me) for me in values]
+
+    def cache_quadrature(self, integral):
+        """
+        Store the quadrature QF(u) of the current values at the nodes for reuse in the next sweep
+
+        Args:
+            integral (list of dtype_u): The quadrature as returned by `integrate`
+        """
+        L = self.level
+        self._quadrature = (integral, L.time, L.dt, [L.f[m] for m in range(1, self.coll.num_nodes + 1)])
+
+    def reset_quadrature(self):
+        """
+        Discard the stored quadrature, e.g. when the values at the nodes have been modified in-place
+        """
+        self._quadrature = None
+
+    def get_quadrature(self):
+        """
+        Get QF(u) for the sweep. If the quadrature of the same values has been computed for the residual already with
+        the sweeper parameter `fuse_residual`, it is reused. Otherwise, it is computed with `integrate`. Values that
+        have been replaced at the nodes or a change in time or step size make the stored quadrature invalid.
+        The quadrature can only be used once.
+
+        Returns:
+            list of dtype_u: containing the integral as values
+        """
+        if self._quadrature is not None:
+            L = self.level
+            integral, time, dt, f = self._quadrature
+            self._quadrature = None
+            if time == L.time and dt == L.dt and not self.stacked and all(me is L.f[m + 1] for m, me in enumerate(f)):
+                return integral
+        return self.integrate()
+
+    def map_nodes(self, function, *iterables):
+        """
+        Apply a function to the arguments for all nodes. If the sweeper parameter `num_threads` is larger than one, the
+        calls are distributed to a pool of threads, so they must be independent of each other and the problem must be
+        thread-safe. This pays off when the function spends most of its time in compiled code that releases the GIL,
+        like sparse direct solvers or numpy operations on large arrays.
+
+        Args:
+            function (callable): Function to apply
+            iterables: Arguments for the function, one entry for every node
+
+        Returns:
+            list: Results of the function in the order of the arguments
+        """
+        num_threads = self.params.num_threads
+        if num_threads <= 1:
+            return list(map(function, *iterables))
+
+        if num_threads not in self._thread_pools.keys():
+            self._thread_pools[num_threads] = ThreadPoolExecutor(max_workers=num_threads)
+        return list(self._thread_pools[num_threads].map(function, *iterables))
+
+    def get_linear_operator(self, param):
+        """
+        Get the constant linear operator of the problem for a sweeper parameter that relies on it. If the problem does
+        not provide one, the parameter is switched off.
+
+        Args:
+            param (str): Name of the sweeper parameter
+
+        Returns:
+            scipy.sparse matrix: The linear operator or None if not available
+        """
+        A = self.level.prob.get_linear_operator()
+        if A is None:
+            self.logger.warning(
+                f'{type(self.level.prob).__name__} does not provide a constant linear operator, so we cannot use '
+                f'{param}. Changing this!'
+            )
+            setattr(self.params, param, False)
+        return A
+
+    def get_sweep_solver(self, QI):
+        r"""
+        Get a solver for the implicit part of a sweep over all nodes at once, i.e. for the space-time system with the
+        matrix :math:`(I - \Delta t Q_\Delta \otimes A)`. This is only available if the sweeper parameter
+        `matrix_sweep` is set and the problem has a constant linear operator :math:`A`, see `get_linear_operator` of
+        the problem. The solver is computed once for every step size and preconditioner.
+
+        Args:
+            QI (numpy.ndarray): Implicit preconditioner without the row and column of the initial conditions
+
+        Returns:
+            function: Solver for right hand sides stacked along the first axis, or None if not available
+        """
+        if not self.params.matrix_sweep:
+            return None
+
+        L = self.level
+        A = self.get_linear_operator('matrix_sweep')
+        if A is None:
+            return None
+
+        return self.sweep_solvers.get((L.dt, QI.tobytes()), lambda: self.build_sweep_solver(A, L.dt * QI))
+
+    @staticmethod
+    def build_sweep_solver(A, QIdt):
+        r"""
+        Precompute the solution of :math:`(I - Q_\Delta \otimes A) u = r` for the values at all nodes. If :math:`A` is
+        diagonal, the system decouples into small systems for every eigenvalue, whose inverses are stored. Otherwise,
+        the block lower triangular structure of the Kronecker product is used: the blocks on the diagonal are
+        LU-decomposed once and the blocks below the diagonal are applied with a single multiplication by :math:`A` per
+        node. This has much less fill-in than decomposing the space-time matrix as a whole.
+
+        Args:
+            A (scipy.sparse matrix): Linear operator of the problem
+            QIdt (numpy.ndarray): Implicit preconditioner scaled by the step size
+
+        Returns:
+            function: Solver for right hand sides stacked along the first axis
+        """
+        M = QIdt.shape[0]
+        A = scipy.sparse.csr_matrix(A)
+        N = A.shape[0]
+
+        if A.count_nonzero() == np.count_nonzero(A.diagonal()):
+            inverses = np.linalg.inv(np.eye(M) - A.diagonal()[:, None, None] * QIdt[None, :, :])
+
+            def solve(rhs):
+                return np.einsum('nij,jn->in', inverses, rhs.reshape(M, N)).reshape(rhs.shape)
+
+        else:
+            Id = scipy.sparse.identity(N, format='csc')
+            factors = {}
+            for m in range(M):
+                if QIdt[m, m] not in factors.keys():
+                    factors[QIdt[m, m]] = splu(scipy.sparse.csc_matrix(Id - QIdt[m, m] * A))
+            LU = [factors[QIdt[m, m]] for m in range(M)]
+
+            def solve(rhs):
+                if np.iscomplexobj(rhs) and not np.iscomplexobj(A.data):
+                    return solve(rhs.real) + 1j * solve(rhs.imag)
+                sol = np.empty((M, N), dtype=rhs.dtype)
+                for m in range(M):
+                    if m > 0 and np.any(QIdt[m, :m] != 0):
+                        sol[m] = LU[m].solve(rhs[m].flatten() + A @ (QIdt[m, :m] @ sol[:m]))
+                    else:
+                        sol[m] = LU[m].solve(rhs[m].flatten())
+                return sol.reshape(rhs.shape)
+
+        return solve
+
     def compute_end_point(self):
         """
         Abstract interface to end-node computation
@@ -550,6 +785,36 @@ class sweeper(object):
         assert isinstance(L, level)
         self.__level = L
 
+    @property
+    def stacked(self):
+        """
+        Whether the solution and right hand side values at the nodes are stored in contiguous arrays of the same
+        shape, such that operations over all nodes can be vectorized. See the level parameter `stacked_nodes`.
+
+        Returns:
+            bool: True if the contiguous arrays are available
+        """
+        L = self.level
+        return (
+            isinstance(L.u, StackedNodes)
+            and isinstance(L.f, StackedNodes)
+            and L.u.stacked
+            and L.f.stacked
+            and L.u.data.shape == L.f.data.shape
+        )
+
+    @property
+    def stacked_integrand(self):
+        """
+        Stacked values at the collocation nodes that `integrate` multiplies with the quadrature matrix. Transfer
+        classes use this to fuse the integration with the restriction in collocation. Sweepers that do not integrate
+        the stacked right hand side values as they are return None.
+
+        Returns:
+            numpy.ndarray: Stacked integrand at the collocation nodes or None if not available
+        """
+        return None
+
     @property
     def rank(self):
         return 0
@@ -0,0 +1,248 @@
+import numpy as np
+
+from pySDC.core.Errors import ParameterError
+from pySDC.core.Level import level
+from pySDC.implementations.problem_classes.TestEquation_0D import testequation0d
+from pySDC.implementations.sweeper_classes.generic_implicit import generic_implicit
+
+
+class EnsembleRunner(object):
+    r"""
+    Run many independent single-level SDC configurations for the Dahlquist test equation
+    :math:`u_t = \lambda u` at once, vectorized along a batch axis of ensemble members.
+
+    Each member is configured with a description as for `controller_nonMPI` with `testequation0d` as problem and
+    `generic_implicit` as sweeper. Members can differ in the step size, the values of lambda, the initial conditions,
+    the collocation and the preconditioner, but need the same number of nodes and the same number of lambdas. They
+    follow the semantics of `controller_nonMPI` with a single time step in the block: the predictor spreads the
+    initial conditions, then sweeps are done until the residual drops below `restol` or `maxiter` is reached. Every
+    member stops iterating and stepping on its own. Hooks and convergence controllers are not supported.
+
+    Attributes:
+        levels (list): One `pySDC.core.Level.level` per member to access the configuration
+        num_members (int): Number of members in the ensemble
+        lambdas (numpy.ndarray): Values of lambda of all members with shape (num_members, nvars)
+        dt (numpy.ndarray): Step size of all members
+        Q (numpy.ndarray): Collocation matrices of all members with shape (num_members, num_nodes, num_nodes)
+        weights (numpy.ndarray): Quadrature weights of all members with shape (num_members, num_nodes)
+    """
+
+    def __init__(self, descriptions):
+        """
+        Args:
+            descriptions (list): Descriptions of the members as for `controller_nonMPI`
+        """
+        self.levels = []
+        for description in descriptions:
+            if not issubclass(description['problem_class'], testequation0d):
+                raise ParameterError(f'Ensembles need testequation0d as problem, got {description["problem_class"]}')
+            sweeper_class = description['sweeper_class']
+            if not (
+                issubclass(sweeper_class, generic_implicit)
+                and sweeper_class.update_nodes is generic_implicit.update_nodes
+                and sweeper_class.integrate is generic_implicit.integrate
+            ):
+                raise ParameterError(f'Ensembles need generic_implicit as sweeper, got {sweeper_class}')
+            if description.get('convergence_controllers', {}):
+                raise ParameterError('Ensembles do not support convergence controllers')
+
+            L = level(
+                problem_class=description['problem_class'],
+                problem_params=description.get('problem_params', {}),
+                sweeper_class=sweeper_class,
+                sweeper_params=description['sweeper_params'].copy(),
+                level_params=description['level_params'],
+                level_index=0,
+            )
+            L.sweep.level = L
+            self.levels.append(L)
+
+        self.num_members = len(self.levels)
+        if len({L.sweep.coll.num_nodes for L in self.levels}) > 1:
+            raise ParameterError('All members of an ensemble need the same number of nodes')
+        if len({L.prob.lambdas.size for L in self.levels}) > 1:
+            raise ParameterError('All members of an ensemble need the same number of lambdas')
+
+        self.maxiter = np.array(
+            [description.get('step_params', {}).get('maxiter', 20) for description in descriptions], dtype=int
+        )
+        self.lambdas = np.stack([L.prob.lambdas for L in self.levels]).astype(complex)
+        self.dt = np.array([L.params.dt for L in self.levels], dtype=float)
+        self.restol = np.array([L.params.restol for L in self.levels], dtype=float)
+        self.Q = np.stack([L.sweep.coll.Qmat[1:, 1:] for L in self.levels])
+        self.weights = np.stack([L.sweep.coll.weights for L in self.levels])
+
+        for L in self.levels:
+            if L.sweep.params.initial_guess not in ['spread', 'copy', 'zero']:
+                raise ParameterError(f'Initial guess {L.sweep.params.initial_guess!r} not supported in ensembles')
+            if L.params.residual_type not in ['full_abs', 'last_abs', 'full_rel', 'last_rel']:
+                raise ParameterError(f'residual_type = {L.params.residual_type} not implemented')
+
+    def get_QI(self, members, sweep):
+        """
+        Get the preconditioners of some members in a given sweep of an iteration
+
+        Args:
+            members (numpy.ndarray): Indices of the members
+            sweep (int): Number of the sweep within the iteration, starting at 1
+
+        Returns:
+            numpy.ndarray: Preconditioners with shape (len(members), num_nodes, num_nodes)
+        """
+        QI = []
+        for i in members:
+            S = self.levels[i].sweep
+            if S.params.QI.startswith('MIN-SR-FLEX'):
+                S.params.QI = 'MIN-SR-S' if sweep > S.coll.num_nodes else f'MIN-SR-FLEX{sweep}'
+                S.QI = S.get_Qdelta_implicit(S.coll, qd_type=S.params.QI)
+            QI.append(S.QI[1:, 1:])
+        return np.stack(QI)
+
+    def sweep(self, members, u0, u, QI):
+        """
+        Do one sweep of `generic_implicit` for some members
+
+        Args:
+            members (numpy.ndarray): Indices of the members
+            u0 (numpy.ndarray): Initial conditions with shape (len(members), nvars)
+            u (numpy.ndarray): Solution at the nodes with shape (len(members), num_nodes, nvars), updated in-place
+            QI (numpy.ndarray): Preconditioners with shape (len(members), num_nodes, num_nodes)
+        """
+        lambdas = self.lambdas[members][:, None, :]
+        dt = self.dt[members][:, None, None]
+
+        # u0 + QF(u^k) - QdF(u^k)
+        f = lambdas * u
+        integral = u0[:, None, :] + np.einsum('bmj,bjn->bmn', dt * (self.Q[members] - QI), f)
+
+        for m in range(u.shape[1]):
+            rhs = integral[:, m] + np.einsum('bj,bjn->bn', dt[:, :, 0] * QI[:, m, :m], f[:, :m])
+            factor = 1 - dt[:, 0] * QI[:, m, m][:, None] * lambdas[:, 0]
+            singular = np.any(factor == 0, axis=1)
+            if np.any(singular):
+                raise ParameterError(
+                    f'Singular system at node {m + 1} for ensemble member(s) {members[singular].tolist()}, where '
+                    'dt * QI[m, m] * lambda = 1'
+                )
+            u[:, m] = rhs / factor
+            f[:, m] = lambdas[:, 0] * u[:, m]
+
+    def compute_residual(self, members, u0, u):
+        """
+        Compute the residual of some members
+
+        Args:
+            members (numpy.ndarray): Indices of the members
+            u0 (numpy.ndarray): Initial conditions with shape (len(members), nvars)
+            u (numpy.ndarray): Solution at the nodes with shape (len(members), num_nodes, nvars)
+
+        Returns:
+            numpy.ndarray: Residual of the members
+        """
+        f = self.lambdas[members][:, None, :] * u
+        res = u0[:, None, :] + np.einsum('bmj,bjn->bmn', self.dt[members][:, None, None] * self.Q[members], f) - u
+        res_norm = np.max(np.abs(res), axis=2)
+
+        residual = np.empty(len(members))
+        for i, member in enumerate(members):
+            residual_type = self.levels[member].params.residual_type
+            residual[i] = np.max(res_norm[i]) if residual_type.startswith('full') else res_norm[i, -1]
+            if residual_type.endswith('rel'):
+                residual[i] /= np.max(np.abs(u0[i]))
+        return residual
+
+    def compute_end_point(self, members, u0, u):
+        """
+        Compute the solution at the end of the step for some members
+
+        Args:
+            members (numpy.ndarray): Indices of the members
+            u0 (numpy.ndarray): Initial conditions with shape (len(members), nvars)
+            u (numpy.ndarray): Solution at the nodes with shape (len(members), num_nodes, nvars)
+
+        Returns:
+            numpy.ndarray: Solution at the end of the step with shape (len(members), nvars)
+        """
+        f = self.lambdas[members][:, None, :] * u
+        uend = u0 + np.einsum('bj,bjn->bn', self.dt[members][:, None] * self.weights[members], f)
+        for i, member in enumerate(members):
+            S = self.levels[member].sweep
+            if S.coll.right_is_node and not S.params.do_coll_update:
+                uend[i] = u[i, -1]
+        return uend
+
+    def run_step(self, members, u0):
+        """
+        Solve a single step with SDC for some members
+
+        Args:
+            members (numpy.ndarray): Indices of the members
+            u0 (numpy.ndarray): Initial conditions with shape (len(members), nvars)
+
+        Returns:
+            numpy.ndarray: Solution at the end of the step
+            numpy.ndarray: Number of iterations
+            numpy.ndarray: Residual after the last iteration
+        """
+        # predict
+        u = np.repeat(u0[:, None, :], self.Q.shape[1], axis=1)
+        for i, member in enumerate(members):
+            if self.levels[member].sweep.params.initial_guess == 'zero':
+                u[i] = 0.0
+
+        niter = np.zeros(len(members), dtype=int)
+        residual = self.compute_residual(members, u0, u)
+        running = (residual > self.restol[members]) & (niter < self.maxiter[members])
+
+        # iterate until every member is converged, members drop out individually
+        while any(running):
+            idx = np.where(running)[0]
+            niter[idx] += 1
+            nsweeps = np.array([self.levels[member].params.nsweeps for member in members])
+            for sweep in range(1, max(nsweeps[idx]) + 1):
+                idx_sweep = np.where(running & (nsweeps >= sweep))[0]
+                u_sweep = u[idx_sweep]
+                self.sweep(members[idx_sweep], u0[idx_sweep], u_sweep, self.get_QI(members[idx_sweep], sweep))
+                u[idx_sweep] = u_sweep
+            residual[idx] = self.compute_residual(members[idx], u0[idx], u[idx])
+            running = (residual > self.restol[members]) & (niter < self.maxiter[members])
+
+        return self.compute_end_point(members, u0, u), niter, residual
+
+    def run(self, t0, Tend, u0=None):
+        """
+        Run all members from `t0` to `Tend`. Each member does steps with its own step size.
+
+        Args:
+            t0 (float): Starting time
+            Tend (float): End time
+            u0 (numpy.ndarray): Initial conditions with shape (num_members, nvars), by default the exact solution
+
+        Returns:
+            numpy.ndarray: Solution at the end time with shape (num_members, nvars)
+            dict: Number of iterations ("niter"), residual ("residual") and time ("time") of each step of each member
+        """
+        if u0 is None:
+            u0 = np.stack([L.prob.u_exact(t0) for L in self.levels])
+        uend = np.array(u0, dtype=complex).reshape(self.lambdas.shape)
+
+        time = np.full(self.num_members, t0, dtype=float)
+        stats = {key: [[] for _ in range(self.num_members)] for key in ['niter', 'residual', 'time']}
+
+        active = time < Tend - 10 * np.finfo(float).eps
+        if not any(active):
+            raise ParameterError('Nothing to do, check t0, dt and Tend.')
+
+        while any(active):
+            members = np.where(active)[0]
+            uend[members], niter, residual = self.run_step(members, uend[members])
+            time[members] += self.dt[members]
+
+            for i, member in enumerate(members):
+                stats['niter'][member].append(niter[i])
+                stats['residual'][member].append(residual[i])
+                stats['time'][member].append(time[member])
+
+            active = time < Tend - 10 * np.finfo(float).eps
+
+        return uend, {key: [np.array(me) for me in value] for key, value in stats.items()}
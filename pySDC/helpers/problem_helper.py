@@ -1,6 +1,11 @@
+import threading
+from collections import OrderedDict
+
 import numpy as np
 from scipy.special import factorial
 
+from pySDC.core.Problem import WorkCounter
+
 
 def get_steps(derivative, order, stencil_type):
     """
@@ -267,3 +272,80 @@ def get_1d_grid(size, bc, left_boundary=0.0, right_boundary=1.0):
         raise NotImplementedError(f'Boundary conditions \"{bc}\" not implemented.')
 
     return dx, xvalues
+
+
+class FactorizationCache(object):
+    """
+    Least-recently-used cache for factorizations of linear operators, e.g. sparse LU decompositions of
+    :math:`(I - factor A)`. Entries are stored with any hashable key and the least recently used entry is evicted
+    once more than `size` entries are stored. Cache hits and misses are counted with `WorkCounter` objects such that
+    they can be registered in the `work_counters` of a problem. The cache can be used from multiple threads, but
+    factorizations that are requested by several threads at the same time may be computed more than once.
+
+    Attributes:
+        size (int): Maximum number of stored factorizations
+        hits (pySDC.core.Problem.WorkCounter): Counter for factorizations that were reused
+        misses (pySDC.core.Problem.WorkCounter): Counter for factorizations that had to be computed
+    """
+
+    def __init__(self, size=8):
+        """
+        Initialization routine
+
+        Args:
+            size (int): Maximum number of stored factorizations
+        """
+        if size < 1:
+            raise ValueError(f'Size of the factorization cache must be positive, got {size}')
+        self.size = size
+        self.hits = WorkCounter()
+        self.misses = WorkCounter()
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop('_lock')
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def get(self, key, factorize):
+        """
+        Get the factorization stored for `key` or compute and store it if it is not available.
+
+        Args:
+            key (hashable): Key identifying the factorization, e.g. the factor in front of the operator
+            factorize (function): Function without arguments that computes the factorization
+
+        Returns:
+            The factorization associated with `key`
+        """
+        with self._lock:
+            if key in self._entries:
+                self.hits()
+                self._entries.move_to_end(key)
+                return self._entries[key]
+            self.misses()
+
+        # factorize outside of the lock such that other threads can use the cache in the meantime
+        factorization = factorize()
+        with self._lock:
+            self._entries[key] = factorization
+            if len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+        return factorization
+
+    def clear(self):
+        """
+        Remove all stored factorizations, e.g. when the operator changes
+        """
+        self._entries.clear()
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,184 @@
+"""
+Cache for the implicit preconditioners :math:`Q_\\Delta` of the sweepers.
+
+Some preconditioners are obtained by numerical optimization, which is expensive compared to the rest of the setup of a
+sweeper. Since the matrices depend only on the collocation and the type of preconditioner, they are memoized for the
+lifetime of the process. Additionally, they can be stored on disk to be shared between processes and runs. To this
+end, set the environment variable ``PYSDC_QDELTA_CACHE_DIR`` or the ``cache_dir`` attribute of ``Qdelta_cache`` to a
+directory. The disk cache can be filled ahead of time from the command line, for instance::
+
+    python -m pySDC.helpers.qdelta_cache --cache-dir ~/.cache/pySDC --num-nodes 2 3 4 5 --qd-types MIN MIN-SR-S
+"""
+
+import os
+import tempfile
+
+import numpy as np
+
+from pySDC.core.Problem import WorkCounter
+
+
+class QdeltaCache(object):
+    """
+    In-process memo of preconditioner matrices with optional persistent storage on disk.
+
+    Only preconditioners that need numerical optimization are stored on disk, since the others are cheaper to compute
+    than to load.
+
+    Attributes:
+        cache_dir (str): Directory for the disk cache or None to keep the matrices in memory only
+        hits (pySDC.core.Problem.WorkCounter): Counter for matrices taken from memory or disk
+        misses (pySDC.core.Problem.WorkCounter): Counter for matrices that had to be computed
+    """
+
+    persistent_types = ['MIN', 'MIN-SR-S']
+
+    def __init__(self, cache_dir=None):
+        """
+        Args:
+            cache_dir (str): Directory for the disk cache or None to keep the matrices in memory only
+        """
+        self.cache_dir = cache_dir
+        self.hits = WorkCounter()
+        self.misses = WorkCounter()
+        self._memo = {}
+
+    @staticmethod
+    def get_key(coll, qd_type):
+        """
+        Get the key identifying a preconditioner
+
+        Args:
+            coll (pySDC.core.Collocation.CollBase): Collocation object
+            qd_type (str): Type of the preconditioner
+
+        Returns:
+            tuple: Key with node type, quadrature type, number of nodes, preconditioner and interval
+        """
+        return (
+            type(coll).__name__,
+            coll.node_type,
+            coll.quad_type,
+            coll.num_nodes,
+            qd_type,
+            float(coll.tleft),
+            float(coll.tright),
+        )
+
+    def _get_path(self, key):
+        name = '_'.join(str(me) for me in key).replace('/', '-')
+        return os.path.join(self.cache_dir, f'Qdelta_{name}.npz')
+
+    def _load(self, key):
+        if self.cache_dir is None or key[4] not in self.persistent_types:
+            return None
+        try:
+            with np.load(self._get_path(key)) as data:
+                return data['QDmat'], bool(data['parallelizable'])
+        except (OSError, KeyError, ValueError):
+            return None
+
+    def _store(self, key, value):
+        if self.cache_dir is None or key[4] not in self.persistent_types:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        # write to a temporary file first such that concurrent processes never read incomplete files
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.npz')
+        try:
+            with os.fdopen(fd, 'wb') as file:
+                np.savez(file, QDmat=value[0], parallelizable=value[1])
+            os.replace(tmp_path, self._get_path(key))
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def get(self, key, compute):
+        """
+        Get a preconditioner from memory, disk or by computing it
+
+        Args:
+            key (tuple): Key as obtained from `get_key`
+            compute (callable): Function returning the preconditioner and whether it allows parallel sweeps
+
+        Returns:
+            numpy.ndarray: Copy of the preconditioner
+            bool: Whether the preconditioner allows parallel sweeps
+        """
+        if key not in self._memo.keys():
+            value = self._load(key)
+            if value is None:
+                self.misses()
+                value = compute()
+                self._store(key, value)
+            else:
+                self.hits()
+            self._memo[key] = (np.array(value[0]), value[1])
+            self._memo[key][0].flags.writeable = False
+        else:
+            self.hits()
+
+        QDmat, parallelizable = self._memo[key]
+        return QDmat.copy(), parallelizable
+
+    def clear(self):
+        """
+        Clear the in-process memo, but not the disk cache
+        """
+        self._memo = {}
+
+
+Qdelta_cache = QdeltaCache(cache_dir=os.environ.get('PYSDC_QDELTA_CACHE_DIR', None))
+
+
+def precompute(num_nodes, qd_types, node_types=None, quad_types=None):
+    """
+    Compute preconditioners for all combinations of the parameters and store them in the cache
+
+    Args:
+        num_nodes (list): Numbers of collocation nodes
+        qd_types (list): Types of preconditioners
+        node_types (list): Types of nodes, defaults to LEGENDRE
+        quad_types (list): Types of quadrature, defaults to all
+
+    Returns:
+        int: Number of preconditioners that were computed
+    """
+    from pySDC.core.Sweeper import sweeper
+
+    node_types = ['LEGENDRE'] if node_types is None else node_types
+    quad_types = ['GAUSS', 'RADAU-LEFT', 'RADAU-RIGHT', 'LOBATTO'] if quad_types is None else quad_types
+
+    misses = Qdelta_cache.misses.niter
+    for node_type in node_types:
+        for quad_type in quad_types:
+            for M in num_nodes:
+                S = sweeper({'num_nodes': M, 'node_type': node_type, 'quad_type': quad_type})
+                for qd_type in qd_types:
+                    try:
+                        S.get_Qdelta_implicit(S.coll, qd_type)
+                    except (NotImplementedError, ValueError) as error:
+                        print(f'Skipping {qd_type} for {M} {node_type} {quad_type} nodes: {error}')
+    return Qdelta_cache.misses.niter - misses
+
+
+if __name__ == '__main__':
+    from argparse import ArgumentParser
+
+    # the sweepers use the cache of the imported module rather than the one of this script
+    from pySDC.helpers import qdelta_cache
+
+    parser = ArgumentParser(description='Precompute implicit preconditioners and store them on disk')
+    parser.add_argument('--cache-dir', type=str, default=Qdelta_cache.cache_dir, help='directory of the disk cache')
+    parser.add_argument('--num-nodes', type=int, nargs='+', default=[2, 3, 4, 5], help='numbers of nodes')
+    parser.add_argument('--qd-types', type=str, nargs='+', default=QdeltaCache.persistent_types, help='preconditioners')
+    parser.add_argument('--node-types', type=str, nargs='+', default=['LEGENDRE'], help='types of nodes')
+    parser.add_argument('--quad-types', type=str, nargs='+', default=None, help='types of quadrature')
+    args = parser.parse_args()
+
+    if args.cache_dir is None:
+        parser.error('need a directory for the cache, either via --cache-dir or PYSDC_QDELTA_CACHE_DIR')
+
+    qdelta_cache.Qdelta_cache.cache_dir = args.cache_dir
+    computed = qdelta_cache.precompute(args.num_nodes, args.qd_types, args.node_types, args.quad_types)
+    print(f'Computed {computed} preconditioners and stored them in {args.cache_dir}')
@@ -0,0 +1,230 @@
+"""
+Cache for reference solutions computed with ``scipy.integrate.solve_ivp``.
+
+Problems without an analytical solution compute "exact" solutions by integrating from the initial conditions with very
+small tolerances. Hooks like ``LogGlobalError`` request these after every step, which would mean integrating from the
+initial conditions every time and cost quadratic in the number of steps. Instead, every solution that has been computed
+is kept as a checkpoint and new solutions are obtained by integrating only from the closest checkpoint before the
+requested time. This allows arbitrary query times at the full accuracy of the integrator, which is not the case when
+evaluating the interpolants of the dense output of ``solve_ivp``.
+
+The checkpoints are shared between all problem objects with identical parameters within a process. To bound the memory,
+only a limited number of trajectories is kept, evicting the least recently used one, and the checkpoints of a trajectory
+are thinned out by discarding every other one when there are too many. Additionally, the checkpoints can be stored on
+disk for reuse in later runs. To this end, set the environment variable ``PYSDC_REFERENCE_CACHE_DIR``
+or the ``cache_dir`` attribute of ``Reference_cache`` to a directory.
+"""
+
+import bisect
+import hashlib
+import os
+import tempfile
+from collections import OrderedDict
+
+import numpy as np
+
+from pySDC.core.Problem import WorkCounter
+
+
+class ReferenceTrajectory(object):
+    """
+    Checkpoints of the solution of an initial value problem with optional storage on disk, one file per checkpoint.
+
+    Attributes:
+        times (list): Sorted times of the checkpoints
+        values (list): Flattened solutions at the checkpoints
+        path (str): Directory for the checkpoints on disk or None to keep them in memory only
+        max_checkpoints (int): Maximum number of checkpoints kept in memory or None for no limit
+    """
+
+    def __init__(self, t0, u0, path=None, max_checkpoints=None):
+        """
+        Args:
+            t0 (float): Initial time
+            u0 (numpy.ndarray): Initial conditions
+            path (str): Directory for the checkpoints on disk or None to keep them in memory only
+            max_checkpoints (int): Maximum number of checkpoints kept in memory or None for no limit
+        """
+        if max_checkpoints is not None and max_checkpoints < 2:
+            raise ValueError(f'Need to keep at least two checkpoints, got {max_checkpoints}')
+        self.times = [float(t0)]
+        self.values = [np.array(u0).flatten()]
+        self.path = path
+        self.max_checkpoints = max_checkpoints
+        self._load()
+
+    def _insert(self, t, value):
+        idx = bisect.bisect_left(self.times, t)
+        if idx < len(self.times) and self.times[idx] == t:
+            return
+        self.times.insert(idx, t)
+        self.values.insert(idx, value)
+        self._thin(keep=idx)
+
+    def _thin(self, keep):
+        """
+        Discard every other checkpoint if there are too many. The initial conditions and the checkpoint with index
+        `keep`, which is usually the latest one, are always kept, such that solutions at increasing times can still be
+        computed from the previous one.
+        """
+        if self.max_checkpoints is None or len(self.times) <= self.max_checkpoints:
+            return
+        indices = [i for i in range(len(self.times)) if i % 2 == 0 or i == keep]
+        self.times = [self.times[i] for i in indices]
+        self.values = [self.values[i] for i in indices]
+
+    def _load(self):
+        if self.path is None or not os.path.isdir(self.path):
+            return
+        for name in os.listdir(self.path):
+            if not name.endswith('.npy'):
+                continue
+            try:
+                t = float.fromhex(name[:-4])
+                value = np.load(os.path.join(self.path, name))
+            except (OSError, ValueError):
+                continue
+            if value.shape == self.values[0].shape:
+                self._insert(t, value)
+
+    def _store(self, t, value):
+        if self.path is None:
+            return
+        os.makedirs(self.path, exist_ok=True)
+
+        # write to a temporary file first such that concurrent processes never read incomplete files
+        fd, tmp_path = tempfile.mkstemp(dir=self.path, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as file:
+                np.save(file, value)
+            os.replace(tmp_path, os.path.join(self.path, f'{t.hex()}.npy'))
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def get(self, eval_rhs, t, hits=None, misses=None, **kwargs):
+        """
+        Get the solution at some time, either from a checkpoint or by integrating from the closest checkpoint before
+
+        Args:
+            eval_rhs (function): Right hand side with signature `eval_rhs(float: t, numpy.1darray: u)`
+            t (float): Time of the requested solution, must not be before the initial time
+            hits (pySDC.core.Problem.WorkCounter): Counter for solutions taken from checkpoints
+            misses (pySDC.core.Problem.WorkCounter): Counter for solutions that had to be integrated
+            kwargs: Arguments for `scipy.solve_ivp`
+
+        Returns:
+            numpy.ndarray: Flattened solution
+        """
+        from scipy.integrate import solve_ivp
+
+        t = float(t)
+        idx = bisect.bisect_right(self.times, t) - 1
+        if idx < 0:
+            raise ValueError(f'Cannot compute reference solution at t={t} before the initial time {self.times[0]}')
+
+        if self.times[idx] == t:
+            if hits is not None:
+                hits()
+            return self.values[idx].copy()
+
+        if misses is not None:
+            misses()
+        value = solve_ivp(eval_rhs, (self.times[idx], t), self.values[idx], **kwargs).y[:, -1]
+        self._insert(t, value)
+        self._store(t, value)
+        return value.copy()
+
+
+class ReferenceCache(object):
+    """
+    In-process least-recently-used memo of reference trajectories with optional persistent storage on disk.
+
+    Attributes:
+        cache_dir (str): Directory for the disk cache or None to keep the trajectories in memory only
+        max_trajectories (int): Maximum number of trajectories kept in memory
+        max_checkpoints (int): Maximum number of checkpoints kept in memory per trajectory or None for no limit
+        hits (pySDC.core.Problem.WorkCounter): Counter for solutions taken from checkpoints in memory or on disk
+        misses (pySDC.core.Problem.WorkCounter): Counter for solutions that had to be integrated
+    """
+
+    def __init__(self, cache_dir=None, max_trajectories=8, max_checkpoints=64):
+        """
+        Args:
+            cache_dir (str): Directory for the disk cache or None to keep the trajectories in memory only
+            max_trajectories (int): Maximum number of trajectories kept in memory
+            max_checkpoints (int): Maximum number of checkpoints kept in memory per trajectory or None for no limit
+        """
+        if max_trajectories < 1:
+            raise ValueError(f'Need to keep at least one trajectory, got {max_trajectories}')
+        self.cache_dir = cache_dir
+        self.max_trajectories = max_trajectories
+        self.max_checkpoints = max_checkpoints
+        self.hits = WorkCounter()
+        self.misses = WorkCounter()
+        self._memo = OrderedDict()
+
+    @staticmethod
+    def get_key(problem, u0, **kwargs):
+        """
+        Get the key identifying the trajectory of a problem. It depends on the class and parameters of the problem, the
+        initial conditions and the arguments for `scipy.solve_ivp` except for functions like the Jacobian.
+
+        Args:
+            problem (pySDC.core.Problem.ptype): Problem object
+            u0 (numpy.ndarray): Initial conditions
+            kwargs: Arguments for `scipy.solve_ivp`
+
+        Returns:
+            str: Name of the problem class and hash of everything else
+        """
+        digest = hashlib.sha256()
+        digest.update(f'{type(problem).__module__}.{type(problem).__qualname__}'.encode())
+
+        items = sorted(problem.params.items()) + sorted(
+            (f'solve_ivp_{key}', value) for key, value in kwargs.items() if not callable(value)
+        )
+        items += [('u0', np.asarray(u0))]
+        for name, value in items:
+            digest.update(name.encode())
+            if isinstance(value, np.ndarray):
+                digest.update(f'{value.shape}{value.dtype}'.encode())
+                digest.update(np.ascontiguousarray(value).tobytes())
+            else:
+                digest.update(repr(value).encode())
+
+        return f'{type(problem).__name__}_{digest.hexdigest()[:32]}'
+
+    def get(self, problem, eval_rhs, t, u0, t0=0.0, **kwargs):
+        """
+        Get the reference solution of a problem
+
+        Args:
+            problem (pySDC.core.Problem.ptype): Problem object
+            eval_rhs (function): Right hand side with signature `eval_rhs(float: t, numpy.1darray: u)`
+            t (float): Time of the requested solution
+            u0 (numpy.ndarray): Initial conditions
+            t0 (float): Initial time
+            kwargs: Arguments for `scipy.solve_ivp`
+
+        Returns:
+            numpy.ndarray: Flattened solution
+        """
+        key = (self.cache_dir, float(t0), self.get_key(problem, u0, **kwargs))
+        if key in self._memo.keys():
+            self._memo.move_to_end(key)
+        else:
+            path = None if self.cache_dir is None else os.path.join(self.cache_dir, f'{key[2]}_t0={float(t0).hex()}')
+            self._memo[key] = ReferenceTrajectory(t0, u0, path=path, max_checkpoints=self.max_checkpoints)
+            while len(self._memo) > self.max_trajectories:
+                self._memo.popitem(last=False)
+        return self._memo[key].get(eval_rhs, t, hits=self.hits, misses=self.misses, **kwargs)
+
+    def clear(self):
+        """
+        Clear the in-process memo, but not the disk cache
+        """
+        self._memo = OrderedDict()
+
+
+Reference_cache = ReferenceCache(cache_dir=os.environ.get('PYSDC_REFERENCE_CACHE_DIR', None))
@@ -0,0 +1,121 @@
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from pySDC.core.Errors import CommunicationError
+
+
+class SharedMemoryBuffer(object):
+    """
+    Numpy array in shared memory that can be accessed by all processes forked after its creation.
+
+    Attributes:
+        array (numpy.ndarray): The array in shared memory
+    """
+
+    def __init__(self, template):
+        """
+        Args:
+            template (numpy.ndarray): Array of the shape and data type to store in the buffer
+        """
+        self.shm = shared_memory.SharedMemory(create=True, size=max(template.nbytes, 1))
+        self.array = np.ndarray(template.shape, dtype=template.dtype, buffer=self.shm.buf)
+
+    @staticmethod
+    def supports(value):
+        """
+        Check if values of this type can be stored in a buffer in shared memory
+
+        Args:
+            value: Some value
+
+        Returns:
+            bool: Whether the value is a numpy array
+        """
+        return isinstance(value, np.ndarray)
+
+    def close(self, unlink=False):
+        """
+        Release the shared memory
+
+        Args:
+            unlink (bool): Free the memory for all processes, which should be done only once by the creating process
+        """
+        self.array = None
+        self.shm.close()
+        if unlink:
+            self.shm.unlink()
+
+
+class SharedMemoryChannel(object):
+    """
+    One-way channel for passing values from one process to another, e.g. the solution at the end of a step to the
+    next step. Numpy arrays are copied through a buffer in shared memory and only a small message containing the tag
+    is sent through a pipe. Other values are pickled and sent through the pipe.
+
+    At most one message can be in transit at a time: Sending blocks until the previous message has been received,
+    such that the buffer is not overwritten before it is read. The channel has to be created before forking the
+    processes that use it.
+    """
+
+    def __init__(self, ctx, template=None):
+        """
+        Args:
+            ctx (multiprocessing.context.BaseContext): Multiprocessing context used for the pipe and the semaphore
+            template: Value of the type that will be sent, or None to send everything through the pipe
+        """
+        self.buffer = SharedMemoryBuffer(template) if SharedMemoryBuffer.supports(template) else None
+        self.recv_conn, self.send_conn = ctx.Pipe(duplex=False)
+        self.free = ctx.Semaphore(1)
+
+    def send(self, value, tag=None):
+        """
+        Send a value to the other process
+
+        Args:
+            value: The value to send
+            tag: Identifier of the message, which is checked by the receiving process
+        """
+        self.free.acquire()
+        if self.buffer is None:
+            self.send_conn.send((tag, value))
+        else:
+            self.buffer.array[...] = value
+            self.send_conn.send((tag, None))
+
+    def recv(self, out=None, tag=None):
+        """
+        Receive a value from the other process, waiting for it if it has not been sent yet
+
+        Args:
+            out: Array to copy values from shared memory into, or None to return a new array
+            tag: Expected identifier of the message, which is not checked if None
+
+        Returns:
+            The received value
+        """
+        received_tag, value = self.recv_conn.recv()
+        if tag is not None and received_tag != tag:
+            raise CommunicationError(f'Expected message with tag {tag}, but got {received_tag}')
+
+        if self.buffer is not None:
+            if out is None:
+                value = self.buffer.array.copy()
+            else:
+                out[...] = self.buffer.array
+                value = out
+
+        self.free.release()
+        return value
+
+    def close(self, unlink=False):
+        """
+        Release the shared memory and the pipe
+
+        Args:
+            unlink (bool): Free the shared memory for all processes, which should be done only by the creating process
+        """
+        if self.buffer is not None:
+            self.buffer.close(unlink=unlink)
+        self.recv_conn.close()
+        self.send_conn.close()
@@ -1,4 +1,113 @@
-import numpy as np
+class IndexedStats(dict):
+    """
+    Dictionary of statistics keyed by entries (see `pySDC.core.Hooks.Entry`) that maintains an index for every field of
+    the entries. The index maps each value of a field to the entries that have this value, such that filtering does not
+    require a scan over all entries, but only a lookup per field and an intersection of the matching entries. The order
+    of the entries in the index is the same as in the dictionary, which keeps the results in insertion order.
+
+    Apart from the index, this behaves like a regular dictionary and can be used wherever the stats were a `dict`.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        self._index = {}
+        self.update(*args, **kwargs)
+
+    def __reduce__(self):
+        # the index is rebuilt when unpickling or copying instead of storing it
+        return (type(self), (dict(self),))
+
+    def _add_to_index(self, key):
+        for field, value in zip(getattr(key, '_fields', ()), key):
+            self._index.setdefault(field, {}).setdefault(value, {})[key] = None
+
+    def _remove_from_index(self, key):
+        for field, value in zip(getattr(key, '_fields', ()), key):
+            matches = self._index[field][value]
+            del matches[key]
+            if len(matches) == 0:
+                del self._index[field][value]
+
+    def __setitem__(self, key, value):
+        if key not in self:
+            self._add_to_index(key)
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._remove_from_index(key)
+
+    def pop(self, key, *args):
+        if key in self:
+            self._remove_from_index(key)
+        return super().pop(key, *args)
+
+    def popitem(self):
+        key, value = super().popitem()
+        self._remove_from_index(key)
+        return key, value
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def clear(self):
+        super().clear()
+        self._index = {}
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def copy(self):
+        return type(self)(self)
+
+    def __or__(self, other):
+        result = self.copy()
+        result.update(other)
+        return result
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def unique(self, field):
+        """
+        Get all values of a field that appear in the stats
+
+        Args:
+            field (str): Name of the field
+
+        Returns:
+            list: Values in order of their first appearance
+        """
+        return list(self._index.get(field, {}).keys())
+
+    def filter_keys(self, **kwargs):
+        """
+        Get the entries whose fields match the values supplied as keyword arguments. Values of None are ignored.
+
+        Returns:
+            list: Matching entries in insertion order
+        """
+        criteria = {field: value for field, value in kwargs.items() if value is not None}
+
+        try:
+            candidates = [self._index.get(field, {}).get(value, {}) for field, value in criteria.items()]
+        except TypeError:
+            # unhashable values cannot be looked up in the index
+            return [
+                key
+                for key in self.keys()
+                if all(getattr(key, field, None) == value for field, value in criteria.items())
+            ]
+
+        if len(candidates) == 0:
+            return list(self.keys())
+
+        candidates = sorted(candidates, key=len)
+        return [key for key in candidates[0] if all(key in me for me in candidates[1:])]
 
 
 def filter_stats(stats, comm=None, recomputed=None, **kwargs):
@@ -6,37 +115,42 @@ def filter_stats(stats, comm=None, recomputed=None, **kwargs):
     Helper function to extract data from the dictionary of statistics. Please supply metadata as keyword arguments.
 
     Args:
-        stats (dict): raw statistics from a controller run
+        stats (dict): raw statistics from a controller run, converted to `IndexedStats` if it is a plain dictionary
         recomputed (bool): filter recomputed values from stats if set to anything other than None
         comm (mpi4py.MPI.Intracomm): Communicator (or None if not applicable)
 
     Returns:
-        dict: dictionary containing only the entries corresponding to the filter
+        IndexedStats: dictionary containing only the entries corresponding to the filter
     """
-    result = {}
-    for k, v in stats.items():
-        if all([k._asdict().get(k2, None) == v2 for k2, v2 in kwargs.items() if v2 is not None] + [True]):
-            result[k] = v
+    if not isinstance(stats, IndexedStats):
+        stats = IndexedStats(stats)
+
+    result = IndexedStats({key: stats[key] for key in stats.filter_keys(**kwargs)})
 
     if comm is not None:
         # gather the results across all ranks
-        result = {key: value for sub_result in comm.allgather(result) for key, value in sub_result.items()}
+        result = IndexedStats(
+            {key: value for sub_result in comm.allgather(result) for key, value in sub_result.items()}
+        )
 
     if recomputed is not None:
         # delete values that have been recorded and superseded by similar, but not identical keys
-        times_restarted = np.unique([me.time for me in result.keys() if me.num_restarts > 0])
+        times_restarted = {
+            key.time
+            for num_restarts in result.unique('num_restarts')
+            if num_restarts is not None and num_restarts > 0
+            for key in result.filter_keys(num_restarts=num_restarts)
+        }
         for t in times_restarted:
+            keys = result.filter_keys(time=t)
+
             restarts = {}
-            for me in filter_stats(result, time=t).keys():
+            for me in keys:
                 restarts[me.type] = max([restarts.get(me.type, 0), me.num_restarts])
 
-            [
-                [
-                    [result.pop(you, None) for you in filter_stats(result, time=t, type=type_, num_restarts=i).keys()]
-                    for i in range(num_restarts_)
-                ]
-                for type_, num_restarts_ in restarts.items()
-            ]
+            for me in keys:
+                if me.num_restarts < restarts[me.type]:
+                    result.pop(me)
 
         # delete values that were recorded at times that shouldn't be recorded because we performed a different step after the restart
         if kwargs.get('type', None) != '_recomputed':
@@ -44,7 +158,8 @@ def filter_stats(stats, comm=None, recomputed=None, **kwargs):
                 key for key, val in filter_stats(stats, type='_recomputed', recomputed=False, comm=comm).items() if val
             ]
             for step in other_restarted_steps:
-                [result.pop(me) for me in filter_stats(result, time=step.time).keys()]
+                for me in result.filter_keys(time=step.time):
+                    result.pop(me)
 
     return result
 
@@ -85,6 +200,9 @@ def get_list_of_types(stats):
 
     """
 
+    if isinstance(stats, IndexedStats):
+        return stats.unique('type')
+
     type_list = []
     for k, _ in stats.items():
         if k.type not in type_list:
@@ -569,8 +569,38 @@ class controller_MPI(controller):
             self.S.levels[0].sweep.update_nodes()
 
         elif self.params.predict_type == 'fmg':
-            # TODO: implement FMG predictor
-            raise NotImplementedError('FMG predictor is not yet implemented')
+            # restrict to coarsest level
+            for l in range(1, len(self.S.levels)):
+                self.S.transfer(source=self.S.levels[l - 1], target=self.S.levels[l])
+
+            # solve serially across the block on the coarsest level by waiting for the end point of the previous step
+            self.recv_full(comm=comm, level=len(self.S.levels) - 1)
+            if self.S.status.force_done:
+                return None
+
+            # do the sweep with new values
+            self.S.levels[-1].sweep.update_nodes()
+
+            self.send_full(comm=comm, blocking=True, level=len(self.S.levels) - 1, add_to_stats=True)
+            if self.S.status.force_done:
+                return None
+
+            # go back to finest level, sweeping on every level
+            for l in range(len(self.S.levels) - 1, 0, -1):
+                # interpolate to the next finer level
+                self.S.transfer(source=self.S.levels[l], target=self.S.levels[l - 1])
+
+                self.send_full(comm=comm, level=l - 1)
+                if self.S.status.force_done:
+                    return None
+
+                self.recv_full(comm=comm, level=l - 1)
+                if self.S.status.force_done:
+                    return None
+
+                # do the sweeps on intermediate levels and end with a single fine sweep
+                for _ in range(self.S.levels[l - 1].params.nsweeps if l > 1 else 1):
+                    self.S.levels[l - 1].sweep.update_nodes()
 
         else:
             raise ControllerError('Wrong predictor type, got %s' % self.params.predict_type)
@@ -0,0 +1,478 @@
+import itertools
+import multiprocessing
+import traceback
+from multiprocessing.connection import wait
+
+import numpy as np
+
+from pySDC.core.Errors import ControllerError
+from pySDC.helpers.shared_memory_channel import SharedMemoryBuffer, SharedMemoryChannel
+from pySDC.implementations.controller_classes.controller_nonMPI import controller_nonMPI
+from pySDC.implementations.convergence_controller_classes.basic_restarting import BasicRestartingNonMPI
+from pySDC.implementations.convergence_controller_classes.check_convergence import CheckConvergence
+from pySDC.implementations.convergence_controller_classes.spread_step_sizes import SpreadStepSizesBlockwiseNonMPI
+
+
+class controller_multiprocessing(controller_nonMPI):
+    """
+
+    PFASST controller, running the steps of a block in parallel in separate processes on a single machine
+
+    Every step is run by its own worker process, which is forked when calling `run`. The workers go through the same
+    stages as the steps in `controller_nonMPI`, but only for their own step. Values are passed between neighbouring steps
+    through buffers in shared memory, with pipes only for synchronization and small messages, such as the convergence
+    status. This gives real parallelism in time without MPI.
+
+    Restrictions:
+        - The 'fork' start method of `multiprocessing` is required, which is not available on Windows.
+        - Only the default convergence controllers are supported, i.e. no adaptivity or restarts.
+        - Spatial parallelization with MPI cannot be combined with this controller.
+        - Only the solution at the end and the statistics are passed back to the main process. The steps in `self.MS`
+          are not updated by `run`.
+
+    """
+
+    supported_convergence_controllers = (CheckConvergence, BasicRestartingNonMPI, SpreadStepSizesBlockwiseNonMPI)
+
+    def __init__(self, num_procs, controller_params, description):
+        """
+        Initialization routine for the multiprocessing PFASST controller
+
+        Args:
+           num_procs: number of parallel time steps, each running in its own process, can be 1
+           controller_params: parameter set for the controller and the steps
+           description: all the parameters to set up the rest (levels, problems, transfer, ...)
+        """
+
+        if 'fork' not in multiprocessing.get_all_start_methods():
+            raise ControllerError('The multiprocessing controller needs the \'fork\' start method')
+
+        # call parent's initialization routine
+        super().__init__(num_procs=num_procs, controller_params=controller_params, description=description)
+
+        for C in self.convergence_controllers:
+            if not isinstance(C, self.supported_convergence_controllers):
+                raise ControllerError(f'Convergence controller {type(C).__name__} is not supported by this controller')
+
+        self.ctx = multiprocessing.get_context('fork')
+
+        # rank of the worker process, which is None in the main process
+        self.rank = None
+
+        self.workers = []
+        self.conns = []
+        self.channels = []
+        self.done_forward = []
+        self.done_backward = []
+        self.u0_buffer = None
+
+    def run(self, u0, t0, Tend):
+        """
+        Main driver for running SDC, MSSDC, MLSDC and PFASST with the steps of a block in parallel processes
+
+        Args:
+           u0: initial values
+           t0: starting time
+           Tend: ending time
+
+        Returns:
+            end values on the finest level
+            stats object containing statistics for each step, each level and each iteration
+        """
+
+        # some initializations and reset of statistics
+        num_procs = len(self.MS)
+        for hook in self.hooks:
+            hook.reset_stats()
+
+        # initial ordering of the steps: 0,1,...,Np-1
+        slots = list(range(num_procs))
+
+        # initialize time variables of each step
+        time = [t0 + sum(self.MS[j].dt for j in range(p)) for p in slots]
+
+        # determine which steps are still active (time < Tend)
+        active = [time[p] < Tend - 10 * np.finfo(float).eps for p in slots]
+
+        if not any(active):
+            raise ControllerError('Nothing to do, check t0, dt and Tend.')
+
+        # compress slots according to active steps, i.e. remove all steps which have times above Tend
+        active_slots = list(itertools.compress(slots, active))
+
+        # the steps in the main process keep track of the times and step sizes of the blocks only
+        self.restart_block(active_slots, time, u0)
+
+        # the first block starts from u0, every other block from the solution at the end of the previous one
+        uend = u0
+
+        self.setup_communication()
+        try:
+            self.start_workers()
+
+            for hook in self.hooks:
+                hook.post_setup(step=None, level_number=None)
+
+            # main loop: as long as at least one step is still active (time < Tend), do something
+            while any(active):
+                MS_active = [self.MS[p] for p in active_slots]
+
+                uend = self.run_block(active_slots, time, uend)
+
+                # initial condition for next block is last solution of current block
+                time[active_slots[0]] = time[active_slots[-1]] + self.MS[active_slots[-1]].dt
+
+                for S in MS_active:
+                    for C in [self.convergence_controllers[i] for i in self.convergence_controller_order]:
+                        C.post_step_processing(self, S, MS=MS_active)
+
+                for C in [self.convergence_controllers[i] for i in self.convergence_controller_order]:
+                    [C.prepare_next_block(self, S, len(active_slots), time, Tend, MS=MS_active) for S in self.MS]
+
+                # setup the times of the steps for the next block
+                for i in range(1, len(active_slots)):
+                    time[active_slots[i]] = time[active_slots[i] - 1] + self.MS[active_slots[i] - 1].dt
+
+                # determine new set of active steps and compress slots accordingly
+                active = [time[p] < Tend - 10 * np.finfo(float).eps for p in slots]
+                active_slots = list(itertools.compress(slots, active))
+
+                self.restart_block(active_slots, time, uend)
+
+            # stop the workers, which call the post-run hook and return their statistics
+            worker_stats = self.gather(slots, [None] * num_procs)
+        except BaseException:
+            # workers may wait for messages that never come
+            self.stop_workers(terminate=True)
+            raise
+        finally:
+            self.stop_workers()
+            self.close_communication()
+
+        stats = self.return_stats()
+        for me in worker_stats:
+            stats.update(me)
+
+        return uend, stats
+
+    def setup_communication(self):
+        """
+        Allocate shared memory and pipes for the communication between the steps, which is inherited by the workers
+        """
+        num_procs = len(self.MS)
+
+        # one channel per level from each step to the next one
+        self.channels = [
+            [SharedMemoryChannel(self.ctx, template=L.prob.u_init) for L in self.MS[p].levels]
+            for p in range(num_procs - 1)
+        ]
+
+        # the convergence status is sent forward to the next step and, for `all_to_done`, backward again
+        self.done_forward = [SharedMemoryChannel(self.ctx) for _ in range(num_procs - 1)]
+        self.done_backward = [SharedMemoryChannel(self.ctx) for _ in range(num_procs - 1)]
+
+        # initial conditions of the blocks and the solution at the end are exchanged with the main process here
+        u_init = self.MS[0].levels[0].prob.u_init
+        self.u0_buffer = SharedMemoryBuffer(u_init) if SharedMemoryBuffer.supports(u_init) else None
+
+    def close_communication(self):
+        """
+        Free the shared memory and close the pipes for communication between the steps
+        """
+        for channel in itertools.chain(*self.channels, self.done_forward, self.done_backward):
+            channel.close(unlink=self.rank is None)
+        if self.u0_buffer is not None:
+            self.u0_buffer.close(unlink=self.rank is None)
+
+        self.channels = []
+        self.done_forward = []
+        self.done_backward = []
+        self.u0_buffer = None
+
+    def start_workers(self):
+        """
+        Fork one worker process per step
+        """
+        for rank in range(len(self.MS)):
+            conn, worker_conn = self.ctx.Pipe()
+            worker = self.ctx.Process(target=self.work, args=(rank, worker_conn), daemon=True)
+            worker.start()
+            worker_conn.close()
+
+            self.workers.append(worker)
+            self.conns.append(conn)
+
+    def stop_workers(self, terminate=False):
+        """
+        Wait for the workers to finish or terminate them if they are still running
+
+        Args:
+            terminate (bool): terminate the workers right away, e.g. after an error
+        """
+        for worker in self.workers:
+            worker.join(timeout=0 if terminate else 1)
+            if worker.is_alive():
+                worker.terminate()
+                worker.join()
+        for conn in self.conns:
+            conn.close()
+
+        self.workers = []
+        self.conns = []
+
+    def gather(self, ranks, tasks):
+        """
+        Send tasks to workers and wait for all of them to reply
+
+        Args:
+            ranks (list): ranks of the workers
+            tasks (list): the tasks for the workers
+
+        Returns:
+            list: replies of the workers
+        """
+        for rank, task in zip(ranks, tasks):
+            self.conns[rank].send(task)
+
+        replies = {}
+        waiting = {self.conns[rank]: rank for rank in ranks}
+        sentinels = {self.workers[rank].sentinel: rank for rank in ranks}
+        while len(waiting) > 0:
+            for ready in wait(list(waiting.keys()) + list(sentinels.keys())):
+                if ready in waiting.keys():
+                    rank = waiting.pop(ready)
+                    sentinels.pop(self.workers[rank].sentinel)
+                    status, replies[rank] = ready.recv()
+                    if status == 'error':
+                        raise ControllerError(f'Worker process {rank} failed with:\n{replies[rank]}')
+                elif ready in sentinels.keys() and not self.conns[sentinels[ready]].poll():
+                    raise ControllerError(f'Worker process {sentinels[ready]} terminated unexpectedly')
+
+        return [replies[rank] for rank in ranks]
+
+    def run_block(self, active_slots, time, u0):
+        """
+        Run a block of steps in the worker processes
+
+        Args:
+            active_slots: list of active steps
+            time: list of times of the steps
+            u0: initial value of the block
+
+        Returns:
+            end values on the finest level
+        """
+        if self.u0_buffer is not None:
+            self.u0_buffer.array[...] = u0
+            u0 = None
+
+        # pass the step sizes as well, since they may have changed between blocks
+        dt = [[L.params.dt for L in S.levels] for S in self.MS]
+        replies = self.gather(active_slots, [(active_slots, time, dt, u0)] * len(active_slots))
+
+        uend = replies[-1]
+        if self.u0_buffer is not None:
+            P = self.MS[active_slots[-1]].levels[0].prob
+            uend = P.dtype_u(P.init)
+            uend[...] = self.u0_buffer.array
+        return uend
+
+    def work(self, rank, conn):
+        """
+        Main function of the worker processes, which run a single step in every block until they are told to stop
+
+        Args:
+            rank (int): index of the step run by this worker
+            conn (multiprocessing.connection.Connection): connection to the main process
+        """
+        self.rank = rank
+        S = self.MS[rank]
+
+        try:
+            for hook in self.hooks:
+                hook.pre_run(step=S, level_number=0)
+
+            while True:
+                task = conn.recv()
+                if task is None:
+                    break
+                conn.send(('done', self.work_block(S, *task)))
+
+            for hook in self.hooks:
+                hook.post_run(step=S, level_number=0)
+
+            conn.send(('done', self.return_stats()))
+        except Exception:
+            conn.send(('error', traceback.format_exc()))
+        finally:
+            conn.close()
+
+    def work_block(self, S, active_slots, time, dt, u0):
+        """
+        Run the own step in a block in a worker process
+
+        Args:
+            S: the step of this worker
+            active_slots: list of active steps
+            time: list of times of the steps
+            dt: list of step sizes on all levels of all steps
+            u0: initial value of the block, or None if it is passed in shared memory
+
+        Returns:
+            the solution at the end of the block from the last step if it cannot be passed in shared memory, else None
+        """
+        if u0 is None:
+            P = S.levels[0].prob
+            u0 = P.dtype_u(P.init)
+            u0[...] = self.u0_buffer.array
+
+        for T, dt_T in zip(self.MS, dt):
+            for L, dt_L in zip(T.levels, dt_T):
+                L.params.dt = dt_L
+
+        # the other steps are only set up for consistency and are not run here
+        self.restart_block(active_slots, time, u0)
+
+        done = False
+        while not done:
+            done = self.pfasst([S])
+
+        if S.status.restart:
+            raise ControllerError('Restarting steps is not supported by the multiprocessing controller')
+
+        if S.status.last:
+            # the solution is copied into shared memory only now, because all steps have read the initial value already
+            if self.u0_buffer is not None:
+                self.u0_buffer.array[...] = S.levels[0].uend
+            else:
+                return S.levels[0].uend
+        return None
+
+    def send_full(self, S, level=None, add_to_stats=False):
+        """
+        Function to perform the send, including bookkeeping and logging
+
+        Args:
+            S: the current step
+            level: the level number
+            add_to_stats: a flag to end recording data in the hooks (defaults to False)
+        """
+        if self.rank is None:
+            return super().send_full(S, level=level, add_to_stats=add_to_stats)
+
+        for hook in self.hooks:
+            hook.pre_comm(step=S, level_number=level)
+        if not S.status.last:
+            self.logger.debug(
+                'Process %2i provides data on level %2i with tag %s' % (S.status.slot, level, S.status.iter)
+            )
+            S.levels[level].sweep.compute_end_point()
+            self.channels[S.status.slot][level].send(S.levels[level].uend, tag=(level, S.status.iter, S.status.slot))
+
+        for hook in self.hooks:
+            hook.post_comm(step=S, level_number=level, add_to_stats=add_to_stats)
+
+    def recv_full(self, S, level=None, add_to_stats=False):
+        """
+        Function to perform the recv, including bookkeeping and logging
+
+        Args:
+            S: the current step
+            level: the level number
+            add_to_stats: a flag to end recording data in the hooks (defaults to False)
+        """
+        if self.rank is None:
+            return super().recv_full(S, level=level, add_to_stats=add_to_stats)
+
+        for hook in self.hooks:
+            hook.pre_comm(step=S, level_number=level)
+        if not S.status.prev_done and not S.status.first:
+            self.logger.debug(
+                'Process %2i receives from %2i on level %2i with tag %s'
+                % (S.status.slot, S.status.slot - 1, level, S.status.iter)
+            )
+            L = S.levels[level]
+            L.u[0] = self.channels[S.status.slot - 1][level].recv(
+                out=L.prob.dtype_u(L.prob.init), tag=(level, S.status.iter, S.status.slot - 1)
+            )
+            # re-evaluate f on left interval boundary
+            L.f[0] = L.prob.eval_f(L.u[0], L.time)
+        for hook in self.hooks:
+            hook.post_comm(step=S, level_number=level, add_to_stats=add_to_stats)
+
+    def coarse_burnin(self, local_MS_running):
+        """
+        Burn-in of the PFASST predictor on the coarsest level, where step p does p + 1 sweeps
+
+        Args:
+            local_MS_running (list): list of currently running steps
+        """
+        if self.rank is None:
+            return super().coarse_burnin(local_MS_running)
+
+        for S in local_MS_running:
+            for q in range(S.status.slot + 1):
+                # do the sweep with new values
+                S.levels[-1].sweep.update_nodes()
+
+                # send updated values on coarsest level
+                self.send_full(S, level=len(S.levels) - 1)
+
+                # receive values sent during previous sweep
+                if q < S.status.slot:
+                    self.recv_full(S, level=len(S.levels) - 1, add_to_stats=S.status.last)
+
+    def is_running_alone(self, S, local_MS_running):
+        """
+        Check if a step is the only one in the block that is still running
+
+        Args:
+            S: the current step
+            local_MS_running (list): list of currently running steps
+
+        Returns:
+            bool: Whether no other step is running
+        """
+        if self.rank is None:
+            return super().is_running_alone(S, local_MS_running)
+
+        # steps finish in order, so the last step runs alone once its predecessor is done
+        return S.status.last and (S.status.first or S.status.prev_done)
+
+    def communicate_convergence(self, S, local_MS_running):
+        """
+        A step is done only if the previous step is done as well or, if `all_to_done` is set, if all steps are done
+
+        Args:
+            S: the current step
+            local_MS_running (list): list of currently running steps
+        """
+        if self.rank is None:
+            return super().communicate_convergence(S, local_MS_running)
+
+        slot = S.status.slot
+        if not S.status.first:
+            for hook in self.hooks:
+                hook.pre_comm(step=S, level_number=0)
+            # a finished step does not send anymore, but stays done
+            if not S.status.prev_done:
+                S.status.prev_done = self.done_forward[slot - 1].recv(tag=(S.status.iter, slot - 1))
+            for hook in self.hooks:
+                hook.post_comm(step=S, level_number=0, add_to_stats=True)
+            S.status.done = S.status.done and S.status.prev_done
+
+        # with `all_to_done`, the status sent forward is the status of all steps up to this one
+        if not S.status.last:
+            self.done_forward[slot].send(S.status.done, tag=(S.status.iter, slot))
+
+        if self.params.all_to_done:
+            for hook in self.hooks:
+                hook.pre_comm(step=S, level_number=0)
+            # the last step knows the status of all steps and sends it back through the block
+            if not S.status.last:
+                S.status.done = self.done_backward[slot].recv(tag=(S.status.iter, slot + 1))
+            if not S.status.first:
+                self.done_backward[slot - 1].send(S.status.done, tag=(S.status.iter, slot))
+                S.status.prev_done = S.status.done
+            for hook in self.hooks:
+                hook.post_comm(step=S, level_number=0, add_to_stats=True)
@@ -424,23 +424,8 @@ class controller_nonMPI(controller):
                 for l in range(1, len(S.levels)):
                     S.transfer(source=S.levels[l - 1], target=S.levels[l])
 
-            # loop over all steps
-            for q in range(len(local_MS_running)):
-                # loop over last steps: [1,2,3,4], [2,3,4], [3,4], [4]
-                for p in range(q, len(local_MS_running)):
-                    S = local_MS_running[p]
-
-                    # do the sweep with new values
-                    S.levels[-1].sweep.update_nodes()
-
-                    # send updated values on coarsest level
-                    self.send_full(S, level=len(S.levels) - 1)
-
-                # loop over last steps: [2,3,4], [3,4], [4]
-                for p in range(q + 1, len(local_MS_running)):
-                    S = local_MS_running[p]
-                    # receive values sent during previous sweep
-                    self.recv_full(S, level=len(S.levels) - 1, add_to_stats=(p == len(local_MS_running) - 1))
+            # sweep on the coarsest level
+            self.coarse_burnin(local_MS_running)
 
             # loop over all steps
             for S in local_MS_running:
@@ -458,8 +443,38 @@ class controller_nonMPI(controller):
                 S.levels[0].sweep.update_nodes()
 
         elif self.params.predict_type == 'fmg':
-            # TODO: implement FMG predictor
-            raise NotImplementedError('FMG predictor is not yet implemented')
+            # loop over all steps
+            for S in local_MS_running:
+                # restrict to coarsest level
+                for l in range(1, len(S.levels)):
+                    S.transfer(source=S.levels[l - 1], target=S.levels[l])
+
+            # solve serially across the block on the coarsest level
+            for S in local_MS_running:
+                # receive end point of the previous step
+                self.recv_full(S, level=len(S.levels) - 1)
+
+                # do the sweep with new values
+                S.levels[-1].sweep.update_nodes()
+
+                # send updated values on coarsest level
+                self.send_full(S, level=len(S.levels) - 1, add_to_stats=S.status.last)
+
+            # go back to finest level, sweeping on every level
+            for l in range(self.nlevels - 1, 0, -1):
+                for S in local_MS_running:
+                    # interpolate to the next finer level
+                    S.transfer(source=S.levels[l], target=S.levels[l - 1])
+
+                    # send updated values forward
+                    self.send_full(S, level=l - 1)
+                    # receive values
+                    self.recv_full(S, level=l - 1)
+
+                # do the sweeps on intermediate levels and end with a single fine sweep
+                for S in local_MS_running:
+                    for _ in range(self.nsweeps[l - 1] if l > 1 else 1):
+                        S.levels[l - 1].sweep.update_nodes()
 
         else:
             raise ControllerError('Wrong predictor type, got %s' % self.params.predict_type)
@@ -472,6 +487,32 @@ class controller_nonMPI(controller):
             # update stage
             S.status.stage = 'IT_CHECK'
 
+    def coarse_burnin(self, local_MS_running):
+        """
+        Burn-in of the PFASST predictor on the coarsest level, where step p does p + 1 sweeps
+
+        Args:
+            local_MS_running (list): list of currently running steps
+        """
+
+        # loop over all steps
+        for q in range(len(local_MS_running)):
+            # loop over last steps: [1,2,3,4], [2,3,4], [3,4], [4]
+            for p in range(q, len(local_MS_running)):
+                S = local_MS_running[p]
+
+                # do the sweep with new values
+                S.levels[-1].sweep.update_nodes()
+
+                # send updated values on coarsest level
+                self.send_full(S, level=len(S.levels) - 1)
+
+            # loop over last steps: [2,3,4], [3,4], [4]
+            for p in range(q + 1, len(local_MS_running)):
+                S = local_MS_running[p]
+                # receive values sent during previous sweep
+                self.recv_full(S, level=len(S.levels) - 1, add_to_stats=(p == len(local_MS_running) - 1))
+
     def it_check(self, local_MS_running):
         """
         Key routine to check for convergence/termination
@@ -480,6 +521,9 @@ class controller_nonMPI(controller):
             local_MS_running (list): list of currently running steps
         """
 
+        # MSSDC continues like SDC once a single step is left running
+        running_alone = [self.is_running_alone(S, local_MS_running) for S in local_MS_running]
+
         for S in local_MS_running:
             # send updated values forward
             self.send_full(S, level=0)
@@ -498,21 +542,8 @@ class controller_nonMPI(controller):
                 C.post_iteration_processing(self, S, MS=local_MS_running)
                 C.convergence_control(self, S, MS=local_MS_running)
 
-        for S in local_MS_running:
-            if not S.status.first:
-                for hook in self.hooks:
-                    hook.pre_comm(step=S, level_number=0)
-                S.status.prev_done = S.prev.status.done  # "communicate"
-                for hook in self.hooks:
-                    hook.post_comm(step=S, level_number=0, add_to_stats=True)
-                S.status.done = S.status.done and S.status.prev_done
-
-            if self.params.all_to_done:
-                for hook in self.hooks:
-                    hook.pre_comm(step=S, level_number=0)
-                S.status.done = all(T.status.done for T in local_MS_running)
-                for hook in self.hooks:
-                    hook.post_comm(step=S, level_number=0, add_to_stats=True)
+        for S, alone in zip(local_MS_running, running_alone):
+            self.communicate_convergence(S, local_MS_running)
 
             if not S.status.done:
                 # increment iteration count here (and only here)
@@ -525,7 +556,7 @@ class controller_nonMPI(controller):
                 if len(S.levels) > 1:  # MLSDC or PFASST
                     S.status.stage = 'IT_DOWN'
                 else:  # SDC or MSSDC
-                    if len(local_MS_running) == 1 or self.params.mssdc_jac:  # SDC or parallel MSSDC (Jacobi-like)
+                    if alone or self.params.mssdc_jac:  # SDC or parallel MSSDC (Jacobi-like)
                         S.status.stage = 'IT_FINE'
                     else:
                         S.status.stage = 'IT_COARSE'  # serial MSSDC (Gauss-like)
@@ -538,6 +569,42 @@ class controller_nonMPI(controller):
         for C in [self.convergence_controllers[i] for i in self.convergence_controller_order]:
             C.reset_buffers_nonMPI(self)
 
+    def is_running_alone(self, S, local_MS_running):
+        """
+        Check if a step is the only one in the block that is still running
+
+        Args:
+            S: the current step
+            local_MS_running (list): list of currently running steps
+
+        Returns:
+            bool: Whether no other step is running
+        """
+        return len(local_MS_running) == 1
+
+    def communicate_convergence(self, S, local_MS_running):
+        """
+        A step is done only if the previous step is done as well or, if `all_to_done` is set, if all steps are done
+
+        Args:
+            S: the current step
+            local_MS_running (list): list of currently running steps
+        """
+        if not S.status.first:
+            for hook in self.hooks:
+                hook.pre_comm(step=S, level_number=0)
+            S.status.prev_done = S.prev.status.done  # "communicate"
+            for hook in self.hooks:
+                hook.post_comm(step=S, level_number=0, add_to_stats=True)
+            S.status.done = S.status.done and S.status.prev_done
+
+        if self.params.all_to_done:
+            for hook in self.hooks:
+                hook.pre_comm(step=S, level_number=0)
+            S.status.done = all(T.status.done for T in local_MS_running)
+            for hook in self.hooks:
+                hook.post_comm(step=S, level_number=0, add_to_stats=True)
+
     def it_fine(self, local_MS_running):
         """
         Fine sweeps
@@ -1,3 +1,5 @@
+from contextlib import contextmanager
+
 import numpy as np
 
 from pySDC.core.Errors import DataError
@@ -16,10 +18,17 @@ class mesh(np.ndarray):
     Numpy-based datatype for serial or parallel meshes.
     Can include a communicator and expects a dtype to allow complex data.
 
+    By default, in-place operations like ``u += v`` allocate a new mesh that replaces ``u``. With in-place arithmetic
+    switched on (see `in_place_arithmetic`), the result is written into the memory of ``u`` instead. Be aware that this
+    also changes every other reference to ``u``, which is why it is not the default.
+
     Attributes:
         _comm: MPI communicator or None
+        in_place (bool): Class wide switch for writing results of in-place operations into the existing memory
     """
 
+    in_place = False
+
     def __new__(cls, init, val=0.0, offset=0, buffer=None, strides=None, order=None):
         """
         Instantiates new datatype. This ensures that even when manipulating data, the result is still a mesh.
@@ -67,24 +76,53 @@ class mesh(np.ndarray):
             return
         self._comm = getattr(obj, '_comm', None)
 
+    def __setstate__(self, state):
+        """
+        Restore the data when unpickling. Communicators cannot be pickled, so unpickled meshes have none.
+        """
+        super().__setstate__(state)
+        self._comm = None
+
     def __array_ufunc__(self, ufunc, method, *inputs, out=None, **kwargs):
         """
         Overriding default ufunc, cf. https://numpy.org/doc/stable/user/basics.subclassing.html#array-ufunc-for-ufuncs
         """
         args = []
         comm = None
-        for _, input_ in enumerate(inputs):
+        for input_ in inputs:
             if isinstance(input_, mesh):
                 args.append(input_.view(np.ndarray))
                 comm = input_.comm
             else:
                 args.append(input_)
 
+        if out is not None and mesh.in_place and all(getattr(me, '_comm', comm) == comm for me in out):
+            # fast path: the output has the communicator of the inputs already, so no need to wrap the result
+            kwargs['out'] = tuple(me.view(np.ndarray) if isinstance(me, mesh) else me for me in out)
+            super(mesh, self).__array_ufunc__(ufunc, method, *args, **kwargs)
+            return out[0] if len(out) == 1 else out
+
         results = super(mesh, self).__array_ufunc__(ufunc, method, *args, **kwargs).view(type(self))
         if type(self) == type(results):
             results._comm = comm
         return results
 
+    @classmethod
+    @contextmanager
+    def in_place_arithmetic(cls, enabled=True):
+        """
+        Context manager for switching in-place arithmetic on or off temporarily for all meshes
+
+        Args:
+            enabled (bool): Write the results of in-place operations into the existing memory or not
+        """
+        previous = mesh.in_place
+        mesh.in_place = enabled
+        try:
+            yield
+        finally:
+            mesh.in_place = previous
+
     def __abs__(self):
         """
         Overloading the abs operator
@@ -106,6 +144,32 @@ class mesh(np.ndarray):
 
         return float(global_absval)
 
+    @staticmethod
+    def batched_abs(values):
+        """
+        Absolute maxima of a number of meshes, which are computed with a single reduction if the meshes are
+        distributed
+
+        Args:
+            values (list of mesh): The meshes
+
+        Returns:
+            list of float: absolute maxima of the meshes
+        """
+        comm = values[0].comm
+        if any(type(me).__abs__ is not mesh.__abs__ or me.comm is not comm for me in values):
+            return [abs(me) for me in values]
+
+        local_absval = np.array([np.amax(np.ndarray.__abs__(me)) for me in values], dtype=float)
+
+        if comm is not None and comm.Get_size() > 1:
+            global_absval = np.empty_like(local_absval)
+            comm.Allreduce(local_absval, global_absval, op=MPI.MAX)
+        else:
+            global_absval = local_absval
+
+        return [float(me) for me in global_absval]
+
     def isend(self, dest=None, tag=None, comm=None):
         """
         Routine for sending data forward in time (non-blocking)
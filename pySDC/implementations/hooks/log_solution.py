@@ -1,6 +1,8 @@
 from pySDC.core.Hooks import hooks
-import pickle
+import json
 import os
+import queue
+import threading
 import numpy as np
 
 
@@ -68,9 +70,213 @@ class LogSolutionAfterIteration(hooks):
         )
 
 
+class StreamWriter(object):
+    """
+    Append-only writer storing records of fixed-size numerical fields in one binary file per field.
+
+    Each record is a dictionary mapping field names to scalars or arrays. Shape and dtype of the fields are taken from
+    the first record and are stored in a json file next to the data. Records are buffered and written in chunks, by
+    default asynchronously in a background thread. Use `StreamReader` to access the data.
+    """
+
+    def __init__(self, prefix, chunk_size=64, asynchronous=True):
+        """
+        Args:
+            prefix (str): Path and file name without extension of the files to write
+            chunk_size (int): Number of records that are written at once
+            asynchronous (bool): Write in a background thread or not
+        """
+        self.prefix = prefix
+        self.chunk_size = chunk_size
+        self.asynchronous = asynchronous
+
+        self.fields = None
+        self._buffer = []
+        self._queue = None
+        self._thread = None
+        self._error = None
+
+        # start with an empty container
+        for path in StreamReader.get_paths(prefix):
+            os.remove(path)
+
+    def append(self, record):
+        """
+        Add a record. The data is copied, so it can be changed after this call.
+
+        Args:
+            record (dict): Values of the fields
+        """
+        self._raise_error()
+
+        if self.fields is None:
+            self.fields = {
+                key: {'shape': list(np.shape(value)), 'dtype': np.asarray(value).dtype.str}
+                for key, value in record.items()
+            }
+            for key, value in record.items():
+                if np.asarray(value).dtype.hasobject:
+                    raise TypeError(f'Can only stream numerical data, but field {key!r} has type {type(value)}')
+            with open(f'{self.prefix}.json', 'w') as file:
+                json.dump({'fields': self.fields}, file)
+
+        self._buffer.append({key: np.array(record[key], dtype=self.fields[key]['dtype']) for key in self.fields.keys()})
+        if len(self._buffer) >= self.chunk_size:
+            self._submit()
+
+    def _submit(self):
+        """
+        Pass the buffered records on for writing
+        """
+        if len(self._buffer) == 0:
+            return
+
+        chunk, self._buffer = self._buffer, []
+        if self.asynchronous:
+            if self._thread is None:
+                self._queue = queue.Queue()
+                self._thread = threading.Thread(target=self._work, daemon=True)
+                self._thread.start()
+            self._queue.put(chunk)
+        else:
+            self._write(chunk)
+
+    def _work(self):
+        """
+        Write chunks from the queue until receiving None
+        """
+        while True:
+            chunk = self._queue.get()
+            try:
+                if chunk is not None and self._error is None:
+                    self._write(chunk)
+            except Exception as error:
+                self._error = error
+            finally:
+                self._queue.task_done()
+            if chunk is None:
+                break
+
+    def _write(self, chunk):
+        """
+        Append a chunk of records to the files of the fields
+        """
+        for key in self.fields.keys():
+            with open(f'{self.prefix}_{key}.bin', 'ab') as file:
+                file.write(np.stack([record[key] for record in chunk]).tobytes())
+
+    def _raise_error(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def flush(self):
+        """
+        Write all buffered records and wait until they are on disk
+        """
+        self._submit()
+        if self._thread is not None:
+            self._queue.join()
+        self._raise_error()
+
+    def close(self):
+        """
+        Write all buffered records and stop the background thread. Appending more records afterwards starts a new one.
+        """
+        self.flush()
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+
+class StreamReader(object):
+    """
+    Lazy random access to the data written by `StreamWriter`. The fields are memory-mapped, so only the records that
+    are accessed are read from disk. Records that are only partially written are ignored.
+
+    Attributes:
+        fields (dict): Memory-mapped arrays of the fields with the record index as first dimension
+    """
+
+    def __init__(self, prefix):
+        """
+        Args:
+            prefix (str): Path and file name without extension of the files
+        """
+        with open(f'{prefix}.json', 'r') as file:
+            meta = json.load(file)
+
+        self.fields = {}
+        for key, field in meta['fields'].items():
+            path = f'{prefix}_{key}.bin'
+            shape = tuple(field['shape'])
+            dtype = np.dtype(field['dtype'])
+
+            record_size = int(np.prod(shape)) * dtype.itemsize
+            num_records = os.path.getsize(path) // record_size if os.path.isfile(path) else 0
+            if num_records > 0:
+                self.fields[key] = np.memmap(path, dtype=dtype, mode='r', shape=(num_records, *shape))
+            else:
+                self.fields[key] = np.zeros((0, *shape), dtype=dtype)
+
+        self._len = min(len(me) for me in self.fields.values()) if self.fields else 0
+
+    @staticmethod
+    def get_paths(prefix):
+        """
+        Get the paths of all existing files belonging to a container
+
+        Args:
+            prefix (str): Path and file name without extension of the files
+
+        Returns:
+            list: Paths of the files
+        """
+        if not os.path.isfile(f'{prefix}.json'):
+            return []
+        with open(f'{prefix}.json', 'r') as file:
+            keys = json.load(file)['fields'].keys()
+        return [f'{prefix}.json'] + [f'{prefix}_{key}.bin' for key in keys if os.path.isfile(f'{prefix}_{key}.bin')]
+
+    def __len__(self):
+        return self._len
+
+    def __getitem__(self, index):
+        """
+        Get a single record
+
+        Args:
+            index (int): Index of the record
+
+        Returns:
+            dict: Values of the fields
+        """
+        if not -len(self) <= index < len(self):
+            raise IndexError(f'Index {index} out of range for {len(self)} records')
+        index = index % len(self)
+        return {
+            key: np.array(value[index]) if np.ndim(value[index]) > 0 else value[index][()]
+            for key, value in self.fields.items()
+        }
+
+    def get_index(self, value, key='t'):
+        """
+        Get the index of the record with the value of a scalar field closest to a given value, e.g. for time.
+
+        Args:
+            value (float): The value to look for
+            key (str): Name of the field
+
+        Returns:
+            int: Index of the record
+        """
+        return int(np.argmin(np.abs(self.fields[key][: len(self)] - value)))
+
+
 class LogToFile(hooks):
     r"""
-    Hook for logging the solution to file after the step using pickle.
+    Hook for logging the solution to file after the step.
 
     Please configure the hook to your liking by manipulating class attributes.
     You must set a custom path to a directory like so:
@@ -80,18 +286,19 @@ class LogToFile(hooks):
     ```
 
     Keep in mind that the hook will overwrite files without warning!
-    You can give a custom file name by setting the ``file_name`` class attribute and give a custom way of rendering the
-    index associated with individual files by giving a different lambda function ``format_index`` class attribute. This
-    lambda should accept one index and return one string.
+    You can give a custom file name by setting the ``file_name`` class attribute.
 
     You can also give a custom ``logging_condition`` lambda, accepting the current level if you want to log selectively.
 
-    Importantly, you may need to change ``process_solution``. By default, this will return a numpy view of the solution.
-    Of course, if you are not using numpy, you need to change this. Again, this is a lambda accepting the level.
+    Importantly, you may need to change ``process_solution``. By default, this will return a numpy view of the solution
+    and the time as a dictionary. If you are not using numpy, you need to change this. Again, this is a lambda accepting
+    the level. Each entry in the dictionary must be numerical and have the same shape in every step.
 
-    After the fact, you can use the classmethod `get_path` to get the path to a certain data or the `load` function to
-    directly load the solution at a given index. Just configure the hook like you did when you recorded the data
-    beforehand.
+    Instead of one file per step, the data is streamed to one binary file per entry in the dictionary, which is
+    appended to in chunks of ``chunk_size`` steps in a background thread. After the fact, you can use the classmethod
+    `load` to directly load the data at a given index, `load_time` to load the data closest to a given time or
+    `get_reader` for memory-mapped access to all data. Just configure the hook like you did when you recorded the data
+    beforehand. The data can be read only after the run is complete, or after calling `flush`.
 
     Finally, be aware that using this hook with MPI parallel runs may lead to different tasks overwriting files. Make
     sure to give a different `file_name` for each task that writes files.
@@ -101,7 +308,8 @@ class LogToFile(hooks):
     file_name = 'solution'
     logging_condition = lambda L: True
     process_solution = lambda L: {'t': L.time + L.dt, 'u': L.uend.view(np.ndarray)}
-    format_index = lambda index: f'{index:06d}'
+    chunk_size = 64
+    asynchronous = True
 
     def __init__(self):
         super().__init__()
@@ -118,6 +326,8 @@ class LogToFile(hooks):
         if not os.path.isdir(self.path):
             os.mkdir(self.path)
 
+        self.writer = StreamWriter(self.get_prefix(), chunk_size=self.chunk_size, asynchronous=self.asynchronous)
+
     def post_step(self, step, level_number):
         if level_number > 0:
             return None
@@ -125,20 +335,56 @@ class LogToFile(hooks):
         L = step.levels[level_number]
 
         if type(self).logging_condition(L):
-            path = self.get_path(self.counter)
-            data = type(self).process_solution(L)
+            self.writer.append(type(self).process_solution(L))
+            self.counter += 1
 
-            with open(path, 'wb') as file:
-                pickle.dump(data, file)
+    def post_run(self, step, level_number):
+        super().post_run(step, level_number)
+        self.writer.close()
 
-            self.counter += 1
+    def flush(self):
+        """
+        Make sure all data logged so far is written to disk
+        """
+        self.writer.flush()
 
     @classmethod
-    def get_path(cls, index):
-        return f'{cls.path}/{cls.file_name}_{cls.format_index(index)}.pickle'
+    def get_prefix(cls):
+        return f'{cls.path}/{cls.file_name}'
+
+    @classmethod
+    def get_reader(cls):
+        """
+        Get memory-mapped access to the logged data
+
+        Returns:
+            StreamReader: Reader for the data
+        """
+        return StreamReader(cls.get_prefix())
 
     @classmethod
     def load(cls, index):
-        path = cls.get_path(index)
-        with open(path, 'rb') as file:
-            return pickle.load(file)
+        """
+        Load the data logged at a given index
+
+        Args:
+            index (int): Number of the logged step
+
+        Returns:
+            dict: The data as returned by `process_solution`
+        """
+        return cls.get_reader()[index]
+
+    @classmethod
+    def load_time(cls, t):
+        """
+        Load the data logged closest to a given time. This requires an entry "t" in the data.
+
+        Args:
+            t (float): The time
+
+        Returns:
+            dict: The data as returned by `process_solution`
+        """
+        reader = cls.get_reader()
+        return reader[reader.get_index(t, key='t')]
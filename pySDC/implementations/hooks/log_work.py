@@ -53,3 +53,58 @@ class LogWork(hooks):
                 type=f'work_{key}',
                 value=L.prob.work_counters[key].niter - self.__work_last_step[step.status.slot][level_number][key],
             )
+
+
+class LogPredictorWork(hooks):
+    """
+    Log the increment of all work counters in the problems on all levels during the predictor
+    """
+
+    def __init__(self):
+        """
+        Initialize the variables for the work recorded before the predictor
+        """
+        super().__init__()
+        self.__work_before_predict = {}
+
+    def pre_predict(self, step, level_number):
+        """
+        Store the current values of the work counters on all levels
+
+        Args:
+            step (pySDC.Step.step): the current step
+            level_number (int): the current level number
+
+        Returns:
+            None
+        """
+        super().pre_predict(step, level_number)
+        self.__work_before_predict[step.status.slot] = [
+            {key: L.prob.work_counters[key].niter for key in L.prob.work_counters.keys()} for L in step.levels
+        ]
+
+    def post_predict(self, step, level_number):
+        """
+        Add the difference between current values of counters and their values before the predictor to the stats for
+        all levels.
+
+        Args:
+            step (pySDC.Step.step): the current step
+            level_number (int): the current level number
+
+        Returns:
+            None
+        """
+        super().post_predict(step, level_number)
+        for L, work_before in zip(step.levels, self.__work_before_predict[step.status.slot]):
+            for key in work_before.keys():
+                self.add_to_stats(
+                    process=step.status.slot,
+                    process_sweeper=L.sweep.rank,
+                    time=L.time,
+                    level=L.level_index,
+                    iter=step.status.iter,
+                    sweep=L.status.sweep,
+                    type=f'work_predictor_{key}',
+                    value=L.prob.work_counters[key].niter - work_before[key],
+                )
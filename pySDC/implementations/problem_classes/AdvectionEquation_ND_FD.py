@@ -52,6 +52,9 @@ class advectionNd(GenericNDimFinDiff):
                 \right)^2
                 }
 
+    factorization_cache_size : int, optional
+        Number of LU factorizations kept for reuse by the direct solver, 0 disables the cache.
+
     Attributes
     ----------
     A : sparse matrix (CSC)
@@ -77,8 +80,21 @@ class advectionNd(GenericNDimFinDiff):
         solver_type='direct',
         bc='periodic',
         sigma=6e-2,
+        factorization_cache_size=8,
     ):
-        super().__init__(nvars, -c, 1, freq, stencil_type, order, lintol, liniter, solver_type, bc)
+        super().__init__(
+            nvars,
+            -c,
+            1,
+            freq,
+            stencil_type,
+            order,
+            lintol,
+            liniter,
+            solver_type,
+            bc,
+            factorization_cache_size=factorization_cache_size,
+        )
 
         if solver_type == 'CG':  # pragma: no cover
             self.logger.warning('CG is not usually used for advection equation')
@@ -60,6 +60,8 @@ class allencahn_imex(IMEX_Laplacian_MPIFFT):
     .. [1] https://mpi4py-fft.readthedocs.io/en/latest/
     """
 
+    nonlinearity_degree = 3
+
     def __init__(
         self,
         eps=0.04,
@@ -95,20 +97,19 @@ class allencahn_imex(IMEX_Laplacian_MPIFFT):
 
         f = self.dtype_f(self.init)
 
-        f.impl[:] = self._eval_Laplacian(u, f.impl)
+        self._eval_Laplacian(u, f.impl)
 
         if self.spectral:
-            f.impl = -self.K2 * u
 
             if self.eps > 0:
-                tmp = self.fft.backward(u)
-                tmp[:] = self._eval_explicit_part(tmp, t, tmp)
-                f.expl[:] = self.fft.forward(tmp)
+                tmp = self._backward_dealiased(u)
+                self._eval_explicit_part(tmp, t, tmp)
+                self._forward_dealiased(tmp, f.expl)
 
         else:
 
             if self.eps > 0:
-                f.expl[:] = self._eval_explicit_part(u, t, f.expl)
+                self._eval_explicit_part(u, t, f.expl)
 
         self.work_counters['rhs']()
         return f
@@ -206,12 +207,11 @@ class allencahn_imex_timeforcing(allencahn_imex):
 
         f = self.dtype_f(self.init)
 
-        f.impl[:] = self._eval_Laplacian(u, f.impl)
+        self._eval_Laplacian(u, f.impl)
 
         if self.spectral:
 
-            tmp = newDistArray(self.fft, False)
-            tmp[:] = self.fft.backward(u, tmp)
+            tmp = self._backward_dealiased(u, self.get_work_array('u'))
 
             if self.eps > 0:
                 tmpf = -2.0 / self.eps**2 * tmp * (1.0 - tmp) * (1.0 - 2.0 * tmp)
@@ -239,7 +239,7 @@ class allencahn_imex_timeforcing(allencahn_imex):
                 dw = 0.0
 
             tmpf -= 6.0 * dw * tmp * (1.0 - tmp)
-            f.expl[:] = self.fft.forward(tmpf)
+            self._forward_dealiased(tmpf, f.expl)
 
         else:
 
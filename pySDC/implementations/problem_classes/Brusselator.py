@@ -67,7 +67,7 @@ class Brusselator(IMEX_Laplacian_MPIFFT):
 
         # evaluate Laplacian to be solved implicitly
         for i in [self.iU, self.iV]:
-            f.impl[i, ...] = self._eval_Laplacian(u[i], f.impl[i])
+            self._eval_Laplacian(u[i], f.impl[i])
 
         f.expl[:] = self._eval_explicit_part(u, t, f.expl)
 
@@ -98,7 +98,7 @@ class Brusselator(IMEX_Laplacian_MPIFFT):
         me = self.dtype_u(self.init)
 
         for i in [self.iU, self.iV]:
-            me[i, ...] = self._invert_Laplacian(me[i], factor, rhs[i])
+            self._invert_Laplacian(me[i], factor, rhs[i])
 
         return me
 
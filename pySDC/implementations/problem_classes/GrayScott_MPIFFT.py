@@ -7,8 +7,6 @@ from pySDC.core.Problem import ptype, WorkCounter
 from pySDC.implementations.datatype_classes.mesh import mesh, imex_mesh, comp2_mesh
 from pySDC.implementations.problem_classes.generic_MPIFFT_Laplacian import IMEX_Laplacian_MPIFFT
 
-from mpi4py_fft import newDistArray
-
 
 class grayscott_imex_diffusion(IMEX_Laplacian_MPIFFT):
     r"""
@@ -60,7 +58,7 @@ class grayscott_imex_diffusion(IMEX_Laplacian_MPIFFT):
     Ku : matrix
         Laplace operator in spectral space (u component).
     Kv : matrix
-        Laplace operator in spectral space (v component).
+        Laplace operator in spectral space (v component). Clear the ``symbol_cache`` after changing ``Ku`` or ``Kv``.
 
     References
     ----------
@@ -71,6 +69,8 @@ class grayscott_imex_diffusion(IMEX_Laplacian_MPIFFT):
     .. [3] https://www.chebfun.org/examples/pde/GrayScott.html
     """
 
+    nonlinearity_degree = 3
+
     def __init__(self, Du=1.0, Dv=0.01, A=0.09, B=0.086, **kwargs):
         kwargs['L'] = 2.0
         super().__init__(dtype='d', alpha=1.0, x0=-kwargs['L'] / 2.0, **kwargs)
@@ -88,6 +88,52 @@ class grayscott_imex_diffusion(IMEX_Laplacian_MPIFFT):
         self.Ku = -self.Du * self.K2
         self.Kv = -self.Dv * self.K2
 
+    def _eval_diffusion(self, u, f_diff):
+        """
+        Evaluate the linear operators ``Ku`` and ``Kv`` for both components and write the result into ``f_diff``.
+        """
+        for i, K in zip([self.iU, self.iV], [self.Ku, self.Kv]):
+            if self.spectral:
+                self.xp.multiply(K, self._as_array(u[i, ...]), out=self._as_array(f_diff[i, ...]))
+            else:
+                self._apply_symbol(u[i, ...], K, f_diff[i, ...])
+        return f_diff
+
+    def _eval_reaction(self, u, v, fu, fv):
+        """
+        Evaluate the reaction terms in real space and write them into ``fu`` and ``fv``. All arguments must be plain
+        arrays such that the operations are done in place.
+        """
+        uv2 = self.get_work_array('uv2')
+        self.xp.multiply(v, v, out=uv2)
+        uv2 *= u
+
+        # -u v^2 + A (1 - u)
+        self.xp.multiply(u, -self.A, out=fu)
+        fu += self.A
+        fu -= uv2
+
+        # u v^2 - B v
+        self.xp.multiply(v, -self.B, out=fv)
+        fv += uv2
+        return fu, fv
+
+    def _eval_reaction_components(self, u, f_react):
+        """
+        Evaluate the reaction terms for both components and write the result into ``f_react``, transforming from and
+        to spectral space if needed.
+        """
+        iU, iV = self.iU, self.iV
+        if self.spectral:
+            tmpu = self._backward_dealiased(u[iU, ...], self.get_work_array('u'))
+            tmpv = self._backward_dealiased(u[iV, ...], self.get_work_array('v'))
+            tmpfu, tmpfv = self._eval_reaction(tmpu, tmpv, self.get_work_array('fu'), self.get_work_array('fv'))
+            self._forward_dealiased(tmpfu, f_react[iU, ...])
+            self._forward_dealiased(tmpfv, f_react[iV, ...])
+        else:
+            self._eval_reaction(*[self._as_array(me) for me in [u[iU], u[iV], f_react[iU], f_react[iV]]])
+        return f_react
+
     def eval_f(self, u, t):
         """
         Routine to evaluate the right-hand side of the problem.
@@ -106,28 +152,8 @@ class grayscott_imex_diffusion(IMEX_Laplacian_MPIFFT):
         """
 
         f = self.dtype_f(self.init)
-
-        if self.spectral:
-            f.impl[0, ...] = self.Ku * u[0, ...]
-            f.impl[1, ...] = self.Kv * u[1, ...]
-            tmpu = newDistArray(self.fft, False)
-            tmpv = newDistArray(self.fft, False)
-            tmpu[:] = self.fft.backward(u[0, ...], tmpu)
-            tmpv[:] = self.fft.backward(u[1, ...], tmpv)
-            tmpfu = -tmpu * tmpv**2 + self.A * (1 - tmpu)
-            tmpfv = tmpu * tmpv**2 - self.B * tmpv
-            f.expl[0, ...] = self.fft.forward(tmpfu)
-            f.expl[1, ...] = self.fft.forward(tmpfv)
-
-        else:
-            u_hat = self.fft.forward(u[0, ...])
-            lap_u_hat = self.Ku * u_hat
-            f.impl[0, ...] = self.fft.backward(lap_u_hat, f.impl[0, ...])
-            u_hat = self.fft.forward(u[1, ...])
-            lap_u_hat = self.Kv * u_hat
-            f.impl[1, ...] = self.fft.backward(lap_u_hat, f.impl[1, ...])
-            f.expl[0, ...] = -u[0, ...] * u[1, ...] ** 2 + self.A * (1 - u[0, ...])
-            f.expl[1, ...] = u[0, ...] * u[1, ...] ** 2 - self.B * u[1, ...]
+        self._eval_diffusion(u, f.impl)
+        self._eval_reaction_components(u, f.expl)
 
         self.work_counters['rhs']()
         return f
@@ -154,17 +180,12 @@ class grayscott_imex_diffusion(IMEX_Laplacian_MPIFFT):
         """
 
         me = self.dtype_u(self.init)
-        if self.spectral:
-            me[0, ...] = rhs[0, ...] / (1.0 - factor * self.Ku)
-            me[1, ...] = rhs[1, ...] / (1.0 - factor * self.Kv)
-
-        else:
-            rhs_hat = self.fft.forward(rhs[0, ...])
-            rhs_hat /= 1.0 - factor * self.Ku
-            me[0, ...] = self.fft.backward(rhs_hat, me[0, ...])
-            rhs_hat = self.fft.forward(rhs[1, ...])
-            rhs_hat /= 1.0 - factor * self.Kv
-            me[1, ...] = self.fft.backward(rhs_hat, me[1, ...])
+        for i, K in zip([self.iU, self.iV], [self.Ku, self.Kv]):
+            symbol = self.get_symbol(('inverse', i, factor), lambda K=K: 1.0 / (1.0 - factor * K))
+            if self.spectral:
+                self.xp.multiply(symbol, self._as_array(rhs[i, ...]), out=self._as_array(me[i, ...]))
+            else:
+                self._apply_symbol(rhs[i, ...], symbol, me[i, ...])
 
         return me
 
@@ -226,49 +247,21 @@ class grayscott_imex_linear(grayscott_imex_diffusion):
         self.Ku -= self.A
         self.Kv -= self.B
 
-    def eval_f(self, u, t):
+    def _eval_reaction(self, u, v, fu, fv):
         """
-        Routine to evaluate the right-hand side of the problem.
-
-        Parameters
-        ----------
-        u : dtype_u
-            Current values of the numerical solution.
-        t : float
-            Current time of the numerical solution is computed.
-
-        Returns
-        -------
-        f : dtype_f
-            The right-hand side of the problem.
+        Evaluate the nonlinear reaction terms in real space and write them into ``fu`` and ``fv``. All arguments must
+        be plain arrays such that the operations are done in place.
         """
+        uv2 = self.get_work_array('uv2')
+        self.xp.multiply(v, v, out=uv2)
+        uv2 *= u
 
-        f = self.dtype_f(self.init)
+        # -u v^2 + A
+        self.xp.subtract(self.A, uv2, out=fu)
 
-        if self.spectral:
-            f.impl[0, ...] = self.Ku * u[0, ...]
-            f.impl[1, ...] = self.Kv * u[1, ...]
-            tmpu = newDistArray(self.fft, False)
-            tmpv = newDistArray(self.fft, False)
-            tmpu[:] = self.fft.backward(u[0, ...], tmpu)
-            tmpv[:] = self.fft.backward(u[1, ...], tmpv)
-            tmpfu = -tmpu * tmpv**2 + self.A
-            tmpfv = tmpu * tmpv**2
-            f.expl[0, ...] = self.fft.forward(tmpfu)
-            f.expl[1, ...] = self.fft.forward(tmpfv)
-
-        else:
-            u_hat = self.fft.forward(u[0, ...])
-            lap_u_hat = self.Ku * u_hat
-            f.impl[0, ...] = self.fft.backward(lap_u_hat, f.impl[0, ...])
-            u_hat = self.fft.forward(u[1, ...])
-            lap_u_hat = self.Kv * u_hat
-            f.impl[1, ...] = self.fft.backward(lap_u_hat, f.impl[1, ...])
-            f.expl[0, ...] = -u[0, ...] * u[1, ...] ** 2 + self.A
-            f.expl[1, ...] = u[0, ...] * u[1, ...] ** 2
-
-        self.work_counters['rhs']()
-        return f
+        # u v^2
+        fv[...] = uv2
+        return fu, fv
 
 
 class grayscott_mi_diffusion(grayscott_imex_diffusion):
@@ -366,28 +359,8 @@ class grayscott_mi_diffusion(grayscott_imex_diffusion):
         """
 
         f = self.dtype_f(self.init)
-
-        if self.spectral:
-            f.comp1[0, ...] = self.Ku * u[0, ...]
-            f.comp1[1, ...] = self.Kv * u[1, ...]
-            tmpu = newDistArray(self.fft, False)
-            tmpv = newDistArray(self.fft, False)
-            tmpu[:] = self.fft.backward(u[0, ...], tmpu)
-            tmpv[:] = self.fft.backward(u[1, ...], tmpv)
-            tmpfu = -tmpu * tmpv**2 + self.A * (1 - tmpu)
-            tmpfv = tmpu * tmpv**2 - self.B * tmpv
-            f.comp2[0, ...] = self.fft.forward(tmpfu)
-            f.comp2[1, ...] = self.fft.forward(tmpfv)
-
-        else:
-            u_hat = self.fft.forward(u[0, ...])
-            lap_u_hat = self.Ku * u_hat
-            f.comp1[0, ...] = self.fft.backward(lap_u_hat, f.comp1[0, ...])
-            u_hat = self.fft.forward(u[1, ...])
-            lap_u_hat = self.Kv * u_hat
-            f.comp1[1, ...] = self.fft.backward(lap_u_hat, f.comp1[1, ...])
-            f.comp2[0, ...] = -u[0, ...] * u[1, ...] ** 2 + self.A * (1 - u[0, ...])
-            f.comp2[1, ...] = u[0, ...] * u[1, ...] ** 2 - self.B * u[1, ...]
+        self._eval_diffusion(u, f.comp1)
+        self._eval_reaction_components(u, f.comp2)
 
         self.work_counters['rhs']()
         return f
@@ -439,14 +412,10 @@ class grayscott_mi_diffusion(grayscott_imex_diffusion):
         u = self.dtype_u(u0)
 
         if self.spectral:
-            tmpu = newDistArray(self.fft, False)
-            tmpv = newDistArray(self.fft, False)
-            tmpu[:] = self.fft.backward(u[0, ...], tmpu)
-            tmpv[:] = self.fft.backward(u[1, ...], tmpv)
-            tmprhsu = newDistArray(self.fft, False)
-            tmprhsv = newDistArray(self.fft, False)
-            tmprhsu[:] = self.fft.backward(rhs[0, ...], tmprhsu)
-            tmprhsv[:] = self.fft.backward(rhs[1, ...], tmprhsv)
+            tmpu = self.fft.backward(u[0, ...], self.get_work_array('u'))
+            tmpv = self.fft.backward(u[1, ...], self.get_work_array('v'))
+            tmprhsu = self.fft.backward(rhs[0, ...], self.get_work_array('rhs_u'))
+            tmprhsv = self.fft.backward(rhs[1, ...], self.get_work_array('rhs_v'))
 
         else:
             tmpu = u[0, ...]
@@ -508,8 +477,8 @@ class grayscott_mi_diffusion(grayscott_imex_diffusion):
 
         me = self.dtype_u(self.init)
         if self.spectral:
-            me[0, ...] = self.fft.forward(tmpu)
-            me[1, ...] = self.fft.forward(tmpv)
+            self.fft.forward(tmpu, me[0, ...])
+            self.fft.forward(tmpv, me[1, ...])
         else:
             me[0, ...] = tmpu
             me[1, ...] = tmpv
@@ -572,28 +541,8 @@ class grayscott_mi_linear(grayscott_imex_linear):
         """
 
         f = self.dtype_f(self.init)
-
-        if self.spectral:
-            f.comp1[0, ...] = self.Ku * u[0, ...]
-            f.comp1[1, ...] = self.Kv * u[1, ...]
-            tmpu = newDistArray(self.fft, False)
-            tmpv = newDistArray(self.fft, False)
-            tmpu[:] = self.fft.backward(u[0, ...], tmpu)
-            tmpv[:] = self.fft.backward(u[1, ...], tmpv)
-            tmpfu = -tmpu * tmpv**2 + self.A
-            tmpfv = tmpu * tmpv**2
-            f.comp2[0, ...] = self.fft.forward(tmpfu)
-            f.comp2[1, ...] = self.fft.forward(tmpfv)
-
-        else:
-            u_hat = self.fft.forward(u[0, ...])
-            lap_u_hat = self.Ku * u_hat
-            f.comp1[0, ...] = self.fft.backward(lap_u_hat, f.comp1[0, ...])
-            u_hat = self.fft.forward(u[1, ...])
-            lap_u_hat = self.Kv * u_hat
-            f.comp1[1, ...] = self.fft.backward(lap_u_hat, f.comp1[1, ...])
-            f.comp2[0, ...] = -u[0, ...] * u[1, ...] ** 2 + self.A
-            f.comp2[1, ...] = u[0, ...] * u[1, ...] ** 2
+        self._eval_diffusion(u, f.comp1)
+        self._eval_reaction_components(u, f.comp2)
 
         self.work_counters['rhs']()
         return f
@@ -645,14 +594,10 @@ class grayscott_mi_linear(grayscott_imex_linear):
         u = self.dtype_u(u0)
 
         if self.spectral:
-            tmpu = newDistArray(self.fft, False)
-            tmpv = newDistArray(self.fft, False)
-            tmpu[:] = self.fft.backward(u[0, ...], tmpu)
-            tmpv[:] = self.fft.backward(u[1, ...], tmpv)
-            tmprhsu = newDistArray(self.fft, False)
-            tmprhsv = newDistArray(self.fft, False)
-            tmprhsu[:] = self.fft.backward(rhs[0, ...], tmprhsu)
-            tmprhsv[:] = self.fft.backward(rhs[1, ...], tmprhsv)
+            tmpu = self.fft.backward(u[0, ...], self.get_work_array('u'))
+            tmpv = self.fft.backward(u[1, ...], self.get_work_array('v'))
+            tmprhsu = self.fft.backward(rhs[0, ...], self.get_work_array('rhs_u'))
+            tmprhsv = self.fft.backward(rhs[1, ...], self.get_work_array('rhs_v'))
 
         else:
             tmpu = u[0, ...]
@@ -714,8 +659,8 @@ class grayscott_mi_linear(grayscott_imex_linear):
 
         me = self.dtype_u(self.init)
         if self.spectral:
-            me[0, ...] = self.fft.forward(tmpu)
-            me[1, ...] = self.fft.forward(tmpv)
+            self.fft.forward(tmpu, me[0, ...])
+            self.fft.forward(tmpv, me[1, ...])
         else:
             me[0, ...] = tmpu
             me[1, ...] = tmpv
@@ -53,6 +53,9 @@ class heatNd_unforced(GenericNDimFinDiff):
                 \right)^2
                 }
 
+    factorization_cache_size : int, optional
+        Number of LU factorizations kept for reuse by the direct solver, 0 disables the cache.
+
     Attributes
     ----------
     A : sparse matrix (CSC)
@@ -73,9 +76,22 @@ class heatNd_unforced(GenericNDimFinDiff):
         solver_type='direct',
         bc='periodic',
         sigma=6e-2,
+        factorization_cache_size=8,
     ):
         """Initialization routine"""
-        super().__init__(nvars, nu, 2, freq, stencil_type, order, lintol, liniter, solver_type, bc)
+        super().__init__(
+            nvars,
+            nu,
+            2,
+            freq,
+            stencil_type,
+            order,
+            lintol,
+            liniter,
+            solver_type,
+            bc,
+            factorization_cache_size=factorization_cache_size,
+        )
         if solver_type == 'GMRES':
             self.logger.warning('GMRES is not usually used for heat equation')
         self._makeAttributeAndRegister('nu', localVars=locals(), readOnly=True)
@@ -203,6 +219,20 @@ class heatNd_forced(heatNd_unforced):
 
         return f
 
+    def get_linear_operator(self):
+        """
+        Finite difference matrix :math:`A` of the implicit part of the right-hand side. The explicit part is the
+        forcing term, which does not depend on the solution. Only available if ``eval_f`` is not overridden.
+
+        Returns
+        -------
+        A : sparse matrix (CSC) or None
+            The linear operator.
+        """
+        if type(self).eval_f is not heatNd_forced.eval_f:
+            return None
+        return self.A
+
     def u_exact(self, t):
         r"""
         Routine to compute the exact solution at time :math:`t`.
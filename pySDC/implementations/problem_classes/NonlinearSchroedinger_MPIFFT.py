@@ -47,6 +47,8 @@ class nonlinearschroedinger_imex(IMEX_Laplacian_MPIFFT):
         Journal of Parallel and Distributed Computing (2019).
     """
 
+    nonlinearity_degree = 3
+
     def __init__(self, c=1.0, **kwargs):
         """Initialization routine"""
         super().__init__(L=2 * np.pi, alpha=1j, dtype='D', **kwargs)
@@ -142,15 +144,16 @@ class nonlinearschroedinger_fully_implicit(nonlinearschroedinger_imex):
 
         f = self.dtype_f(self.init)
 
+        self._eval_Laplacian(u, f)
+        f_array = self._as_array(f)
+
         if self.spectral:
-            tmp = self.fft.backward(u)
-            tmpf = self.ndim * self.c * 2j * self.xp.absolute(tmp) ** 2 * tmp
-            f[:] = -self.K2 * 1j * u + self.fft.forward(tmpf)
+            tmp = self._backward_dealiased(u)
+            self._eval_explicit_part(tmp, t, tmp)
+            f_array += self._forward_dealiased(tmp, self.get_work_array('f', spectral=True))
 
         else:
-            u_hat = self.fft.forward(u)
-            lap_u_hat = -self.K2 * 1j * u_hat
-            f[:] = self.fft.backward(lap_u_hat) + self.ndim * self.c * 2j * self.xp.absolute(u) ** 2 * u
+            f_array += self._eval_explicit_part(u, t, self.get_work_array('f'))
 
         self.work_counters['rhs']()
         return f
@@ -1,9 +1,9 @@
 import numpy as np
-from numba import jit
 
 from pySDC.core.Errors import ProblemError
-from pySDC.core.Problem import ptype, WorkCounter
+from pySDC.core.Problem import ptype, WorkCounter, WorkTimer
 from pySDC.implementations.datatype_classes.particles import particles, fields, acceleration
+from pySDC.implementations.problem_classes.penningtrap_helpers import interactions as particle_interactions
 
 
 # noinspection PyUnusedLocal
@@ -67,11 +67,22 @@ class penningtrap(ptype):
         The number of particles.
     sig : float
         The smoothing parameter :math:`\lambda>0`.
+    interactions : str, optional
+        Backend for the inter-particle interaction. Choose ``'direct'`` for the exact :math:`\mathcal{O}(N^2)` sum,
+        ``'barnes_hut'`` for an octree code or ``'cell_list'`` to only include particles closer than ``cutoff``.
+    theta : float, optional
+        Opening angle of the Barnes-Hut backend. Smaller values are more accurate, ``theta=0`` gives the direct sum.
+    leaf_size : int, optional
+        Maximum number of particles in a leaf of the octree of the Barnes-Hut backend.
+    cutoff : float, optional
+        Cutoff radius of the cell list backend.
 
     Attributes
     ----------
     work_counter : dict
-        Counts the calls of the right-hand side, and calls of the Boris solver.
+        Counts the calls of the right-hand side, and calls of the Boris solver. For the Barnes-Hut and cell list
+        backends, ``'tree_build'`` and ``'tree_traversal'`` count the calls and accumulate the time spent on building
+        the octree or cell list and on computing the interactions with it.
 
     References
     ----------
@@ -84,16 +95,25 @@ class penningtrap(ptype):
     dtype_u = particles
     dtype_f = fields
 
-    def __init__(self, omega_B, omega_E, u0, nparts, sig):
+    def __init__(self, omega_B, omega_E, u0, nparts, sig, interactions='direct', theta=0.5, leaf_size=8, cutoff=None):
+        if interactions not in ['direct', 'barnes_hut', 'cell_list']:
+            raise ProblemError(f'unknown backend for the interactions: {interactions!r}')
+        if interactions == 'cell_list' and (cutoff is None or cutoff <= 0):
+            raise ProblemError('need a positive cutoff radius for the cell list backend')
+
         # invoke super init, passing nparts, dtype_u and dtype_f
         super().__init__(((3, nparts), None, np.dtype('float64')))
-        self._makeAttributeAndRegister('nparts', localVars=locals(), readOnly=True)
-        self._makeAttributeAndRegister('omega_B', 'omega_E', 'u0', 'sig', localVars=locals())
+        self._makeAttributeAndRegister('nparts', 'interactions', localVars=locals(), readOnly=True)
+        self._makeAttributeAndRegister(
+            'omega_B', 'omega_E', 'u0', 'sig', 'theta', 'leaf_size', 'cutoff', localVars=locals()
+        )
         self.work_counters['Boris_solver'] = WorkCounter()
         self.work_counters['rhs'] = WorkCounter()
+        if interactions != 'direct':
+            self.work_counters['tree_build'] = WorkTimer()
+            self.work_counters['tree_traversal'] = WorkTimer()
 
     @staticmethod
-    @jit(nopython=True, nogil=True)
     def fast_interactions(N, pos, sig, q):
         r"""
         Computes the fast interactions.
@@ -114,25 +134,12 @@ class penningtrap(ptype):
         Efield : np.2darray
             The internal E field for each particle.
         """
-        Efield = np.zeros((3, N))
-        contrib = np.zeros(3)
-
-        for i in range(N):
-            contrib[:] = 0
-
-            for j in range(N):
-                dist2 = (
-                    (pos[0, i] - pos[0, j]) ** 2 + (pos[1, i] - pos[1, j]) ** 2 + (pos[2, i] - pos[2, j]) ** 2 + sig**2
-                )
-                contrib += q[j] * (pos[:, i] - pos[:, j]) / dist2**1.5
-
-            Efield[:, i] += contrib[:]
-
-        return Efield
+        return particle_interactions.direct_interactions(pos[:, :N], sig, q[:N])
 
     def get_interactions(self, part):
         r"""
-        Routine to compute the particle-particle interaction, assuming :math:`q = 1` for all particles.
+        Routine to compute the particle-particle interaction with the backend selected by the ``interactions``
+        parameter.
 
         Parameters
         ----------
@@ -147,7 +154,21 @@ class penningtrap(ptype):
 
         N = self.nparts
 
-        Efield = self.fast_interactions(N, part.pos, self.sig, part.q)
+        if self.interactions == 'barnes_hut':
+            with self.work_counters['tree_build']:
+                tree = particle_interactions.build_octree(part.pos, part.q, self.leaf_size)
+            with self.work_counters['tree_traversal']:
+                Efield = particle_interactions.barnes_hut_interactions(part.pos, self.sig, part.q, self.theta, tree)
+        elif self.interactions == 'cell_list':
+            with self.work_counters['tree_build']:
+                lo, h, ncells = particle_interactions.get_cell_grid(part.pos, self.cutoff)
+                cells = particle_interactions.build_cell_list(part.pos, lo, h, ncells)
+            with self.work_counters['tree_traversal']:
+                Efield = particle_interactions.cell_list_interactions(
+                    part.pos, self.sig, part.q, self.cutoff, lo, h, ncells, cells
+                )
+        else:
+            Efield = self.fast_interactions(N, part.pos, self.sig, part.q)
 
         return Efield
 
@@ -168,8 +189,6 @@ class penningtrap(ptype):
             Fields for the particles (internal and external), i.e., the right-hand side of the problem.
         """
 
-        N = self.nparts
-
         self.work_counters['rhs']()
         try:
             penningtrap.Harmonic_oscillator
@@ -180,10 +199,8 @@ class penningtrap(ptype):
         f = self.dtype_f(self.init)
 
         f.elec[:] = self.get_interactions(part)
-
-        for n in range(N):
-            f.elec[:, n] += self.omega_E**2 / (part.q[n] / part.m[n]) * np.dot(Emat, part.pos[:, n])
-            f.magn[:, n] = self.omega_B * np.array([0, 0, 1])
+        f.elec += self.omega_E**2 / (part.q / part.m) * np.dot(Emat, part.pos)
+        f.magn[:] = self.omega_B * np.array([0, 0, 1])[:, None]
 
         return f
 
@@ -324,11 +341,8 @@ class penningtrap(ptype):
         if not isinstance(part, particles):
             raise ProblemError('something is wrong during build_f, got %s' % type(part))
 
-        N = self.nparts
-
         rhs = acceleration(self.init)
-        for n in range(N):
-            rhs[:, n] = part.q[n] / part.m[n] * (f.elec[:, n] + np.cross(part.vel[:, n], f.magn[:, n]))
+        rhs[:] = part.q / part.m * (f.elec + np.cross(part.vel, f.magn, axis=0))
 
         return rhs
 
@@ -356,22 +370,20 @@ class penningtrap(ptype):
             The velocities at the :math:`(m+1)`-th node.
         """
 
-        N = self.nparts
         vel = particles.velocity(self.init)
         self.work_counters['Boris_solver']()
         Emean = 0.5 * (old_fields.elec + new_fields.elec)
-        for n in range(N):
-            a = old_parts.q[n] / old_parts.m[n]
-
-            c[:, n] += dt / 2 * a * np.cross(old_parts.vel[:, n], old_fields.magn[:, n] - new_fields.magn[:, n])
-
-            # pre-velocity, separated by the electric forces (and the c term)
-            vm = old_parts.vel[:, n] + dt / 2 * a * Emean[:, n] + c[:, n] / 2
-            # rotation
-            t = dt / 2 * a * new_fields.magn[:, n]
-            s = 2 * t / (1 + np.linalg.norm(t, 2) ** 2)
-            vp = vm + np.cross(vm + np.cross(vm, t), s)
-            # post-velocity
-            vel[:, n] = vp + dt / 2 * a * Emean[:, n] + c[:, n] / 2
+        a = old_parts.q / old_parts.m
+
+        c[:] += dt / 2 * a * np.cross(old_parts.vel, old_fields.magn - new_fields.magn, axis=0)
+
+        # pre-velocity, separated by the electric forces (and the c term)
+        vm = old_parts.vel + dt / 2 * a * Emean + c / 2
+        # rotation
+        t = dt / 2 * a * new_fields.magn
+        s = 2 * t / (1 + np.linalg.norm(t, 2, axis=0) ** 2)
+        vp = vm + np.cross(vm + np.cross(vm, t, axis=0), s, axis=0)
+        # post-velocity
+        vel[:] = vp + dt / 2 * a * Emean + c / 2
 
         return vel
@@ -1,9 +1,10 @@
 import numpy as np
 import scipy.sparse as sp
-from scipy.sparse.linalg import spsolve, gmres
+from scipy.sparse.linalg import spsolve
 from scipy.linalg import inv
 
 from pySDC.core.Errors import ProblemError
+from pySDC.core.Newton import NewtonSolver
 from pySDC.core.Problem import ptype, WorkCounter
 from pySDC.helpers import problem_helper
 from pySDC.implementations.datatype_classes.mesh import mesh, imex_mesh
@@ -64,6 +65,13 @@ class Quench(ptype):
         Ratio of tolerance of linear solver to the Newton residual, overrides `lintol`
     min_lintol : float, optional
         Minimal tolerance for the linear solver
+    simplified_newton : bool, optional
+        Freeze the Jacobian across Newton iterations, nodes and sweeps until convergence degrades.
+    newton_max_contraction : float, optional
+        Maximal ratio of subsequent Newton residuals before a frozen Jacobian is renewed.
+    eisenstat_walker : bool, optional
+        Choose the tolerance of the linear solver with the Eisenstat-Walker forcing term, overrides
+        `inexact_linear_ratio`.
     reference_sol_type : str, optional
         Indicates which method should be used to compute a reference solution.
         Choose between ``'scipy'``, ``'SDC'``, or ``'DIRK'``.
@@ -80,6 +88,9 @@ class Quench(ptype):
         Spatial grid values.
     leak : np.1darray of bool
         Indicates the leak.
+    newton_solver : pySDC.core.Newton.NewtonSolver
+        Newton solver used in `solve_system`, which also provides the work counters for Jacobian evaluations and
+        factorizations.
 
     References
     ----------
@@ -112,6 +123,9 @@ class Quench(ptype):
         inexact_linear_ratio=None,
         min_lintol=1e-12,
         reference_sol_type='scipy',
+        simplified_newton=False,
+        newton_max_contraction=0.5,
+        eisenstat_walker=False,
     ):
         """
         Initialization routine
@@ -138,6 +152,9 @@ class Quench(ptype):
             'nvars',
             'direct_solver',
             'reference_sol_type',
+            'simplified_newton',
+            'newton_max_contraction',
+            'eisenstat_walker',
             localVars=locals(),
             readOnly=True,
         )
@@ -181,10 +198,27 @@ class Quench(ptype):
 
         self.leak = np.logical_and(self.xv > self.leak_range[0], self.xv < self.leak_range[1])
 
-        self.work_counters['newton'] = WorkCounter()
+        if eisenstat_walker:
+            forcing = 'Eisenstat-Walker'
+        elif inexact_linear_ratio:
+            forcing = inexact_linear_ratio
+        else:
+            forcing = None
+
         self.work_counters['rhs'] = WorkCounter()
-        if not self.direct_solver:
-            self.work_counters['linear'] = WorkCounter()
+        self.newton_solver = NewtonSolver(
+            eval_f=self.eval_f,
+            jacobian=self.get_Jacobian,
+            simplified=simplified_newton,
+            max_contraction=newton_max_contraction,
+            direct_solver=direct_solver,
+            forcing=forcing,
+            min_lintol=min_lintol,
+            min_iter=1,
+            preconditioner=lambda factor: inv((self.Id - factor * self.A).toarray()),
+            rhs_counter=self.work_counters['rhs'],
+        )
+        self.work_counters.update(self.newton_solver.work_counters)
 
     def eval_f_non_linear(self, u, t):
         """
@@ -290,6 +324,24 @@ class Quench(ptype):
 
         return sp.diags(me, format='csc')
 
+    def get_Jacobian(self, u, t):
+        """
+        Evaluate the Jacobian of the full right-hand side.
+
+        Parameters
+        ----------
+        u : dtype_u
+            Current values of the numerical solution.
+        t : float
+            Current time at which the numerical solution is computed.
+
+        Returns
+        -------
+        scipy.sparse.csc
+            The derivative of the right-hand side w.r.t. to the solution.
+        """
+        return sp.csc_matrix(self.A + self.get_non_linear_Jacobian(u))
+
     def solve_system(self, rhs, factor, u0, t):
         r"""
         Simple Newton solver for :math:`(I - factor \cdot f)(\vec{u}) = \vec{rhs}`.
@@ -310,55 +362,22 @@ class Quench(ptype):
         u : dtype_u
             The solution as mesh.
         """
-        u = self.dtype_u(u0)
-        res = np.inf
-        delta = self.dtype_u(self.init, val=0.0)
-
-        # construct a preconditioner for the space solver
-        if not self.direct_solver:
-            M = inv((self.Id - factor * self.A).toarray())
-            zero = self.dtype_u(self.init, val=0.0)
-
-        for n in range(0, self.newton_maxiter):
-            # assemble G such that G(u) = 0 at the solution of the step
-            G = u - factor * self.eval_f(u, t) - rhs
-            self.work_counters[
-                'rhs'
-            ].decrement()  # Work regarding construction of the Jacobian etc. should count into the Newton iterations only
-
-            res = np.linalg.norm(G, np.inf)
-            if res <= self.newton_tol and n > 0:  # we want to make at least one Newton iteration
-                break
-
-            if self.inexact_linear_ratio:
-                self.lintol = max([res * self.inexact_linear_ratio, self.min_lintol])
-
-            # assemble Jacobian J of G
-            J = self.Id - factor * (self.A + self.get_non_linear_Jacobian(u))
-
-            # solve the linear system
-            if self.direct_solver:
-                delta = spsolve(J, G)
-            else:
-                delta, info = gmres(
-                    J,
-                    G,
-                    x0=zero,
-                    M=M,
-                    tol=self.lintol,
-                    maxiter=self.liniter,
-                    atol=0,
-                    callback=self.work_counters['linear'],
-                )
-
-            if not np.isfinite(delta).all():
-                break
-
-            # update solution
-            u = u - delta
-
-            self.work_counters['newton']()
-
+        u = self.dtype_u(self.init)
+        u[:] = self.newton_solver.solve(
+            rhs,
+            factor,
+            u0,
+            t,
+            tol=self.newton_tol,
+            maxiter=self.newton_maxiter,
+            lintol=self.lintol,
+            liniter=self.liniter,
+        ).reshape(u.shape)
+
+        # Newton may stop early without convergence, e.g. when the Jacobian is singular
+        n, res = self.newton_solver.niter, self.newton_solver.residual
+        if not self.newton_solver.converged and n < self.newton_maxiter:
+            self.logger.warning('Newton broke down after %i iterations, error is %s' % (n, res))
         return u
 
     def u_exact(self, t, u_init=None, t_init=None):
@@ -93,6 +93,19 @@ class testequation0d(ptype):
         self.work_counters['rhs']()
         return f
 
+    def get_linear_operator(self):
+        """
+        Diagonal matrix :math:`A` of the right-hand side, only available on CPU and if ``eval_f`` is not overridden.
+
+        Returns
+        -------
+        A : scipy.sparse.csc_matrix or None
+            The linear operator.
+        """
+        if self.useGPU or type(self).eval_f is not testequation0d.eval_f:
+            return None
+        return self.A
+
     def solve_system(self, rhs, factor, u0, t):
         r"""
         Simple linear solver for :math:`(I-factor\cdot A)\vec{u}=\vec{rhs}`.
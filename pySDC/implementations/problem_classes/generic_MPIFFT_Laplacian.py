@@ -4,11 +4,54 @@ from mpi4py_fft import PFFT
 
 from pySDC.core.Errors import ProblemError
 from pySDC.core.Problem import ptype, WorkCounter
+from pySDC.helpers.problem_helper import FactorizationCache
 from pySDC.implementations.datatype_classes.mesh import mesh, imex_mesh
 
 from mpi4py_fft import newDistArray
 
 
+class CountedTransform(object):
+    """
+    Wrapper around a transform of ``mpi4py-fft`` that counts how often it is called, but otherwise behaves the same.
+
+    Parameters
+    ----------
+    transform : callable
+        The wrapped transform, e.g. ``PFFT.forward``.
+    counter : WorkCounter
+        Counter that is incremented with every transform.
+    """
+
+    def __init__(self, transform, counter):
+        self.transform = transform
+        self.counter = counter
+
+    def __call__(self, *args, **kwargs):
+        self.counter()
+        return self.transform(*args, **kwargs)
+
+    def __getattr__(self, name):
+        # attributes of the wrapper itself may not be set yet, e.g. during copying
+        if name in ['transform', 'counter'] or name.startswith('__'):
+            raise AttributeError(name)
+        return getattr(self.transform, name)
+
+    @classmethod
+    def count_transforms(cls, fft, counter):
+        """
+        Count the forward and backward transforms of a ``PFFT`` object.
+
+        Parameters
+        ----------
+        fft : PFFT
+            The FFT object, which is modified in place.
+        counter : WorkCounter
+            Counter for the transforms.
+        """
+        fft.forward = cls(fft.forward, counter)
+        fft.backward = cls(fft.backward, counter)
+
+
 class IMEX_Laplacian_MPIFFT(ptype):
     r"""
     Generic base class for IMEX problems using a spectral method to solve the Laplacian implicitly and a possible rest
@@ -26,6 +69,15 @@ class IMEX_Laplacian_MPIFFT(ptype):
         Multiplicative factor before the Laplacian
     comm : MPI.COMM_World
         Communicator for parallelisation.
+    symbol_cache_size : int, optional
+        Number of operators in spectral space, such as the inverse of :math:`(1 + factor \cdot alpha K^2)`, that are
+        kept for reuse. They depend on ``factor``, which takes only as many distinct values as there are collocation
+        nodes for a fixed step size. Use 0 to compute them on the fly.
+    dealias : bool, optional
+        If True, the explicit part is evaluated without aliasing errors by truncation. All modes with
+        :math:`|k_i| \geq N_i / (p + 1)` are discarded from the solution before it is transformed to real space and from
+        the explicit part after it is transformed back, where :math:`p` is ``nonlinearity_degree``. For quadratic
+        nonlinearities, this is the 2/3 rule. Only used if ``spectral`` is True.
 
     Attributes
     ----------
@@ -35,6 +87,21 @@ class IMEX_Laplacian_MPIFFT(ptype):
         Grid coordinates in real space.
     K2 : matrix
         Laplace operator in spectral space.
+    symbol_cache : FactorizationCache or None
+        Cache for the operators in spectral space.
+    dealias_mask : array or None
+        Modes in spectral space that are kept when dealiasing.
+    nonlinearity_degree : int
+        Polynomial degree of the explicit part, which determines how many modes are discarded when dealiasing.
+
+    Notes
+    -----
+    Temporary arrays are kept between calls, see ``get_work_array``, and the FFTs write into existing arrays. Hence,
+    the problem must not be used from several threads at the same time.
+
+    With ``spectral=True``, the solution and right-hand side stay in spectral space throughout the sweeps, the implicit
+    solves are diagonal and FFTs are needed only for the explicit part. All transforms are counted in
+    ``work_counters['fft']``.
 
     References
     ----------
@@ -48,6 +115,7 @@ class IMEX_Laplacian_MPIFFT(ptype):
     xp = np
     fft_backend = 'fftw'
     fft_comm_backend = 'MPI'
+    nonlinearity_degree = 2
 
     @classmethod
     def setup_GPU(cls):
@@ -64,7 +132,17 @@ class IMEX_Laplacian_MPIFFT(ptype):
         cls.fft_comm_backend = 'NCCL'
 
     def __init__(
-        self, nvars=None, spectral=False, L=2 * np.pi, alpha=1.0, comm=MPI.COMM_WORLD, dtype='d', useGPU=False, x0=0.0
+        self,
+        nvars=None,
+        spectral=False,
+        L=2 * np.pi,
+        alpha=1.0,
+        comm=MPI.COMM_WORLD,
+        dtype='d',
+        useGPU=False,
+        x0=0.0,
+        symbol_cache_size=8,
+        dealias=False,
     ):
         """Initialization routine"""
 
@@ -98,7 +176,16 @@ class IMEX_Laplacian_MPIFFT(ptype):
         # invoke super init, passing the communicator and the local dimensions as init
         super().__init__(init=(tmp_u.shape, comm, tmp_u.dtype))
         self._makeAttributeAndRegister(
-            'nvars', 'spectral', 'L', 'alpha', 'comm', 'x0', localVars=locals(), readOnly=True
+            'nvars',
+            'spectral',
+            'L',
+            'alpha',
+            'comm',
+            'x0',
+            'symbol_cache_size',
+            'dealias',
+            localVars=locals(),
+            readOnly=True,
         )
 
         # get local mesh
@@ -114,6 +201,11 @@ class IMEX_Laplacian_MPIFFT(ptype):
         k = [self.xp.fft.fftfreq(n, 1.0 / n).astype(int) for n in N]
         K = [ki[si] for ki, si in zip(k, s)]
         Ks = self.xp.meshgrid(*K, indexing='ij', sparse=True)
+        self.dealias_mask = None
+        if dealias:
+            self.dealias_mask = self.xp.ones(self.fft.shape(True), dtype=bool)
+            for ki, n in zip(Ks, N):
+                self.dealias_mask &= abs(ki) < n / (self.nonlinearity_degree + 1)
         Lp = 2 * np.pi / self.L
         for i in range(self.ndim):
             Ks[i] = (Ks[i] * Lp[i]).astype(float)
@@ -127,6 +219,129 @@ class IMEX_Laplacian_MPIFFT(ptype):
 
         # work counters
         self.work_counters['rhs'] = WorkCounter()
+        self.work_counters['fft'] = WorkCounter()
+        CountedTransform.count_transforms(self.fft, self.work_counters['fft'])
+
+        # persistent temporaries and operators in spectral space
+        self._work_arrays = {}
+        self.symbol_cache = FactorizationCache(size=symbol_cache_size) if symbol_cache_size > 0 else None
+
+    def get_work_array(self, name, spectral=False):
+        """
+        Get a distributed array for temporary values, which is allocated only on the first request. The same array is
+        returned for the same name every time, so its content is valid only until it is requested again.
+
+        Parameters
+        ----------
+        name : str
+            Name of the temporary.
+        spectral : bool, optional
+            Whether the array lives in spectral space or in real space.
+
+        Returns
+        -------
+        DistArray
+            The temporary array.
+        """
+        key = (name, spectral)
+        if key not in self._work_arrays.keys():
+            self._work_arrays[key] = newDistArray(self.fft, spectral)
+        return self._work_arrays[key]
+
+    def get_symbol(self, key, compute):
+        """
+        Get an operator in spectral space from the cache or compute it if the cache is switched off or it is not stored.
+
+        Parameters
+        ----------
+        key : hashable
+            Key identifying the operator, e.g. a name and the factor.
+        compute : function
+            Function without arguments computing the operator.
+
+        Returns
+        -------
+        array
+            The operator.
+        """
+        if self.symbol_cache is None:
+            return compute()
+        return self.symbol_cache.get(key, compute)
+
+    def _as_array(self, me):
+        """
+        Plain array view of a mesh, such that ufuncs write into the memory passed as ``out`` instead of allocating new
+        memory, see ``mesh.__array_ufunc__``.
+        """
+        return me.view(self.xp.ndarray)
+
+    def _backward_dealiased(self, u, out=None):
+        """
+        Transform the solution from spectral to real space for evaluating the explicit part. If dealiasing is switched
+        on, the modes that would cause aliasing errors in the nonlinearity are discarded before the transform.
+
+        Parameters
+        ----------
+        u : dtype_u
+            Values in spectral space.
+        out : array, optional
+            Array to store the result in real space.
+
+        Returns
+        -------
+        array
+            The result.
+        """
+        if self.dealias_mask is not None:
+            u_hat = self.get_work_array('dealias', spectral=True)
+            self.xp.multiply(self._as_array(u), self.dealias_mask, out=u_hat)
+            u = u_hat
+        return self.fft.backward(u) if out is None else self.fft.backward(u, out)
+
+    def _forward_dealiased(self, u, out):
+        """
+        Transform the explicit part from real to spectral space and discard aliased modes if dealiasing is switched on.
+
+        Parameters
+        ----------
+        u : array
+            Values in real space.
+        out : dtype_u
+            Array to store the result in spectral space.
+
+        Returns
+        -------
+        dtype_u
+            The result.
+        """
+        self.fft.forward(u, out)
+        if self.dealias_mask is not None:
+            self.xp.multiply(self._as_array(out), self.dealias_mask, out=self._as_array(out))
+        return out
+
+    def _apply_symbol(self, u, symbol, out):
+        """
+        Fused transform to spectral space, multiplication with an operator and transform back to real space. The
+        multiplication is done in place in the output of the forward transform, so no temporaries are allocated.
+
+        Parameters
+        ----------
+        u : dtype_u
+            Values in real space.
+        symbol : array
+            Operator in spectral space.
+        out : dtype_u
+            Array to store the result in real space.
+
+        Returns
+        -------
+        dtype_u
+            The result.
+        """
+        u_hat = self.fft.forward(u)
+        u_hat *= symbol
+        self.fft.backward(u_hat, out)
+        return out
 
     def eval_f(self, u, t):
         """
@@ -147,12 +362,12 @@ class IMEX_Laplacian_MPIFFT(ptype):
 
         f = self.dtype_f(self.init)
 
-        f.impl[:] = self._eval_Laplacian(u, f.impl)
+        self._eval_Laplacian(u, f.impl)
 
         if self.spectral:
-            tmp = self.fft.backward(u)
-            tmp[:] = self._eval_explicit_part(tmp, t, tmp)
-            f.expl[:] = self.fft.forward(tmp)
+            tmp = self._backward_dealiased(u)
+            self._eval_explicit_part(tmp, t, tmp)
+            self._forward_dealiased(tmp, f.expl)
 
         else:
             f.expl[:] = self._eval_explicit_part(u, t, f.expl)
@@ -162,12 +377,11 @@ class IMEX_Laplacian_MPIFFT(ptype):
 
     def _eval_Laplacian(self, u, f_impl, alpha=None):
         alpha = alpha if alpha else self.alpha
+        symbol = self.get_symbol(('Laplacian', alpha), lambda: -alpha * self.K2)
         if self.spectral:
-            f_impl[:] = -alpha * self.K2 * u
+            self.xp.multiply(symbol, self._as_array(u), out=self._as_array(f_impl))
         else:
-            u_hat = self.fft.forward(u)
-            lap_u_hat = -alpha * self.K2 * u_hat
-            f_impl[:] = self.fft.backward(lap_u_hat, f_impl)
+            self._apply_symbol(u, symbol, f_impl)
         return f_impl
 
     def _eval_explicit_part(self, u, t, f_expl):
@@ -194,17 +408,15 @@ class IMEX_Laplacian_MPIFFT(ptype):
             The solution as mesh.
         """
         me = self.dtype_u(self.init)
-        me[:] = self._invert_Laplacian(me, factor, rhs)
+        self._invert_Laplacian(me, factor, rhs)
 
         return me
 
     def _invert_Laplacian(self, me, factor, rhs, alpha=None):
         alpha = alpha if alpha else self.alpha
+        symbol = self.get_symbol(('inverse Laplacian', factor, alpha), lambda: 1.0 / (1.0 + factor * alpha * self.K2))
         if self.spectral:
-            me[:] = rhs / (1.0 + factor * alpha * self.K2)
-
+            self.xp.multiply(symbol, self._as_array(rhs), out=self._as_array(me))
         else:
-            rhs_hat = self.fft.forward(rhs)
-            rhs_hat /= 1.0 + factor * alpha * self.K2
-            me[:] = self.fft.backward(rhs_hat)
+            self._apply_symbol(rhs, symbol, me)
         return me
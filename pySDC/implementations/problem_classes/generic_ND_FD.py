@@ -5,7 +5,7 @@ Created on Sat Feb 11 22:39:30 2023
 """
 import numpy as np
 import scipy.sparse as sp
-from scipy.sparse.linalg import gmres, spsolve, cg
+from scipy.sparse.linalg import gmres, spsolve, cg, splu
 
 from pySDC.core.Errors import ProblemError
 from pySDC.core.Problem import ptype, WorkCounter
@@ -66,6 +66,12 @@ class GenericNDimFinDiff(ptype):
         Default is None, which takes the default values for each parameters.
         You can also define a tuple to set different parameters for each
         side.
+    factorization_cache_size : int, optional
+        Number of sparse LU factorizations of :math:`(I - factor A)` that are
+        kept for reuse with the direct solver. The factorizations are stored
+        in a least-recently-used cache keyed by ``factor``, which takes only
+        as many distinct values as there are collocation nodes for a fixed
+        step size. Use 0 to disable the cache. Default is 8.
 
     Attributes
     ----------
@@ -75,6 +81,10 @@ class GenericNDimFinDiff(ptype):
         Identity matrix of the same dimension as A.
     xvalues : np.1darray
         Values of spatial grid.
+    factorization_cache : FactorizationCache or None
+        Cache for the LU factorizations used by the direct solver. Hits and
+        misses are counted in ``work_counters['factorization_hits']`` and
+        ``work_counters['factorization_misses']``.
     """
 
     dtype_u = mesh
@@ -93,6 +103,7 @@ class GenericNDimFinDiff(ptype):
         solver_type='direct',
         bc='periodic',
         bcParams=None,
+        factorization_cache_size=8,
     ):
         # make sure parameters have the correct types
         if not type(nvars) in [int, tuple]:
@@ -151,12 +162,21 @@ class GenericNDimFinDiff(ptype):
         self.Id = sp.eye(np.prod(nvars), format='csc')
 
         # store attribute and register them as parameters
-        self._makeAttributeAndRegister('nvars', 'stencil_type', 'order', 'bc', localVars=locals(), readOnly=True)
+        self._makeAttributeAndRegister(
+            'nvars', 'stencil_type', 'order', 'bc', 'factorization_cache_size', localVars=locals(), readOnly=True
+        )
         self._makeAttributeAndRegister('freq', 'lintol', 'liniter', 'solver_type', localVars=locals())
 
         if self.solver_type != 'direct':
             self.work_counters[self.solver_type] = WorkCounter()
 
+        if self.solver_type == 'direct' and factorization_cache_size > 0:
+            self.factorization_cache = problem_helper.FactorizationCache(size=factorization_cache_size)
+            self.work_counters['factorization_hits'] = self.factorization_cache.hits
+            self.work_counters['factorization_misses'] = self.factorization_cache.misses
+        else:
+            self.factorization_cache = None
+
     @property
     def ndim(self):
         """Number of dimensions of the spatial problem"""
@@ -204,6 +224,19 @@ class GenericNDimFinDiff(ptype):
         f[:] = self.A.dot(u.flatten()).reshape(self.nvars)
         return f
 
+    def get_linear_operator(self):
+        """
+        Finite difference matrix :math:`A` of the right-hand side, only available if ``eval_f`` is not overridden.
+
+        Returns
+        -------
+        A : sparse matrix (CSC) or None
+            The linear operator.
+        """
+        if type(self).eval_f is not GenericNDimFinDiff.eval_f:
+            return None
+        return self.A
+
     def solve_system(self, rhs, factor, u0, t):
         r"""
         Simple linear solver for :math:`(I-factor\cdot A)\vec{u}=\vec{rhs}`.
@@ -212,7 +245,7 @@ class GenericNDimFinDiff(ptype):
         ----------
         rhs : dtype_f
             Right-hand side for the linear system.
-        factor : float
+        factor : float or complex
             Abbrev. for the local stepsize (or any other factor required).
         u0 : dtype_u
             Initial guess for the iterative solver.
@@ -222,7 +255,7 @@ class GenericNDimFinDiff(ptype):
         Returns
         -------
         sol : dtype_u
-            The solution of the linear solver.
+            The solution of the linear solver, which is complex if the factor or the right-hand side are complex.
         """
         solver_type, Id, A, nvars, lintol, liniter, sol = (
             self.solver_type,
@@ -234,7 +267,14 @@ class GenericNDimFinDiff(ptype):
             self.u_init,
         )
 
-        if solver_type == 'direct':
+        # complex factors appear for instance when diagonalizing the collocation problem
+        if np.iscomplexobj(rhs) or np.iscomplexobj(factor):
+            sol = self.dtype_u((self.init[0], self.init[1], np.dtype('complex128')))
+
+        if solver_type == 'direct' and self.factorization_cache is not None:
+            LU = self.factorization_cache.get(factor, lambda: splu((Id - factor * A).tocsc()))
+            sol[:] = LU.solve(rhs.flatten()).reshape(nvars)
+        elif solver_type == 'direct':
             sol[:] = spsolve(Id - factor * A, rhs.flatten()).reshape(nvars)
         elif solver_type == 'GMRES':
             sol[:] = gmres(
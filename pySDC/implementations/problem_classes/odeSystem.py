@@ -13,6 +13,7 @@ on parallel computers. SIAM journal on scientific and statistical computing,
 import numpy as np
 
 from pySDC.core.Errors import ProblemError
+from pySDC.core.Newton import NewtonSolver
 from pySDC.core.Problem import ptype, WorkCounter
 from pySDC.implementations.datatype_classes.mesh import mesh
 
@@ -64,6 +65,9 @@ class ProtheroRobinsonAutonomous(ptype):
         Residuum tolerance for Newton iteration in solve_system. The default is 5e-11.
     stop_at_nan : bool, optional
         Wheter to stop or not solve_system when getting NAN. The default is True.
+    simplified_newton : bool, optional
+        Wether to freeze the Jacobian across Newton iterations and nodes until convergence degrades.
+        The default is False.
 
     Reference
     ---------
@@ -75,17 +79,35 @@ class ProtheroRobinsonAutonomous(ptype):
     dtype_u = mesh
     dtype_f = mesh
 
-    def __init__(self, epsilon=1e-3, nonLinear=False, newton_maxiter=200, newton_tol=5e-11, stop_at_nan=True):
+    def __init__(
+        self,
+        epsilon=1e-3,
+        nonLinear=False,
+        newton_maxiter=200,
+        newton_tol=5e-11,
+        stop_at_nan=True,
+        simplified_newton=False,
+    ):
         nvars = 2
         super().__init__((nvars, None, np.dtype('float64')))
 
         self.f = self.f_NONLIN if nonLinear else self.f_LIN
-        self.dgInv = self.dgInv_NONLIN if nonLinear else self.dgInv_LIN
+        self.jac = self.jac_NONLIN if nonLinear else self.jac_LIN
         self._makeAttributeAndRegister(
-            'epsilon', 'nonLinear', 'newton_maxiter', 'newton_tol', 'stop_at_nan', localVars=locals(), readOnly=True
+            'epsilon',
+            'nonLinear',
+            'newton_maxiter',
+            'newton_tol',
+            'stop_at_nan',
+            'simplified_newton',
+            localVars=locals(),
+            readOnly=True,
         )
-        self.work_counters['newton'] = WorkCounter()
         self.work_counters['rhs'] = WorkCounter()
+        self.newton_solver = NewtonSolver(
+            self.eval_f, self.jac, simplified=simplified_newton, rhs_counter=self.work_counters['rhs']
+        )
+        self.work_counters.update(self.newton_solver.work_counters)
 
     # -------------------------------------------------------------------------
     # g function (analytical solution), and its first and second derivative
@@ -111,20 +133,19 @@ class ProtheroRobinsonAutonomous(ptype):
     def f_NONLIN(self, u, t):
         return -self.epsilon ** (-1) * (u**3 - self.g(t) ** 3) + self.dg(t)
 
-    def dgInv(self, u, t):
+    def jac(self, u, t):
         raise NotImplementedError()
 
-    def dgInv_LIN(self, u, t, dt):
+    def jac_LIN(self, u, t):
         e = self.epsilon
-        g1, g2 = self.dg(t), self.dg2(t)
-        return np.array([[1 / (dt / e + 1), (dt * g2 + dt * g1 / e) / (dt / e + 1)], [0, 1]])
+        u, t = u
+        return np.array([[-1 / e, self.dg(t) / e + self.dg2(t)], [0, 0]])
 
-    def dgInv_NONLIN(self, u, t, dt):
+    def jac_NONLIN(self, u, t):
         e = self.epsilon
+        u, t = u
         g, g1, g2 = self.g(t), self.dg(t), self.dg2(t)
-        return np.array(
-            [[1 / (3 * dt * u**2 / e + 1), (dt * g2 + 3 * dt * g**2 * g1 / e) / (3 * dt * u**2 / e + 1)], [0, 1]]
-        )
+        return np.array([[-3 * u**2 / e, 3 * g**2 * g1 / e + g2], [0, 0]])
 
     # -------------------------------------------------------------------------
     # pySDC required methods
@@ -196,41 +217,20 @@ class ProtheroRobinsonAutonomous(ptype):
         u : dtype_u
             The solution as mesh.
         """
-        # create new mesh object from u0 and set initial values for iteration
-        u = self.dtype_u(u0)
-
-        # start newton iteration
-        n, res = 0, np.inf
-        while n < self.newton_maxiter:
-            # evaluate RHS
-            f = self.dtype_u(u)
-            f[0] = self.f(*u)
-            f[1] = 1
-
-            # form the function g with g(u) = 0
-            g = u - dt * f - rhs
-
-            # if g is close to 0, then we are done
-            res = np.linalg.norm(g, np.inf)
-            if res < self.newton_tol or np.isnan(res):
-                break
-
-            # assemble (dg/du)^{-1}
-            dgInv = self.dgInv(u[0], u[1], dt)
-            # newton update: u1 = u0 - g/dg
-            u -= dgInv @ g
-
-            # increase iteration count and work counter
-            n += 1
-            self.work_counters['newton']()
+        u = self.dtype_u(self.init)
+        u[:] = self.newton_solver.solve(rhs, dt, u0, t, tol=self.newton_tol, maxiter=self.newton_maxiter)
+        n, res = self.newton_solver.niter, self.newton_solver.residual
 
         if np.isnan(res) and self.stop_at_nan:
             raise ProblemError('Newton got nan after %i iterations, aborting...' % n)
         elif np.isnan(res):  # pragma: no cover
             self.logger.warning('Newton got nan after %i iterations...' % n)
 
-        if n == self.newton_maxiter:
+        # Newton may also stop early without convergence, e.g. when the Jacobian is singular
+        if not self.newton_solver.converged and (n == self.newton_maxiter or self.stop_at_nan):
             raise ProblemError('Newton did not converge after %i iterations, error is %s' % (n, res))
+        elif not self.newton_solver.converged and not np.isnan(res):  # pragma: no cover
+            self.logger.warning('Newton did not converge after %i iterations, error is %s' % (n, res))
 
         return u
 
@@ -259,6 +259,9 @@ class Kaps(ptype):
         Residuum tolerance for Newton iteration in solve_system. The default is 5e-11.
     stop_at_nan : bool, optional
         Wheter to stop or not solve_system when getting NAN. The default is True.
+    simplified_newton : bool, optional
+        Wether to freeze the Jacobian across Newton iterations and nodes until convergence degrades.
+        The default is False.
 
     Reference
     ---------
@@ -270,15 +273,24 @@ class Kaps(ptype):
     dtype_u = mesh
     dtype_f = mesh
 
-    def __init__(self, epsilon=1e-3, newton_maxiter=200, newton_tol=5e-11, stop_at_nan=True):
+    def __init__(self, epsilon=1e-3, newton_maxiter=200, newton_tol=5e-11, stop_at_nan=True, simplified_newton=False):
         nvars = 2
         super().__init__((nvars, None, np.dtype('float64')))
 
         self._makeAttributeAndRegister(
-            'epsilon', 'newton_maxiter', 'newton_tol', 'stop_at_nan', localVars=locals(), readOnly=True
+            'epsilon',
+            'newton_maxiter',
+            'newton_tol',
+            'stop_at_nan',
+            'simplified_newton',
+            localVars=locals(),
+            readOnly=True,
         )
-        self.work_counters['newton'] = WorkCounter()
         self.work_counters['rhs'] = WorkCounter()
+        self.newton_solver = NewtonSolver(
+            self.eval_f, self.jac, simplified=simplified_newton, rhs_counter=self.work_counters['rhs']
+        )
+        self.work_counters.update(self.newton_solver.work_counters)
 
     def u_exact(self, t, u_init=None, t_init=None):
         r"""
@@ -326,6 +338,26 @@ class Kaps(ptype):
         self.work_counters['rhs']()
         return f
 
+    def jac(self, u, t):
+        r"""
+        Routine to evaluate the Jacobian of the right-hand side.
+
+        Parameters
+        ----------
+        u : dtype_u
+            Current values of the numerical solution.
+        t : float
+            Current time of the numerical solution is computed (not used here).
+
+        Returns
+        -------
+        np.2darray
+            The Jacobian :math:`\partial f / \partial u`.
+        """
+        eps = self.epsilon
+        x, y = u
+        return np.array([[-(2 + 1 / eps), 2 * y / eps], [1, -(1 + 2 * y)]])
+
     def solve_system(self, rhs, dt, u0, t):
         """
         Simple Newton solver for the nonlinear equation
@@ -346,46 +378,20 @@ class Kaps(ptype):
         u : dtype_u
             The solution as mesh.
         """
-        # create new mesh object from u0 and set initial values for iteration
-        u = self.dtype_u(u0)
-        eps = self.epsilon
-
-        # start newton iteration
-        n, res = 0, np.inf
-        while n < self.newton_maxiter:
-            x, y = u
-            f = np.array([-(2 + 1 / eps) * x + y**2 / eps, x - y * (1 + y)])
-
-            # form the function g with g(u) = 0
-            g = u - dt * f - rhs
-
-            # if g is close to 0, then we are done
-            res = np.linalg.norm(g, np.inf)
-            if res < self.newton_tol or np.isnan(res):
-                break
-
-            # assemble (dg/du)^(-1)
-            prefactor = 4 * dt**2 * eps * y + 2 * dt**2 * eps + dt**2 + 2 * dt * eps * y + 3 * dt * eps + dt + eps
-            dgInv = (
-                1
-                / prefactor
-                * np.array([[2 * dt * eps * y + dt * eps + eps, 2 * dt * y], [dt * eps, 2 * dt * eps + dt + eps]])
-            )
-
-            # newton update: u1 = u0 - g/dg
-            u -= dgInv @ g
-
-            # increase iteration count and work counter
-            n += 1
-            self.work_counters['newton']()
+        u = self.dtype_u(self.init)
+        u[:] = self.newton_solver.solve(rhs, dt, u0, t, tol=self.newton_tol, maxiter=self.newton_maxiter)
+        n, res = self.newton_solver.niter, self.newton_solver.residual
 
         if np.isnan(res) and self.stop_at_nan:
             raise ProblemError('Newton got nan after %i iterations, aborting...' % n)
         elif np.isnan(res):  # pragma: no cover
             self.logger.warning('Newton got nan after %i iterations...' % n)
 
-        if n == self.newton_maxiter:
+        # Newton may also stop early without convergence, e.g. when the Jacobian is singular
+        if not self.newton_solver.converged and (n == self.newton_maxiter or self.stop_at_nan):
             raise ProblemError('Newton did not converge after %i iterations, error is %s' % (n, res))
+        elif not self.newton_solver.converged and not np.isnan(res):  # pragma: no cover
+            self.logger.warning('Newton did not converge after %i iterations, error is %s' % (n, res))
 
         return u
 
@@ -413,6 +419,9 @@ class ChemicalReaction3Var(ptype):
         Residuum tolerance for Newton iteration in solve_system. The default is 5e-11.
     stop_at_nan : bool, optional
         Wheter to stop or not solve_system when getting NAN. The default is True.
+    simplified_newton : bool, optional
+        Wether to freeze the Jacobian across Newton iterations and nodes until convergence degrades.
+        The default is False.
 
     Reference
     ---------
@@ -424,16 +433,19 @@ class ChemicalReaction3Var(ptype):
     dtype_u = mesh
     dtype_f = mesh
 
-    def __init__(self, newton_maxiter=200, newton_tol=5e-11, stop_at_nan=True):
+    def __init__(self, newton_maxiter=200, newton_tol=5e-11, stop_at_nan=True, simplified_newton=False):
         nvars = 3
         u0 = (0.990731920827, 1.009264413846, -0.366532612659e-5)
         super().__init__((nvars, None, np.dtype('float64')))
 
         self._makeAttributeAndRegister(
-            'u0', 'newton_maxiter', 'newton_tol', 'stop_at_nan', localVars=locals(), readOnly=True
+            'u0', 'newton_maxiter', 'newton_tol', 'stop_at_nan', 'simplified_newton', localVars=locals(), readOnly=True
         )
-        self.work_counters['newton'] = WorkCounter()
         self.work_counters['rhs'] = WorkCounter()
+        self.newton_solver = NewtonSolver(
+            self.eval_f, self.jac, simplified=simplified_newton, rhs_counter=self.work_counters['rhs']
+        )
+        self.work_counters.update(self.newton_solver.work_counters)
 
     def u_exact(self, t, u_init=None, t_init=None):
         r"""
@@ -499,6 +511,31 @@ class ChemicalReaction3Var(ptype):
         self.work_counters['rhs']()
         return f
 
+    def jac(self, u, t):
+        r"""
+        Routine to evaluate the Jacobian of the right-hand side.
+
+        Parameters
+        ----------
+        u : dtype_u
+            Current values of the numerical solution.
+        t : float
+            Current time of the numerical solution is computed (not used here).
+
+        Returns
+        -------
+        np.2darray
+            The Jacobian :math:`\partial f / \partial u`.
+        """
+        c1, c2, c3 = u
+        return -np.array(
+            [
+                [0.013 + 1000 * c3, 0, 1000 * c1],
+                [0, 2500 * c3, 2500 * c2],
+                [0.013 + 1000 * c3, 2500 * c3, 1000 * c1 + 2500 * c2],
+            ]
+        )
+
     def solve_system(self, rhs, dt, u0, t):
         """
         Simple Newton solver for the nonlinear equation
@@ -519,224 +556,20 @@ class ChemicalReaction3Var(ptype):
         u : dtype_u
             The solution as mesh.
         """
-        # create new mesh object from u0 and set initial values for iteration
-        u = self.dtype_u(u0)
-
-        # start newton iteration
-        n, res = 0, np.inf
-        while n < self.newton_maxiter:
-            c1, c2, c3 = u
-            f = -np.array([0.013 * c1 + 1000 * c3 * c1, 2500 * c3 * c2, 0.013 * c1 + 1000 * c1 * c3 + 2500 * c2 * c3])
-
-            # form the function g with g(u) = 0
-            g = u - dt * f - rhs
-
-            # if g is close to 0, then we are done
-            res = np.linalg.norm(g, np.inf)
-            if res < self.newton_tol or np.isnan(res):
-                break
-
-            # assemble (dg/du)^(-1)
-            dgInv = np.array(
-                [
-                    [
-                        (
-                            2500000000.0 * c1 * c3**2 * dt**3
-                            + 32500.0 * c1 * c3 * dt**3
-                            + 3500000.0 * c1 * c3 * dt**2
-                            + 13.0 * c1 * dt**2
-                            + 1000.0 * c1 * dt
-                            + 2500000.0 * c2 * c3 * dt**2
-                            + 32.5 * c2 * dt**2
-                            + 2500.0 * c2 * dt
-                            + 2500000.0 * c3**2 * dt**2
-                            + 32.5 * c3 * dt**2
-                            + 3500.0 * c3 * dt
-                            + 0.013 * dt
-                            + 1.0
-                        )
-                        / (
-                            2500000000.0 * c1 * c3**2 * dt**3
-                            + 32500.0 * c1 * c3 * dt**3
-                            + 3500000.0 * c1 * c3 * dt**2
-                            + 13.0 * c1 * dt**2
-                            + 1000.0 * c1 * dt
-                            + 2500000000.0 * c2 * c3**2 * dt**3
-                            + 65000.0 * c2 * c3 * dt**3
-                            + 5000000.0 * c2 * c3 * dt**2
-                            + 0.4225 * c2 * dt**3
-                            + 65.0 * c2 * dt**2
-                            + 2500.0 * c2 * dt
-                            + 2500000000.0 * c3**3 * dt**3
-                            + 65000.0 * c3**2 * dt**3
-                            + 6000000.0 * c3**2 * dt**2
-                            + 0.4225 * c3 * dt**3
-                            + 91.0 * c3 * dt**2
-                            + 4500.0 * c3 * dt
-                            + 0.000169 * dt**2
-                            + 0.026 * dt
-                            + 1.0
-                        ),
-                        (2500000000.0 * c1 * c3**2 * dt**3 + 32500.0 * c1 * c3 * dt**3 + 2500000.0 * c1 * c3 * dt**2)
-                        / (
-                            2500000000.0 * c1 * c3**2 * dt**3
-                            + 32500.0 * c1 * c3 * dt**3
-                            + 3500000.0 * c1 * c3 * dt**2
-                            + 13.0 * c1 * dt**2
-                            + 1000.0 * c1 * dt
-                            + 2500000000.0 * c2 * c3**2 * dt**3
-                            + 65000.0 * c2 * c3 * dt**3
-                            + 5000000.0 * c2 * c3 * dt**2
-                            + 0.4225 * c2 * dt**3
-                            + 65.0 * c2 * dt**2
-                            + 2500.0 * c2 * dt
-                            + 2500000000.0 * c3**3 * dt**3
-                            + 65000.0 * c3**2 * dt**3
-                            + 6000000.0 * c3**2 * dt**2
-                            + 0.4225 * c3 * dt**3
-                            + 91.0 * c3 * dt**2
-                            + 4500.0 * c3 * dt
-                            + 0.000169 * dt**2
-                            + 0.026 * dt
-                            + 1.0
-                        ),
-                        (
-                            -2500000000.0 * c1 * c3**2 * dt**3
-                            - 32500.0 * c1 * c3 * dt**3
-                            - 3500000.0 * c1 * c3 * dt**2
-                            - 13.0 * c1 * dt**2
-                            - 1000.0 * c1 * dt
-                        )
-                        / (
-                            2500000000.0 * c1 * c3**2 * dt**3
-                            + 32500.0 * c1 * c3 * dt**3
-                            + 3500000.0 * c1 * c3 * dt**2
-                            + 13.0 * c1 * dt**2
-                            + 1000.0 * c1 * dt
-                            + 2500000000.0 * c2 * c3**2 * dt**3
-                            + 65000.0 * c2 * c3 * dt**3
-                            + 5000000.0 * c2 * c3 * dt**2
-                            + 0.4225 * c2 * dt**3
-                            + 65.0 * c2 * dt**2
-                            + 2500.0 * c2 * dt
-                            + 2500000000.0 * c3**3 * dt**3
-                            + 65000.0 * c3**2 * dt**3
-                            + 6000000.0 * c3**2 * dt**2
-                            + 0.4225 * c3 * dt**3
-                            + 91.0 * c3 * dt**2
-                            + 4500.0 * c3 * dt
-                            + 0.000169 * dt**2
-                            + 0.026 * dt
-                            + 1.0
-                        ),
-                    ],
-                    [
-                        (6250000000.0 * c2 * c3 * dt**2 + 81250.0 * c2 * dt**2)
-                        / (
-                            6250000000.0 * c1 * c3 * dt**2
-                            + 2500000.0 * c1 * dt
-                            + 6250000000.0 * c2 * c3 * dt**2
-                            + 81250.0 * c2 * dt**2
-                            + 6250000.0 * c2 * dt
-                            + 6250000000.0 * c3**2 * dt**2
-                            + 81250.0 * c3 * dt**2
-                            + 8750000.0 * c3 * dt
-                            + 32.5 * dt
-                            + 2500.0
-                        ),
-                        (
-                            2500000.0 * c1 * dt
-                            + 6250000000.0 * c2 * c3 * dt**2
-                            + 81250.0 * c2 * dt**2
-                            + 6250000.0 * c2 * dt
-                            + 2500000.0 * c3 * dt
-                            + 32.5 * dt
-                            + 2500.0
-                        )
-                        / (
-                            6250000000.0 * c1 * c3 * dt**2
-                            + 2500000.0 * c1 * dt
-                            + 6250000000.0 * c2 * c3 * dt**2
-                            + 81250.0 * c2 * dt**2
-                            + 6250000.0 * c2 * dt
-                            + 6250000000.0 * c3**2 * dt**2
-                            + 81250.0 * c3 * dt**2
-                            + 8750000.0 * c3 * dt
-                            + 32.5 * dt
-                            + 2500.0
-                        ),
-                        (-6250000000.0 * c2 * c3 * dt**2 - 81250.0 * c2 * dt**2 - 6250000.0 * c2 * dt)
-                        / (
-                            6250000000.0 * c1 * c3 * dt**2
-                            + 2500000.0 * c1 * dt
-                            + 6250000000.0 * c2 * c3 * dt**2
-                            + 81250.0 * c2 * dt**2
-                            + 6250000.0 * c2 * dt
-                            + 6250000000.0 * c3**2 * dt**2
-                            + 81250.0 * c3 * dt**2
-                            + 8750000.0 * c3 * dt
-                            + 32.5 * dt
-                            + 2500.0
-                        ),
-                    ],
-                    [
-                        (-2500000.0 * c3**2 * dt**2 - 32.5 * c3 * dt**2 - 1000.0 * c3 * dt - 0.013 * dt)
-                        / (
-                            2500000.0 * c1 * c3 * dt**2
-                            + 1000.0 * c1 * dt
-                            + 2500000.0 * c2 * c3 * dt**2
-                            + 32.5 * c2 * dt**2
-                            + 2500.0 * c2 * dt
-                            + 2500000.0 * c3**2 * dt**2
-                            + 32.5 * c3 * dt**2
-                            + 3500.0 * c3 * dt
-                            + 0.013 * dt
-                            + 1.0
-                        ),
-                        (-2500000.0 * c3**2 * dt**2 - 32.5 * c3 * dt**2 - 2500.0 * c3 * dt)
-                        / (
-                            2500000.0 * c1 * c3 * dt**2
-                            + 1000.0 * c1 * dt
-                            + 2500000.0 * c2 * c3 * dt**2
-                            + 32.5 * c2 * dt**2
-                            + 2500.0 * c2 * dt
-                            + 2500000.0 * c3**2 * dt**2
-                            + 32.5 * c3 * dt**2
-                            + 3500.0 * c3 * dt
-                            + 0.013 * dt
-                            + 1.0
-                        ),
-                        (2500000.0 * c3**2 * dt**2 + 32.5 * c3 * dt**2 + 3500.0 * c3 * dt + 0.013 * dt + 1.0)
-                        / (
-                            2500000.0 * c1 * c3 * dt**2
-                            + 1000.0 * c1 * dt
-                            + 2500000.0 * c2 * c3 * dt**2
-                            + 32.5 * c2 * dt**2
-                            + 2500.0 * c2 * dt
-                            + 2500000.0 * c3**2 * dt**2
-                            + 32.5 * c3 * dt**2
-                            + 3500.0 * c3 * dt
-                            + 0.013 * dt
-                            + 1.0
-                        ),
-                    ],
-                ]
-            )
-
-            # newton update: u1 = u0 - g/dg
-            u -= dgInv @ g
-
-            # increase iteration count and work counter
-            n += 1
-            self.work_counters['newton']()
+        u = self.dtype_u(self.init)
+        u[:] = self.newton_solver.solve(rhs, dt, u0, t, tol=self.newton_tol, maxiter=self.newton_maxiter)
+        n, res = self.newton_solver.niter, self.newton_solver.residual
 
         if np.isnan(res) and self.stop_at_nan:
             raise ProblemError('Newton got nan after %i iterations, aborting...' % n)
         elif np.isnan(res):  # pragma: no cover
             self.logger.warning('Newton got nan after %i iterations...' % n)
 
-        if n == self.newton_maxiter:
+        # Newton may also stop early without convergence, e.g. when the Jacobian is singular
+        if not self.newton_solver.converged and (n == self.newton_maxiter or self.stop_at_nan):
             raise ProblemError('Newton did not converge after %i iterations, error is %s' % (n, res))
+        elif not self.newton_solver.converged and not np.isnan(res):  # pragma: no cover
+            self.logger.warning('Newton did not converge after %i iterations, error is %s' % (n, res))
 
         return u
 
@@ -760,6 +593,9 @@ class JacobiElliptic(ptype):
         Residuum tolerance for Newton iteration in solve_system. The default is 5e-11.
     stop_at_nan : bool, optional
         Wheter to stop or not solve_system when getting NAN. The default is True.
+    simplified_newton : bool, optional
+        Wether to freeze the Jacobian across Newton iterations and nodes until convergence degrades.
+        The default is False.
 
     Reference
     ---------
@@ -772,16 +608,19 @@ class JacobiElliptic(ptype):
     dtype_u = mesh
     dtype_f = mesh
 
-    def __init__(self, newton_maxiter=200, newton_tol=5e-11, stop_at_nan=True):
+    def __init__(self, newton_maxiter=200, newton_tol=5e-11, stop_at_nan=True, simplified_newton=False):
         nvars = 3
         u0 = (0.0, 1.0, 1.0)
         super().__init__((nvars, None, np.dtype('float64')))
 
         self._makeAttributeAndRegister(
-            'u0', 'newton_maxiter', 'newton_tol', 'stop_at_nan', localVars=locals(), readOnly=True
+            'u0', 'newton_maxiter', 'newton_tol', 'stop_at_nan', 'simplified_newton', localVars=locals(), readOnly=True
         )
-        self.work_counters['newton'] = WorkCounter()
         self.work_counters['rhs'] = WorkCounter()
+        self.newton_solver = NewtonSolver(
+            self.eval_f, self.jac, simplified=simplified_newton, rhs_counter=self.work_counters['rhs']
+        )
+        self.work_counters.update(self.newton_solver.work_counters)
 
     def u_exact(self, t, u_init=None, t_init=None):
         r"""
@@ -847,6 +686,25 @@ class JacobiElliptic(ptype):
         self.work_counters['rhs']()
         return f
 
+    def jac(self, u, t):
+        r"""
+        Routine to evaluate the Jacobian of the right-hand side.
+
+        Parameters
+        ----------
+        u : dtype_u
+            Current values of the numerical solution.
+        t : float
+            Current time of the numerical solution is computed (not used here).
+
+        Returns
+        -------
+        np.2darray
+            The Jacobian :math:`\partial f / \partial u`.
+        """
+        u1, u2, u3 = u
+        return np.array([[0, u3, u2], [-u3, 0, -u1], [-0.51 * u2, -0.51 * u1, 0]])
+
     def solve_system(self, rhs, dt, u0, t):
         """
         Simple Newton solver for the nonlinear equation
@@ -867,60 +725,19 @@ class JacobiElliptic(ptype):
         u : dtype_u
             The solution as mesh.
         """
-        # create new mesh object from u0 and set initial values for iteration
-        u = self.dtype_u(u0)
-
-        # start newton iteration
-        n, res = 0, np.inf
-        while n < self.newton_maxiter:
-            u1, u2, u3 = u
-            f = np.array([u2 * u3, -u1 * u3, -0.51 * u1 * u2])
-
-            # form the function g with g(u) = 0
-            g = u - dt * f - rhs
-
-            # if g is close to 0, then we are done
-            res = np.linalg.norm(g, np.inf)
-            if res < self.newton_tol or np.isnan(res):
-                break
-
-            # assemble (dg/du)^(-1)
-            dgInv = np.array(
-                [
-                    [
-                        0.51 * dt**2 * u1**2 - 1.0,
-                        0.51 * dt**2 * u1 * u2 - 1.0 * dt * u3,
-                        1.0 * dt**2 * u1 * u3 - 1.0 * dt * u2,
-                    ],
-                    [
-                        -0.51 * dt**2 * u1 * u2 + 1.0 * dt * u3,
-                        -0.51 * dt**2 * u2**2 - 1.0,
-                        1.0 * dt**2 * u2 * u3 + 1.0 * dt * u1,
-                    ],
-                    [
-                        -0.51 * dt**2 * u1 * u3 + 0.51 * dt * u2,
-                        0.51 * dt**2 * u2 * u3 + 0.51 * dt * u1,
-                        -1.0 * dt**2 * u3**2 - 1.0,
-                    ],
-                ]
-            )
-            dgInv /= (
-                1.02 * dt**3 * u1 * u2 * u3 + 0.51 * dt**2 * u1**2 - 0.51 * dt**2 * u2**2 - 1.0 * dt**2 * u3**2 - 1.0
-            )
-
-            # newton update: u1 = u0 - g/dg
-            u -= dgInv @ g
-
-            # increase iteration count and work counter
-            n += 1
-            self.work_counters['newton']()
+        u = self.dtype_u(self.init)
+        u[:] = self.newton_solver.solve(rhs, dt, u0, t, tol=self.newton_tol, maxiter=self.newton_maxiter)
+        n, res = self.newton_solver.niter, self.newton_solver.residual
 
         if np.isnan(res) and self.stop_at_nan:
             raise ProblemError('Newton got nan after %i iterations, aborting...' % n)
         elif np.isnan(res):  # pragma: no cover
             self.logger.warning('Newton got nan after %i iterations...' % n)
 
-        if n == self.newton_maxiter:
+        # Newton may also stop early without convergence, e.g. when the Jacobian is singular
+        if not self.newton_solver.converged and (n == self.newton_maxiter or self.stop_at_nan):
             raise ProblemError('Newton did not converge after %i iterations, error is %s' % (n, res))
+        elif not self.newton_solver.converged and not np.isnan(res):  # pragma: no cover
+            self.logger.warning('Newton did not converge after %i iterations, error is %s' % (n, res))
 
         return u
@@ -0,0 +1,406 @@
+r"""
+Backends for the smoothed Coulomb interaction between particles
+
+.. math::
+    E_{int}(x_{i})=\sum_{k=1, k\neq i}^{N_{particles}}Q_{k}\frac{x_{i}-x_{k}}{(|x_{i}-x_{k}|^{2}+\lambda^{2})^{3/2}}
+
+All backends take positions of shape (3, N) and return the field with the same shape.
+
+- `direct_interactions` sums all pairs exactly in :math:`\mathcal{O}(N^2)`.
+- `build_octree` and `barnes_hut_interactions` form a tree code in :math:`\mathcal{O}(N\log N)`. Distant groups of
+  particles are replaced by their total charge in their center of charge, controlled by an opening angle.
+- `build_cell_list` and `cell_list_interactions` only sum pairs closer than a cutoff radius in :math:`\mathcal{O}(N)`.
+"""
+
+import numpy as np
+from numba import jit
+
+# number of bits per dimension in the Morton keys, which is also the maximum depth of the octree
+MORTON_BITS = 21
+
+
+@jit(nopython=True, nogil=True)
+def direct_interactions(pos, sig, q):
+    """
+    Compute the interactions by summing over all pairs of particles
+
+    Args:
+        pos (numpy.ndarray): Positions of the particles
+        sig (float): Smoothing parameter
+        q (numpy.ndarray): Charges of the particles
+
+    Returns:
+        numpy.ndarray: Internal electric field at the particles
+    """
+    N = pos.shape[1]
+    Efield = np.zeros((3, N))
+
+    for i in range(N):
+        ex = 0.0
+        ey = 0.0
+        ez = 0.0
+
+        for j in range(N):
+            dx = pos[0, i] - pos[0, j]
+            dy = pos[1, i] - pos[1, j]
+            dz = pos[2, i] - pos[2, j]
+            dist2 = dx**2 + dy**2 + dz**2 + sig**2
+            ex += q[j] * dx / dist2**1.5
+            ey += q[j] * dy / dist2**1.5
+            ez += q[j] * dz / dist2**1.5
+
+        Efield[0, i] = ex
+        Efield[1, i] = ey
+        Efield[2, i] = ez
+
+    return Efield
+
+
+@jit(nopython=True, nogil=True)
+def _spread_bits(x):
+    """
+    Insert two zeros between each of the lower 21 bits of an integer
+    """
+    x &= 0x1FFFFF
+    x = (x | x << 32) & 0x1F00000000FFFF
+    x = (x | x << 16) & 0x1F0000FF0000FF
+    x = (x | x << 8) & 0x100F00F00F00F00F
+    x = (x | x << 4) & 0x10C30C30C30C30C3
+    x = (x | x << 2) & 0x1249249249249249
+    return x
+
+
+@jit(nopython=True, nogil=True)
+def _morton_keys(pos):
+    """
+    Compute Morton keys of the particles in the bounding cube of all particles
+    """
+    N = pos.shape[1]
+    lo = np.empty(3)
+    size = 0.0
+    for d in range(3):
+        lo[d] = pos[d].min()
+        size = max(size, pos[d].max() - lo[d])
+    scale = 2**MORTON_BITS / size if size > 0 else 0.0
+
+    keys = np.empty(N, dtype=np.int64)
+    for i in range(N):
+        key = 0
+        for d in range(3):
+            idx = min(np.int64((pos[d, i] - lo[d]) * scale), 2**MORTON_BITS - 1)
+            key |= _spread_bits(idx) << (2 - d)
+        keys[i] = key
+    return keys
+
+
+@jit(nopython=True, nogil=True)
+def _split(keys, start, end, level, child_start):
+    """
+    Split a range of sorted keys into the octants of the next level and store the start of each non-empty octant in
+    `child_start`, followed by the end of the range
+
+    Returns:
+        int: Number of non-empty octants
+    """
+    shift = 3 * (MORTON_BITS - level - 1)
+    nchild = 0
+    last = -1
+    for i in range(start, end):
+        octant = (keys[i] >> shift) & 7
+        if octant != last:
+            child_start[nchild] = i
+            nchild += 1
+            last = octant
+    child_start[nchild] = end
+    return nchild
+
+
+@jit(nopython=True, nogil=True)
+def build_octree(pos, q, leaf_size):
+    """
+    Build an octree over the particles with the total charge and the center of charge of every node. The particles are
+    sorted along a Morton curve such that every node contains a contiguous range of them. Nodes are split until they
+    contain at most `leaf_size` particles or the maximum depth is reached. Children of a node are stored contiguously.
+
+    The center of charge is weighted with the absolute values of the charges such that it is well-defined for mixed
+    charges.
+
+    Args:
+        pos (numpy.ndarray): Positions of the particles
+        q (numpy.ndarray): Charges of the particles
+        leaf_size (int): Maximum number of particles in a leaf
+
+    Returns:
+        numpy.ndarray: Permutation sorting the particles along the Morton curve
+        numpy.ndarray: Index of the first particle of every node in the sorted particles
+        numpy.ndarray: Index after the last particle of every node in the sorted particles
+        numpy.ndarray: Index of the first child of every node
+        numpy.ndarray: Number of children of every node, zero for leaves
+        numpy.ndarray: Total charge of every node
+        numpy.ndarray: Center of charge of every node with shape (3, number of nodes)
+        numpy.ndarray: Lower corner of the bounding box of the particles in every node
+        numpy.ndarray: Upper corner of the bounding box of the particles in every node
+    """
+    keys = _morton_keys(pos)
+    perm = np.argsort(keys, kind='mergesort')
+    keys = keys[perm]
+    child_start = np.empty(9, dtype=np.int64)
+
+    # count the nodes first such that the tree can be stored in arrays of fixed size
+    stack = np.empty((8 * (MORTON_BITS + 1) + 1, 3), dtype=np.int64)
+    stack[0, 0], stack[0, 1], stack[0, 2] = 0, keys.size, 0
+    nstack = 1
+    nnodes = 1
+    while nstack > 0:
+        nstack -= 1
+        start, end, depth = stack[nstack, 0], stack[nstack, 1], stack[nstack, 2]
+        if end - start > leaf_size and depth < MORTON_BITS:
+            nchild = _split(keys, start, end, depth, child_start)
+            nnodes += nchild
+            for c in range(nchild):
+                stack[nstack, 0], stack[nstack, 1], stack[nstack, 2] = child_start[c], child_start[c + 1], depth + 1
+                nstack += 1
+
+    node_start = np.empty(nnodes, dtype=np.int64)
+    node_end = np.empty(nnodes, dtype=np.int64)
+    level = np.empty(nnodes, dtype=np.int64)
+    first_child = np.zeros(nnodes, dtype=np.int64)
+    num_children = np.zeros(nnodes, dtype=np.int64)
+    node_start[0], node_end[0], level[0] = 0, keys.size, 0
+
+    # fill the nodes in breadth first order, such that children always come after their parents
+    nfilled = 1
+    for k in range(nnodes):
+        if node_end[k] - node_start[k] > leaf_size and level[k] < MORTON_BITS:
+            nchild = _split(keys, node_start[k], node_end[k], level[k], child_start)
+            first_child[k] = nfilled
+            num_children[k] = nchild
+            for c in range(nchild):
+                node_start[nfilled] = child_start[c]
+                node_end[nfilled] = child_start[c + 1]
+                level[nfilled] = level[k] + 1
+                nfilled += 1
+
+    # accumulate the moments from the leaves to the root
+    charge = np.zeros(nnodes)
+    abs_charge = np.zeros(nnodes)
+    center = np.zeros((3, nnodes))
+    box_lo = np.full((3, nnodes), np.inf)
+    box_hi = np.full((3, nnodes), -np.inf)
+    for k in range(nnodes - 1, -1, -1):
+        if num_children[k] == 0:
+            for i in perm[node_start[k] : node_end[k]]:
+                charge[k] += q[i]
+                abs_charge[k] += abs(q[i])
+                for d in range(3):
+                    center[d, k] += abs(q[i]) * pos[d, i]
+                    box_lo[d, k] = min(box_lo[d, k], pos[d, i])
+                    box_hi[d, k] = max(box_hi[d, k], pos[d, i])
+        else:
+            for c in range(first_child[k], first_child[k] + num_children[k]):
+                charge[k] += charge[c]
+                abs_charge[k] += abs_charge[c]
+                for d in range(3):
+                    center[d, k] += center[d, c]
+                    box_lo[d, k] = min(box_lo[d, k], box_lo[d, c])
+                    box_hi[d, k] = max(box_hi[d, k], box_hi[d, c])
+
+    for k in range(nnodes):
+        for d in range(3):
+            if abs_charge[k] > 0:
+                center[d, k] /= abs_charge[k]
+            else:
+                center[d, k] = 0.5 * (box_lo[d, k] + box_hi[d, k])
+
+    return perm, node_start, node_end, first_child, num_children, charge, center, box_lo, box_hi
+
+
+@jit(nopython=True, nogil=True)
+def barnes_hut_interactions(pos, sig, q, theta, tree):
+    """
+    Compute the interactions by traversing an octree. A node is approximated by its total charge in its center of
+    charge if the particle is outside of its bounding box and the largest edge of the bounding box is smaller than
+    `theta` times the distance to the center of charge. Otherwise, its children are visited or, for leaves, the
+    interactions with its particles are summed directly. For `theta = 0`, the result matches the direct sum up to
+    round-off errors.
+
+    Args:
+        pos (numpy.ndarray): Positions of the particles
+        sig (float): Smoothing parameter
+        q (numpy.ndarray): Charges of the particles
+        theta (float): Opening angle
+        tree (tuple): Octree as returned by `build_octree`
+
+    Returns:
+        numpy.ndarray: Internal electric field at the particles
+    """
+    perm, node_start, node_end, first_child, num_children, charge, center, box_lo, box_hi = tree
+    N = pos.shape[1]
+    Efield = np.zeros((3, N))
+    stack = np.empty(8 * (MORTON_BITS + 1) + 1, dtype=np.int64)
+
+    for i in range(N):
+        ex = 0.0
+        ey = 0.0
+        ez = 0.0
+
+        stack[0] = 0
+        nstack = 1
+        while nstack > 0:
+            nstack -= 1
+            k = stack[nstack]
+
+            if num_children[k] == 0:
+                for j in perm[node_start[k] : node_end[k]]:
+                    dx = pos[0, i] - pos[0, j]
+                    dy = pos[1, i] - pos[1, j]
+                    dz = pos[2, i] - pos[2, j]
+                    dist2 = dx**2 + dy**2 + dz**2 + sig**2
+                    ex += q[j] * dx / dist2**1.5
+                    ey += q[j] * dy / dist2**1.5
+                    ez += q[j] * dz / dist2**1.5
+                continue
+
+            inside = True
+            edge = 0.0
+            for d in range(3):
+                inside = inside and box_lo[d, k] <= pos[d, i] <= box_hi[d, k]
+                edge = max(edge, box_hi[d, k] - box_lo[d, k])
+
+            dx = pos[0, i] - center[0, k]
+            dy = pos[1, i] - center[1, k]
+            dz = pos[2, i] - center[2, k]
+            r2 = dx**2 + dy**2 + dz**2
+
+            if not inside and edge**2 < theta**2 * r2:
+                dist2 = r2 + sig**2
+                ex += charge[k] * dx / dist2**1.5
+                ey += charge[k] * dy / dist2**1.5
+                ez += charge[k] * dz / dist2**1.5
+            else:
+                for c in range(first_child[k], first_child[k] + num_children[k]):
+                    stack[nstack] = c
+                    nstack += 1
+
+        Efield[0, i] = ex
+        Efield[1, i] = ey
+        Efield[2, i] = ez
+
+    return Efield
+
+
+def get_cell_grid(pos, cutoff, max_cells_per_particle=8):
+    """
+    Get a grid of cubic cells covering all particles with edges of at least the cutoff radius. The cells are enlarged
+    if there would be more than `max_cells_per_particle` cells per particle, which keeps the memory bounded for
+    particles spread over large domains.
+
+    Args:
+        pos (numpy.ndarray): Positions of the particles
+        cutoff (float): Cutoff radius
+        max_cells_per_particle (int): Maximum number of cells per particle
+
+    Returns:
+        numpy.ndarray: Lower corner of the grid
+        float: Edge length of the cells
+        numpy.ndarray: Number of cells in each dimension
+    """
+    lo = pos.min(axis=1)
+    extent = pos.max(axis=1) - lo
+
+    h = float(cutoff)
+    ncells = np.floor(extent / h).astype(np.int64) + 1
+    while np.prod(ncells) > max_cells_per_particle * max(pos.shape[1], 1):
+        h *= 2
+        ncells = np.floor(extent / h).astype(np.int64) + 1
+    return lo, h, ncells
+
+
+@jit(nopython=True, nogil=True)
+def build_cell_list(pos, lo, h, ncells):
+    """
+    Sort the particles into cells of a grid as obtained from `get_cell_grid`
+
+    Args:
+        pos (numpy.ndarray): Positions of the particles
+        lo (numpy.ndarray): Lower corner of the grid
+        h (float): Edge length of the cells
+        ncells (numpy.ndarray): Number of cells in each dimension
+
+    Returns:
+        numpy.ndarray: Permutation sorting the particles by cells
+        numpy.ndarray: Index of the first particle of every cell in the sorted particles, followed by the number of
+            particles
+    """
+    N = pos.shape[1]
+    cell = np.empty(N, dtype=np.int64)
+    for i in range(N):
+        idx = 0
+        for d in range(3):
+            idx = idx * ncells[d] + min(np.int64((pos[d, i] - lo[d]) / h), ncells[d] - 1)
+        cell[i] = idx
+
+    cell_start = np.zeros(ncells[0] * ncells[1] * ncells[2] + 1, dtype=np.int64)
+    for i in range(N):
+        cell_start[cell[i] + 1] += 1
+    cell_start = np.cumsum(cell_start)
+
+    perm = np.empty(N, dtype=np.int64)
+    fill = cell_start[:-1].copy()
+    for i in range(N):
+        perm[fill[cell[i]]] = i
+        fill[cell[i]] += 1
+    return perm, cell_start
+
+
+@jit(nopython=True, nogil=True)
+def cell_list_interactions(pos, sig, q, cutoff, lo, h, ncells, cells):
+    """
+    Compute the interactions with all particles closer than the cutoff radius by searching the neighbouring cells
+
+    Args:
+        pos (numpy.ndarray): Positions of the particles
+        sig (float): Smoothing parameter
+        q (numpy.ndarray): Charges of the particles
+        cutoff (float): Cutoff radius
+        lo (numpy.ndarray): Lower corner of the grid
+        h (float): Edge length of the cells
+        ncells (numpy.ndarray): Number of cells in each dimension
+        cells (tuple): Cell list as returned by `build_cell_list`
+
+    Returns:
+        numpy.ndarray: Internal electric field at the particles
+    """
+    perm, cell_start = cells
+    N = pos.shape[1]
+    Efield = np.zeros((3, N))
+    idx = np.empty(3, dtype=np.int64)
+
+    for i in range(N):
+        ex = 0.0
+        ey = 0.0
+        ez = 0.0
+
+        for d in range(3):
+            idx[d] = min(np.int64((pos[d, i] - lo[d]) / h), ncells[d] - 1)
+
+        for cx in range(max(idx[0] - 1, 0), min(idx[0] + 2, ncells[0])):
+            for cy in range(max(idx[1] - 1, 0), min(idx[1] + 2, ncells[1])):
+                for cz in range(max(idx[2] - 1, 0), min(idx[2] + 2, ncells[2])):
+                    c = (cx * ncells[1] + cy) * ncells[2] + cz
+                    for j in perm[cell_start[c] : cell_start[c + 1]]:
+                        dx = pos[0, i] - pos[0, j]
+                        dy = pos[1, i] - pos[1, j]
+                        dz = pos[2, i] - pos[2, j]
+                        r2 = dx**2 + dy**2 + dz**2
+                        if r2 < cutoff**2:
+                            dist2 = r2 + sig**2
+                            ex += q[j] * dx / dist2**1.5
+                            ey += q[j] * dy / dist2**1.5
+                            ez += q[j] * dz / dist2**1.5
+
+        Efield[0, i] = ex
+        Efield[1, i] = ey
+        Efield[2, i] = ez
+
+    return Efield
@@ -110,12 +110,14 @@ class boris_2nd_order(sweeper):
         # initialize integral terms with zeros, will add stuff later
         integral = [P.dtype_u(P.init, val=0.0) for l in range(M)]
 
+        # build RHS from f-terms (containing the E field) and the B field once per node
+        rhs = [P.build_f(L.f[j], L.u[j], L.time + L.dt * self.coll.nodes[j - 1]) for j in range(M + 1)]
+
         # gather all terms which are known already (e.g. from the previous iteration)
         # this corresponds to SF(u^k) - SdF(u^k) + tau (note: have integrals in pos and vel!)
         for m in range(M):
             for j in range(M + 1):
-                # build RHS from f-terms (containing the E field) and the B field
-                f = P.build_f(L.f[j], L.u[j], L.time + L.dt * self.coll.nodes[j - 1])
+                f = rhs[j]
                 # add SQF(u^k) - SxF(u^k) for the position
                 integral[m].pos += L.dt * (L.dt * (self.SQ[m + 1, j] - self.Sx[m + 1, j]) * f)
                 # add SF(u^k) - STF(u^k) for the velocity
@@ -131,11 +133,12 @@ class boris_2nd_order(sweeper):
         for m in range(0, M):
             # build rhs, consisting of the known values from above and new values from previous nodes (at k+1)
             tmp = P.dtype_u(integral[m])
+            # the RHS at the previous node has been updated in the last step of the sweep
+            if m > 0:
+                rhs[m] = P.build_f(L.f[m], L.u[m], L.time + L.dt * self.coll.nodes[m - 1])
             for j in range(m + 1):
-                # build RHS from f-terms (containing the E field) and the B field
-                f = P.build_f(L.f[j], L.u[j], L.time + L.dt * self.coll.nodes[j - 1])
                 # add SxF(u^{k+1})
-                tmp.pos += L.dt * (L.dt * self.Sx[m + 1, j] * f)
+                tmp.pos += L.dt * (L.dt * self.Sx[m + 1, j] * rhs[j])
             # add pos at previous node + dt*v0
             tmp.pos += L.u[m].pos + L.dt * self.coll.delta_m[m] * L.u[0].vel
             # set new position, is explicit
@@ -1,3 +1,5 @@
+import numpy as np
+
 from pySDC.core.Sweeper import sweeper
 
 
@@ -5,6 +7,16 @@ class generic_implicit(sweeper):
     """
     Generic implicit sweeper, expecting lower triangular matrix type as input
 
+    If the level stores the values at the nodes contiguously (level parameter `stacked_nodes`), the quadrature is
+    computed for all nodes at once with a single matrix product instead of looping over the nodes.
+
+    With a diagonal preconditioner, the solves at the nodes are independent and can be distributed to threads with the
+    parameter `num_threads`. This requires the problem to be thread-safe.
+
+    For problems with a constant linear operator, the collocation problem can be solved directly instead of sweeping
+    by diagonalizing Q (parameter `diagonalize_Q`). The solves for the eigenvalues are independent and can be
+    distributed to threads with the parameter `num_threads`.
+
     Attributes:
         QI: lower triangular matrix
     """
@@ -19,6 +31,8 @@ class generic_implicit(sweeper):
 
         if 'QI' not in params:
             params['QI'] = 'IE'
+        if 'diagonalize_Q' not in params:
+            params['diagonalize_Q'] = False
 
         # call parent's initialization routine
         super().__init__(params)
@@ -37,17 +51,32 @@ class generic_implicit(sweeper):
         L = self.level
         P = L.prob
 
+        if self.stacked:
+            return L.u.wrap(np.tensordot(L.dt * self.coll.Qmat[1:, 1:], L.f.data[1:], axes=1))
+
         me = []
 
         # integrate RHS over all collocation nodes
         for m in range(1, self.coll.num_nodes + 1):
             # new instance of dtype_u, initialize values with 0
-            me.append(P.dtype_u(P.init, val=0.0))
+            me.append(P.borrow_u(val=0.0))
             for j in range(1, self.coll.num_nodes + 1):
-                me[-1] += L.dt * self.coll.Qmat[m, j] * L.f[j]
+                me[-1] = P.accumulate(me[-1], L.dt * self.coll.Qmat[m, j] * L.f[j])
 
         return me
 
+    @property
+    def stacked_integrand(self):
+        """
+        Stacked right hand side values at the collocation nodes, if `integrate` is not overloaded by a derived class
+
+        Returns:
+            numpy.ndarray: Stacked integrand at the collocation nodes or None if not available
+        """
+        if self.stacked and type(self).integrate is generic_implicit.integrate:
+            return self.level.f.data[1:]
+        return None
+
     def update_nodes(self):
         """
         Update the u- and f-values at the collocation nodes -> corresponds to a single sweep over all nodes
@@ -74,11 +103,26 @@ class generic_implicit(sweeper):
                 self.params.QI = 'MIN-SR-FLEX' + str(k)
             self.QI = self.get_Qdelta_implicit(self.coll, qd_type=self.params.QI)
 
+        # solve the collocation problem directly for problems with a constant linear operator if requested
+        if self.params.diagonalize_Q and self.get_linear_operator('diagonalize_Q') is not None:
+            self.solve_collocation_problem()
+            return None
+
+        # use a precomputed sweep for problems with a constant linear operator if requested
+        solver = self.get_sweep_solver(self.QI[1:, 1:])
+        if solver is not None:
+            self.update_nodes_matrix(solver)
+            return None
+
         # gather all terms which are known already (e.g. from the previous iteration)
         # this corresponds to u0 + QF(u^k) - QdF(u^k) + tau
 
-        # get QF(u^k)
-        integral = self.integrate()
+        if self.stacked:
+            self.update_nodes_stacked()
+            return None
+
+        # get QF(u^k), possibly left over from the computation of the residual
+        integral = self.get_quadrature()
         for m in range(M):
             # get -QdF(u^k)_m
             for j in range(1, M + 1):
@@ -91,18 +135,129 @@ class generic_implicit(sweeper):
                 integral[m] += L.tau[m]
 
         # do the sweep
-        for m in range(0, M):
-            # build rhs, consisting of the known values from above and new values from previous nodes (at k+1)
-            rhs = P.dtype_u(integral[m])
-            for j in range(1, m + 1):
-                rhs += L.dt * self.QI[m + 1, j] * L.f[j]
-
-            # implicit solve with prefactor stemming from the diagonal of Qd
-            alpha = L.dt * self.QI[m + 1, m + 1]
-            if alpha == 0:
-                L.u[m + 1] = rhs
-            else:
-                L.u[m + 1] = P.solve_system(rhs, alpha, L.u[m + 1], L.time + L.dt * self.coll.nodes[m])
+        if self.params.num_threads > 1 and self.parallelizable:
+            # with a diagonal preconditioner, there are no new values from previous nodes and we can solve concurrently
+            new_values = self.map_nodes(self.solve_node, range(M), [P.dtype_u(me) for me in integral])
+            for m in range(M):
+                L.u[m + 1], L.f[m + 1] = new_values[m]
+        else:
+            for m in range(0, M):
+                # build rhs, consisting of the known values from above and new values from previous nodes (at k+1)
+                rhs = P.dtype_u(integral[m])
+                for j in range(1, m + 1):
+                    rhs += L.dt * self.QI[m + 1, j] * L.f[j]
+
+                L.u[m + 1], L.f[m + 1] = self.solve_node(m, rhs)
+
+        # the integrals are not needed anymore and can be reused as temporaries
+        P.give_back(*integral)
+
+        # indicate presence of new values at this level
+        L.status.updated = True
+
+        return None
+
+    def solve_node(self, m, rhs):
+        """
+        Implicit solve with prefactor stemming from the diagonal of Qd at a single node and evaluation of the right hand
+        side with the new value. This only reads from the level, such that it can be called concurrently for independent
+        nodes.
+
+        Args:
+            m (int): Index of the node, starting from 0
+            rhs (dtype_u): Right hand side of the implicit system
+
+        Returns:
+            dtype_u: New value at the node
+            dtype_f: Right hand side evaluated with the new value
+        """
+        L = self.level
+        P = L.prob
+
+        t = L.time + L.dt * self.coll.nodes[m]
+        alpha = L.dt * self.QI[m + 1, m + 1]
+        if alpha == 0:
+            u = P.dtype_u(rhs)
+        else:
+            u = P.solve_system(rhs, alpha, L.u[m + 1], t)
+        return u, P.eval_f(u, t)
+
+    def update_nodes_stacked(self):
+        """
+        Same as `update_nodes`, but with the quadrature carried out as matrix products on the contiguous arrays of the
+        values at the nodes
+
+        Returns:
+            None
+        """
+
+        L = self.level
+
+        M = self.coll.num_nodes
+
+        # gather u0 + QF(u^k) - QdF(u^k) for all nodes at once
+        integral = np.tensordot(L.dt * (self.coll.Qmat[1:, 1:] - self.QI[1:, 1:]), L.f.data[1:], axes=1)
+        integral += L.u.data[0]
+        for m in range(M):
+            # add tau if associated
+            if L.tau[m] is not None:
+                integral[m] += L.tau[m]
+        rhs = L.u.wrap(integral)
+
+        # do the sweep
+        if self.params.num_threads > 1 and self.parallelizable:
+            # with a diagonal preconditioner, there are no new values from previous nodes and we can solve concurrently
+            new_values = self.map_nodes(self.solve_node, range(M), rhs)
+            for m in range(M):
+                L.u[m + 1], L.f[m + 1] = new_values[m]
+        else:
+            for m in range(0, M):
+                # add new values from previous nodes (at k+1)
+                if m > 0:
+                    integral[m] += np.tensordot(L.dt * self.QI[m + 1, 1 : m + 1], L.f.data[1 : m + 1], axes=1)
+
+                L.u[m + 1], L.f[m + 1] = self.solve_node(m, rhs[m])
+
+        # indicate presence of new values at this level
+        L.status.updated = True
+
+        return None
+
+    def update_nodes_matrix(self, solver):
+        """
+        Same as `update_nodes`, but with the implicit solves for all nodes carried out at once by a precomputed solver
+        for linear problems, see `get_sweep_solver`
+
+        Args:
+            solver (function): Solver for the space-time system of the sweep
+
+        Returns:
+            None
+        """
+
+        L = self.level
+        P = L.prob
+
+        M = self.coll.num_nodes
+
+        # the quadrature is included in the right hand side below
+        self.reset_quadrature()
+
+        # gather u0 + QF(u^k) - QdF(u^k) + tau for all nodes at once
+        f = L.f.data[1:] if self.stacked else np.array([L.f[m] for m in range(1, M + 1)])
+        rhs = np.tensordot(L.dt * (self.coll.Qmat[1:, 1:] - self.QI[1:, 1:]), f, axes=1)
+        rhs += L.u[0]
+        for m in range(M):
+            # add tau if associated
+            if L.tau[m] is not None:
+                rhs[m] += L.tau[m]
+
+        # solve for the new values at all nodes at once
+        sol = solver(rhs)
+        for m in range(M):
+            u = P.dtype_u(P.init)
+            u[:] = sol[m]
+            L.u[m + 1] = u
             # update function values
             L.f[m + 1] = P.eval_f(L.u[m + 1], L.time + L.dt * self.coll.nodes[m])
 
@@ -111,6 +266,62 @@ class generic_implicit(sweeper):
 
         return None
 
+    def solve_collocation_problem(self):
+        """
+        Solve the collocation problem u - dt Q A u = u0 + tau directly for problems with a constant linear operator A.
+        With the eigendecomposition Q = V D V^-1, the problem decouples into the independent systems
+        (I - dt D_m A) v_m = (V^-1 (u0 + tau))_m for the transformed values v = V^-1 u. These are solved with
+        `solve_system` of the problem, which has to support complex factors, and distributed to threads if requested.
+
+        Returns:
+            None
+        """
+
+        L = self.level
+        P = L.prob
+
+        M = self.coll.num_nodes
+        D, V, Vinv = self.coll.Qmat_eig
+
+        # the values at the nodes are replaced without using the quadrature
+        self.reset_quadrature()
+
+        # gather u0 + tau for all nodes and transform the right hand side and the initial guess
+        rhs = np.array([L.u[0]] * M)
+        for m in range(M):
+            # add tau if associated
+            if L.tau[m] is not None:
+                rhs[m] += L.tau[m]
+        guess = L.u.data[1:] if self.stacked else np.array([L.u[m] for m in range(1, M + 1)])
+        init = (P.init[0], P.init[1], np.result_type(P.init[2], Vinv.dtype))
+
+        def transform(values):
+            transformed = []
+            for me in np.tensordot(Vinv, values, axes=1):
+                transformed.append(P.dtype_u(init))
+                transformed[-1][:] = me
+            return transformed
+
+        def solve(rhs, u0, factor):
+            # the transformed values do not belong to a node, but the operator does not depend on time anyway
+            return P.solve_system(rhs, factor, u0, L.time + L.dt)
+
+        # solve the decoupled systems, possibly in parallel
+        sol = self.map_nodes(solve, transform(rhs), transform(guess), L.dt * D)
+
+        # transform back and update the function values
+        sol = np.tensordot(V, np.array(sol), axes=1)
+        for m in range(M):
+            u = P.dtype_u(P.init)
+            u[:] = sol[m] if np.iscomplexobj(u) else sol[m].real
+            L.u[m + 1] = u
+            L.f[m + 1] = P.eval_f(L.u[m + 1], L.time + L.dt * self.coll.nodes[m])
+
+        # indicate presence of new values at this level
+        L.status.updated = True
+
+        return None
+
     def compute_end_point(self):
         """
         Compute u at the right point of the interval
@@ -131,8 +342,11 @@ class generic_implicit(sweeper):
         else:
             # start with u0 and add integral over the full interval (using coll.weights)
             L.uend = P.dtype_u(L.u[0])
-            for m in range(self.coll.num_nodes):
-                L.uend += L.dt * self.coll.weights[m] * L.f[m + 1]
+            if self.stacked:
+                L.uend += np.tensordot(L.dt * self.coll.weights, L.f.data[1:], axes=1)
+            else:
+                for m in range(self.coll.num_nodes):
+                    L.uend += L.dt * self.coll.weights[m] * L.f[m + 1]
             # add up tau correction of the full interval (last entry)
             if L.tau[-1] is not None:
                 L.uend += L.tau[-1]
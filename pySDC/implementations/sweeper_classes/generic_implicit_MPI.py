@@ -1,4 +1,5 @@
 from mpi4py import MPI
+import numpy as np
 
 from pySDC.implementations.sweeper_classes.generic_implicit import generic_implicit
 from pySDC.core.Sweeper import sweeper, ParameterError
@@ -20,6 +21,10 @@ class SweeperMPI(sweeper):
     It's a bit confusing because `self.params` is overwritten in the second call to the `__init__` of the core `sweeper`
     class, but the `SweeperMPI` class adds parameters to the `params` dictionary, which will again be added in
     `generic_implicit`.
+
+    By default, the quadrature is computed with one `Reduce` per collocation node, each rooted at a different rank.
+    Setting the parameter `single_collective` replaces these with a single `Reduce_scatter_block` on a preallocated
+    buffer, and the residual computation starts a non-blocking collective that overlaps with the local contributions.
     """
 
     def __init__(self, params):
@@ -28,6 +33,7 @@ class SweeperMPI(sweeper):
         if 'comm' not in params.keys():
             params['comm'] = MPI.COMM_WORLD
             self.logger.debug('Using MPI.COMM_WORLD for the communicator because none was supplied in the params.')
+        params['single_collective'] = params.get('single_collective', False)
         super().__init__(params)
 
         if self.params.comm.size != self.coll.num_nodes:
@@ -35,6 +41,8 @@ class SweeperMPI(sweeper):
                 f'The communicator in the {type(self).__name__} sweeper needs to have one rank for each node as of now! That means we need {self.coll.num_nodes} nodes, but got {self.params.comm.size} processes.'
             )
 
+        self._send_buffer = None
+
     @property
     def comm(self):
         return self.params.comm
@@ -43,6 +51,73 @@ class SweeperMPI(sweeper):
     def rank(self):
         return self.comm.rank
 
+    def get_integrand(self):
+        """
+        Get the values at the node of this rank that need to be integrated
+
+        Returns:
+            dtype_f: right hand side at the node of this rank
+        """
+        return self.level.f[self.rank + 1]
+
+    def get_send_buffer(self, like):
+        """
+        Get the preallocated buffer holding the contributions of this rank to the integrals at all nodes.
+        The buffer is reallocated only if the shape or type of the data changes.
+
+        Args:
+            like (dtype_u): Value to take shape and dtype from
+
+        Returns:
+            numpy.ndarray: Buffer of shape `(num_nodes, *like.shape)`
+        """
+        shape = (self.coll.num_nodes, *like.shape)
+        if self._send_buffer is None or self._send_buffer.shape != shape or self._send_buffer.dtype != like.dtype:
+            self._send_buffer = np.empty(shape, dtype=like.dtype)
+        return self._send_buffer
+
+    def integrate_single_collective(self, last_only=False, blocking=True):
+        """
+        Integrate the right hand side with a single collective communication. Every rank computes its contributions to
+        the integrals at all nodes in a preallocated buffer and a reduce-scatter operation sums them up and sends every
+        rank the integral at its own node.
+
+        Args:
+            last_only (bool): Integrate only the last node for the residual or all of them
+            blocking (bool): Wait for the communication to finish or return the request for non-blocking communication
+
+        Returns:
+            dtype_u: The integral at the node of this rank (at the last node on the last rank if `last_only`)
+            mpi4py.MPI.Request: Request of the communication, only returned if not `blocking`
+        """
+        L = self.level
+        P = L.prob
+
+        me = P.dtype_u(P.init, val=0.0)
+        integrand = np.asarray(self.get_integrand())
+        sendbuf = self.get_send_buffer(me)
+
+        if last_only:
+            root = self.comm.size - 1
+            recvbuf = me if self.rank == root else None
+            np.multiply(L.dt * self.coll.Qmat[-1, self.rank + 1], integrand, out=sendbuf[-1])
+            if blocking:
+                self.comm.Reduce(sendbuf[-1], recvbuf, root=root, op=MPI.SUM)
+            else:
+                request = self.comm.Ireduce(sendbuf[-1], recvbuf, root=root, op=MPI.SUM)
+        else:
+            weights = L.dt * self.coll.Qmat[1:, self.rank + 1]
+            np.multiply(weights.reshape((-1,) + (1,) * integrand.ndim), integrand, out=sendbuf)
+            if blocking:
+                self.comm.Reduce_scatter_block(sendbuf, me, op=MPI.SUM)
+            else:
+                request = self.comm.Ireduce_scatter_block(sendbuf, me, op=MPI.SUM)
+
+        if blocking:
+            return me
+        else:
+            return me, request
+
     def compute_end_point(self):
         """
         Compute u at the right point of the interval
@@ -87,14 +162,31 @@ class SweeperMPI(sweeper):
 
         # compute the residual for each node
 
-        # build QF(u)
-        res = self.integrate(last_only=L.params.residual_type[:4] == 'last')
-        res += L.u[0] - L.u[self.rank + 1]
-        # add tau if associated
-        if L.tau[self.rank] is not None:
-            res += L.tau[self.rank]
-        # use abs function from data type here
-        res_norm = abs(res)
+        last_only = L.params.residual_type[:4] == 'last'
+        if self.params.single_collective:
+            # start building QF(u) and compute the local contributions while the communication is in progress
+            res, request = self.integrate_single_collective(last_only=last_only, blocking=False)
+            if last_only and self.rank != self.comm.size - 1:
+                request.Wait()
+                res_norm = None
+            else:
+                local = L.u[0] - L.u[self.rank + 1]
+                # add tau if associated
+                if L.tau[self.rank] is not None:
+                    local += L.tau[self.rank]
+                request.Wait()
+                res += local
+                # use abs function from data type here
+                res_norm = abs(res)
+        else:
+            # build QF(u)
+            res = self.integrate(last_only=last_only)
+            res += L.u[0] - L.u[self.rank + 1]
+            # add tau if associated
+            if L.tau[self.rank] is not None:
+                res += L.tau[self.rank]
+            # use abs function from data type here
+            res_norm = abs(res)
 
         # find maximal residual over the nodes
         if L.params.residual_type == 'full_abs':
@@ -104,7 +196,9 @@ class SweeperMPI(sweeper):
         elif L.params.residual_type == 'full_rel':
             L.status.residual = self.comm.allreduce(res_norm / abs(L.u[0]), op=MPI.MAX)
         elif L.params.residual_type == 'last_rel':
-            L.status.residual = self.comm.bcast(res_norm / abs(L.u[0]), root=self.comm.size - 1)
+            L.status.residual = self.comm.bcast(
+                None if res_norm is None else res_norm / abs(L.u[0]), root=self.comm.size - 1
+            )
         else:
             raise NotImplementedError(f'residual type \"{L.params.residual_type}\" not implemented!')
 
@@ -171,6 +265,9 @@ class generic_implicit_MPI(SweeperMPI, generic_implicit):
         L = self.level
         P = L.prob
 
+        if self.params.single_collective:
+            return self.integrate_single_collective(last_only=last_only)
+
         me = P.dtype_u(P.init, val=0.0)
         for m in [self.coll.num_nodes - 1] if last_only else range(self.coll.num_nodes):
             recvBuf = me if m == self.rank else None
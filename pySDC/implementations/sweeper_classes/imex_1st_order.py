@@ -9,6 +9,9 @@ class imex_1st_order(sweeper):
 
     First-order IMEX sweeper using implicit/explicit Euler as base integrator
 
+    With a diagonal QI and QE='PIC', the solves at the nodes are independent and can be distributed to threads with the
+    parameter `num_threads`. This requires the problem to be thread-safe.
+
     Attributes:
         QI: implicit Euler integration matrix
         QE: explicit Euler integration matrix
@@ -48,9 +51,9 @@ class imex_1st_order(sweeper):
         me = []
         # integrate RHS over all collocation nodes
         for m in range(1, self.coll.num_nodes + 1):
-            me.append(P.dtype_u(P.init, val=0.0))
+            me.append(P.borrow_u(val=0.0))
             for j in range(1, self.coll.num_nodes + 1):
-                me[m - 1] += L.dt * self.coll.Qmat[m, j] * (L.f[j].impl + L.f[j].expl)
+                me[m - 1] = P.accumulate(me[m - 1], L.dt * self.coll.Qmat[m, j] * (L.f[j].impl + L.f[j].expl))
 
         return me
 
@@ -72,11 +75,17 @@ class imex_1st_order(sweeper):
         # get number of collocation nodes for easier access
         M = self.coll.num_nodes
 
+        # use a precomputed sweep for problems with a constant linear operator if requested
+        solver = self.get_sweep_solver(self.QI[1:, 1:])
+        if solver is not None:
+            self.update_nodes_matrix(solver)
+            return None
+
         # gather all terms which are known already (e.g. from the previous iteration)
         # this corresponds to u0 + QF(u^k) - QIFI(u^k) - QEFE(u^k) + tau
 
-        # get QF(u^k)
-        integral = self.integrate()
+        # get QF(u^k), possibly left over from the computation of the residual
+        integral = self.get_quadrature()
         for m in range(M):
             # subtract QIFI(u^k)_m + QEFE(u^k)_m
             for j in range(1, M + 1):
@@ -88,17 +97,86 @@ class imex_1st_order(sweeper):
                 integral[m] += L.tau[m]
 
         # do the sweep
-        for m in range(0, M):
-            # build rhs, consisting of the known values from above and new values from previous nodes (at k+1)
-            rhs = P.dtype_u(integral[m])
-            for j in range(1, m + 1):
-                rhs += L.dt * (self.QI[m + 1, j] * L.f[j].impl + self.QE[m + 1, j] * L.f[j].expl)
+        if self.params.num_threads > 1 and self.parallelizable and not np.any(self.QE):
+            # with a diagonal QI and no QE, there are no new values from previous nodes and we can solve concurrently
+            new_values = self.map_nodes(self.solve_node, range(M), [P.dtype_u(me) for me in integral])
+            for m in range(M):
+                L.u[m + 1], L.f[m + 1] = new_values[m]
+        else:
+            for m in range(0, M):
+                # build rhs, consisting of the known values from above and new values from previous nodes (at k+1)
+                rhs = P.dtype_u(integral[m])
+                for j in range(1, m + 1):
+                    rhs += L.dt * (self.QI[m + 1, j] * L.f[j].impl + self.QE[m + 1, j] * L.f[j].expl)
+
+                L.u[m + 1], L.f[m + 1] = self.solve_node(m, rhs)
+
+        # the integrals are not needed anymore and can be reused as temporaries
+        P.give_back(*integral)
+
+        # indicate presence of new values at this level
+        L.status.updated = True
+
+        return None
+
+    def solve_node(self, m, rhs):
+        """
+        Implicit solve with prefactor stemming from QI at a single node and evaluation of the right hand side with the
+        new value. This only reads from the level, such that it can be called concurrently for independent nodes.
+
+        Args:
+            m (int): Index of the node, starting from 0
+            rhs (dtype_u): Right hand side of the implicit system
+
+        Returns:
+            dtype_u: New value at the node
+            dtype_f: Right hand side evaluated with the new value
+        """
+        L = self.level
+        P = L.prob
 
-            # implicit solve with prefactor stemming from QI
-            L.u[m + 1] = P.solve_system(
-                rhs, L.dt * self.QI[m + 1, m + 1], L.u[m + 1], L.time + L.dt * self.coll.nodes[m]
-            )
+        t = L.time + L.dt * self.coll.nodes[m]
+        u = P.solve_system(rhs, L.dt * self.QI[m + 1, m + 1], L.u[m + 1], t)
+        return u, P.eval_f(u, t)
 
+    def update_nodes_matrix(self, solver):
+        """
+        Same as `update_nodes`, but with the implicit solves for all nodes carried out at once by a precomputed solver
+        for linear problems, see `get_sweep_solver`. The explicit part must not depend on the solution, such that
+        QEFE(u^k) and QEFE(u^k+1) cancel out.
+
+        Args:
+            solver (function): Solver for the space-time system of the sweep
+
+        Returns:
+            None
+        """
+
+        L = self.level
+        P = L.prob
+
+        M = self.coll.num_nodes
+
+        # the quadrature is included in the right hand side below
+        self.reset_quadrature()
+
+        # gather u0 + QF(u^k) - QIFI(u^k) + tau for all nodes at once
+        f_impl = np.array([L.f[m].impl for m in range(1, M + 1)])
+        f_expl = np.array([L.f[m].expl for m in range(1, M + 1)])
+        rhs = np.tensordot(L.dt * (self.coll.Qmat[1:, 1:] - self.QI[1:, 1:]), f_impl, axes=1)
+        rhs += np.tensordot(L.dt * self.coll.Qmat[1:, 1:], f_expl, axes=1)
+        rhs += L.u[0]
+        for m in range(M):
+            # add tau if associated
+            if L.tau[m] is not None:
+                rhs[m] += L.tau[m]
+
+        # solve for the new values at all nodes at once
+        sol = solver(rhs)
+        for m in range(M):
+            u = P.dtype_u(P.init)
+            u[:] = sol[m]
+            L.u[m + 1] = u
             # update function values
             L.f[m + 1] = P.eval_f(L.u[m + 1], L.time + L.dt * self.coll.nodes[m])
 
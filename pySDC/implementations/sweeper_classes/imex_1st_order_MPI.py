@@ -10,6 +10,16 @@ class imex_1st_order_MPI(SweeperMPI, imex_1st_order):
             self.params.QE == 'PIC'
         ), f"Only Picard is implemented for explicit precondioner so far in {type(self).__name__}! You chose \"{self.params.QE}\""
 
+    def get_integrand(self):
+        """
+        Get the values at the node of this rank that need to be integrated
+
+        Returns:
+            dtype_u: sum of implicit and explicit part of the right hand side at the node of this rank
+        """
+        f = self.level.f[self.rank + 1]
+        return f.impl + f.expl
+
     def integrate(self, last_only=False):
         """
         Integrates the right-hand side (here impl + expl)
@@ -24,6 +34,9 @@ class imex_1st_order_MPI(SweeperMPI, imex_1st_order):
         L = self.level
         P = L.prob
 
+        if self.params.single_collective:
+            return self.integrate_single_collective(last_only=last_only)
+
         me = P.dtype_u(P.init, val=0.0)
         for m in [self.coll.num_nodes - 1] if last_only else range(self.coll.num_nodes):
             recvBuf = me if m == self.rank else None
@@ -216,3 +216,33 @@ class mesh_to_mesh(space_transfer):
         else:
             raise TransferError('Wrong data type for prolongation, got %s' % type(G))
         return F
+
+    def restrict_stacked(self, F):
+        """
+        Restriction of the values at multiple nodes with a single sparse matrix product
+
+        Args:
+            F: the fine level data at multiple nodes, stacked along the first axis
+        """
+        if type(F).__name__ != 'mesh' or hasattr(self.fine_prob, 'ncomp'):
+            return super().restrict_stacked(F)
+
+        num_nodes = F.shape[0]
+        shape = tuple(np.atleast_1d(self.coarse_prob.nvars))
+        G = self.Rspace @ np.asarray(F).reshape(num_nodes, -1).T
+        return np.ascontiguousarray(G.T).reshape((num_nodes,) + shape)
+
+    def prolong_stacked(self, G):
+        """
+        Prolongation of the values at multiple nodes with a single sparse matrix product
+
+        Args:
+            G: the coarse level data at multiple nodes, stacked along the first axis
+        """
+        if type(G).__name__ != 'mesh' or hasattr(self.fine_prob, 'ncomp'):
+            return super().prolong_stacked(G)
+
+        num_nodes = G.shape[0]
+        shape = tuple(np.atleast_1d(self.fine_prob.nvars))
+        F = self.Pspace @ np.asarray(G).reshape(num_nodes, -1).T
+        return np.ascontiguousarray(F.T).reshape((num_nodes,) + shape)
@@ -1,6 +1,9 @@
+import numpy as np
+
 from pySDC.core.Errors import TransferError
 from pySDC.core.SpaceTransfer import space_transfer
-from mpi4py_fft import PFFT, newDistArray
+from pySDC.implementations.problem_classes.generic_MPIFFT_Laplacian import CountedTransform
+from mpi4py_fft import PFFT
 
 
 class fft_to_fft(space_transfer):
@@ -9,6 +12,10 @@ class fft_to_fft(space_transfer):
 
     This implementation can restrict and prolong between PMESH datatypes meshes with FFT for periodic boundaries
 
+    If the problems are solved in spectral space and all Fourier coefficients are stored on one process, the transfer
+    is done without any FFTs by truncating or padding the coefficients. Modes that are not resolved on the coarse
+    level, including the Nyquist modes, are discarded. Since ``mpi4py-fft`` normalizes the forward transform, the
+    coefficients of a mode are the same on both levels.
     """
 
     def __init__(self, fine_prob, coarse_prob, params):
@@ -48,6 +55,55 @@ class fft_to_fft(space_transfer):
             **fft_args,
         )
 
+        # count the transforms of the padded FFT along with the ones of the coarse problem
+        if 'fft' in self.coarse_prob.work_counters.keys():
+            CountedTransform.count_transforms(self.fft_pad, self.coarse_prob.work_counters['fft'])
+
+        self.transfer_in_spectral_space = self.spectral and self.coarse_prob.comm.Get_size() == 1
+        if self.transfer_in_spectral_space:
+            xp = self.fine_prob.xp
+            modes_coarse = []
+            modes_fine = []
+            for nf, nc, sc in zip(Nf, Nc, self.coarse_prob.fft.shape(True)):
+                # the last axis of real-to-complex transforms contains only the non-negative wave numbers
+                k = np.arange(sc) if sc < nc else np.fft.fftfreq(nc, 1.0 / nc).astype(int)
+                keep = np.abs(k) < nc / 2
+                modes_coarse.append(xp.asarray(np.nonzero(keep)[0]))
+                modes_fine.append(xp.asarray(k[keep] % nf))
+            self.modes_coarse = xp.ix_(*modes_coarse)
+            self.modes_fine = xp.ix_(*modes_fine)
+
+    def _restrict_spectral(self, fine, coarse):
+        """
+        Restrict a single component in spectral space
+
+        Args:
+            fine: the fine level data
+            coarse: the coarse level data, which is overwritten
+        """
+        if self.transfer_in_spectral_space:
+            coarse[...] = 0.0
+            coarse[self.modes_coarse] = fine[self.modes_fine]
+        else:
+            tmpF = self.fine_prob.fft.backward(fine)
+            tmpG = tmpF[:: int(self.ratio[0]), :: int(self.ratio[1])]
+            self.coarse_prob.fft.forward(tmpG, coarse)
+
+    def _prolong_spectral(self, coarse, fine):
+        """
+        Prolong a single component in spectral space
+
+        Args:
+            coarse: the coarse level data
+            fine: the fine level data, which is overwritten
+        """
+        if self.transfer_in_spectral_space:
+            fine[...] = 0.0
+            fine[self.modes_fine] = coarse[self.modes_coarse]
+        else:
+            tmpF = self.fft_pad.backward(coarse)
+            self.fine_prob.fft.forward(tmpF, fine)
+
     def restrict(self, F):
         """
         Restriction implementation
@@ -62,21 +118,13 @@ class fft_to_fft(space_transfer):
                 if hasattr(self.fine_prob, 'ncomp'):
                     for i in range(self.fine_prob.ncomp):
                         if fine.shape[-1] == self.fine_prob.ncomp:
-                            tmpF = newDistArray(self.fine_prob.fft, False)
-                            tmpF = self.fine_prob.fft.backward(fine[..., i], tmpF)
-                            tmpG = tmpF[:: int(self.ratio[0]), :: int(self.ratio[1])]
-                            coarse[..., i] = self.coarse_prob.fft.forward(tmpG, coarse[..., i])
+                            self._restrict_spectral(fine[..., i], coarse[..., i])
                         elif fine.shape[0] == self.fine_prob.ncomp:
-                            tmpF = newDistArray(self.fine_prob.fft, False)
-                            tmpF = self.fine_prob.fft.backward(fine[i, ...], tmpF)
-                            tmpG = tmpF[:: int(self.ratio[0]), :: int(self.ratio[1])]
-                            coarse[i, ...] = self.coarse_prob.fft.forward(tmpG, coarse[i, ...])
+                            self._restrict_spectral(fine[i, ...], coarse[i, ...])
                         else:
                             raise TransferError('Don\'t know how to restrict for this problem with multiple components')
                 else:
-                    tmpF = self.fine_prob.fft.backward(fine)
-                    tmpG = tmpF[:: int(self.ratio[0]), :: int(self.ratio[1])]
-                    coarse[:] = self.coarse_prob.fft.forward(tmpG, coarse)
+                    self._restrict_spectral(fine, coarse)
             else:
                 coarse[:] = fine[:: int(self.ratio[0]), :: int(self.ratio[1])]
 
@@ -104,17 +152,14 @@ class fft_to_fft(space_transfer):
                 if hasattr(self.fine_prob, 'ncomp'):
                     for i in range(self.fine_prob.ncomp):
                         if coarse.shape[-1] == self.fine_prob.ncomp:
-                            tmpF = self.fft_pad.backward(coarse[..., i])
-                            fine[..., i] = self.fine_prob.fft.forward(tmpF, fine[..., i])
+                            self._prolong_spectral(coarse[..., i], fine[..., i])
                         elif coarse.shape[0] == self.fine_prob.ncomp:
-                            tmpF = self.fft_pad.backward(coarse[i, ...])
-                            fine[i, ...] = self.fine_prob.fft.forward(tmpF, fine[i, ...])
+                            self._prolong_spectral(coarse[i, ...], fine[i, ...])
                         else:
                             raise TransferError('Don\'t know how to prolong for this problem with multiple components')
 
                 else:
-                    tmpF = self.fft_pad.backward(coarse)
-                    fine[:] = self.fine_prob.fft.forward(tmpF, fine)
+                    self._prolong_spectral(coarse, fine)
             else:
                 if hasattr(self.fine_prob, 'ncomp'):
                     for i in range(self.fine_prob.ncomp):
@@ -0,0 +1,137 @@
+import numpy as np
+from mpi4py import MPI
+
+from pySDC.core.Hooks import hooks
+from pySDC.helpers.stats_helper import get_sorted
+from pySDC.implementations.controller_classes.controller_nonMPI import controller_nonMPI
+from pySDC.implementations.sweeper_classes.imex_1st_order import imex_1st_order
+from pySDC.implementations.problem_classes.AllenCahn_MPIFFT import allencahn_imex
+from pySDC.implementations.transfer_classes.TransferMesh_MPIFFT import fft_to_fft
+
+
+class LogFFTs(hooks):
+    """
+    Log the number of FFTs per sweep on every level and the total number of FFTs per step
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.fft_before_sweep = {}
+
+    def pre_sweep(self, step, level_number):
+        super().pre_sweep(step, level_number)
+        L = step.levels[level_number]
+        self.fft_before_sweep[level_number] = L.prob.work_counters['fft'].niter
+
+    def post_sweep(self, step, level_number):
+        super().post_sweep(step, level_number)
+        L = step.levels[level_number]
+        self.add_to_stats(
+            process=step.status.slot,
+            time=L.time,
+            level=L.level_index,
+            iter=step.status.iter,
+            sweep=L.status.sweep,
+            type='fft_per_sweep',
+            value=L.prob.work_counters['fft'].niter - self.fft_before_sweep[level_number],
+        )
+
+    def post_step(self, step, level_number):
+        super().post_step(step, level_number)
+        self.add_to_stats(
+            process=step.status.slot,
+            time=step.time,
+            level=-1,
+            iter=step.status.iter,
+            sweep=-1,
+            type='fft_total',
+            value=sum(L.prob.work_counters['fft'].niter for L in step.levels),
+        )
+
+
+def run_simulation(spectral, ml, dealias=False):
+    """
+    Run MLSDC or SDC for the Allen-Cahn equation and count the FFTs
+
+    Args:
+        spectral (bool): run in real or spectral space
+        ml (bool): single or multiple levels
+        dealias (bool): dealias the explicit part in spectral space
+
+    Returns:
+        dict: statistics of the run
+    """
+
+    # initialize level parameters
+    level_params = dict()
+    level_params['restol'] = 1e-08
+    level_params['dt'] = 1e-03
+    level_params['nsweeps'] = [1]
+
+    # initialize sweeper parameters
+    sweeper_params = dict()
+    sweeper_params['quad_type'] = 'RADAU-RIGHT'
+    sweeper_params['num_nodes'] = [3]
+    sweeper_params['QI'] = ['LU']
+    sweeper_params['initial_guess'] = 'spread'
+
+    # initialize problem parameters
+    problem_params = dict()
+    problem_params['L'] = 1.0
+    problem_params['nvars'] = [(128, 128), (64, 64)] if ml else [(128, 128)]
+    problem_params['eps'] = [0.04]
+    problem_params['radius'] = 0.25
+    problem_params['comm'] = MPI.COMM_WORLD
+    problem_params['spectral'] = spectral
+    problem_params['dealias'] = dealias
+
+    # initialize step parameters
+    step_params = dict()
+    step_params['maxiter'] = 50
+
+    # initialize controller parameters
+    controller_params = dict()
+    controller_params['logger_level'] = 30
+    controller_params['hook_class'] = LogFFTs
+
+    # fill description dictionary for easy step instantiation
+    description = dict()
+    description['problem_class'] = allencahn_imex
+    description['problem_params'] = problem_params
+    description['sweeper_class'] = imex_1st_order
+    description['sweeper_params'] = sweeper_params
+    description['level_params'] = level_params
+    description['step_params'] = step_params
+    description['space_transfer_class'] = fft_to_fft
+
+    # instantiate controller
+    controller = controller_nonMPI(num_procs=1, controller_params=controller_params, description=description)
+
+    # get initial values on finest level and run
+    P = controller.MS[0].levels[0].prob
+    uinit = P.u_exact(0.0)
+    _, stats = controller.run(u0=uinit, t0=0.0, Tend=4 * level_params['dt'])
+
+    return stats
+
+
+def main():
+    """
+    Compare the number of FFTs in real and spectral space for SDC and MLSDC
+    """
+    for ml in [False, True]:
+        for spectral in [False, True]:
+            stats = run_simulation(spectral=spectral, ml=ml)
+
+            out = f'{"MLSDC" if ml else "SDC":5s} in {"spectral" if spectral else "real":8s} space:'
+            for level in range(2 if ml else 1):
+                ffts = [me[1] for me in get_sorted(stats, type='fft_per_sweep', level=level)]
+                out += f' {np.mean(ffts):5.1f} FFTs per sweep on level {level},'
+            niter = sum(me[1] for me in get_sorted(stats, type='niter'))
+            total = get_sorted(stats, type='fft_total')[-1][1]
+            out += f' {total / niter:5.1f} FFTs per iteration in total'
+            print(out)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+import os
+import time
+
+import numpy as np
+
+from pySDC.helpers.stats_helper import get_sorted
+from pySDC.implementations.controller_classes.controller_nonMPI import controller_nonMPI
+from pySDC.implementations.controller_classes.controller_multiprocessing import controller_multiprocessing
+from pySDC.implementations.problem_classes.HeatEquation_ND_FD import heatNd_forced
+from pySDC.implementations.sweeper_classes.imex_1st_order import imex_1st_order
+from pySDC.implementations.transfer_classes.TransferMesh import mesh_to_mesh
+
+
+def run_simulation(controller_class, num_procs, num_levels):
+    """
+    Run Jacobi MSSDC or PFASST for the 2D heat equation and measure the wall-clock time
+
+    Args:
+        controller_class: the controller class
+        num_procs (int): number of steps in a block
+        num_levels (int): single level for MSSDC or two levels for PFASST
+
+    Returns:
+        numpy.ndarray: solution at the end
+        int: total number of iterations
+        float: wall-clock time of the run
+    """
+
+    description = {
+        'problem_class': heatNd_forced,
+        'problem_params': {
+            'nu': 0.1,
+            'freq': (2, 2),
+            'nvars': [(255, 255), (127, 127)][:num_levels],
+            'bc': 'dirichlet-zero',
+        },
+        'sweeper_class': imex_1st_order,
+        'sweeper_params': {'quad_type': 'RADAU-RIGHT', 'num_nodes': 3, 'QI': 'LU'},
+        'level_params': {'restol': 1e-8, 'dt': 0.05},
+        'step_params': {'maxiter': 50},
+        'space_transfer_class': mesh_to_mesh,
+        'space_transfer_params': {'rorder': 2, 'iorder': 6},
+    }
+
+    controller_params = {'logger_level': 30, 'mssdc_jac': True}
+    if num_levels > 1:
+        controller_params['predict_type'] = 'pfasst_burnin'
+
+    controller = controller_class(num_procs=num_procs, controller_params=controller_params, description=description)
+    P = controller.MS[0].levels[0].prob
+
+    t0 = time.perf_counter()
+    uend, stats = controller.run(u0=P.u_exact(0.0), t0=0.0, Tend=2 * num_procs * description['level_params']['dt'])
+    wall_time = time.perf_counter() - t0
+
+    return uend, sum(me[1] for me in get_sorted(stats, type='niter')), wall_time
+
+
+def main():
+    """
+    Compare the wall-clock time of running the steps in a single process and in one process per step. There is no
+    speedup unless there are at least as many cores as steps.
+    """
+    num_procs = 4
+    print(f'Running {num_procs} steps in parallel on {os.cpu_count()} cores')
+    for num_levels, name in zip([1, 2], ['MSSDC', 'PFASST']):
+        uend, niter, serial_time = run_simulation(controller_nonMPI, num_procs, num_levels)
+        uend_mp, niter_mp, parallel_time = run_simulation(controller_multiprocessing, num_procs, num_levels)
+
+        assert niter == niter_mp and np.allclose(uend, uend_mp, atol=1e-14)
+        print(
+            f'{name:6s} with {num_procs} steps: {serial_time:.2f}s in a single process, {parallel_time:.2f}s with one '
+            f'process per step, speedup {serial_time / parallel_time:.2f}'
+        )
+
+
+if __name__ == "__main__":
+    main()
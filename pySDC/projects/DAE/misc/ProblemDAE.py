@@ -1,45 +1,281 @@
 import numpy as np
+import scipy.sparse as sp
+from scipy.linalg import lu_factor, lu_solve
 from scipy.optimize import root
+from scipy.sparse.linalg import splu
 
 from pySDC.core.Problem import ptype, WorkCounter
+from pySDC.helpers.problem_helper import FactorizationCache
 from pySDC.projects.DAE.misc.DAEMesh import DAEMesh
 
 
+def get_column_groups(sparsity):
+    r"""
+    Greedy coloring of the columns of a sparsity pattern. Columns in the same group do not share any nonzero row, such
+    that all columns of one group can be approximated with a single finite difference.
+
+    Parameters
+    ----------
+    sparsity : scipy.sparse matrix or np.2darray
+        Sparsity pattern of a Jacobian.
+
+    Returns
+    -------
+    groups : list of np.1darray
+        Indices of the columns in each group.
+    """
+    sparsity = sp.csc_matrix(sparsity)
+    rows_of_groups = []
+    groups = []
+    for col in range(sparsity.shape[1]):
+        rows = set(sparsity.indices[sparsity.indptr[col] : sparsity.indptr[col + 1]])
+        for group, rows_of_group in zip(groups, rows_of_groups):
+            if rows_of_group.isdisjoint(rows):
+                group.append(col)
+                rows_of_group.update(rows)
+                break
+        else:
+            groups.append([col])
+            rows_of_groups.append(rows)
+    return [np.array(group) for group in groups]
+
+
 class ptype_dae(ptype):
     r"""
     This class implements a generic DAE class and illustrates the interface class for DAE problems.
     It ensures that all parameters are passed that are needed by DAE sweepers.
 
+    The nonlinear systems in the sweepers are solved with ``scipy.optimize.root``, which approximates a dense Jacobian
+    by finite differences in every solve. Problems can provide the partial derivatives of the implicit representation
+    :math:`F(u, u', t)` instead, either analytically by overriding ``get_Jacobian`` or by setting the attribute
+    ``jacobian_sparsity`` to the sparsity patterns of :math:`\partial F / \partial u` and
+    :math:`\partial F / \partial u'`, which are then approximated by finite differences with grouped columns. In this
+    case, a Newton solver is used. In simplified mode, the Jacobian is frozen across Newton iterations, nodes, sweeps
+    and steps until convergence degrades, and LU decompositions are reused for all nodes with the same diagonal entry
+    of the preconditioner. If Newton does not converge, the solver falls back to ``scipy.optimize.root``.
+
     Parameters
     ----------
     nvars : int
         Number of unknowns of the problem class.
     newton_tol : float
         Tolerance for the nonlinear solver.
+    simplified_newton : bool, optional
+        Reuse the Jacobian until convergence of Newton degrades. Only used when the problem provides a Jacobian.
+    newton_maxiter : int, optional
+        Maximum number of Newton iterations before falling back to ``scipy.optimize.root``.
 
     Attributes
     ----------
     work_counters : WorkCounter
         Counts the work, here the number of function calls during the nonlinear solve is logged and stored
         in work_counters['newton']. The number of each function class of the right-hand side is then stored
-        in work_counters['rhs']
+        in work_counters['rhs']. Evaluations of the Jacobian and LU decompositions are stored in
+        work_counters['jacobian'] and work_counters['factorization'].
+    jacobian_sparsity : tuple or None
+        Sparsity patterns of the partial derivatives with respect to the flattened :math:`u` and :math:`u'`, or None if
+        the problem does not provide them.
+    factorizations : FactorizationCache
+        Cache for the LU decompositions of the Jacobians of the implicit systems.
     """
 
     dtype_u = DAEMesh
     dtype_f = DAEMesh
 
-    def __init__(self, nvars, newton_tol):
+    def __init__(self, nvars, newton_tol, simplified_newton=True, newton_maxiter=100):
         """Initialization routine"""
         super().__init__((nvars, None, np.dtype('float64')))
-        self._makeAttributeAndRegister('nvars', 'newton_tol', localVars=locals(), readOnly=True)
+        self._makeAttributeAndRegister(
+            'nvars', 'newton_tol', 'simplified_newton', 'newton_maxiter', localVars=locals(), readOnly=True
+        )
+
+        self.jacobian_sparsity = None
+        self.factorizations = FactorizationCache()
 
         self.work_counters['newton'] = WorkCounter()
         self.work_counters['rhs'] = WorkCounter()
+        self.work_counters['jacobian'] = WorkCounter()
+        self.work_counters['factorization'] = self.factorizations.misses
+
+        self._jacobian = None
+        self._jacobian_age = 0
+        self._column_groups = None
+
+    def get_Jacobian(self, u, du, t):
+        r"""
+        Partial derivatives :math:`\partial F / \partial u` and :math:`\partial F / \partial u'` of the implicit
+        representation with respect to the flattened arguments. Problem classes can override this with analytic
+        derivatives. By default, they are approximated by finite differences if ``jacobian_sparsity`` is set.
+
+        Parameters
+        ----------
+        u : dtype_u
+            Current values of the numerical solution at time t.
+        du : dtype_u
+            Current values of the derivative of the numerical solution at time t.
+        t : float
+            Current time of the numerical solution.
+
+        Returns
+        -------
+        jacobian : tuple or None
+            Dense or sparse matrices with the partial derivatives, or None if no Jacobian is available.
+        """
+        if self.jacobian_sparsity is None:
+            return None
+
+        if self._column_groups is None:
+            self._column_groups = [get_column_groups(sparsity) for sparsity in self.jacobian_sparsity]
 
-    def solve_system(self, impl_sys, u0, t):
+        args = [np.array(u, dtype=float).flatten(), np.array(du, dtype=float).flatten()]
+        f0 = np.asarray(self.eval_f(u, du, t)).flatten()
+
+        jacobian = []
+        for i in range(2):
+            sparsity = sp.csc_matrix(self.jacobian_sparsity[i])
+            data = np.zeros_like(sparsity.data, dtype=float)
+            for group in self._column_groups[i]:
+                steps = np.sqrt(np.finfo(float).eps) * np.maximum(1.0, np.abs(args[i][group]))
+                perturbed = [me.copy() for me in args]
+                perturbed[i][group] += steps
+                f = self.eval_f(
+                    *[me.reshape(u.shape).view(type(u)) for me in perturbed],
+                    t,
+                )
+                diff = np.asarray(f).flatten() - f0
+                for col, step in zip(group, steps):
+                    entries = slice(sparsity.indptr[col], sparsity.indptr[col + 1])
+                    data[entries] = diff[sparsity.indices[entries]] / step
+            jacobian.append(sp.csc_matrix((data, sparsity.indices, sparsity.indptr), shape=sparsity.shape))
+        return tuple(jacobian)
+
+    def _factorize(self, scaling):
+        r"""
+        LU decomposition of the Jacobian :math:`\partial F / \partial u \cdot diag(scaling) + \partial F / \partial u'`
+        of the implicit system, where unused components of the mesh are replaced by the identity.
+        """
+        jac_u, jac_du = self._jacobian
+        if sp.issparse(jac_u) or sp.issparse(jac_du):
+            A = sp.csc_matrix(sp.csc_matrix(jac_u) @ sp.diags(scaling) + jac_du)
+            A.eliminate_zeros()
+            A = A + sp.diags((A.getnnz(axis=1) == 0).astype(float))
+            return splu(sp.csc_matrix(A))
+        A = np.asarray(jac_u) * scaling[None, :] + np.asarray(jac_du)
+        A += np.diag(~np.any(A != 0, axis=1)).astype(float)
+        return lu_factor(A)
+
+    def _newton(self, impl_sys, u0, t, state, factor, alg_factor):
+        r"""
+        Damped Newton solver for the implicit system using the Jacobian of the problem. Steps are halved until the
+        residual decreases, which keeps the iterates close to the initial guess like the trust region of
+        ``scipy.optimize.root``. If Newton stagnates, for instance due to discontinuities in the right-hand side, or
+        does not converge within ``newton_maxiter`` iterations, None is returned such that ``scipy.optimize.root`` is
+        used instead.
+
+        Returns
+        -------
+        sol : np.1darray or None
+            Flattened solution or None if Newton did not converge or no Jacobian is available.
+        """
+        scaling = self.dtype_u(self.init, val=factor)
+        if alg_factor is not None:
+            scaling.alg[:] = alg_factor
+        scaling = np.asarray(scaling).flatten()
+
+        def residual(x):
+            G = np.asarray(impl_sys(x.reshape(u0.shape).view(type(u0)))).flatten()
+            self.work_counters['newton']()
+            return G, np.linalg.norm(G, np.inf)
+
+        x = np.array(u0, dtype=float).flatten()
+        G, res = residual(x)
+        if not np.isfinite(res):
+            return None
+
+        fresh = False
+        for _ in range(self.newton_maxiter):
+            if res == 0:
+                return x
+
+            if not self.simplified_newton or self._jacobian is None:
+                fresh = self._update_jacobian(x, u0, t, state)
+                if not fresh:
+                    return None
+
+            try:
+                lu = self.factorizations.get((factor, alg_factor, self._jacobian_age), lambda: self._factorize(scaling))
+            except (RuntimeError, ValueError):
+                return self._discard_jacobian()
+            delta = lu.solve(G) if hasattr(lu, 'solve') else lu_solve(lu, G)
+            if not np.isfinite(delta).all():
+                return self._discard_jacobian()
+
+            x_new = x - delta
+            G_new, res_new = residual(x_new)
+
+            # renew a frozen Jacobian when it does not give good convergence
+            if not fresh and not res_new <= 0.5 * res:
+                fresh = self._update_jacobian(x, u0, t, state)
+                if not fresh:
+                    return None
+                continue
+
+            # damp the step until the residual decreases, otherwise Newton stagnates in the current iterate
+            step = 1.0
+            while not res_new < res:
+                if step < 1e-3:
+                    return self._discard_jacobian()
+                step /= 2
+                x_new = x - step * delta
+                G_new, res_new = residual(x_new)
+
+            x, G, res = x_new, G_new, res_new
+            fresh = False
+
+            # same criterion as in scipy.optimize.root: the relative change of the unknowns is below the tolerance
+            if np.linalg.norm(delta, np.inf) <= self.newton_tol * np.linalg.norm(x, np.inf):
+                return x
+
+        return self._discard_jacobian()
+
+    def _update_jacobian(self, x, u0, t, state):
+        """
+        Evaluate and store the Jacobian of the problem at the arguments of ``eval_f`` for the unknowns ``x``
+
+        Returns
+        -------
+        success : bool
+            Whether the problem provides a Jacobian.
+        """
+        jacobian = self.get_Jacobian(*state(x.reshape(u0.shape).view(type(u0))), t)
+        if jacobian is None:
+            return False
+        self._jacobian = jacobian
+        self._jacobian_age += 1
+        self.work_counters['jacobian']()
+        return True
+
+    def _discard_jacobian(self):
+        """
+        Discard the frozen Jacobian after Newton failed with it, such that the next solve starts with a new one
+
+        Returns
+        -------
+        None
+            Returned for convenience to signal the failure of Newton.
+        """
+        self._jacobian = None
+        return None
+
+    def solve_system(self, impl_sys, u0, t, state=None, factor=None, alg_factor=None):
         r"""
         Solver for nonlinear implicit system (defined in sweeper).
 
+        Newton is used when the sweeper describes how the arguments of ``eval_f`` depend on the unknowns and the problem
+        provides a Jacobian. As for ``scipy.optimize.root``, it stops when the relative change of the unknowns is below
+        ``newton_tol``. The arguments are :math:`u = u_{approx} + factor \cdot x` and :math:`u' = x` for the
+        unknowns :math:`x`, where the algebraic components of :math:`u` may use ``alg_factor`` instead of ``factor``.
+
         Parameters
         ----------
         impl_sys : callable
@@ -48,6 +284,12 @@ class ptype_dae(ptype):
             Initial guess for solver.
         t : float
             Current time :math:`t`.
+        state : callable, optional
+            Function returning the arguments :math:`(u, u')` of ``eval_f`` for given unknowns.
+        factor : float, optional
+            Derivative of the differential components of :math:`u` with respect to the unknowns.
+        alg_factor : float, optional
+            Derivative of the algebraic components of :math:`u` with respect to the unknowns, same as ``factor`` if None.
 
         Returns
         -------
@@ -56,6 +298,12 @@ class ptype_dae(ptype):
         """
         me = self.dtype_u(self.init)
 
+        if state is not None:
+            sol = self._newton(impl_sys, u0, t, state, factor, alg_factor)
+            if sol is not None:
+                me[:] = sol.reshape(me.shape)
+                return me
+
         def implSysFlatten(unknowns, **kwargs):
             sys = impl_sys(unknowns.reshape(me.shape).view(type(u0)), **kwargs)
             return sys.flatten()
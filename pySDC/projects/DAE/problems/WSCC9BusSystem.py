@@ -1,4 +1,5 @@
 import numpy as np
+import scipy.sparse as sp
 from pySDC.projects.DAE.misc.ProblemDAE import ptype_dae
 from pySDC.core.Errors import ParameterError
 
@@ -584,6 +585,8 @@ class WSCC9BusSystem(ptype_dae):
         Number of unknowns of the system of DAEs (not used here, since it is set up inside this class).
     newton_tol : float
         Tolerance for Newton solver.
+    simplified_newton : bool, optional
+        Reuse the Jacobian until convergence of Newton degrades.
 
     Attributes
     ----------
@@ -751,6 +754,9 @@ class WSCC9BusSystem(ptype_dae):
         Time the event found by detection.
     nswitches : int
         Number of events found by detection.
+    jacobian_sparsity : tuple
+        Sparsity patterns of the partial derivatives of the implicit representation, used to approximate the Jacobian
+        by finite differences with grouped columns.
 
     References
     ----------
@@ -762,12 +768,12 @@ class WSCC9BusSystem(ptype_dae):
        for Power Systems Research and Education. IEEE Transactions on Power Systems. Vol. 26, No. 1, pp. 12–19 (2011).
     """
 
-    def __init__(self, newton_tol=1e-10):
+    def __init__(self, newton_tol=1e-10, simplified_newton=True):
         """Initialization routine"""
         m, n = 3, 9
         nvars = 11 * m + 2 * m + 2 * n
         # invoke super init, passing number of dofs
-        super().__init__(nvars=nvars, newton_tol=newton_tol)
+        super().__init__(nvars=nvars, newton_tol=newton_tol, simplified_newton=simplified_newton)
         self._makeAttributeAndRegister('m', 'n', localVars=locals())
         self.mpc = WSCC9Bus()
 
@@ -969,6 +975,68 @@ class WSCC9BusSystem(ptype_dae):
         self.t_switch = None
         self.nswitches = 0
 
+        self.jacobian_sparsity = self.get_Jacobian_sparsity()
+
+    def get_Jacobian_sparsity(self):
+        r"""
+        Returns the sparsity patterns of the partial derivatives :math:`\partial F / \partial u` and
+        :math:`\partial F / \partial u'` of the implicit representation with respect to the flattened arguments. The
+        patterns contain all entries that can be nonzero in any of the branches of ``eval_f``.
+
+        Returns
+        -------
+        sparsity_u : scipy.sparse.csc_matrix
+            Sparsity pattern of the derivative with respect to the solution.
+        sparsity_du : scipy.sparse.csc_matrix
+            Sparsity pattern of the derivative with respect to the derivative of the solution.
+        """
+        m, n, N = self.m, self.n, self.nvars
+        Eqp, Si1d, Edp, Si2q, Delta, w, Efd, RF, VR, TM, PSV = range(11)
+
+        def diff(block, i=None):
+            """Indices of the differential variables in a block for one machine or all machines"""
+            return [block * m + i] if i is not None else [block * m + j for j in range(m)]
+
+        Id = [N + i for i in range(m)]
+        Iq = [N + m + i for i in range(m)]
+        V = [N + 2 * m + j for j in range(n)]
+        TH = [N + 2 * m + n + j for j in range(n)]
+
+        sparsity_u = sp.lil_matrix((2 * N, 2 * N), dtype=bool)
+        sparsity_du = sp.lil_matrix((2 * N, 2 * N), dtype=bool)
+        # equations of the machines follow the order of the differential variables except for the last two
+        row_blocks = [Eqp, Si1d, Edp, Si2q, Delta, w, Efd, RF, VR, PSV, TM]
+        for i in range(m):
+            dependencies = [
+                diff(Eqp, i) + diff(Si1d, i) + diff(Efd, i) + [Id[i]],
+                diff(Si1d, i) + diff(Eqp, i) + [Id[i]],
+                diff(Edp, i) + diff(Si2q, i) + [Iq[i]],
+                diff(Si2q, i) + diff(Edp, i) + [Iq[i]],
+                diff(w),
+                [block * m + i for block in [TM, Eqp, Si1d, Edp, Si2q, w]] + [Id[i], Iq[i]],
+                diff(Efd, i) + diff(VR, i),
+                diff(RF, i) + diff(Efd, i),
+                diff(VR, i) + diff(RF, i) + diff(Efd, i) + [V[i]],
+                diff(PSV, i) + diff(w, i),
+                diff(TM, i) + diff(PSV, i),
+            ]
+            for row, (block, cols) in enumerate(zip(row_blocks, dependencies)):
+                sparsity_u[row * m + i, cols] = True
+                sparsity_du[row * m + i, block * m + i] = True
+
+            # stator equations and power balance at the generator buses
+            stator = [Id[i], Iq[i], V[i], TH[i]] + diff(Delta, i)
+            sparsity_u[N + i, stator + diff(Edp, i) + diff(Si2q, i)] = True
+            sparsity_u[N + m + i, stator + diff(Eqp, i) + diff(Si1d, i)] = True
+            sparsity_u[N + 2 * m + i, stator + V + TH] = True
+            sparsity_u[N + 3 * m + i, stator + V + TH] = True
+
+        # power balance at the load buses
+        for j in range(2 * (n - m)):
+            sparsity_u[N + 4 * m + j, V + TH] = True
+
+        return sp.csc_matrix(sparsity_u), sp.csc_matrix(sparsity_du)
+
     def eval_f(self, u, du, t):
         r"""
         Routine to evaluate the implicit representation of the problem, i.e., :math:`F(u, u', t)`.
@@ -35,6 +35,8 @@ class pendulum_2d(ptype_dae):
         Number of unknowns of the system of DAEs.
     newton_tol : float
         Tolerance for Newton solver.
+    simplified_newton : bool, optional
+        Reuse the Jacobian until convergence of Newton degrades.
 
     Attributes
     ----------
@@ -47,9 +49,9 @@ class pendulum_2d(ptype_dae):
         Lect. Notes Math. (1989).
     """
 
-    def __init__(self, newton_tol):
+    def __init__(self, newton_tol, simplified_newton=True):
         """Initialization routine"""
-        super().__init__(nvars=5, newton_tol=newton_tol)
+        super().__init__(nvars=5, newton_tol=newton_tol, simplified_newton=simplified_newton)
         # load reference solution
         # data file must be generated and stored under misc/data and self.t_end = t[-1]
         # data = np.load(r'pySDC/projects/DAE/misc/data/pendulum.npy')
@@ -90,6 +92,39 @@ class pendulum_2d(ptype_dae):
         self.work_counters['rhs']()
         return f
 
+    def get_Jacobian(self, u, du, t):
+        r"""
+        Routine to evaluate the partial derivatives :math:`\partial F / \partial u` and :math:`\partial F / \partial u'`
+        of the implicit representation with respect to the flattened arguments.
+
+        Parameters
+        ----------
+        u : dtype_u
+            Current values of the numerical solution at time t.
+        du : dtype_u
+            Current values of the derivative of the numerical solution at time t.
+        t : float
+            Current time of the numerical solution.
+
+        Returns
+        -------
+        jac_u : np.2darray
+            Derivative with respect to the solution.
+        jac_du : np.2darray
+            Derivative with respect to the derivative of the solution.
+        """
+        n = self.nvars
+        jac_u = np.zeros((2 * n, 2 * n))
+        jac_u[0, 2] = -1
+        jac_u[1, 3] = -1
+        jac_u[2, [0, n]] = u.alg[0], u.diff[0]
+        jac_u[3, [1, n]] = u.alg[0], u.diff[1]
+        jac_u[n, [0, 1]] = 2 * u.diff[0], 2 * u.diff[1]
+
+        jac_du = np.zeros((2 * n, 2 * n))
+        jac_du[range(4), range(4)] = 1
+        return jac_u, jac_du
+
     def u_exact(self, t):
         """
         Approximation of the exact solution generated by spline interpolation of an extremely accurate numerical reference solution.
@@ -150,6 +185,8 @@ class simple_dae_1(ptype_dae):
         Number of unknowns of the system of DAEs.
     newton_tol : float
         Tolerance for Newton solver.
+    simplified_newton : bool, optional
+        Reuse the Jacobian until convergence of Newton degrades.
 
     References
     ----------
@@ -157,9 +194,9 @@ class simple_dae_1(ptype_dae):
         equations. Society for Industrial and Applied Mathematics (1998).
     """
 
-    def __init__(self, newton_tol=1e-10):
+    def __init__(self, newton_tol=1e-10, simplified_newton=True):
         """Initialization routine"""
-        super().__init__(nvars=3, newton_tol=newton_tol)
+        super().__init__(nvars=3, newton_tol=newton_tol, simplified_newton=simplified_newton)
 
     def eval_f(self, u, du, t):
         r"""
@@ -191,6 +228,38 @@ class simple_dae_1(ptype_dae):
         self.work_counters['rhs']()
         return f
 
+    def get_Jacobian(self, u, du, t):
+        r"""
+        Routine to evaluate the partial derivatives :math:`\partial F / \partial u` and :math:`\partial F / \partial u'`
+        of the implicit representation with respect to the flattened arguments.
+
+        Parameters
+        ----------
+        u : dtype_u
+            Current values of the numerical solution at time t.
+        du : dtype_u
+            Current values of the derivative of the numerical solution at time t.
+        t : float
+            Current time of the numerical solution.
+
+        Returns
+        -------
+        jac_u : np.2darray
+            Derivative with respect to the solution.
+        jac_du : np.2darray
+            Derivative with respect to the derivative of the solution.
+        """
+        a = 10.0
+        n = self.nvars
+        jac_u = np.zeros((2 * n, 2 * n))
+        jac_u[0, [0, n]] = a - 1 / (2 - t), (2 - t) * a
+        jac_u[1, [0, 1, n]] = (1 - a) / (t - 2), -1, a - 1
+        jac_u[n, [0, 1]] = t + 2, t**2 - 4
+
+        jac_du = np.zeros((2 * n, 2 * n))
+        jac_du[[0, 1], [0, 1]] = -1
+        return jac_u, jac_du
+
     def u_exact(self, t):
         """
         Routine for the exact solution.
@@ -230,6 +299,10 @@ class problematic_f(ptype_dae):
         Number of unknowns of the system of DAEs.
     newton_tol : float
         Tolerance for Newton solver.
+    eta : float
+        Specific parameter of the problem.
+    simplified_newton : bool, optional
+        Reuse the Jacobian until convergence of Newton degrades.
 
     Attributes
     ----------
@@ -245,9 +318,9 @@ class problematic_f(ptype_dae):
     dtype_u = mesh
     dtype_f = mesh
 
-    def __init__(self, newton_tol, eta=1):
+    def __init__(self, newton_tol, eta=1, simplified_newton=True):
         """Initialization routine"""
-        super().__init__(nvars=2, newton_tol=newton_tol)
+        super().__init__(nvars=2, newton_tol=newton_tol, simplified_newton=simplified_newton)
         self._makeAttributeAndRegister('eta', localVars=locals())
 
     def eval_f(self, u, du, t):
@@ -276,6 +349,31 @@ class problematic_f(ptype_dae):
         self.work_counters['rhs']()
         return f
 
+    def get_Jacobian(self, u, du, t):
+        r"""
+        Routine to evaluate the partial derivatives :math:`\partial F / \partial u` and :math:`\partial F / \partial u'`
+        of the implicit representation.
+
+        Parameters
+        ----------
+        u : dtype_u
+            Current values of the numerical solution at time t.
+        du : dtype_u
+            Current values of the derivative of the numerical solution at time t.
+        t : float
+            Current time of the numerical solution.
+
+        Returns
+        -------
+        jac_u : np.2darray
+            Derivative with respect to the solution.
+        jac_du : np.2darray
+            Derivative with respect to the derivative of the solution.
+        """
+        jac_u = np.array([[1, self.eta * t], [0, 1 + self.eta]])
+        jac_du = np.array([[0, 0], [1, self.eta * t]])
+        return jac_u, jac_du
+
     def u_exact(self, t):
         """
         Routine for the exact solution.
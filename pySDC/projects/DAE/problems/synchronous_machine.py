@@ -100,6 +100,8 @@ class synchronous_machine_infinite_bus(ptype_dae):
         Number of unknowns of the system of DAEs.
     newton_tol : float
         Tolerance for Newton solver.
+    simplified_newton : bool, optional
+        Reuse the Jacobian until convergence of Newton degrades.
 
     Attributes
     ----------
@@ -149,8 +151,8 @@ class synchronous_machine_infinite_bus(ptype_dae):
     .. [1] P. Kundur, N. J. Balu, M. G. Lauby. Power system stability and control. The EPRI power system series (1994).
     """
 
-    def __init__(self, newton_tol):
-        super().__init__(nvars=14, newton_tol=newton_tol)
+    def __init__(self, newton_tol, simplified_newton=True):
+        super().__init__(nvars=14, newton_tol=newton_tol, simplified_newton=simplified_newton)
         # load reference solution
         # data file must be generated and stored under misc/data and self.t_end = t[-1]
         # data = np.load(r'pySDC/projects/DAE/misc/data/synch_gen.npy')
@@ -265,6 +267,67 @@ class synchronous_machine_infinite_bus(ptype_dae):
         self.work_counters['rhs']()
         return f
 
+    def get_Jacobian(self, u, du, t):
+        r"""
+        Routine to evaluate the partial derivatives :math:`\partial F / \partial u` and :math:`\partial F / \partial u'`
+        of the implicit representation with respect to the flattened arguments.
+
+        Parameters
+        ----------
+        u : dtype_u
+            Current values of the numerical solution at time t.
+        du : dtype_u
+            Current values of the derivative of the numerical solution at time t.
+        t : float
+            Current time of the numerical solution.
+
+        Returns
+        -------
+        jac_u : np.2darray
+            Derivative with respect to the solution.
+        jac_du : np.2darray
+            Derivative with respect to the derivative of the solution.
+        """
+        n = self.nvars
+        psi_d, psi_q = u.diff[0], u.diff[1]
+        delta_r, omega_m = u.diff[6], u.diff[7]
+        i_d, i_q = u.alg[0], u.alg[1]
+
+        # indices of the flattened variables
+        psi_d_, psi_q_, psi_F_, psi_D_, psi_Q1_, psi_Q2_, delta_r_, omega_m_ = range(8)
+        i_d_, i_q_, i_F_, i_D_, i_Q1_, i_Q2_ = range(n, n + 6)
+
+        # the terminal voltages reduce to v_d = E_B sin(delta_r) + Re(Z) i_d - Im(Z) i_q and
+        # v_q = E_B cos(delta_r) + Im(Z) i_d + Re(Z) i_q
+        a, b = np.real(self.Z_line), np.imag(self.Z_line)
+
+        jac_u = np.zeros((2 * n, 2 * n))
+        jac_u[0, [psi_q_, delta_r_, omega_m_, i_d_, i_q_]] = self.omega_b * np.array(
+            [omega_m, self.E_B * np.cos(delta_r), psi_q, a - self.R_s, -b]
+        )
+        jac_u[1, [psi_d_, delta_r_, omega_m_, i_d_, i_q_]] = self.omega_b * np.array(
+            [-omega_m, -self.E_B * np.sin(delta_r), -psi_d, b, a - self.R_s]
+        )
+        jac_u[2, i_F_] = -self.omega_b * self.R_F
+        jac_u[3, i_D_] = -self.omega_b * self.R_D
+        jac_u[4, i_Q1_] = -self.omega_b * self.R_Q1
+        jac_u[5, i_Q2_] = -self.omega_b * self.R_Q2
+        jac_u[6, omega_m_] = self.omega_b
+        jac_u[7, [psi_d_, psi_q_, omega_m_, i_d_, i_q_]] = np.array(
+            [i_q, -i_d, -self.K_D * self.omega_b, -psi_q, psi_d]
+        ) / (2 * self.H_)
+
+        jac_u[n, [psi_d_, i_d_, i_F_, i_D_]] = -1, self.L_d, self.L_md, self.L_md
+        jac_u[n + 1, [psi_q_, i_q_, i_Q1_, i_Q2_]] = -1, self.L_q, self.L_mq, self.L_mq
+        jac_u[n + 2, [psi_F_, i_d_, i_F_, i_D_]] = -1, self.L_md, self.L_F, self.L_md
+        jac_u[n + 3, [psi_D_, i_d_, i_F_, i_D_]] = -1, self.L_md, self.L_md, self.L_D
+        jac_u[n + 4, [psi_Q1_, i_q_, i_Q1_, i_Q2_]] = -1, self.L_mq, self.L_Q1, self.L_mq
+        jac_u[n + 5, [psi_Q2_, i_q_, i_Q1_, i_Q2_]] = -1, self.L_mq, self.L_mq, self.L_Q2
+
+        jac_du = np.zeros((2 * n, 2 * n))
+        jac_du[range(8), range(8)] = -1
+        return jac_u, jac_du
+
     def u_exact(self, t):
         """
         Approximation of the exact solution generated by spline interpolation of an extremely accurate numerical reference solution.
@@ -148,9 +148,9 @@ class SemiImplicitDAE(fully_implicit_DAE):
             for j in range(1, m):
                 u_approx.diff[:] += L.dt * self.QI[m, j] * L.f[j].diff[:]
 
-            def implSystem(unknowns):
+            def state(unknowns):
                 """
-                Build implicit system to solve in order to find the unknowns.
+                Build the arguments of the implicit function for given unknowns.
 
                 Parameters
                 ----------
@@ -159,8 +159,10 @@ class SemiImplicitDAE(fully_implicit_DAE):
 
                 Returns
                 -------
-                sys :
-                    System to be solved as implicit function.
+                local_u_approx : dtype_u
+                    Solution at the node.
+                unknowns_mesh : dtype_f
+                    Derivative of the differential variables at the node.
                 """
 
                 unknowns_mesh = P.dtype_f(unknowns)
@@ -168,13 +170,36 @@ class SemiImplicitDAE(fully_implicit_DAE):
                 local_u_approx = P.dtype_u(u_approx)
                 local_u_approx.diff[:] += L.dt * self.QI[m, m] * unknowns_mesh.diff[:]
                 local_u_approx.alg[:] = unknowns_mesh.alg[:]
+                return local_u_approx, unknowns_mesh
+
+            def implSystem(unknowns):
+                """
+                Build implicit system to solve in order to find the unknowns.
+
+                Parameters
+                ----------
+                unknowns : dtype_u
+                    Unknowns of the system.
+
+                Returns
+                -------
+                sys :
+                    System to be solved as implicit function.
+                """
 
-                sys = P.eval_f(local_u_approx, unknowns_mesh, L.time + L.dt * self.coll.nodes[m - 1])
+                sys = P.eval_f(*state(unknowns), L.time + L.dt * self.coll.nodes[m - 1])
                 return sys
 
             u0 = P.dtype_u(P.init)
             u0.diff[:], u0.alg[:] = L.f[m].diff[:], L.u[m].alg[:]
-            u_new = P.solve_system(implSystem, u0, L.time + L.dt * self.coll.nodes[m - 1])
+            u_new = P.solve_system(
+                implSystem,
+                u0,
+                L.time + L.dt * self.coll.nodes[m - 1],
+                state=state,
+                factor=L.dt * self.QI[m, m],
+                alg_factor=1.0,
+            )
             # ---- update U' and z ----
             L.f[m].diff[:] = u_new.diff[:]
             L.u[m].alg[:] = u_new.alg[:]
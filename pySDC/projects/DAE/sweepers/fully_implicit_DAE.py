@@ -91,9 +91,9 @@ class fully_implicit_DAE(generic_implicit):
                 u_approx += L.dt * self.QI[m, j] * L.f[j]
 
             # params contains U = u'
-            def implSystem(params):
+            def state(params):
                 """
-                Build implicit system to solve in order to find the unknowns.
+                Build the arguments of the implicit function for given unknowns.
 
                 Parameters
                 ----------
@@ -102,8 +102,10 @@ class fully_implicit_DAE(generic_implicit):
 
                 Returns
                 -------
-                sys :
-                    System to be solved as implicit function.
+                local_u_approx : dtype_f
+                    Solution at the node.
+                params_mesh : dtype_f
+                    Derivative of the solution at the node.
                 """
 
                 params_mesh = P.dtype_f(params)
@@ -114,12 +116,34 @@ class fully_implicit_DAE(generic_implicit):
                 # note that derivatives of algebraic variables are taken into account here too
                 # these do not directly affect the output of eval_f but rather indirectly via QI
                 local_u_approx += L.dt * self.QI[m, m] * params_mesh
+                return local_u_approx, params_mesh
+
+            def implSystem(params):
+                """
+                Build implicit system to solve in order to find the unknowns.
+
+                Parameters
+                ----------
+                params : dtype_u
+                    Unknowns of the system.
+
+                Returns
+                -------
+                sys :
+                    System to be solved as implicit function.
+                """
 
-                sys = P.eval_f(local_u_approx, params_mesh, L.time + L.dt * self.coll.nodes[m - 1])
+                sys = P.eval_f(*state(params), L.time + L.dt * self.coll.nodes[m - 1])
                 return sys
 
             # update gradient (recall L.f is being used to store the gradient)
-            L.f[m] = P.solve_system(implSystem, L.f[m], L.time + L.dt * self.coll.nodes[m - 1])
+            L.f[m] = P.solve_system(
+                implSystem,
+                L.f[m],
+                L.time + L.dt * self.coll.nodes[m - 1],
+                state=state,
+                factor=L.dt * self.QI[m, m],
+            )
 
         # Update solution approximation
         integral = self.integrate()
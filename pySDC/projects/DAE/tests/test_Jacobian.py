@@ -0,0 +1,147 @@
+import pytest
+import numpy as np
+
+
+def get_finite_difference_Jacobian(prob, u, du, t, h=1e-6):
+    r"""
+    Approximates the partial derivatives of the implicit representation by central finite differences.
+
+    Parameters
+    ----------
+    prob : pySDC.projects.DAE.misc.ProblemDAE.ptype_dae
+        Problem class.
+    u : dtype_u
+        Solution to linearize around.
+    du : dtype_u
+        Derivative of the solution to linearize around.
+    t : float
+        Time to linearize around.
+    h : float, optional
+        Relative step size.
+
+    Returns
+    -------
+    jacobian : list of np.2darray
+        Partial derivatives with respect to the flattened solution and its derivative.
+    """
+    args = [np.array(u).flatten(), np.array(du).flatten()]
+    jacobian = []
+    for i in range(2):
+        J = np.zeros((args[i].size, args[i].size))
+        for col in range(args[i].size):
+            step = h * max(1, abs(args[i][col]))
+            plus, minus = [me.copy() for me in args], [me.copy() for me in args]
+            plus[i][col] += step
+            minus[i][col] -= step
+            f_plus = prob.eval_f(*[me.reshape(u.shape).view(type(u)) for me in plus], t)
+            f_minus = prob.eval_f(*[me.reshape(u.shape).view(type(u)) for me in minus], t)
+            J[:, col] = (np.array(f_plus).flatten() - np.array(f_minus).flatten()) / (2 * step)
+        jacobian.append(J)
+    return jacobian
+
+
+@pytest.mark.base
+@pytest.mark.parametrize('name', ['pendulum', 'simple_dae_1', 'problematic_f', 'synchronous_machine', 'WSCC9'])
+def test_Jacobian(name):
+    r"""
+    Test that the analytic Jacobians and the ones approximated by finite differences with grouped columns match
+    central finite differences.
+    """
+    from pySDC.projects.DAE.problems.simple_DAE import pendulum_2d, simple_dae_1, problematic_f
+    from pySDC.projects.DAE.problems.synchronous_machine import synchronous_machine_infinite_bus
+    from pySDC.projects.DAE.problems.WSCC9BusSystem import WSCC9BusSystem
+
+    problems = {
+        'pendulum': pendulum_2d,
+        'simple_dae_1': simple_dae_1,
+        'problematic_f': problematic_f,
+        'synchronous_machine': synchronous_machine_infinite_bus,
+        'WSCC9': WSCC9BusSystem,
+    }
+    prob = problems[name](newton_tol=1e-10)
+
+    rng = np.random.default_rng(seed=99)
+    t = 0.03
+    u = prob.dtype_u(prob.u_exact(0))
+    u[:] += 1e-2 * rng.random(u.shape)
+    du = prob.dtype_u(prob.init)
+    du[:] = rng.random(u.shape)
+
+    jacobian = prob.get_Jacobian(u, du, t)
+    jacobian_FD = get_finite_difference_Jacobian(prob, u, du, t)
+    for J, J_FD in zip(jacobian, jacobian_FD):
+        J = J.toarray() if hasattr(J, 'toarray') else np.asarray(J)
+        assert np.allclose(J, J_FD, rtol=1e-6, atol=1e-6 * np.max(np.abs(J_FD))), f'Jacobian of {name} is wrong!'
+
+
+@pytest.mark.base
+def test_column_groups():
+    r"""
+    Test that grouped columns do not share any nonzero row and that all columns are grouped exactly once.
+    """
+    import scipy.sparse as sp
+    from pySDC.projects.DAE.misc.ProblemDAE import get_column_groups
+
+    sparsity = sp.random(50, 50, density=0.1, random_state=1, format='csc') + sp.identity(50)
+    groups = get_column_groups(sparsity)
+
+    assert sorted(np.concatenate(groups)) == list(range(50)), 'Columns are not grouped exactly once!'
+    assert len(groups) < 50, 'Expected columns to be grouped!'
+    for group in groups:
+        rows = sparsity[:, group].toarray() != 0
+        assert np.all(rows.sum(axis=1) <= 1), 'Grouped columns share rows!'
+
+
+@pytest.mark.base
+@pytest.mark.parametrize('simplified_newton', [True, False])
+@pytest.mark.parametrize('sweeper_name', ['fully_implicit_DAE', 'SemiImplicitDAE'])
+def test_Newton(sweeper_name, simplified_newton):
+    r"""
+    Test that Newton with the Jacobian of the problem gives the same results as ``scipy.optimize.root`` with less work
+    and that the Jacobian is reused across nodes in simplified mode.
+    """
+    from pySDC.projects.DAE.problems.simple_DAE import simple_dae_1
+    from pySDC.projects.DAE.sweepers.fully_implicit_DAE import fully_implicit_DAE
+    from pySDC.projects.DAE.sweepers.SemiImplicitDAE import SemiImplicitDAE
+    from pySDC.implementations.controller_classes.controller_nonMPI import controller_nonMPI
+    from pySDC.implementations.hooks.log_work import LogWork
+    from pySDC.helpers.stats_helper import get_sorted
+
+    class simple_dae_1_without_Jacobian(simple_dae_1):
+        def get_Jacobian(self, u, du, t):
+            return None
+
+    sweeper = {'fully_implicit_DAE': fully_implicit_DAE, 'SemiImplicitDAE': SemiImplicitDAE}[sweeper_name]
+
+    results = {}
+    for problem in [simple_dae_1, simple_dae_1_without_Jacobian]:
+        description = {
+            'problem_class': problem,
+            'problem_params': {'newton_tol': 1e-12, 'simplified_newton': simplified_newton},
+            'sweeper_class': sweeper,
+            'sweeper_params': {'quad_type': 'RADAU-RIGHT', 'num_nodes': 3, 'QI': 'LU'},
+            'level_params': {'restol': 1e-12, 'dt': 0.1},
+            'step_params': {'maxiter': 20},
+        }
+        controller = controller_nonMPI(
+            num_procs=1, controller_params={'logger_level': 30, 'hook_class': LogWork}, description=description
+        )
+        P = controller.MS[0].levels[0].prob
+        uend, stats = controller.run(u0=P.u_exact(0.0), t0=0.0, Tend=0.5)
+        results[problem] = {
+            'uend': uend,
+            'niter': [me[1] for me in get_sorted(stats, type='niter')],
+            **{key: sum(me[1] for me in get_sorted(stats, type=f'work_{key}')) for key in ['newton', 'jacobian']},
+        }
+
+    newton, root = results[simple_dae_1], results[simple_dae_1_without_Jacobian]
+    assert np.allclose(newton['uend'], root['uend'], atol=1e-10), 'Newton gives different results than root!'
+    assert newton['niter'] == root['niter'], 'Newton needs different numbers of SDC iterations than root!'
+    assert newton['newton'] < root['newton'], 'Newton needs more evaluations of the implicit system than root!'
+    assert root['jacobian'] == 0, 'Jacobian was used although it is not available!'
+
+    num_solves = sum(newton['niter']) * 3
+    if simplified_newton:
+        assert newton['jacobian'] < num_solves, 'Jacobian was not reused in simplified Newton!'
+    else:
+        assert newton['jacobian'] >= num_solves, 'Jacobian was reused although simplified Newton is not used!'
@@ -3,6 +3,7 @@ import numpy as np
 
 from pySDC.core.Hooks import hooks
 from pySDC.implementations.datatype_classes.mesh import mesh
+from pySDC.implementations.datatype_classes.particles import particles
 from pySDC.helpers.pysdc_helper import FrozenClass
 
 
@@ -26,6 +27,68 @@ def get_combination_from_index(index, options):
         return [index % options[0]] + get_combination_from_index(index // options[0], options[1:])
 
 
+def get_num_bits(dtype):
+    """
+    Get the number of bits in the binary representation of a floating point type. Complex numbers are represented by
+    the bits of the real part followed by the bits of the imaginary part.
+
+    Args:
+        dtype (numpy.dtype): The data type
+
+    Returns:
+        int: Number of bits
+    """
+    dtype = np.dtype(dtype)
+    if dtype.kind not in ['f', 'c']:
+        raise NotImplementedError(f'Don\'t know how many bits type {dtype} has')
+    return dtype.itemsize * 8
+
+
+def flip_bits(data, positions, bits):
+    """
+    Flip bits in an array in-place by applying XOR masks to an unsigned integer view of its buffer. Bits are counted
+    from the most significant bit in IEEE754, i.e. bit 0 is the sign and the exponent follows. For complex numbers,
+    bits of the imaginary part follow the bits of the real part.
+
+    Any number of bits can be flipped at once and positions may occur multiple times, for instance to flip several
+    bits in the same number.
+
+    Args:
+        data (numpy.ndarray): Array of floating point or complex numbers, e.g. a mesh
+        positions (list): Indices of the numbers in which to flip bits, with one entry per bit flip
+        bits (list): Bits to flip, with one entry per bit flip
+
+    Returns:
+        None
+    """
+    data = np.asarray(data)
+    bits = np.asarray(bits, dtype=int).reshape(-1)
+    num_bits = get_num_bits(data.dtype)
+    if np.any(bits < 0) or np.any(bits >= num_bits):
+        raise ValueError(f'Can only flip bits between 0 and {num_bits - 1} in type {data.dtype}, got {bits}')
+
+    positions = np.asarray(positions, dtype=int).reshape(len(bits), data.ndim)
+    flat_positions = np.ravel_multi_index(tuple(positions.T), data.shape) if data.ndim > 0 else np.zeros_like(bits)
+    unique_positions, inverse = np.unique(flat_positions, return_inverse=True)
+
+    # get a copy of the affected numbers and view them as unsigned integers of the same size as the real part
+    values = data.reshape(-1)[unique_positions] if data.ndim > 0 else data.reshape(1)
+    real_dtype = values.real.dtype
+    words = values.view(real_dtype).view(f'u{real_dtype.itemsize}')
+    word_size = real_dtype.itemsize * 8
+    words_per_value = num_bits // word_size
+
+    # XOR masks with the bit to flip, where multiple flips in the same word are accumulated
+    word_positions = inverse * words_per_value + bits // word_size
+    masks = np.left_shift(np.ones_like(bits, dtype=words.dtype), (word_size - 1 - bits % word_size).astype(words.dtype))
+    np.bitwise_xor.at(words, word_positions, masks)
+
+    if data.ndim > 0:
+        data.flat[unique_positions] = values
+    else:
+        data[()] = values[0]
+
+
 class Fault(FrozenClass):
     '''
     Class for storing all the data that belongs to a fault, i.e. when and where it happens
@@ -48,6 +111,7 @@ class Fault(FrozenClass):
         self.node = None
         self.problem_pos = None
         self.bit = None
+        self.burst = 1  # number of adjacent bits that are flipped starting at self.bit
         self.rank = None
         self.target = 0
         self.when = 'after'  # before or after an iteration?
@@ -276,47 +340,100 @@ class FaultInjector(hooks):
         Returns:
             None
         '''
-        L = step.levels[f.level_number]
-        _abs_before = None
-        _abs_after = None
-
-        # insert the fault in some target
-        if f.target == 0:
-            '''
-            Target 0 means we flip a bit in the solution.
-
-            To make sure the faults have some impact, we have to reevaluate the right hand side. Otherwise the fault is
-            fixed automatically in this implementation, as the right hand side is assembled only from f(t, u) and u is
-            tempered with after computing f(t, u).
-
-            To be fair to iteration based resilience strategies, we also reevaluate the residual. Otherwise, when a
-            fault happens in the last iteration, it will not show up in the residual and the iteration is wrongly
-            stopped.
-            '''
-            _abs_before = abs(L.u[f.node][tuple(f.problem_pos)])
-            L.u[f.node][tuple(f.problem_pos)] = self.flip_bit(L.u[f.node][tuple(f.problem_pos)], f.bit)
-            L.f[f.node] = L.prob.eval_f(L.u[f.node], L.time + L.dt * L.sweep.coll.nodes[max([0, f.node - 1])])
-            L.sweep.compute_residual()
-            _abs_after = abs(L.u[f.node][tuple(f.problem_pos)])
-        else:
-            raise NotImplementedError(f'Target {f.target} for faults not implemented!')
+        self.inject_faults(step, [f])
 
-        # log what happened to stats and screen
-        self.logger.info(
-            f'Flipping bit {f.bit} {f.when} iteration {f.iteration} in node {f.node} on rank {f.rank}. Target: {f.target}. Abs: {_abs_before:.4e} -> {_abs_after:.4e}'
-        )
-        self.add_to_stats(
-            process=step.status.slot,
-            time=L.time,
-            level=L.level_index,
-            iter=step.status.iter,
-            sweep=L.status.sweep,
-            type='bitflip',
-            value=(f.level_number, f.iteration, f.node, f.problem_pos, f.bit, f.target, f.rank),
-        )
+    @staticmethod
+    def get_target_array(u, problem_pos):
+        '''
+        Get the array and the index within it that a position in the problem refers to. For particles, the first entry
+        of the position selects positions or velocities.
 
-        # remove the fault from the list to make sure it happens only once
-        self.faults.remove(f)
+        Args:
+            u (dtype_u): Solution at a node
+            problem_pos (list): Position in the problem
+
+        Returns:
+            numpy.ndarray: The array containing the position
+            tuple: Index within the array
+        '''
+        if isinstance(u, particles):
+            return [u.pos, u.vel][problem_pos[0]], tuple(problem_pos[1:])
+        return u, tuple(problem_pos)
+
+    def inject_faults(self, step, faults):
+        '''
+        Method to inject a number of faults into a step at once. All bits are flipped with a single vectorized
+        operation per affected array and the right hand side and residual are reevaluated only once.
+
+        Args:
+            step (pySDC.Step.step): Step to inject the faults into
+            faults (list): Faults that should be injected
+
+        Returns:
+            None
+        '''
+        if len(faults) == 0:
+            return None
+
+        for f in faults:
+            if f.target != 0:
+                raise NotImplementedError(f'Target {f.target} for faults not implemented!')
+
+        '''
+        Target 0 means we flip a bit in the solution.
+
+        To make sure the faults have some impact, we have to reevaluate the right hand side. Otherwise the fault is
+        fixed automatically in this implementation, as the right hand side is assembled only from f(t, u) and u is
+        tempered with after computing f(t, u).
+
+        To be fair to iteration based resilience strategies, we also reevaluate the residual. Otherwise, when a
+        fault happens in the last iteration, it will not show up in the residual and the iteration is wrongly
+        stopped.
+        '''
+        # gather all bit flips in the same array
+        flips = {}
+        abs_before = []
+        for f in faults:
+            L = step.levels[f.level_number]
+            array, index = self.get_target_array(L.u[f.node], f.problem_pos)
+            abs_before += [abs(array[index])]
+
+            bits = [bit for bit in range(f.bit, f.bit + f.burst) if bit < get_num_bits(array.dtype)]
+            flips_array = flips.get(id(array), (f.level_number, f.node, array, [], []))
+            flips_array[3].extend([index] * len(bits))
+            flips_array[4].extend(bits)
+            flips[id(array)] = flips_array
+
+        for _level_number, _node, array, positions, bits in flips.values():
+            flip_bits(array, positions, bits)
+
+        for level_number, node in {(me[0], me[1]) for me in flips.values()}:
+            L = step.levels[level_number]
+            L.f[node] = L.prob.eval_f(L.u[node], L.time + L.dt * L.sweep.coll.nodes[max([0, node - 1])])
+        for level_number in {me[0] for me in flips.values()}:
+            step.levels[level_number].sweep.compute_residual()
+
+        for f, _abs_before in zip(faults, abs_before):
+            L = step.levels[f.level_number]
+            array, index = self.get_target_array(L.u[f.node], f.problem_pos)
+            _abs_after = abs(array[index])
+
+            # log what happened to stats and screen
+            self.logger.info(
+                f'Flipping bit {f.bit} {f.when} iteration {f.iteration} in node {f.node} on rank {f.rank}. Target: {f.target}. Abs: {_abs_before:.4e} -> {_abs_after:.4e}'
+            )
+            self.add_to_stats(
+                process=step.status.slot,
+                time=L.time,
+                level=L.level_index,
+                iter=step.status.iter,
+                sweep=L.status.sweep,
+                type='bitflip',
+                value=(f.level_number, f.iteration, f.node, f.problem_pos, f.bit, f.target, f.rank),
+            )
+
+            # remove the fault from the list to make sure it happens only once
+            self.faults.remove(f)
 
         return None
 
@@ -334,26 +451,22 @@ class FaultInjector(hooks):
 
         super().pre_run(step, level_number)
 
-        if not type(step.levels[level_number].u[0]) == mesh:
-            raise NotImplementedError(
-                f'Fault insertion is only implemented for type mesh, not \
-{type(step.levels[level_number].u[0])}'
-            )
-
-        dtype = step.levels[level_number].prob.u_exact(t=0).dtype
-        if dtype in [float, np.float64]:
-            bit = 64
-        elif dtype in [complex]:
-            bit = 128
+        u = step.levels[level_number].u[0]
+        if isinstance(u, particles):
+            problem_pos = (2,) + u.pos.shape
+            bit = get_num_bits(u.pos.dtype)
+        elif isinstance(u, mesh):
+            problem_pos = u.shape
+            bit = get_num_bits(u.dtype)
         else:
-            raise NotImplementedError(f'Don\'t know how many bits type {dtype} has')
+            raise NotImplementedError(f'Fault insertion is only implemented for types mesh and particles, not {type(u)}')
 
         # define parameters for randomization
         self.rnd_params = {
             'level_number': len(step.levels),
             'node': step.levels[0].sweep.params.num_nodes,
             'iteration': step.params.maxiter,
-            'problem_pos': step.levels[level_number].u[0].shape,
+            'problem_pos': problem_pos,
             'bit': bit,  # change manually if you ever have something else
             'rank': 0,
             **self.rnd_params,
@@ -413,14 +526,7 @@ class FaultInjector(hooks):
             self.add_random_fault(args={'timestep': self.timestep_idx, 'iteration': step.status.iter})
 
         # loop though all faults that have not yet happened and check if they are scheduled now
-        for f in [me for me in self.faults if me.when == 'before']:
-            # based on iteration number
-            if self.timestep_idx == f.timestep and step.status.iter == f.iteration:
-                self.inject_fault(step, f)
-            # based on time
-            elif f.time is not None:
-                if step.time > f.time and step.status.iter == f.iteration and step.status.slot == f.rank:
-                    self.inject_fault(step, f)
+        self.inject_faults(step, [me for me in self.faults if me.when == 'before' and self.is_scheduled(step, me)])
 
         self.iter_idx += 1
 
@@ -441,17 +547,29 @@ class FaultInjector(hooks):
         super().post_iteration(step, level_number)
 
         # loop though all unhappened faults and check if they are scheduled now
-        for f in [me for me in self.faults if me.when == 'after']:
-            # based on iteration number
-            if self.timestep_idx == f.timestep and step.status.iter == f.iteration:
-                self.inject_fault(step, f)
-            # based on time
-            elif f.time is not None:
-                if step.time > f.time and step.status.iter == f.iteration and step.status.slot == f.rank:
-                    self.inject_fault(step, f)
+        self.inject_faults(step, [me for me in self.faults if me.when == 'after' and self.is_scheduled(step, me)])
 
         return None
 
+    def is_scheduled(self, step, f):
+        '''
+        Check if a fault is scheduled in the current iteration
+
+        Args:
+            step (pySDC.Step.step): the current step
+            f (Fault): the fault
+
+        Returns:
+            bool: Whether the fault should be inserted now
+        '''
+        # based on iteration number
+        if self.timestep_idx == f.timestep and step.status.iter == f.iteration:
+            return True
+        # based on time
+        elif f.time is not None:
+            return step.time > f.time and step.status.iter == f.iteration and step.status.slot == f.rank
+        return False
+
     @classmethod
     def to_binary(cls, f):
         '''
@@ -507,17 +625,18 @@ class FaultInjector(hooks):
     @classmethod
     def flip_bit(cls, target, bit):
         '''
-        Flips a bit at position bit in a target using the bitwise xor operator
+        Flips a bit at position bit in a target using the bitwise xor operator on an integer view of the number
 
         Args:
-            target (float, np.float64, np.float32): the floating point number in which you want to flip a bit
+            target (float, np.float64, np.float32, complex): the floating point number in which you want to flip a bit
             bit (int): the bit which you intend to flip
 
         Returns:
             (float) The floating point number resulting from flipping the respective bit in target
         '''
-        binary = cls.to_binary(target)
-        return cls.to_float(f'{binary[:bit]}{int(binary[bit]) ^ 1}{binary[bit+1:]}')
+        value = np.array(target)
+        flip_bits(value, [()], [bit])
+        return value[()]
 
 
 def prepare_controller_for_faults(controller, fault_stuff, rnd_args=None, args=None):
@@ -8,6 +8,7 @@ from pySDC.helpers.stats_helper import get_sorted
 
 from pySDC.projects.Resilience.hook import hook_collection, LogUAllIter, LogData
 from pySDC.projects.Resilience.fault_injection import get_fault_injector_hook
+from pySDC.projects.Resilience.work_queue import WorkQueue, RunStore, ProgressReporter
 from pySDC.implementations.convergence_controller_classes.hotrod import HotRod
 from pySDC.implementations.convergence_controller_classes.adaptivity import Adaptivity
 from pySDC.implementations.hooks.log_errors import LogLocalErrorPostStep
@@ -29,12 +30,41 @@ plot_helper.setup_mpl(reset=True)
 
 LOGGER_LEVEL = 40
 
+# data that is recorded for every run in addition to the position of the fault in the problem
+RUN_KEYS = [
+    'level',
+    'iteration',
+    'node',
+    'bit',
+    'error',
+    'total_iteration',
+    'total_newton_iteration',
+    'restarts',
+    'target',
+    'rank',
+]
+
 RECOVERY_THRESH_ABS = {
     # run_quench: 5e-3,
     # run_Schroedinger: 1.7e-6,
 }
 
 
+def record_run(fault_stats, task):
+    '''
+    Perform a single experiment of a campaign. This is a module-level function such that it can be sent to the processes
+    of a pool without the `FaultStats` object, which is passed to the work queue as context instead.
+
+    Args:
+        fault_stats (FaultStats): Object setting up the experiments
+        task (tuple): Index of the strategy, whether to use faults and the index of the run
+
+    Returns:
+        dict: Data of the run
+    '''
+    return fault_stats.record_run(task)
+
+
 class FaultStats:
     '''
     Class to generate and analyse fault statistics
@@ -109,28 +139,27 @@ class FaultStats:
         '''
         return self.strategies[0].get_Tend(self.prob, self.num_procs)
 
-    def run_stats_generation(
-        self, runs=1000, step=None, comm=None, kwargs_range=None, faults=None, _reload=False, _runs_partial=0
-    ):
+    def run_stats_generation(self, runs=1000, step=None, comm=None, kwargs_range=None, faults=None, num_workers=1):
         '''
-        Run the generation of stats for all strategies in the `self.strategies` variable
+        Run the generation of stats for all strategies in the `self.strategies` variable.
+
+        The runs are distributed dynamically with a work queue, either with MPI or with a local process pool, and every
+        completed run is appended to a store on disk right away. When reloading, only the runs that have not been
+        recorded yet are performed, such that interrupted campaigns can be resumed. The stats that are used for
+        analysis are refreshed from the stores every `step` completed runs and at the end.
 
         Args:
             runs (int): Number of runs you want to do
-            step (int): Number of runs you want to do between saving
+            step (int): Number of completed runs between refreshing the stats, only at the end if None
             comm (MPI.Communicator): Communicator for distributing runs
             faults (bool): Whether to do stats with faults or without
             kw_args_range (dict): Range for the parameters
-            _reload, _runs_partial: Variables only used for recursion. Do not change!
+            num_workers (int): Number of processes in a local process pool if no MPI communicator with more than one
+                rank is used
 
         Returns:
             None
         '''
-        if faults is None:
-            for f in self.faults:
-                self.run_stats_generation(runs=runs, step=step, comm=comm, kwargs_range=kwargs_range, faults=f)
-            return None
-
         for key, val in kwargs_range.items() if kwargs_range is not None else {}:
             if type(val) == int:
                 self.kwargs[key] = val
@@ -138,58 +167,90 @@ class FaultStats:
                 for me in val:
                     kwargs_range_me = {**kwargs_range, key: me}
                     self.run_stats_generation(
-                        runs=runs, step=step, comm=comm, kwargs_range=kwargs_range_me, faults=faults
+                        runs=runs,
+                        step=step,
+                        comm=comm,
+                        kwargs_range=kwargs_range_me,
+                        faults=faults,
+                        num_workers=num_workers,
                     )
                 return None
 
         comm = MPI.COMM_WORLD if comm is None else comm
-        step = (runs if comm.size == 1 else comm.size) if step is None else step
-        _runs_partial = step if _runs_partial == 0 else _runs_partial
-        reload = self.reload or _reload
+        queue = WorkQueue(comm=comm, num_workers=num_workers)
+        faults = self.faults if faults is None else [faults]
+
+        tasks = None
+        if queue.is_master:
+            tasks = self.get_missing_runs(runs=runs, faults=faults)
+        tasks = comm.bcast(tasks, root=0)
+
+        stores = {}
+        counts = {}
+        progress = None
+        if queue.is_master:
+            for strategy_idx, strategy in enumerate(self.strategies):
+                for faults_run in faults:
+                    stores[(strategy_idx, faults_run)] = self.get_run_store(strategy=strategy, faults=faults_run)
+                    counts[(strategy_idx, faults_run)] = 0
+            workers = comm.size if comm.size > 1 else num_workers
+            progress = ProgressReporter(total=len(tasks), name=f'{self.prob.__name__} with {workers} worker(s)')
+
+        def record(task, result):
+            strategy_idx, faults_run, run = task
+            stores[(strategy_idx, faults_run)].append(run, result)
+            counts[(strategy_idx, faults_run)] += 1
+            if step is not None and counts[(strategy_idx, faults_run)] % step == 0:
+                self.consolidate(strategy=self.strategies[strategy_idx], faults=faults_run)
+
+        if len(tasks) > 0:
+            queue.run(function=record_run, tasks=tasks, callback=record, progress=progress, context=self)
+
+        # refresh the stats from the stores, also if a previous campaign was interrupted before doing so
+        if queue.is_master:
+            for strategy_idx, faults_run in stores.keys():
+                self.consolidate(strategy=self.strategies[strategy_idx], faults=faults_run)
 
-        # see if we limit the number of runs we want to do
-        max_runs = (
-            (min(self.get_max_combinations(), runs) if self.mode == 'combination' else runs) if faults else min(runs, 5)
-        )
+        return None
 
-        if reload:
-            # sort the strategies to do some load balancing
-            sorting_index = None
-            if comm.rank == 0:
-                already_completed = np.array(
-                    [self.load(strategy=strategy, faults=faults).get('runs', 0) for strategy in self.strategies]
-                )
-                sorting_index_ = np.argsort(already_completed)
-                sorting_index = sorting_index_[already_completed[sorting_index_] < max_runs]
-                _runs_partial = max(min(already_completed), _runs_partial)
-
-            # tell all ranks what strategies to use
-            sorting_index = comm.bcast(sorting_index, root=0)
-            _runs_partial = comm.bcast(_runs_partial, root=0)
-            strategies = [self.strategies[i] for i in sorting_index]
-            if len(strategies) == 0:  # check if we are already done
-                return None
-        else:
-            strategies = self.strategies
+    def get_missing_runs(self, runs, faults):
+        '''
+        Get the runs that have not been recorded yet. If we don't want to reload, all previously recorded runs are
+        discarded. Runs are sorted by their index, such that results of all strategies are completed at similar pace.
 
-        strategy_comm = comm.Split(comm.rank % len(strategies))
+        Args:
+            runs (int): Number of runs you want to do
+            faults (list): List of booleans that describe whether to use faults or not
 
-        for j in range(0, len(strategies), comm.size):
-            self.generate_stats(
-                strategy=strategies[j + (comm.rank % len(strategies) % (len(strategies) - j))],
-                runs=min(_runs_partial, max_runs),
-                faults=faults,
-                reload=reload,
-                comm=strategy_comm,
+        Returns:
+            list: Tasks containing the index of the strategy, whether to use faults and the index of the run
+        '''
+        tasks = []
+        for faults_run in faults:
+            # see if we limit the number of runs we want to do
+            max_runs = (
+                (min(self.get_max_combinations(), runs) if self.mode == 'combination' else runs)
+                if faults_run
+                else min(runs, 5)
             )
-        strategy_comm.Free()
-        self.run_stats_generation(
-            runs=runs, step=step, comm=comm, faults=faults, _reload=True, _runs_partial=_runs_partial + step
-        )
 
-        return None
+            for strategy_idx, strategy in enumerate(self.strategies):
+                identifier_args = {'strategy': strategy, 'faults': faults_run}
+                store = self.get_run_store(**identifier_args)
 
-    def generate_stats(self, strategy=None, runs=1000, reload=True, faults=True, comm=None):
+                if self.reload:
+                    completed = store.load()
+                    if len(completed) == 0:
+                        completed = self.import_legacy_stats(**identifier_args)
+                else:
+                    store.clear()
+                    completed = {}
+
+                tasks += [(strategy_idx, faults_run, run) for run in range(max_runs) if run not in completed]
+
+        return sorted(tasks, key=lambda task: (task[2], task[1], task[0]))
+
+    def generate_stats(self, strategy=None, runs=1000, reload=True, faults=True, comm=None, num_workers=1):
         '''
         Generate statistics for recovery from bit flips
         -----------------------------------------------
@@ -202,104 +263,131 @@ class FaultStats:
             reload (bool): Load previously computed statistics and continue from there or start from scratch
             faults (bool): Whether to do stats with faults or without
             comm (MPI.Communicator): Communicator for distributing runs
+            num_workers (int): Number of processes in a local process pool
 
         Returns:
             None
         '''
-        comm = MPI.COMM_WORLD if comm is None else comm
+        strategies, self.strategies = self.strategies, [strategy]
+        reload_, self.reload = self.reload, reload
+        try:
+            self.run_stats_generation(runs=runs, comm=comm, faults=faults, num_workers=num_workers)
+        finally:
+            self.strategies, self.reload = strategies, reload_
 
-        # initialize dictionary to store the stats in
-        dat = {
-            'level': np.zeros(runs),
-            'iteration': np.zeros(runs),
-            'node': np.zeros(runs),
-            'problem_pos': [],
-            'bit': np.zeros(runs),
-            'error': np.zeros(runs),
-            'total_iteration': np.zeros(runs),
-            'total_newton_iteration': np.zeros(runs),
-            'restarts': np.zeros(runs),
-            'target': np.zeros(runs),
-            'rank': np.zeros(runs),
-        }
+        return None
 
-        # store arguments for storing and loading
-        identifier_args = {
-            'faults': faults,
-            'strategy': strategy,
-        }
+    def record_run(self, task):
+        '''
+        Perform a single experiment and extract the data we want to record from the stats
 
-        # reload previously recorded stats and write them to dat
-        if reload:
-            already_completed_ = None
-            if comm.rank == 0:
-                already_completed_ = self.load(**identifier_args)
-            already_completed = comm.bcast(already_completed_, root=0)
-            if already_completed['runs'] > 0 and already_completed['runs'] <= runs and comm.rank == 0:
-                avail_len = min([already_completed['runs'], runs])
-                for k in dat.keys():
-                    dat[k][:avail_len] = already_completed.get(k, [None] * avail_len)
-        else:
-            already_completed = {'runs': 0}
+        Args:
+            task (tuple): Index of the strategy, whether to use faults and the index of the run
 
-        # prepare a message
-        involved_ranks = comm.gather(MPI.COMM_WORLD.rank, root=0)
-        msg = f'{comm.size} rank(s) ({involved_ranks}) doing {strategy.name}{" with faults" if faults else ""} with {self.num_procs} ranks for {self.prob.__name__} from {already_completed["runs"]} to {runs}'
-        if comm.rank == 0 and already_completed['runs'] < runs:
-            print(msg, flush=True)
+        Returns:
+            dict: Data of the run
+        '''
+        strategy_idx, faults, run = task
+        strategy = self.strategies[strategy_idx]
 
+        dat = {key: 0.0 for key in RUN_KEYS}
+        dat['problem_pos'] = None
+
+        # perform a single experiment with the correct random seed
         space_comm = MPI.COMM_SELF.Split(True)
+        stats, controller, crash = self.single_run(strategy=strategy, run=run, faults=faults, space_comm=space_comm)
+        space_comm.Free()
 
-        # perform the remaining experiments
-        for i in range(already_completed['runs'], runs):
-            if i % comm.size != comm.rank:
-                continue
+        # get the data from the stats
+        faults_run = get_sorted(stats, type='bitflip')
 
-            # perform a single experiment with the correct random seed
-            stats, controller, crash = self.single_run(strategy=strategy, run=i, faults=faults, space_comm=space_comm)
-
-            # get the data from the stats
-            faults_run = get_sorted(stats, type='bitflip')
-
-            if faults:
-                assert len(faults_run) > 0, f"Did not record a fault in run {i} of {strategy.name}!"
-                dat['level'][i] = faults_run[0][1][0]
-                dat['iteration'][i] = faults_run[0][1][1]
-                dat['node'][i] = faults_run[0][1][2]
-                dat['problem_pos'] += [faults_run[0][1][3]]
-                dat['bit'][i] = faults_run[0][1][4]
-                dat['target'][i] = faults_run[0][1][5]
-                dat['rank'][i] = faults_run[0][1][6]
-            if crash:
-                print('Code crashed!')
-                continue
+        if faults:
+            assert len(faults_run) > 0, f"Did not record a fault in run {run} of {strategy.name}!"
+            dat['level'] = faults_run[0][1][0]
+            dat['iteration'] = faults_run[0][1][1]
+            dat['node'] = faults_run[0][1][2]
+            dat['problem_pos'] = faults_run[0][1][3]
+            dat['bit'] = faults_run[0][1][4]
+            dat['target'] = faults_run[0][1][5]
+            dat['rank'] = faults_run[0][1][6]
+        if crash:
+            print('Code crashed!')
+            return dat
+
+        # record the rest of the data
+        t, u = get_sorted(stats, type='u', recomputed=False)[-1]
+        dat['error'] = self.get_error(u, t, controller, strategy, self.get_Tend())
+        dat['total_iteration'] = sum([k[1] for k in get_sorted(stats, type='k')])
+        dat['total_newton_iteration'] = sum([k[1] for k in get_sorted(stats, type='work_newton')])
+        dat['restarts'] = sum([me[1] for me in get_sorted(stats, type='restart')])
 
-            # record the rest of the data
-            t, u = get_sorted(stats, type='u', recomputed=False)[-1]
-            error = self.get_error(u, t, controller, strategy, self.get_Tend())
-            total_iteration = sum([k[1] for k in get_sorted(stats, type='k')])
-            total_newton_iteration = sum([k[1] for k in get_sorted(stats, type='work_newton')])
+        return dat
 
-            dat['error'][i] = error
-            dat['total_iteration'][i] = total_iteration
-            dat['total_newton_iteration'][i] = total_newton_iteration
-            dat['restarts'][i] = sum([me[1] for me in get_sorted(stats, type='restart')])
+    def get_run_store(self, **kwargs):
+        '''
+        Get the append-only store for the data of single runs
 
-        # free the space communicator
-        space_comm.Free()
+        Args:
+            strategy (Strategy): The resilience strategy
+            faults (bool): Whether or not faults have been activated
+
+        Returns:
+            RunStore: The store
+        '''
+        return RunStore(self.get_path(suffix='runs', **kwargs))
 
-        dat_full = {}
-        for k in dat.keys():
-            dat_full[k] = comm.reduce(dat[k], op=MPI.SUM)
+    def import_legacy_stats(self, **kwargs):
+        '''
+        Put the data of stats that have been stored before the runs were recorded individually into the store of
+        single runs, such that they can be continued.
+
+        Args:
+            strategy (Strategy): The resilience strategy
+            faults (bool): Whether or not faults have been activated
+
+        Returns:
+            dict: Data of the runs with the indices of the runs as keys
+        '''
+        dat = self.load(**kwargs)
+        runs = {}
+        if dat['runs'] == 0:
+            return runs
+
+        store = self.get_run_store(**kwargs)
+        problem_pos = dat.get('problem_pos', [])
+        for run in range(dat['runs']):
+            runs[run] = {key: dat[key][run] if key in dat.keys() else 0.0 for key in RUN_KEYS}
+            runs[run]['problem_pos'] = problem_pos[run] if len(problem_pos) == dat['runs'] else None
+            store.append(run, runs[run])
+        return runs
+
+    def consolidate(self, **kwargs):
+        '''
+        Gather the data of single runs from the store into the stats used for analysis. Only runs up to the first one
+        that has not been completed yet are included, such that the stats contain the first `runs` runs.
+
+        Args:
+            strategy (Strategy): The resilience strategy
+            faults (bool): Whether or not faults have been activated
+
+        Returns:
+            None
+        '''
+        results = self.get_run_store(**kwargs).load()
+
+        runs = 0
+        while runs in results.keys():
+            runs += 1
+        if runs == 0:
+            return None
 
-        # store the completed stats
-        dat_full['runs'] = runs
+        dat = {key: np.array([results[run][key] for run in range(runs)], dtype=float) for key in RUN_KEYS}
+        dat['problem_pos'] = [results[run]['problem_pos'] for run in range(runs) if kwargs['faults']]
+        dat['runs'] = runs
 
-        if already_completed['runs'] < runs:
-            if comm.rank == 0:
-                self.store(dat_full, **identifier_args)
-                if self.faults:
-                    self.get_recovered(strategy=strategy)
+        self.store(dat, **kwargs)
+        if self.faults:
+            self.get_recovered(strategy=kwargs['strategy'])
 
         return None
 
@@ -594,18 +682,19 @@ class FaultStats:
         bit = [faults[i][1][4] for i in range(len(faults))]
         return time, level, iteration, node, problem_pos, bit
 
-    def get_path(self, **kwargs):
+    def get_path(self, suffix='pickle', **kwargs):
         '''
         Get the path to where the stats are stored
 
         Args:
+            suffix (str): File extension
             strategy (Strategy): The resilience strategy
             faults (bool): Whether or not faults have been activated
 
         Returns:
             str: The path to what you are looking for
         '''
-        return f'{self.stats_path}/{self.get_name(**kwargs)}.pickle'
+        return f'{self.stats_path}/{self.get_name(**kwargs)}.{suffix}'
 
     def get_name(self, strategy=None, faults=True, mode=None):
         '''
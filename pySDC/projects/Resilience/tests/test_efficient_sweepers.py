@@ -172,11 +172,11 @@ def assert_sameness(stats_normal, stats_efficient, sweeper_name, check_residual=
         normal = [you[1] for you in get_sorted(stats_normal, type=me)]
         if 'timing' in me or all(you is None for you in normal) or (not check_residual and 'residual' in me):
             continue
-        elif 'work_rhs' in me:
+        elif 'work_rhs' in me or 'work_fft' in me:
             efficient = [me[1] for me in get_sorted(stats_efficient, type=me)]
             assert all(
                 normal[i] >= efficient[i] for i in range(len(efficient))
-            ), f'Efficient sweeper performs more right hand side evaluations than regular implementations of {sweeper_name} sweeper!'
+            ), f'Efficient sweeper performs more right hand side evaluations or FFTs than regular implementations of {sweeper_name} sweeper!'
         else:
             comp = [you[1] for you in get_sorted(stats_efficient, type=me)]
             assert np.allclose(
@@ -72,6 +72,85 @@ def test_complex_conversion():
         ), f"Conversion between bytes and float failed for {rand_complex}: result: {res}"
 
 
+@pytest.mark.base
+@pytest.mark.parametrize('dtype', [np.float32, np.float64, np.complex128])
+def test_flip_bits(dtype):
+    """
+    Test that flipping many bits at once gives the same result as flipping them one by one and that flipping a bit
+    twice restores the number
+    """
+    from pySDC.projects.Resilience.fault_injection import FaultInjector, flip_bits, get_num_bits
+
+    rng = np.random.default_rng(47)
+    data = rng.random((4, 5)).astype(dtype)
+    if np.iscomplexobj(data):
+        data += 1j * rng.random((4, 5))
+    num_bits = get_num_bits(dtype)
+
+    positions = [(1, 2), (1, 2), (3, 4), (0, 0), (2, 1)]
+    bits = [1, num_bits - 1, 5, num_bits // 2 + 1, 12]
+    expected = data.copy()
+    for pos, bit in zip(positions, bits):
+        expected[pos] = FaultInjector.flip_bit(expected[pos], bit)
+    assert expected.dtype == data.dtype
+
+    flipped = data.copy()
+    flip_bits(flipped, positions, bits)
+    assert np.array_equal(flipped, expected), 'Flipping bits vectorized gives different result than one by one!'
+
+    flip_bits(flipped, positions, bits)
+    assert np.array_equal(flipped, data), 'Flipping bits twice did not restore the data!'
+
+    with pytest.raises(ValueError):
+        flip_bits(flipped, [(0, 0)], [num_bits])
+
+
+@pytest.mark.base
+def test_particle_faults():
+    """
+    Test injection of multiple faults with a burst of flipped bits in the same iteration into particles
+    """
+    from pySDC.implementations.controller_classes.controller_nonMPI import controller_nonMPI
+    from pySDC.implementations.problem_classes.PenningTrap_3D import penningtrap
+    from pySDC.implementations.sweeper_classes.boris_2nd_order import boris_2nd_order
+    from pySDC.projects.Resilience.fault_injection import get_fault_injector_hook
+    from pySDC.helpers.stats_helper import get_sorted
+
+    description = {
+        'problem_class': penningtrap,
+        'problem_params': {
+            'omega_E': 4.9,
+            'omega_B': 25.0,
+            'u0': np.array([[10, 0, 0], [100, 0, 100], [1], [1]], dtype=object),
+            'nparts': 2,
+            'sig': 0.1,
+        },
+        'sweeper_class': boris_2nd_order,
+        'sweeper_params': {'quad_type': 'GAUSS', 'num_nodes': 3},
+        'level_params': {'dt': 1e-2},
+        'step_params': {'maxiter': 3},
+    }
+
+    uend = {}
+    for faults in [False, True]:
+        controller = controller_nonMPI(num_procs=1, controller_params={'logger_level': 30}, description=description)
+        if faults:
+            injector = get_fault_injector_hook(controller)
+            args = {'time': 0.0, 'iteration': 2, 'node': 1, 'level_number': 0, 'rank': 0}
+            injector.add_random_fault(
+                args={**args, 'problem_pos': [1, 0, 0], 'bit': 1, 'burst': 3}, rnd_args={'rank': 1}
+            )
+            injector.add_random_fault(args={**args, 'problem_pos': [0, 2, 1], 'bit': 62}, rnd_args={'rank': 1})
+        P = controller.MS[0].levels[0].prob
+        uend[faults], stats = controller.run(u0=P.u_init(), t0=0.0, Tend=3e-2)
+
+    # faults in the same iteration share the same entry in the stats, so we check the injector instead
+    assert len(injector.faults) == 0, f'Not all faults were injected: {injector.faults}'
+    assert len(get_sorted(stats, type='bitflip')) == 1, 'Expected faults to be injected in the same iteration!'
+    assert not np.allclose(uend[True].vel, uend[False].vel), 'Faults did not change the velocities!'
+    assert not np.allclose(uend[True].pos, uend[False].pos), 'Faults did not change the positions!'
+
+
 @pytest.mark.base
 def test_fault_injection():
     from pySDC.projects.Resilience.fault_injection import FaultInjector
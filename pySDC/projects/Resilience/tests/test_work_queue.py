@@ -0,0 +1,117 @@
+import pytest
+import os
+import sys
+import subprocess
+
+
+def square(x):
+    return x**2
+
+
+class Power:
+    def __init__(self, exponent):
+        self.exponent = exponent
+
+    def compute(self, x):
+        return x**self.exponent
+
+
+def power(context, x):
+    return context.compute(x)
+
+
+def run_work_queue(comm=None, num_workers=1):
+    """
+    Compute squares of numbers with a work queue
+
+    Args:
+        comm (MPI.Intracomm): Communicator for distributing the tasks
+        num_workers (int): Number of processes in a local process pool
+
+    Returns:
+        dict: Results on the master
+        list: Messages reporting the progress on the master
+    """
+    from pySDC.projects.Resilience.work_queue import WorkQueue, ProgressReporter
+
+    tasks = list(range(20))
+    results = {}
+    messages = []
+
+    queue = WorkQueue(comm=comm, num_workers=num_workers)
+    progress = ProgressReporter(total=len(tasks), name='squares', interval=0, log=messages.append)
+    queue.run(function=square, tasks=tasks, callback=results.__setitem__, progress=progress)
+    return results, messages
+
+
+@pytest.mark.base
+@pytest.mark.parametrize('num_workers', [1, 3])
+def test_work_queue(num_workers):
+    results, messages = run_work_queue(num_workers=num_workers)
+
+    assert results == {i: i**2 for i in range(20)}, 'Got wrong results from the work queue!'
+    assert len(messages) == 20, 'Expected a progress report for every task!'
+    assert messages[-1].startswith('squares: 20/20 runs completed'), f'Unexpected progress report {messages[-1]!r}'
+    assert 'runs/s' in messages[-1] and 'ETA 0.0s' in messages[-1], f'Unexpected progress report {messages[-1]!r}'
+
+
+@pytest.mark.base
+@pytest.mark.parametrize('num_workers', [1, 3])
+def test_work_queue_context(num_workers):
+    from pySDC.projects.Resilience.work_queue import WorkQueue
+
+    results = {}
+    queue = WorkQueue(num_workers=num_workers)
+    queue.run(function=power, tasks=range(10), callback=results.__setitem__, context=Power(3))
+    assert results == {i: i**3 for i in range(10)}, 'Got wrong results from the work queue with context!'
+
+
+@pytest.mark.base
+def test_run_store(tmpdir):
+    from pySDC.projects.Resilience.work_queue import RunStore
+
+    path = f'{tmpdir}/test.runs'
+    store = RunStore(path)
+    assert store.load() == {}, 'Expected empty store before anything was recorded!'
+
+    for run in range(4):
+        store.append(run, {'error': run / 10})
+    store.append(2, {'error': 1.0})
+    assert RunStore(path).load() == {0: {'error': 0.0}, 1: {'error': 0.1}, 2: {'error': 1.0}, 3: {'error': 0.3}}
+
+    # simulate an interruption while writing the last record and make sure we can resume
+    with open(path, 'rb+') as f:
+        f.truncate(os.path.getsize(path) - 3)
+    results = store.load()
+    assert sorted(results.keys()) == [0, 1, 2, 3], 'Expected the interrupted record to be discarded!'
+    assert results[2] == {'error': 0.2}, 'Expected the interrupted record to be discarded!'
+    store.append(2, {'error': 0.5})
+    assert store.load()[2] == {'error': 0.5}, 'Could not continue recording after an interruption!'
+
+    store.clear()
+    assert store.load() == {}, 'Expected empty store after clearing!'
+
+
+@pytest.mark.mpi4py
+@pytest.mark.parametrize('num_procs', [2, 3])
+def test_work_queue_MPI(num_procs):
+    my_env = os.environ.copy()
+    my_env['PYTHONPATH'] = '../../..:.'
+    my_env['COVERAGE_PROCESS_START'] = 'pyproject.toml'
+
+    cmd = f"mpirun -np {num_procs} python {__file__} --test-MPI".split()
+    p = subprocess.Popen(cmd, env=my_env, cwd=".")
+    p.wait()
+    assert p.returncode == 0, 'ERROR: did not get return code 0, got %s with %2i processes' % (p.returncode, num_procs)
+
+
+if __name__ == '__main__':
+    if '--test-MPI' in sys.argv:
+        from mpi4py import MPI
+
+        results, messages = run_work_queue(comm=MPI.COMM_WORLD)
+        if MPI.COMM_WORLD.rank == 0:
+            assert results == {i: i**2 for i in range(20)}, 'Got wrong results from the work queue!'
+            assert len(messages) == 20, 'Expected a progress report for every task!'
+        else:
+            assert results == {}, 'Got results on a worker!'
@@ -0,0 +1,285 @@
+import os
+import pickle
+import time
+from functools import partial
+
+# context of the tasks in the processes of a local process pool, which is set once when the process is started
+_worker_context = None
+
+
+def _set_worker_context(context):
+    global _worker_context
+    _worker_context = context
+
+
+def _run_with_worker_context(function, task):
+    return function(_worker_context, task)
+
+
+class RunStore:
+    '''
+    Append-only store for the results of single runs. Every result is appended to the file as a separate pickle, such
+    that no data is rewritten when a run finishes and a campaign can be resumed after it was interrupted at the
+    granularity of single runs. A record that was cut off by an interruption while writing is removed when loading.
+    '''
+
+    def __init__(self, path):
+        '''
+        Initialization routine
+
+        Args:
+            path (str): Path to the file where the results are stored
+        '''
+        self.path = path
+
+    def append(self, key, result):
+        '''
+        Append the result of a single run to the store
+
+        Args:
+            key: Identifier of the run
+            result: The result of the run, needs to be picklable
+
+        Returns:
+            None
+        '''
+        with open(self.path, 'ab') as f:
+            pickle.dump((key, result), f)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def load(self):
+        '''
+        Load all results from the store. If a run has been recorded multiple times, the last result is used.
+
+        Returns:
+            dict: Results of the runs with the identifiers as keys
+        '''
+        results = {}
+        if not os.path.exists(self.path):
+            return results
+
+        with open(self.path, 'rb') as f:
+            valid_size = 0
+            while True:
+                try:
+                    key, result = pickle.load(f)
+                except EOFError:
+                    break
+                except (pickle.UnpicklingError, ValueError, TypeError, AttributeError, IndexError):
+                    break
+                results[key] = result
+                valid_size = f.tell()
+            truncated = valid_size < os.path.getsize(self.path)
+
+        # remove an incomplete record at the end such that we can keep appending to the file
+        if truncated:
+            os.truncate(self.path, valid_size)
+
+        return results
+
+    def clear(self):
+        '''
+        Remove all results from the store
+
+        Returns:
+            None
+        '''
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+class ProgressReporter:
+    '''
+    Report progress of a campaign of runs with throughput and estimated time of arrival
+    '''
+
+    def __init__(self, total, name='', interval=10.0, log=None):
+        '''
+        Initialization routine
+
+        Args:
+            total (int): Number of runs in the campaign
+            name (str): Name of the campaign for the messages
+            interval (float): Minimal time in seconds between two messages
+            log (callable): Function that is called with the messages, by default they are printed
+        '''
+        self.total = total
+        self.name = name
+        self.interval = interval
+        self.log = (lambda msg: print(msg, flush=True)) if log is None else log
+
+        self.completed = 0
+        self.start_time = time.perf_counter()
+        self.last_report = -float('inf')
+
+    @property
+    def elapsed(self):
+        return time.perf_counter() - self.start_time
+
+    @property
+    def throughput(self):
+        '''
+        Returns:
+            float: Completed runs per second
+        '''
+        elapsed = self.elapsed
+        return self.completed / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def eta(self):
+        '''
+        Returns:
+            float: Estimated time in seconds until all runs are completed
+        '''
+        if self.completed >= self.total:
+            return 0.0
+        throughput = self.throughput
+        return (self.total - self.completed) / throughput if throughput > 0 else float('inf')
+
+    def update(self, completed=1):
+        '''
+        Register completed runs and report if enough time has passed since the last message or we are done
+
+        Args:
+            completed (int): Number of newly completed runs
+
+        Returns:
+            None
+        '''
+        self.completed += completed
+        if self.completed >= self.total or time.perf_counter() - self.last_report >= self.interval:
+            self.report()
+
+    def report(self):
+        '''
+        Report the current progress
+
+        Returns:
+            None
+        '''
+        self.last_report = time.perf_counter()
+        eta = f'{self.eta:.1f}s' if self.eta < float('inf') else 'unknown'
+        self.log(
+            f'{self.name + ": " if self.name else ""}{self.completed}/{self.total} runs completed after '
+            f'{self.elapsed:.1f}s, {self.throughput:.2f} runs/s, ETA {eta}'
+        )
+
+
+class WorkQueue:
+    '''
+    Dynamic scheduler for independent runs. Tasks are handed out one at a time to whichever worker is idle, such that
+    differences in the run times of the tasks do not leave workers waiting for others.
+
+    With an MPI communicator with more than one rank, rank 0 acts as the master, which distributes the tasks and
+    receives the results, and all other ranks are workers. The master performs tasks itself while no worker is waiting
+    for a new one, so all ranks do work. Since workers that finish in the meantime wait until the master has completed
+    its task, short tasks give the best load balance. Otherwise, the tasks are distributed to a local process pool
+    if more than one worker is requested, or are executed in serial. The results are passed to a callback on the
+    master as soon as they are available, in the order in which they finish.
+
+    Data that is needed by all tasks, such as the object performing them, can be passed as a context, which is sent to
+    every process of a pool only once instead of with every task.
+    '''
+
+    def __init__(self, comm=None, num_workers=1):
+        '''
+        Initialization routine
+
+        Args:
+            comm (MPI.Intracomm): Communicator for distributing the tasks
+            num_workers (int): Number of processes in the local process pool if no communicator is used
+        '''
+        self.comm = comm
+        self.num_workers = num_workers
+
+    @property
+    def is_master(self):
+        return self.comm is None or self.comm.rank == 0
+
+    def run(self, function, tasks, callback=None, progress=None, context=None):
+        '''
+        Execute `function(task)`, or `function(context, task)` if a context is given, for all tasks. Needs to be called
+        on all ranks of the communicator, but only the tasks on the master are used.
+
+        Args:
+            function (callable): Function performing a single task, needs to be picklable for process pools
+            tasks (list): Arguments for the function
+            callback (callable): Function that is called as `callback(task, result)` on the master for every result
+            progress (ProgressReporter): Reporter for the progress of the tasks on the master
+            context: Data passed to the function along with every task, needs to be picklable for process pools
+
+        Returns:
+            None
+        '''
+        callback = (lambda task, result: None) if callback is None else callback
+        call = function if context is None else partial(function, context)
+
+        def finished(task, result):
+            callback(task, result)
+            if progress is not None:
+                progress.update()
+
+        if self.comm is not None and self.comm.size > 1:
+            if self.is_master:
+                self._distribute_MPI(call, tasks, finished)
+            else:
+                self._work_MPI(call)
+        elif self.num_workers > 1:
+            self._run_pool(function, tasks, finished, context)
+        else:
+            for task in tasks:
+                finished(task, call(task))
+
+    def _distribute_MPI(self, function, tasks, finished):
+        from mpi4py import MPI
+
+        tasks = list(tasks)
+        next_task = 0
+        busy = {}
+        active_workers = self.comm.size - 1
+        status = MPI.Status()
+
+        # every message from a worker is a request for a new task, possibly containing the result of the last one
+        while active_workers > 0:
+            if next_task < len(tasks) and not self.comm.Iprobe(source=MPI.ANY_SOURCE):
+                # no worker is waiting, so the master does a task itself
+                finished(tasks[next_task], function(tasks[next_task]))
+                next_task += 1
+                continue
+
+            result = self.comm.recv(source=MPI.ANY_SOURCE, status=status)
+            worker = status.Get_source()
+
+            if worker in busy:
+                finished(tasks[busy.pop(worker)], result)
+
+            if next_task < len(tasks):
+                self.comm.send((next_task, tasks[next_task]), dest=worker)
+                busy[worker] = next_task
+                next_task += 1
+            else:
+                self.comm.send(None, dest=worker)
+                active_workers -= 1
+
+    def _work_MPI(self, function):
+        self.comm.send(None, dest=0)
+        while True:
+            message = self.comm.recv(source=0)
+            if message is None:
+                break
+            self.comm.send(function(message[1]), dest=0)
+
+    def _run_pool(self, function, tasks, finished, context=None):
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        pool_args = {}
+        if context is not None:
+            # send the context once to every process rather than with every task
+            pool_args = {'initializer': _set_worker_context, 'initargs': (context,)}
+            function = partial(_run_with_worker_context, function)
+
+        with ProcessPoolExecutor(max_workers=self.num_workers, **pool_args) as pool:
+            futures = {pool.submit(function, task): task for task in tasks}
+            for future in as_completed(futures):
+                finished(futures[future], future.result())
@@ -98,3 +98,18 @@ def test_Q_transfer_minimal(node_type, quad_type):
                 assert err_restr < 2e-15, "ERROR: Q-restriction order is not reached, got %s" % err_restr
             else:
                 assert err_inter > 2e-15, "ERROR: Q-interpolation order is higher than expected, got %s" % polyorder
+
+
+@pytest.mark.base
+def test_shared_transfer_matrices():
+    from pySDC.core.BaseTransfer import base_transfer
+
+    fine_grid = CollBase(5, 0, 1, node_type='LEGENDRE', quad_type='RADAU-RIGHT').nodes
+    coarse_grid = CollBase(3, 0, 1, node_type='LEGENDRE', quad_type='RADAU-RIGHT').nodes
+
+    Pcoll = base_transfer.get_transfer_matrix_Q(fine_grid, coarse_grid)
+    assert Pcoll is base_transfer.get_transfer_matrix_Q(fine_grid.copy(), coarse_grid.copy())
+    assert not Pcoll.flags.writeable
+
+    # interpolation of a polynomial of degree lower than the number of coarse nodes is exact
+    assert np.allclose(Pcoll @ coarse_grid**2, fine_grid**2)
@@ -0,0 +1,134 @@
+import pytest
+import numpy as np
+
+nparts_list = [1, 10, 100, 1000, 10000, 100000]
+
+# the loops over the particles are too slow to be benchmarked repeatedly for many particles, run this file for that
+benchmark_cases = [(nparts, True) for nparts in nparts_list]
+benchmark_cases += [(nparts, False) for nparts in nparts_list if nparts <= 1000]
+
+
+def get_problem(nparts):
+    from pySDC.implementations.problem_classes.PenningTrap_3D import penningtrap
+
+    problem_params = {
+        'omega_E': 4.9,
+        'omega_B': 25.0,
+        'u0': np.array([[10, 0, 0], [100, 0, 100], [1], [1]], dtype=object),
+        'nparts': nparts,
+        'sig': 0.1,
+    }
+    return penningtrap(**problem_params)
+
+
+def get_data(nparts):
+    """
+    Get a problem and random particles and fields to push
+    """
+    from pySDC.implementations.datatype_classes.particles import particles
+
+    prob = get_problem(nparts)
+    rng = np.random.default_rng(nparts)
+
+    part = prob.u_init()
+    part.pos[:] = rng.random((3, nparts))
+    part.vel[:] = rng.random((3, nparts))
+    old_fields = prob.dtype_f(prob.init)
+    new_fields = prob.dtype_f(prob.init)
+    for f in [old_fields, new_fields]:
+        f.elec[:] = rng.random((3, nparts))
+        f.magn[:] = rng.random((3, nparts))
+    c = particles.velocity(prob.init)
+    c[:] = rng.random((3, nparts))
+    return prob, part, old_fields, new_fields, c
+
+
+def build_f_loop(prob, f, part):
+    """
+    Reference implementation of `penningtrap.build_f` with a loop over the particles
+    """
+    from pySDC.implementations.datatype_classes.particles import acceleration
+
+    rhs = acceleration(prob.init)
+    for n in range(prob.nparts):
+        rhs[:, n] = part.q[n] / part.m[n] * (f.elec[:, n] + np.cross(part.vel[:, n], f.magn[:, n]))
+    return rhs
+
+
+def boris_solver_loop(prob, c, dt, old_fields, new_fields, old_parts):
+    """
+    Reference implementation of `penningtrap.boris_solver` with a loop over the particles
+    """
+    from pySDC.implementations.datatype_classes.particles import particles
+
+    vel = particles.velocity(prob.init)
+    Emean = 0.5 * (old_fields.elec + new_fields.elec)
+    for n in range(prob.nparts):
+        a = old_parts.q[n] / old_parts.m[n]
+        c[:, n] += dt / 2 * a * np.cross(old_parts.vel[:, n], old_fields.magn[:, n] - new_fields.magn[:, n])
+        vm = old_parts.vel[:, n] + dt / 2 * a * Emean[:, n] + c[:, n] / 2
+        t = dt / 2 * a * new_fields.magn[:, n]
+        s = 2 * t / (1 + np.linalg.norm(t, 2) ** 2)
+        vp = vm + np.cross(vm + np.cross(vm, t), s)
+        vel[:, n] = vp + dt / 2 * a * Emean[:, n] + c[:, n] / 2
+    return vel
+
+
+@pytest.mark.base
+@pytest.mark.parametrize('nparts', [1, 7, 100])
+def test_vectorized_matches_loop(nparts):
+    """
+    Test that the vectorized Boris push and force assembly give the same results as the loop over the particles
+    """
+    prob, part, old_fields, new_fields, c = get_data(nparts)
+
+    assert np.allclose(prob.build_f(new_fields, part, 0), build_f_loop(prob, new_fields, part), rtol=1e-14, atol=0)
+
+    c_loop = c.copy()
+    vel = prob.boris_solver(c, 0.1, old_fields, new_fields, part)
+    vel_loop = boris_solver_loop(prob, c_loop, 0.1, old_fields, new_fields, part)
+    assert np.allclose(vel, vel_loop, rtol=1e-14, atol=0)
+    assert np.allclose(c, c_loop, rtol=1e-14, atol=0), 'c-term has not been updated in the same way'
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize('nparts, vectorized', benchmark_cases)
+def test_benchmark_boris_solver(benchmark, nparts, vectorized):
+    prob, part, old_fields, new_fields, c = get_data(nparts)
+    benchmark.extra_info['nparts'] = nparts
+
+    if vectorized:
+        benchmark(prob.boris_solver, c, 0.1, old_fields, new_fields, part)
+    else:
+        benchmark(boris_solver_loop, prob, c, 0.1, old_fields, new_fields, part)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize('nparts, vectorized', benchmark_cases)
+def test_benchmark_build_f(benchmark, nparts, vectorized):
+    prob, part, old_fields, new_fields, c = get_data(nparts)
+    benchmark.extra_info['nparts'] = nparts
+
+    if vectorized:
+        benchmark(prob.build_f, new_fields, part, 0)
+    else:
+        benchmark(build_f_loop, prob, new_fields, part)
+
+
+if __name__ == '__main__':
+    from timeit import timeit
+
+    print(
+        f'{"N":>7} | {"Boris loop":>11} {"Boris vec":>11} | {"build_f loop":>12} {"build_f vec":>12}  (s per particle)'
+    )
+    for nparts in nparts_list:
+        prob, part, old_fields, new_fields, c = get_data(nparts)
+        number = max(1, 1000 // nparts)
+        times = [
+            timeit(lambda: boris_solver_loop(prob, c, 0.1, old_fields, new_fields, part), number=number),
+            timeit(lambda: prob.boris_solver(c, 0.1, old_fields, new_fields, part), number=number),
+            timeit(lambda: build_f_loop(prob, new_fields, part), number=number),
+            timeit(lambda: prob.build_f(new_fields, part, 0), number=number),
+        ]
+        print(f'{nparts:7d} | {times[0] / number / nparts:11.2e} {times[1] / number / nparts:11.2e} | ', end='')
+        print(f'{times[2] / number / nparts:12.2e} {times[3] / number / nparts:12.2e}')
@@ -115,3 +115,43 @@ def test_partialquadraturewithS(node_type, quad_type):
                 + ", partial quadrature rule from Smat failed to integrate polynomial of degree M-1 exactly for M = "
                 + str(M)
             )
+
+
+@pytest.mark.base
+@pytest.mark.parametrize("node_type", node_types)
+@pytest.mark.parametrize("quad_type", quad_types)
+def test_shared_arrays(node_type, quad_type):
+    import pickle
+
+    coll = CollBase(4, 0, 1, node_type=node_type, quad_type=quad_type)
+    other = CollBase(4, 0, 1, node_type=node_type, quad_type=quad_type)
+
+    # identical parameters give identical read-only arrays
+    for name in ['nodes', 'weights', 'Qmat', 'Smat', 'delta_m']:
+        assert getattr(coll, name) is getattr(other, name)
+        with pytest.raises(ValueError):
+            getattr(coll, name)[0] = 1.0
+
+    # copies share the arrays as well
+    copy = pickle.loads(pickle.dumps(coll))
+    assert copy.Qmat is coll.Qmat and copy.num_nodes == coll.num_nodes
+
+    # different intervals do not share the arrays
+    shifted = CollBase(4, 1, 2, node_type=node_type, quad_type=quad_type)
+    assert np.allclose(shifted.nodes, coll.nodes + 1)
+    assert np.allclose(shifted.Qmat, coll.Qmat)
+
+
+@pytest.mark.base
+@pytest.mark.parametrize("node_type", node_types)
+@pytest.mark.parametrize("quad_type", quad_types)
+def test_Qmat_eig(node_type, quad_type):
+    coll = CollBase(5, 0, 1, node_type=node_type, quad_type=quad_type)
+    D, V, Vinv = coll.Qmat_eig
+
+    assert np.allclose(V @ np.diag(D) @ Vinv, coll.Qmat[1:, 1:], atol=1e-13), 'Eigendecomposition is wrong!'
+    assert np.allclose(V @ Vinv, np.eye(5), atol=1e-13), 'Inverse of eigenvectors is wrong!'
+
+    # the eigendecomposition is computed only once for identical parameters
+    other = CollBase(5, 0, 1, node_type=node_type, quad_type=quad_type)
+    assert all(me is you for me, you in zip(coll.Qmat_eig, other.Qmat_eig))
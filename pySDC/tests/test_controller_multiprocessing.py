@@ -0,0 +1,121 @@
+import pytest
+
+from pySDC.core.Hooks import hooks
+
+
+class FailingHook(hooks):
+    """
+    Hook that raises an error after the second step of the first block
+    """
+
+    def post_step(self, step, level_number):
+        super().post_step(step, level_number)
+        if step.status.slot == 1:
+            raise ValueError('Step failed on purpose')
+
+
+def run_heat(controller_class, num_procs, num_levels, predict_type=None, mssdc_jac=True, all_to_done=False, **kwargs):
+    """
+    Run MSSDC or PFASST for the forced heat equation
+
+    Args:
+        controller_class: the controller class
+        num_procs (int): number of steps in a block
+        num_levels (int): number of levels
+        predict_type (str): type of the predictor
+        mssdc_jac (bool): Jacobi-like or Gauss-Seidel-like MSSDC
+        all_to_done (bool): iterate until all steps are done
+        kwargs: additional controller parameters
+
+    Returns:
+        numpy.ndarray: solution at the end of the run
+        dict: statistics of the run
+    """
+    from pySDC.implementations.problem_classes.HeatEquation_ND_FD import heatNd_forced
+    from pySDC.implementations.sweeper_classes.imex_1st_order import imex_1st_order
+    from pySDC.implementations.transfer_classes.TransferMesh import mesh_to_mesh
+    from pySDC.implementations.hooks.log_solution import LogSolution
+
+    description = {
+        'problem_class': heatNd_forced,
+        'problem_params': {'nu': 0.1, 'freq': 4, 'nvars': [63, 31][:num_levels], 'bc': 'dirichlet-zero'},
+        'sweeper_class': imex_1st_order,
+        'sweeper_params': {'quad_type': 'RADAU-RIGHT', 'num_nodes': 3, 'QI': 'LU'},
+        'level_params': {'restol': 1e-10, 'dt': 0.125},
+        'step_params': {'maxiter': 50},
+        'space_transfer_class': mesh_to_mesh,
+        'space_transfer_params': {'rorder': 2, 'iorder': 6},
+    }
+
+    controller_params = {
+        'logger_level': 30,
+        'predict_type': predict_type,
+        'mssdc_jac': mssdc_jac,
+        'all_to_done': all_to_done,
+        'hook_class': LogSolution,
+        **kwargs,
+    }
+
+    controller = controller_class(num_procs=num_procs, controller_params=controller_params, description=description)
+    P = controller.MS[0].levels[0].prob
+
+    # the last block is not full
+    return controller.run(u0=P.u_exact(0.0), t0=0.0, Tend=2.5 * num_procs * description['level_params']['dt'])
+
+
+@pytest.mark.base
+@pytest.mark.parametrize('num_procs', [1, 3])
+@pytest.mark.parametrize(
+    'num_levels, predict_type, mssdc_jac',
+    [(1, None, True), (1, None, False), (2, None, True), (2, 'pfasst_burnin', True), (2, 'fmg', True)],
+)
+@pytest.mark.parametrize('all_to_done', [False, True])
+def test_multiprocessing_vs_nonMPI(num_procs, num_levels, predict_type, mssdc_jac, all_to_done):
+    """
+    Test that running the steps in separate processes gives exactly the same as running them in a single process.
+    """
+    import numpy as np
+    from pySDC.helpers.stats_helper import get_sorted
+    from pySDC.implementations.controller_classes.controller_nonMPI import controller_nonMPI
+    from pySDC.implementations.controller_classes.controller_multiprocessing import controller_multiprocessing
+
+    args = (num_procs, num_levels, predict_type, mssdc_jac, all_to_done)
+    uend, stats = run_heat(controller_multiprocessing, *args)
+    uend_nonMPI, stats_nonMPI = run_heat(controller_nonMPI, *args)
+
+    assert np.allclose(uend, uend_nonMPI, atol=1e-14, rtol=0), 'Multiprocessing and non-MPI controllers disagree!'
+
+    for key in ['niter', 'residual_post_iteration', 'u']:
+        res = [me[1] for me in get_sorted(stats, type=key, sortby='time')]
+        res_nonMPI = [me[1] for me in get_sorted(stats_nonMPI, type=key, sortby='time')]
+        assert len(res) == len(res_nonMPI) and all(
+            np.allclose(me, you, atol=1e-14, rtol=0) for me, you in zip(res, res_nonMPI)
+        ), f'Multiprocessing and non-MPI controllers disagree in {key!r}'
+
+
+@pytest.mark.base
+def test_multiprocessing_errors():
+    """
+    Test that errors in the workers are raised in the main process and that unsupported features are rejected.
+    """
+    from pySDC.core.Errors import ControllerError
+    from pySDC.implementations.controller_classes.controller_multiprocessing import controller_multiprocessing
+    from pySDC.implementations.convergence_controller_classes.adaptivity import Adaptivity
+    from pySDC.implementations.problem_classes.TestEquation_0D import testequation0d
+    from pySDC.implementations.sweeper_classes.generic_implicit import generic_implicit
+
+    with pytest.raises(ControllerError, match='Step failed on purpose'):
+        run_heat(controller_multiprocessing, num_procs=3, num_levels=1, hook_class=FailingHook)
+
+    description = {
+        'problem_class': testequation0d,
+        'problem_params': {},
+        'sweeper_class': generic_implicit,
+        'sweeper_params': {'num_nodes': 3, 'quad_type': 'RADAU-RIGHT'},
+        'level_params': {'dt': 0.1},
+        'step_params': {'maxiter': 4},
+        'convergence_controllers': {Adaptivity: {'e_tol': 1e-7}},
+    }
+    controller_params = {'logger_level': 30, 'mssdc_jac': False}
+    with pytest.raises(ControllerError, match='not supported'):
+        controller_multiprocessing(num_procs=2, controller_params=controller_params, description=description)
@@ -0,0 +1,113 @@
+import pytest
+
+
+@pytest.mark.base
+def test_in_place_arithmetic():
+    import numpy as np
+    from pySDC.implementations.datatype_classes.mesh import mesh, imex_mesh
+
+    init = ((8,), None, np.dtype('float64'))
+    u = mesh(init, val=1.0)
+    v = mesh(init, val=2.0)
+
+    # by default, in-place operations replace the mesh
+    w = u
+    u += v
+    assert w is not u and np.allclose(w, 1.0) and np.allclose(u, 3.0)
+
+    with mesh.in_place_arithmetic():
+        w = u
+        u += v
+        u *= 2.0
+        assert w is u and np.allclose(w, 10.0)
+        assert type(u) is mesh and u.comm is None
+
+        f = imex_mesh(init, val=1.0)
+        g = f
+        f -= 0.5
+        assert g is f and type(f) is imex_mesh and np.allclose(f.impl, 0.5)
+
+        # operations without output are not affected
+        assert type(u + v) is mesh and np.allclose(u + v, 12.0)
+
+    assert not mesh.in_place
+
+
+@pytest.mark.base
+def test_buffer_pool():
+    import numpy as np
+    from pySDC.implementations.problem_classes.HeatEquation_ND_FD import heatNd_unforced
+
+    P = heatNd_unforced(nvars=16)
+
+    u = P.borrow_u(val=1.0)
+    assert type(u) is P.dtype_u and np.allclose(u, 1.0)
+    assert P.buffers[P.dtype_u].allocations.niter == 1
+
+    P.give_back(u)
+    v = P.borrow_u(val=0.0)
+    assert v is u and np.allclose(v, 0.0)
+    assert P.buffers[P.dtype_u].allocations.niter == 1
+
+    # variables of different shape or dtype are not reused
+    P.give_back(v * 1j, P.dtype_u(((4,), None, np.dtype('float64'))))
+    assert len(P.buffers[P.dtype_u]) == 0
+
+    # summing into a borrowed variable keeps its memory, also without in-place arithmetic
+    w = P.borrow_u(val=1.0)
+    assert P.accumulate(w, P.dtype_u(P.init, val=2.0)) is w and np.allclose(w, 3.0)
+
+
+@pytest.mark.base
+@pytest.mark.parametrize('imex', [False, True])
+def test_in_place_run(imex):
+    import numpy as np
+    from pySDC.implementations.datatype_classes.mesh import mesh
+    from pySDC.implementations.controller_classes.controller_nonMPI import controller_nonMPI
+
+    if imex:
+        from pySDC.implementations.problem_classes.HeatEquation_ND_FD import heatNd_forced as problem_class
+        from pySDC.implementations.sweeper_classes.imex_1st_order import imex_1st_order as sweeper_class
+    else:
+        from pySDC.implementations.problem_classes.HeatEquation_ND_FD import heatNd_unforced as problem_class
+        from pySDC.implementations.sweeper_classes.generic_implicit import generic_implicit as sweeper_class
+
+    description = {
+        'problem_class': problem_class,
+        'problem_params': {'nvars': 64},
+        'sweeper_class': sweeper_class,
+        'sweeper_params': {'num_nodes': 3, 'quad_type': 'RADAU-RIGHT', 'QI': 'LU'},
+        'level_params': {'dt': 1e-2, 'restol': 1e-10},
+        'step_params': {'maxiter': 8},
+    }
+
+    solutions = []
+    for in_place in [False, True]:
+        controller = controller_nonMPI(num_procs=1, controller_params={'logger_level': 30}, description=description)
+        P = controller.MS[0].levels[0].prob
+        with mesh.in_place_arithmetic(in_place):
+            uend, _ = controller.run(u0=P.u_exact(0), t0=0, Tend=5e-2)
+        solutions.append(uend)
+
+        # the temporaries for the integrals are reused across sweeps
+        assert P.buffers[P.dtype_u].allocations.niter <= 2 * description['sweeper_params']['num_nodes']
+
+    assert np.allclose(*solutions, atol=1e-14), 'In-place arithmetic changes the solution!'
+
+
+@pytest.mark.base
+def test_pickle():
+    import pickle
+    import numpy as np
+    from pySDC.implementations.datatype_classes.mesh import mesh, imex_mesh
+
+    init = ((8,), None, np.dtype('float64'))
+    for u in [mesh(init, val=2.0), imex_mesh(init, val=2.0)]:
+        v = pickle.loads(pickle.dumps(u))
+        assert type(v) is type(u) and np.allclose(u, v)
+        assert v.comm is None and abs(v) == 2.0, 'Unpickled mesh is not usable!'
+
+    # communicators are not pickled
+    u = mesh(init, val=2.0)
+    u._comm = lambda: None
+    assert pickle.loads(pickle.dumps(u)).comm is None
@@ -0,0 +1,71 @@
+import pytest
+
+
+def get_description(dt, lambdas, QI, quad_type='RADAU-RIGHT', restol=1e-10, maxiter=20, nsweeps=1):
+    import numpy as np
+    from pySDC.implementations.problem_classes.TestEquation_0D import testequation0d
+    from pySDC.implementations.sweeper_classes.generic_implicit import generic_implicit
+
+    description = {}
+    description['problem_class'] = testequation0d
+    description['problem_params'] = {'lambdas': np.array(lambdas), 'u0': 1.0}
+    description['sweeper_class'] = generic_implicit
+    description['sweeper_params'] = {'num_nodes': 3, 'quad_type': quad_type, 'QI': QI}
+    description['level_params'] = {'dt': dt, 'restol': restol, 'nsweeps': nsweeps}
+    description['step_params'] = {'maxiter': maxiter}
+    return description
+
+
+@pytest.mark.base
+def test_ensemble_runner():
+    """
+    Check that running an ensemble gives the same results as running the members one by one with the controller
+    """
+    import numpy as np
+    from pySDC.helpers.ensemble_runner import EnsembleRunner
+    from pySDC.implementations.controller_classes.controller_nonMPI import controller_nonMPI
+    from pySDC.helpers.stats_helper import get_sorted
+
+    descriptions = [
+        get_description(0.1, [-1.0, 1j], 'LU'),
+        get_description(0.25, [-10.0, -1 + 3j], 'IE', quad_type='GAUSS'),
+        get_description(0.2, [-2.0, 2j], 'MIN-SR-FLEX', restol=1e-12, nsweeps=2),
+        get_description(0.5, [-100.0, -5.0], 'MIN-SR-S', maxiter=3, quad_type='LOBATTO'),
+    ]
+    Tend = 1.0
+    u0 = np.array([[1.0, 1.0], [2.0, 1j], [0.5, -1.0], [1.0, 3.0]])
+
+    ensemble = EnsembleRunner(descriptions)
+    uend, stats = ensemble.run(t0=0.0, Tend=Tend, u0=u0)
+
+    for i, description in enumerate(descriptions):
+        controller = controller_nonMPI(1, {'logger_level': 30}, description)
+        P = controller.MS[0].levels[0].prob
+        u0_member = P.u_exact(0.0)
+        u0_member[:] = u0[i]
+        _uend, _stats = controller.run(u0=u0_member, t0=0.0, Tend=Tend)
+
+        niter = [me[1] for me in get_sorted(_stats, type='niter')]
+        assert np.allclose(niter, stats['niter'][i]), f'Got different iteration counts for member {i}'
+        assert np.allclose(uend[i], _uend, rtol=1e-12, atol=1e-14), f'Got different solution for member {i}'
+        assert len(stats['time'][i]) == round(Tend / description['level_params']['dt'])
+
+    assert max(stats['niter'][3]) == 3, 'Member with maxiter did not stop at maxiter'
+
+
+@pytest.mark.base
+def test_ensemble_runner_singular():
+    """
+    Check that members with a singular system at a node are reported instead of giving a wrong solution
+    """
+    import numpy as np
+    from pySDC.core.Errors import ParameterError
+    from pySDC.helpers.ensemble_runner import EnsembleRunner
+
+    ensemble = EnsembleRunner([get_description(0.1, [-1.0], 'LU'), get_description(0.5, [4.0], 'LU')])
+
+    # 1 - dt * QI[m, m] * lambda vanishes for the second member
+    QI = np.stack([0.5 * np.eye(3)] * 2)
+    u = np.zeros((2, 3, 1))
+    with pytest.raises(ParameterError, match=r'member\(s\) \[1\]'):
+        ensemble.sweep(np.arange(2), np.ones((2, 1)), u, QI)
@@ -122,6 +122,69 @@ def test_filter_recomputed(test_type, num_procs, comm=None):
     assert len(filtered) == 2 * num_procs * 3, 'Incorrect number of entries in the stats!'
 
 
+@pytest.mark.base
+def test_indexed_stats():
+    """
+    Test that the indexed stats behave like a dictionary and that filtering with the index gives the same result as
+    comparing all entries
+    """
+    import pickle
+    from pySDC.core.Hooks import hooks
+    from pySDC.helpers.stats_helper import IndexedStats, filter_stats, get_list_of_types
+
+    hook = hooks()
+    for t in range(10):
+        for level in range(3):
+            for it in range(4):
+                hook.add_to_stats(process=t % 2, time=t * 0.1, level=level, iter=it, type='residual', value=t + it)
+        hook.add_to_stats(process=t % 2, time=t * 0.1, type='niter', value=4)
+        hook.increment_stats(process=t % 2, time=0, type='counter', value=1)
+    stats = hook.return_stats()
+    assert isinstance(stats, IndexedStats)
+
+    def linear_filter(stats, **kwargs):
+        return {
+            key: value
+            for key, value in stats.items()
+            if all(getattr(key, field) == target for field, target in kwargs.items() if target is not None)
+        }
+
+    filters = [
+        {},
+        {'type': 'residual'},
+        {'type': 'residual', 'level': 1, 'iter': None},
+        {'time': 0.5, 'level': 2},
+        {'type': 'counter', 'time': 0},
+        {'type': 'niter', 'process': 1},
+        {'type': 'does not exist'},
+    ]
+    for kwargs in filters:
+        filtered = filter_stats(stats, **kwargs)
+        expected = linear_filter(stats, **kwargs)
+        assert list(filtered.items()) == list(expected.items()), f'Wrong result of filtering for {kwargs}'
+        assert filter_stats(dict(stats), **kwargs) == expected, f'Wrong result of filtering plain dict for {kwargs}'
+
+    assert (
+        filter_stats(stats, type='counter')[
+            hook.entry(**{**hook.meta_data, 'time': 0, 'process': 0, 'type': 'counter', 'num_restarts': 0})
+        ]
+        == 5
+    )
+    assert get_list_of_types(stats) == ['residual', 'niter', 'counter']
+
+    # check that the index is kept up to date when removing entries and when copying
+    stats_copy = pickle.loads(pickle.dumps(stats))
+    assert isinstance(stats_copy, IndexedStats) and stats_copy == stats
+    for key in stats_copy.filter_keys(type='niter'):
+        del stats_copy[key]
+    stats_copy.pop(list(stats_copy.keys())[0])
+    stats_copy = stats_copy.copy()
+    for kwargs in filters:
+        assert filter_stats(stats_copy, **kwargs) == linear_filter(stats_copy, **kwargs)
+    assert 'niter' not in get_list_of_types(stats_copy)
+    assert len(filter_stats(stats, type='niter')) == 10, 'Removing entries from a copy changed the original'
+
+
 @pytest.mark.mpi4py
 @pytest.mark.parametrize("test_type", [1, 2])
 @pytest.mark.parametrize("num_procs", [1, 4])
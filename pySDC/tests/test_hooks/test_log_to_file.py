@@ -81,5 +81,40 @@ def test_logging():
         assert np.allclose(us[1], uf[1])
 
 
+@pytest.mark.base
+@pytest.mark.parametrize('asynchronous', [True, False])
+def test_streaming(asynchronous):
+    from pySDC.implementations.hooks.log_solution import LogToFile, LogSolution
+    from pySDC.helpers.stats_helper import get_sorted
+    import os
+    import numpy as np
+
+    class LogToFileChunked(LogToFile):
+        path = f'{os.getcwd()}/tmp'
+        file_name = f'chunked_{asynchronous}'
+        chunk_size = 7
+
+    LogToFileChunked.asynchronous = asynchronous
+    Tend = 5
+
+    stats = run([LogToFileChunked, LogSolution], Tend=Tend)
+    u = get_sorted(stats, type='u')
+
+    reader = LogToFileChunked.get_reader()
+    assert len(reader) == len(u) == 50
+    assert isinstance(reader.fields['u'], np.memmap)
+    assert np.allclose(reader.fields['t'], [me[0] for me in u])
+
+    # random access by index and by time
+    assert np.allclose(LogToFileChunked.load(-1)['u'], u[-1][1])
+    data = LogToFileChunked.load_time(2.01)
+    assert np.isclose(data['t'], 2.0) and np.allclose(data['u'], u[19][1])
+
+    # incomplete records at the end of the file are ignored
+    with open(f'{LogToFileChunked.get_prefix()}_u.bin', 'ab') as file:
+        file.write(b'\x00')
+    assert len(LogToFileChunked.get_reader()) == 50
+
+
 if __name__ == '__main__':
     test_logging()
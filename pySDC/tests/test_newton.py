@@ -0,0 +1,110 @@
+import pytest
+
+
+def solve_quench(num_solves=6, **kwargs):
+    """
+    Do a couple of solves of the Quench problem with a few factors as in a sweep and return the solutions and problem
+    """
+    import numpy as np
+    from pySDC.implementations.problem_classes.Quench import Quench
+
+    prob = Quench(newton_tol=1e-10, leak_type='exponential', **kwargs)
+    u0 = prob.u_exact(0) + 2e-2
+
+    solutions = []
+    for i in range(num_solves):
+        factor = [0.4, 0.2, 0.1][i % 3]
+        rhs = u0 + 0.01 * i
+        u = prob.solve_system(rhs, factor, u0, 0)
+        assert abs(u - factor * prob.eval_f(u, 0) - rhs) < 1e-9, 'Solution does not solve the nonlinear system'
+        solutions.append(np.array(u))
+    return solutions, prob
+
+
+@pytest.mark.base
+def test_simplified_Newton():
+    import numpy as np
+
+    solutions, prob = solve_quench()
+    solutions_simplified, prob_simplified = solve_quench(simplified_newton=True)
+
+    for u, u_simplified in zip(solutions, solutions_simplified):
+        assert np.allclose(u, u_simplified, atol=1e-9)
+
+    work = {key: me.niter for key, me in prob.work_counters.items()}
+    work_simplified = {key: me.niter for key, me in prob_simplified.work_counters.items()}
+    assert work['jacobian'] == work['newton'], 'Full Newton should evaluate the Jacobian in every iteration'
+    assert work_simplified['jacobian'] < work['jacobian'], 'Simplified Newton did not reuse the Jacobian'
+    assert work_simplified['factorization'] < work['factorization'], 'Factorizations have not been reused'
+
+
+@pytest.mark.base
+@pytest.mark.parametrize('eisenstat_walker', [True, False])
+def test_inexact_Newton(eisenstat_walker):
+    import numpy as np
+
+    solutions, _ = solve_quench(num_solves=3)
+    solutions_inexact, prob = solve_quench(
+        num_solves=3, direct_solver=False, eisenstat_walker=eisenstat_walker, inexact_linear_ratio=1e-1
+    )
+
+    for u, u_inexact in zip(solutions, solutions_inexact):
+        assert np.allclose(u, u_inexact, atol=1e-9)
+    assert prob.work_counters['linear'].niter > 0
+    assert prob.work_counters['rhs'].niter == 3, 'Evaluations inside Newton should not count as rhs evaluations'
+
+
+@pytest.mark.base
+@pytest.mark.parametrize('problem', ['ProtheroRobinsonAutonomous', 'Kaps', 'ChemicalReaction3Var', 'JacobiElliptic'])
+@pytest.mark.parametrize('simplified_newton', [True, False])
+def test_Jacobians_ODE_systems(problem, simplified_newton):
+    """
+    Check the analytic Jacobians with finite differences and that solving the nonlinear systems works
+    """
+    import numpy as np
+    import pySDC.implementations.problem_classes.odeSystem as odeSystem
+
+    problem_params = {'simplified_newton': simplified_newton}
+    if problem == 'ProtheroRobinsonAutonomous':
+        problem_params['nonLinear'] = True
+    prob = getattr(odeSystem, problem)(**problem_params)
+
+    u = prob.u_exact(0.1)
+    jac = prob.jac(u, 0.1)
+    eps = 1e-6
+    for i in range(u.size):
+        up, um = prob.dtype_u(u), prob.dtype_u(u)
+        up[i] += eps
+        um[i] -= eps
+        assert np.allclose((prob.eval_f(up, 0.1) - prob.eval_f(um, 0.1)) / (2 * eps), jac[:, i], rtol=1e-6, atol=1e-6)
+
+    rhs = prob.u_exact(0.1)
+    for dt in [1e-2, 2e-2, 1e-2]:
+        sol = prob.solve_system(rhs, dt, rhs, 0.1)
+        assert abs(sol - dt * prob.eval_f(sol, 0.1) - rhs) < 1e-10
+
+
+@pytest.mark.base
+@pytest.mark.parametrize('stop_at_nan', [True, False])
+def test_singular_Jacobian(stop_at_nan):
+    """
+    Check that solving the nonlinear system is not silently accepted when Newton breaks down due to a singular Jacobian
+    """
+    import numpy as np
+    from pySDC.core.Errors import ProblemError
+    from pySDC.implementations.problem_classes.odeSystem import Kaps
+
+    prob = Kaps(stop_at_nan=stop_at_nan)
+    dt = 1e-2
+
+    # the linearized system I - dt * J is zero
+    prob.newton_solver.jacobian = lambda u, t: np.eye(u.size) / dt
+
+    rhs = prob.u_exact(0.1)
+    if stop_at_nan:
+        with pytest.raises(ProblemError):
+            prob.solve_system(rhs, dt, rhs + 0.1, 0.1)
+    else:
+        prob.solve_system(rhs, dt, rhs + 0.1, 0.1)
+    assert not prob.newton_solver.converged
+    assert prob.newton_solver.niter < prob.newton_maxiter, 'Newton should stop early with a singular Jacobian'
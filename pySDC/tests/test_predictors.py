@@ -0,0 +1,185 @@
+import pytest
+
+
+def run_heat(useMPI, predict_type, num_procs=4, num_levels=3):
+    """
+    Run PFASST for the forced heat equation with the given predictor
+
+    Args:
+        useMPI (bool): use the MPI controller or the non-MPI controller
+        predict_type (str): type of the predictor
+        num_procs (int): number of processes for the non-MPI controller
+        num_levels (int): number of levels
+
+    Returns:
+        numpy.ndarray: solution at the end of the run
+        dict: statistics of the run
+        MPI.Intracomm: the communicator, if any
+    """
+    from pySDC.implementations.problem_classes.HeatEquation_ND_FD import heatNd_forced
+    from pySDC.implementations.sweeper_classes.imex_1st_order import imex_1st_order
+    from pySDC.implementations.transfer_classes.TransferMesh import mesh_to_mesh
+    from pySDC.implementations.hooks.log_work import LogPredictorWork
+
+    # initialize level parameters
+    level_params = {}
+    level_params['restol'] = 1e-10
+    level_params['dt'] = 0.125
+
+    # initialize sweeper parameters
+    sweeper_params = {}
+    sweeper_params['quad_type'] = 'RADAU-RIGHT'
+    sweeper_params['num_nodes'] = 3
+    sweeper_params['QI'] = 'LU'
+
+    # initialize problem parameters
+    problem_params = {}
+    problem_params['nu'] = 0.1
+    problem_params['freq'] = 4
+    problem_params['nvars'] = [127, 63, 31][:num_levels]
+    problem_params['bc'] = 'dirichlet-zero'
+
+    # initialize step parameters
+    step_params = {}
+    step_params['maxiter'] = 50
+
+    # initialize space transfer parameters
+    space_transfer_params = {}
+    space_transfer_params['rorder'] = 2
+    space_transfer_params['iorder'] = 6
+
+    # initialize controller parameters
+    controller_params = {}
+    controller_params['logger_level'] = 30
+    controller_params['predict_type'] = predict_type
+    controller_params['hook_class'] = LogPredictorWork
+
+    # fill description dictionary for easy step instantiation
+    description = {}
+    description['problem_class'] = heatNd_forced
+    description['problem_params'] = problem_params
+    description['sweeper_class'] = imex_1st_order
+    description['sweeper_params'] = sweeper_params
+    description['level_params'] = level_params
+    description['step_params'] = step_params
+    description['space_transfer_class'] = mesh_to_mesh
+    description['space_transfer_params'] = space_transfer_params
+
+    # set time parameters
+    t0 = 0.0
+
+    # instantiate controller
+    if useMPI:
+        from mpi4py import MPI
+        from pySDC.implementations.controller_classes.controller_MPI import controller_MPI
+
+        comm = MPI.COMM_WORLD
+        num_procs = comm.size
+
+        controller = controller_MPI(controller_params=controller_params, description=description, comm=comm)
+        P = controller.S.levels[0].prob
+    else:
+        from pySDC.implementations.controller_classes.controller_nonMPI import controller_nonMPI
+
+        comm = None
+        controller = controller_nonMPI(
+            num_procs=num_procs, controller_params=controller_params, description=description
+        )
+        P = controller.MS[0].levels[0].prob
+    uinit = P.u_exact(t0)
+
+    uend, stats = controller.run(u0=uinit, t0=t0, Tend=2 * num_procs * level_params['dt'])
+    return uend, stats, comm
+
+
+def check_FMG_MPI_vs_nonMPI():
+    """
+    Check that the FMG predictor does the same with the MPI controller as with the non-MPI controller
+    """
+    import numpy as np
+    from pySDC.helpers.stats_helper import get_sorted
+
+    uend, stats, comm = run_heat(useMPI=True, predict_type='fmg')
+    uend_nonMPI, stats_nonMPI, _ = run_heat(useMPI=False, predict_type='fmg', num_procs=comm.size)
+
+    for key in [
+        'niter',
+        'residual_post_step',
+        'work_predictor_factorization_hits',
+        'work_predictor_factorization_misses',
+    ]:
+        res = [me[1] for me in get_sorted(stats, type=key, process=comm.rank)]
+        res_nonMPI = [me[1] for me in get_sorted(stats_nonMPI, type=key, process=comm.rank)]
+        assert np.allclose(
+            res, res_nonMPI, rtol=1e-8, atol=1e-14
+        ), f'MPI and non-MPI controllers disagree in {key!r} with FMG predictor on process {comm.rank}: {res} vs {res_nonMPI}'
+
+    if comm.rank == comm.size - 1:
+        assert np.allclose(uend, uend_nonMPI, atol=1e-12), 'MPI and non-MPI controllers disagree with FMG predictor'
+
+
+@pytest.mark.base
+@pytest.mark.parametrize('num_levels', [2, 3])
+def test_FMG_predictor(num_levels):
+    """
+    Test that the FMG predictor does one sweep on every level, converges to the same solution as the other predictors
+    and needs fewer iterations than without predictor.
+    """
+    import numpy as np
+    from pySDC.helpers.stats_helper import get_sorted
+
+    num_procs = 4
+    results = {
+        predict_type: run_heat(useMPI=False, predict_type=predict_type, num_procs=num_procs, num_levels=num_levels)
+        for predict_type in [None, 'pfasst_burnin', 'fmg']
+    }
+
+    for predict_type in [None, 'pfasst_burnin']:
+        assert np.allclose(results['fmg'][0], results[predict_type][0], atol=1e-9)
+
+    niter = {key: sum(me[1] for me in get_sorted(value[1], type='niter')) for key, value in results.items()}
+    assert niter['fmg'] < niter[None], f'FMG predictor does not reduce the number of iterations: {niter}'
+
+    # the linear solves in the predictor are counted as hits and misses of the cache for the factorizations
+    for predict_type, (_, stats, _) in results.items():
+        for level in range(num_levels):
+            solves = [
+                sum(
+                    me[1]
+                    for key in ['hits', 'misses']
+                    for me in get_sorted(stats, type=f'work_predictor_factorization_{key}', level=level, time=t)
+                )
+                for t in np.arange(2 * num_procs) * 0.125
+            ]
+            if predict_type is None:
+                assert all(me == 0 for me in solves), 'Recorded predictor work without predictor!'
+            elif predict_type == 'fmg':
+                # one sweep with three nodes on every level in every step
+                assert all(me == 3 for me in solves), f'Unexpected work of FMG predictor on level {level}: {solves}'
+
+
+@pytest.mark.mpi4py
+@pytest.mark.parametrize('num_procs', [2, 4])
+def test_FMG_predictor_MPI(num_procs):
+    import os
+    import subprocess
+
+    # Set python path once
+    my_env = os.environ.copy()
+    my_env['PYTHONPATH'] = '../../..:.'
+    my_env['COVERAGE_PROCESS_START'] = 'pyproject.toml'
+
+    # run code with different number of MPI processes
+    cmd = f"mpirun -np {num_procs} python {__file__}".split()
+
+    p = subprocess.Popen(cmd, env=my_env, cwd=".")
+
+    p.wait()
+    assert p.returncode == 0, 'ERROR: did not get return code 0, got %s with %2i processes' % (
+        p.returncode,
+        num_procs,
+    )
+
+
+if __name__ == "__main__":
+    check_FMG_MPI_vs_nonMPI()
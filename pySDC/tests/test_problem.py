@@ -42,6 +42,85 @@ def test_scipy_reference(init):
     assert np.allclose(u_ref, u_exact, atol=1e-12), "The scipy solution deviates significantly from the exact solution"
 
 
+@pytest.mark.base
+def test_scipy_reference_cache(tmp_path):
+    """
+    Test that reference solutions starting from the initial conditions are computed incrementally, agree with solutions
+    computed from scratch and are reused from memory and from disk.
+    """
+    from pySDC.helpers.reference_solution import Reference_cache
+    from pySDC.implementations.problem_classes.Van_der_Pol_implicit import vanderpol
+
+    cache_dir = Reference_cache.cache_dir
+    Reference_cache.cache_dir = str(tmp_path)
+    Reference_cache.clear()
+
+    def eval_rhs(t, u):
+        return problem.eval_f(u, t)
+
+    try:
+        problem = vanderpol(mu=2.0)
+        times = np.linspace(0.1, 1.0, 10)
+
+        misses = Reference_cache.misses.niter
+        u_cached = [problem.u_exact(t) for t in times]
+        assert Reference_cache.misses.niter - misses == len(times), 'Expected one integration per requested time!'
+
+        for t, u in zip(times, u_cached):
+            u_direct = problem.generate_scipy_reference_solution(eval_rhs, t, use_cache=False)
+            assert np.allclose(u, u_direct, atol=1e-11, rtol=1e-11), f'Cached solution is wrong at t={t}!'
+
+        # solutions are shared between problems with the same parameters and can be loaded from disk
+        for clear in [False, True]:
+            if clear:
+                Reference_cache.clear()
+            misses = Reference_cache.misses.niter
+            u_again = [vanderpol(mu=2.0).u_exact(t) for t in times[::-1]]
+            assert Reference_cache.misses.niter == misses, 'Reference solution has been computed again!'
+            assert all(np.array_equal(u, v) for u, v in zip(u_cached, u_again[::-1])), 'Got different solution!'
+
+        # different parameters lead to different solutions
+        misses = Reference_cache.misses.niter
+        vanderpol(mu=3.0).u_exact(times[-1])
+        assert Reference_cache.misses.niter == misses + 1, 'Reference solution for different parameters was reused!'
+    finally:
+        Reference_cache.cache_dir = cache_dir
+        Reference_cache.clear()
+
+
+@pytest.mark.base
+def test_scipy_reference_cache_bounds():
+    """
+    Test that the reference cache keeps only a limited number of trajectories and checkpoints in memory and that
+    solutions are still correct after checkpoints have been discarded.
+    """
+    from pySDC.helpers.reference_solution import ReferenceCache
+    from pySDC.implementations.problem_classes.Van_der_Pol_implicit import vanderpol
+
+    def eval_rhs(t, u):
+        return problem.eval_f(u, t)
+
+    cache = ReferenceCache(max_trajectories=2, max_checkpoints=4)
+    problem = vanderpol(mu=2.0)
+    u0 = np.asarray(problem.u_exact(0))
+    kwargs = {'atol': 100 * np.finfo(float).eps, 'rtol': 100 * np.finfo(float).eps}
+
+    times = np.linspace(0.1, 1.0, 10)
+    u_cached = [cache.get(problem, eval_rhs, t, u0, **kwargs) for t in times]
+    (trajectory,) = cache._memo.values()
+    assert len(trajectory.times) <= 4, 'Checkpoints have not been thinned out!'
+    assert trajectory.times[0] == 0 and trajectory.times[-1] == times[-1], 'Kept the wrong checkpoints!'
+
+    for t, u in zip(times, u_cached):
+        u_direct = problem.generate_scipy_reference_solution(eval_rhs, t, use_cache=False)
+        assert np.allclose(u, u_direct, atol=1e-11, rtol=1e-11), f'Cached solution is wrong at t={t}!'
+
+    for mu in [3.0, 4.0]:
+        other = vanderpol(mu=mu)
+        cache.get(other, lambda t, u: other.eval_f(u, t), 0.1, u0, **kwargs)
+    assert len(cache._memo) == 2, 'Least recently used trajectory has not been evicted!'
+
+
 @pytest.mark.base
 class TestBasics:
     @staticmethod
@@ -54,5 +54,68 @@ def test_GrayScottMPIFFT(name, spectral):
         assert prob.work_counters['newton'].niter > 0
 
 
+@pytest.mark.mpi4py
+@pytest.mark.parametrize('name', ['imex_diffusion', 'mi_linear'])
+@pytest.mark.parametrize('spectral', [True, False])
+def test_GrayScottMPIFFT_buffers(name, spectral):
+    """
+    Test that persistent work arrays and cached operators in spectral space give the same results as computing
+    everything from scratch and that results do not change when the work arrays are reused.
+    """
+    if name == 'imex_diffusion':
+        from pySDC.implementations.problem_classes.GrayScott_MPIFFT import grayscott_imex_diffusion as problem_class
+    elif name == 'mi_linear':
+        from pySDC.implementations.problem_classes.GrayScott_MPIFFT import grayscott_mi_linear as problem_class
+    import numpy as np
+
+    prob = problem_class(spectral=spectral, nvars=(32,) * 2)
+    prob_no_cache = problem_class(spectral=spectral, nvars=(32,) * 2, symbol_cache_size=0)
+
+    u0 = prob.u_exact(0)
+    f0 = prob.eval_f(u0, 0)
+    f1 = prob.eval_f(u0 * 0.5, 0)
+    assert np.allclose(f0, prob.eval_f(u0, 0), atol=1e-14), 'Reusing work arrays changes the result!'
+    assert np.allclose(f0, prob_no_cache.eval_f(u0, 0), atol=1e-14)
+    assert not np.allclose(f0, f1), 'Right hand side evaluations share memory!'
+
+    solve = prob.solve_system_1 if 'solve_system_1' in dir(prob) else prob.solve_system
+    solve_no_cache = prob_no_cache.solve_system_1 if 'solve_system_1' in dir(prob) else prob_no_cache.solve_system
+    for dt in [1e-2, 1e-3, 1e-2]:
+        assert np.allclose(solve(u0, dt, u0, 0), solve_no_cache(u0, dt, u0, 0), atol=1e-14)
+    assert prob.symbol_cache.hits.niter > 0, 'Operators in spectral space have not been reused!'
+    assert prob_no_cache.symbol_cache is None
+
+
+@pytest.mark.mpi4py
+@pytest.mark.parametrize('spectral', [True, False])
+def test_GrayScottMPIFFT_transforms(spectral):
+    """
+    Test that the implicit solves need no FFTs in spectral space and two FFTs per component in real space. Also test
+    that dealiasing discards the high modes, which would cause aliasing errors in the cubic reaction term, from the
+    solution and from the explicit part.
+    """
+    from pySDC.implementations.problem_classes.GrayScott_MPIFFT import grayscott_imex_diffusion as problem_class
+    import numpy as np
+
+    prob = problem_class(spectral=spectral, nvars=(32,) * 2, dealias=spectral)
+
+    u0 = prob.u_exact(0)
+    prob.work_counters['fft'].niter = 0
+    prob.solve_system(u0, 1e-2, u0, 0)
+    assert prob.work_counters['fft'].niter == (0 if spectral else 2 * prob.ncomp)
+
+    f = prob.eval_f(u0, 0)
+    if spectral:
+        assert np.allclose(f.expl[:, ~prob.dealias_mask], 0), 'Explicit part has not been dealiased!'
+        assert not np.allclose(f.expl[:, prob.dealias_mask], 0)
+
+        # the discarded modes of the solution do not enter the explicit part
+        u0_truncated = prob.dtype_u(u0)
+        u0_truncated[:, ~prob.dealias_mask] = 0
+        assert np.allclose(prob.eval_f(u0_truncated, 0).expl, f.expl), 'Solution has not been dealiased!'
+    else:
+        assert prob.dealias_mask is None
+
+
 if __name__ == '__main__':
     test_GrayScottMPIFFT('imex_diffusion', False)
@@ -0,0 +1,74 @@
+import pytest
+
+
+def get_problem(nparts, **kwargs):
+    import numpy as np
+    from pySDC.implementations.problem_classes.PenningTrap_3D import penningtrap
+
+    problem_params = {
+        'omega_E': 4.9,
+        'omega_B': 25.0,
+        'u0': np.array([[10, 0, 0], [100, 0, 100], [1], [1]], dtype=object),
+        'nparts': nparts,
+        'sig': 0.1,
+        **kwargs,
+    }
+    return penningtrap(**problem_params)
+
+
+@pytest.mark.base
+@pytest.mark.parametrize('nparts', [1, 10, 300])
+def test_Barnes_Hut(nparts):
+    """
+    Test that the Barnes-Hut backend matches the direct sum for zero opening angle and approximates it otherwise.
+    """
+    import numpy as np
+
+    direct = get_problem(nparts)
+    u = direct.u_init()
+    E_direct = direct.get_interactions(u)
+
+    exact = get_problem(nparts, interactions='barnes_hut', theta=0.0, leaf_size=4)
+    assert np.allclose(exact.get_interactions(u), E_direct, rtol=1e-12, atol=1e-12)
+
+    approx = get_problem(nparts, interactions='barnes_hut', theta=0.5, leaf_size=4)
+    error = abs(approx.get_interactions(u) - E_direct).max()
+    assert error <= 1e-2 * max(abs(E_direct).max(), 1e-14), f'Barnes-Hut error too large: {error:.2e}'
+
+    assert approx.work_counters['tree_build'].niter == 1
+    assert approx.work_counters['tree_traversal'].niter == 1
+    assert approx.work_counters['tree_traversal'].time > 0
+
+
+@pytest.mark.base
+@pytest.mark.parametrize('cutoff', [0.3, 100.0])
+def test_cell_list(cutoff):
+    """
+    Test that the cell list backend matches a direct sum over the particles within the cutoff radius.
+    """
+    import numpy as np
+
+    prob = get_problem(300, interactions='cell_list', cutoff=cutoff)
+    u = prob.u_init()
+    pos = u.pos
+
+    dist = pos[:, :, None] - pos[:, None, :]
+    r2 = np.sum(dist**2, axis=0)
+    weights = np.where(r2 < cutoff**2, u.q[None, :] / (r2 + prob.sig**2) ** 1.5, 0)
+    E_ref = np.sum(dist * weights[None, :, :], axis=2)
+
+    assert np.allclose(prob.get_interactions(u), E_ref, rtol=1e-12, atol=1e-12)
+    assert prob.work_counters['tree_build'].niter == 1
+
+    prob.eval_f(u, 0)
+    assert prob.work_counters['tree_build'].niter == 2, 'eval_f did not use the cell list backend'
+
+
+@pytest.mark.base
+def test_invalid_backend():
+    from pySDC.core.Errors import ProblemError
+
+    with pytest.raises(ProblemError):
+        get_problem(1, interactions='fmm')
+    with pytest.raises(ProblemError):
+        get_problem(1, interactions='cell_list')
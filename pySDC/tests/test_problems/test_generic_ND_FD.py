@@ -0,0 +1,50 @@
+import pytest
+
+
+@pytest.mark.base
+@pytest.mark.parametrize('ndim', [1, 2])
+def test_factorization_cache(ndim):
+    import numpy as np
+    from pySDC.implementations.problem_classes.HeatEquation_ND_FD import heatNd_unforced
+
+    nvars = (32,) * ndim
+    cached = heatNd_unforced(nvars=nvars, factorization_cache_size=2)
+    uncached = heatNd_unforced(nvars=nvars, factorization_cache_size=0)
+
+    assert uncached.factorization_cache is None
+    assert 'factorization_hits' not in uncached.work_counters.keys()
+
+    u0 = cached.u_exact(0)
+    factors = [1e-2, 2e-2, 1e-2, 3e-2, 2e-2]
+    for factor in factors:
+        sol_cached = cached.solve_system(u0, factor, u0, 0)
+        sol_uncached = uncached.solve_system(u0, factor, u0, 0)
+        assert np.allclose(sol_cached, sol_uncached, atol=1e-13), 'Cached factorization gives different solution!'
+
+    # 1e-2 is reused once, 2e-2 has been evicted by 3e-2 before it is requested again
+    assert cached.work_counters['factorization_hits'].niter == 1
+    assert cached.work_counters['factorization_misses'].niter == 4
+    assert len(cached.factorization_cache) == 2
+
+
+@pytest.mark.base
+def test_factorization_cache_in_run():
+    from pySDC.implementations.problem_classes.AdvectionEquation_ND_FD import advectionNd
+    from pySDC.implementations.sweeper_classes.generic_implicit import generic_implicit
+    from pySDC.implementations.controller_classes.controller_nonMPI import controller_nonMPI
+
+    num_nodes = 3
+    description = {
+        'problem_class': advectionNd,
+        'problem_params': {'nvars': 64},
+        'sweeper_class': generic_implicit,
+        'sweeper_params': {'num_nodes': num_nodes, 'quad_type': 'RADAU-RIGHT', 'QI': 'LU'},
+        'level_params': {'dt': 1e-2, 'restol': -1},
+        'step_params': {'maxiter': 4},
+    }
+    controller = controller_nonMPI(num_procs=1, controller_params={'logger_level': 30}, description=description)
+    P = controller.MS[0].levels[0].prob
+    controller.run(u0=P.u_exact(0), t0=0, Tend=4e-2)
+
+    assert P.work_counters['factorization_misses'].niter == num_nodes
+    assert P.work_counters['factorization_hits'].niter > 0
@@ -1,7 +1,7 @@
 import pytest
 
 
-def run(use_MPI, num_nodes, quad_type, residual_type, imex, initGuess, useNCCL):
+def run(use_MPI, num_nodes, quad_type, residual_type, imex, initGuess, useNCCL, single_collective=False):
     """
     Run a single sweep for a problem and compute the solution at the end point with a sweeper as specified.
 
@@ -13,6 +13,7 @@ def run(use_MPI, num_nodes, quad_type, residual_type, imex, initGuess, useNCCL):
         imex (bool): Use IMEX sweeper or not
         initGuess (str): which initial guess should be used
         useNCCL (bool): ...
+        single_collective (bool): Use a single collective communication for the quadrature in the MPI sweeper
 
     Returns:
         pySDC.Level.level: The level containing relevant data
@@ -44,6 +45,9 @@ def run(use_MPI, num_nodes, quad_type, residual_type, imex, initGuess, useNCCL):
     }
     problem_params = {}
 
+    if use_MPI:
+        sweeper_params['single_collective'] = single_collective
+
     if useNCCL:
         from pySDC.helpers.NCCL_communicator import NCCLComm
         from mpi4py import MPI
@@ -70,7 +74,9 @@ def run(use_MPI, num_nodes, quad_type, residual_type, imex, initGuess, useNCCL):
     return controller.MS[0].levels[0]
 
 
-def individual_test(num_nodes, quad_type, residual_type, imex, initGuess, useNCCL, launch=True):
+def individual_test(
+    num_nodes, quad_type, residual_type, imex, initGuess, useNCCL, single_collective=False, launch=True
+):
     """
     Make a test if the result matches between the MPI and non-MPI versions of a sweeper.
     Tests solution at the right end point and the residual.
@@ -82,6 +88,7 @@ def individual_test(num_nodes, quad_type, residual_type, imex, initGuess, useNCC
         imex (bool): Use IMEX sweeper or not
         initGuess (str): which initial guess should be used
         useNCCL (bool): ...
+        single_collective (bool): Use a single collective communication for the quadrature in the MPI sweeper
         launch (bool): If yes, it will launch `mpirun` with the required number of processes
     """
     if launch:
@@ -93,7 +100,7 @@ def individual_test(num_nodes, quad_type, residual_type, imex, initGuess, useNCC
         my_env['PYTHONPATH'] = '../../..:.'
         my_env['COVERAGE_PROCESS_START'] = 'pyproject.toml'
 
-        cmd = f"mpirun -np {num_nodes} python {__file__} --test_sweeper {num_nodes} {quad_type} {residual_type} {imex} {initGuess} {useNCCL}".split()
+        cmd = f"mpirun -np {num_nodes} python {__file__} --test_sweeper {num_nodes} {quad_type} {residual_type} {imex} {initGuess} {useNCCL} {single_collective}".split()
 
         p = subprocess.Popen(cmd, env=my_env, cwd=".")
 
@@ -116,6 +123,7 @@ def individual_test(num_nodes, quad_type, residual_type, imex, initGuess, useNCC
             imex=imex,
             initGuess=initGuess,
             useNCCL=useNCCL,
+            single_collective=single_collective,
         )
         nonMPI = run(
             use_MPI=False,
@@ -152,6 +160,28 @@ def test_sweeper(num_nodes, quad_type, residual_type, imex, initGuess, launch=Tr
     individual_test(num_nodes, quad_type, residual_type, imex, initGuess, useNCCL=False, launch=launch)
 
 
+@pytest.mark.mpi4py
+@pytest.mark.parametrize("num_nodes", [2, 4])
+@pytest.mark.parametrize("quad_type", ['GAUSS', 'RADAU-RIGHT'])
+@pytest.mark.parametrize("residual_type", ['last_abs', 'full_abs', 'last_rel', 'full_rel'])
+@pytest.mark.parametrize("imex", [True, False])
+def test_sweeper_single_collective(num_nodes, quad_type, residual_type, imex, launch=True):
+    """
+    Make a test if the result matches between the MPI version of a sweeper with a single collective communication for
+    the quadrature and the non-MPI version.
+
+    Args:
+        num_nodes (int): The number of nodes to use
+        quad_type (str): Type of nodes
+        residual_type (str): Type of residual computation
+        imex (bool): Use IMEX sweeper or not
+        launch (bool): If yes, it will launch `mpirun` with the required number of processes
+    """
+    individual_test(
+        num_nodes, quad_type, residual_type, imex, 'spread', useNCCL=False, single_collective=True, launch=launch
+    )
+
+
 @pytest.mark.cupy
 @pytest.mark.skip(reason="We haven\'t figured out how to run tests on the cluster with multiple processes yet.")
 @pytest.mark.parametrize("num_nodes", [2])
@@ -178,8 +208,16 @@ if __name__ == '__main__':
     import sys
 
     if '--test_sweeper' in sys.argv:
-        imex = False if sys.argv[-3] == 'False' else True
-        useNCCL = False if sys.argv[-1] == 'False' else True
+        imex = False if sys.argv[-4] == 'False' else True
+        useNCCL = False if sys.argv[-2] == 'False' else True
+        single_collective = False if sys.argv[-1] == 'False' else True
         individual_test(
-            sys.argv[-6], sys.argv[-5], sys.argv[-4], imex=imex, initGuess=sys.argv[-2], useNCCL=useNCCL, launch=False
+            sys.argv[-7],
+            sys.argv[-6],
+            sys.argv[-5],
+            imex=imex,
+            initGuess=sys.argv[-3],
+            useNCCL=useNCCL,
+            single_collective=single_collective,
+            launch=False,
         )
@@ -0,0 +1,76 @@
+import pytest
+
+
+def run_problem(problem_name, diagonalize_Q, num_threads=1, num_levels=1, restol=1e-12):
+    from pySDC.implementations.controller_classes.controller_nonMPI import controller_nonMPI
+    from pySDC.implementations.transfer_classes.TransferMesh import mesh_to_mesh
+    from pySDC.implementations.sweeper_classes.generic_implicit import generic_implicit
+    from pySDC.implementations.problem_classes.TestEquation_0D import testequation0d
+    from pySDC.implementations.problem_classes.HeatEquation_ND_FD import heatNd_unforced
+    from pySDC.implementations.problem_classes.AdvectionEquation_ND_FD import advectionNd
+    from pySDC.helpers.stats_helper import get_sorted
+
+    if problem_name == 'testequation0d':
+        problem_class = testequation0d
+        problem_params = {'lambdas': [[-1.0, -10.0 + 3j, -1e3, 5j]], 'u0': 1.0}
+    elif problem_name == 'heat':
+        problem_class = heatNd_unforced
+        problem_params = {'nvars': [64, 32][:num_levels], 'bc': 'periodic'}
+    elif problem_name == 'advection2D':
+        problem_class = advectionNd
+        problem_params = {'nvars': [(16, 16), (8, 8)][:num_levels], 'order': 4, 'bc': 'periodic'}
+    else:
+        raise NotImplementedError(f'No test setup for problem {problem_name}')
+
+    description = {
+        'problem_class': problem_class,
+        'problem_params': problem_params,
+        'sweeper_class': generic_implicit,
+        'sweeper_params': {
+            'num_nodes': [4, 2][:num_levels],
+            'quad_type': 'RADAU-RIGHT',
+            'QI': 'MIN-SR-S',
+            'diagonalize_Q': diagonalize_Q,
+            'num_threads': num_threads,
+        },
+        'level_params': {'dt': 2e-2, 'restol': restol},
+        'step_params': {'maxiter': 50},
+        'space_transfer_class': mesh_to_mesh,
+    }
+
+    controller = controller_nonMPI(num_procs=1, controller_params={'logger_level': 30}, description=description)
+    P = controller.MS[0].levels[0].prob
+    uend, stats = controller.run(u0=P.u_exact(0), t0=0, Tend=1e-1)
+    niter = [me[1] for me in get_sorted(stats, type='niter')]
+    return uend, niter
+
+
+@pytest.mark.base
+@pytest.mark.parametrize('num_threads', [1, 3])
+@pytest.mark.parametrize('problem_name', ['testequation0d', 'heat', 'advection2D'])
+def test_diagonalize_Q(problem_name, num_threads):
+    """
+    Test that diagonalizing Q solves the collocation problem in a single iteration, also with threads
+    """
+    import numpy as np
+
+    uend, _ = run_problem(problem_name, False)
+    uend_diag, niter_diag = run_problem(problem_name, True, num_threads=num_threads)
+
+    assert np.allclose(uend, uend_diag, rtol=1e-10, atol=1e-12), 'Diagonalization gives different collocation solution!'
+    assert all(me == 1 for me in niter_diag), f'Expected to solve the collocation problem at once, got {niter_diag}'
+    assert uend.dtype == uend_diag.dtype, 'Diagonalization changed the data type of the solution!'
+
+
+@pytest.mark.base
+def test_diagonalize_Q_MLSDC():
+    """
+    Test that diagonalizing Q on both levels of MLSDC gives the collocation solution of the fine level
+    """
+    import numpy as np
+
+    uend, _ = run_problem('heat', False, num_levels=2)
+    uend_diag, niter_diag = run_problem('heat', True, num_levels=2)
+
+    assert np.allclose(uend, uend_diag, rtol=1e-10, atol=1e-12), 'Diagonalization gives different collocation solution!'
+    assert max(niter_diag) <= 2, f'Expected to solve the collocation problem at once, got {niter_diag}'
@@ -0,0 +1,93 @@
+import pytest
+
+
+def run_problem(sweeper_class, problem_class, problem_params, fuse_residual, num_levels=1, num_procs=1):
+    import numpy as np
+    from pySDC.implementations.controller_classes.controller_nonMPI import controller_nonMPI
+    from pySDC.implementations.transfer_classes.TransferMesh import mesh_to_mesh
+    from pySDC.helpers.stats_helper import get_sorted
+
+    class counting_sweeper(sweeper_class):
+        integrations = 0
+
+        def integrate(self):
+            counting_sweeper.integrations += 1
+            return super().integrate()
+
+    description = {
+        'problem_class': problem_class,
+        'problem_params': problem_params,
+        'sweeper_class': counting_sweeper,
+        'sweeper_params': {
+            'num_nodes': [3, 2][:num_levels],
+            'quad_type': 'RADAU-RIGHT',
+            'QI': 'LU',
+            'fuse_residual': fuse_residual,
+        },
+        'level_params': {'dt': 1e-2, 'restol': 1e-10, 'residual_type': 'full_rel'},
+        'step_params': {'maxiter': 8},
+        'space_transfer_class': mesh_to_mesh,
+    }
+    if num_levels > 1:
+        description['problem_params'] = {**problem_params, 'nvars': [problem_params['nvars'], 32]}
+
+    controller = controller_nonMPI(num_procs=num_procs, controller_params={'logger_level': 30}, description=description)
+    P = controller.MS[0].levels[0].prob
+    uend, stats = controller.run(u0=P.u_exact(0), t0=0, Tend=4e-2)
+    residuals = np.array([me[1] for me in get_sorted(stats, type='residual_post_iteration')])
+    return uend, get_sorted(stats, type='niter'), residuals, counting_sweeper.integrations
+
+
+@pytest.mark.base
+@pytest.mark.parametrize('num_levels', [1, 2])
+@pytest.mark.parametrize('num_procs', [1, 2])
+@pytest.mark.parametrize('sweeper_name', ['generic_implicit', 'imex_1st_order'])
+def test_fused_residual(sweeper_name, num_procs, num_levels):
+    """
+    Test that reusing the quadrature from the residual in the next sweep gives the same results with fewer
+    integrations, also when the values at the nodes are changed by transfer between the sweeps
+    """
+    import numpy as np
+    from pySDC.implementations.sweeper_classes.generic_implicit import generic_implicit
+    from pySDC.implementations.sweeper_classes.imex_1st_order import imex_1st_order
+    from pySDC.implementations.problem_classes.HeatEquation_ND_FD import heatNd_unforced, heatNd_forced
+
+    if sweeper_name == 'generic_implicit':
+        sweeper_class, problem_class = generic_implicit, heatNd_unforced
+    else:
+        sweeper_class, problem_class = imex_1st_order, heatNd_forced
+    problem_params = {'nvars': 64, 'bc': 'periodic'}
+
+    uend, niter, residuals, integrations = run_problem(
+        sweeper_class, problem_class, problem_params, False, num_levels, num_procs
+    )
+    uend_fused, niter_fused, residuals_fused, integrations_fused = run_problem(
+        sweeper_class, problem_class, problem_params, True, num_levels, num_procs
+    )
+
+    assert np.allclose(uend, uend_fused, rtol=1e-14, atol=1e-14), 'Fused residual gives different solution!'
+    assert niter == niter_fused, 'Fused residual needs different number of iterations!'
+    assert np.allclose(residuals, residuals_fused, rtol=1e-12, atol=1e-14), 'Fused residual gives different residuals!'
+    if num_levels == 1:
+        assert integrations_fused < integrations, 'Fused residual did not save any integrations!'
+    else:
+        # the transfer changes the values at the nodes between the sweeps, so there is nothing to reuse
+        assert integrations_fused == integrations, 'Fused residual reused outdated quadrature!'
+
+
+@pytest.mark.base
+def test_batched_abs():
+    import numpy as np
+    from pySDC.core.Sweeper import sweeper
+    from pySDC.implementations.datatype_classes.mesh import mesh, imex_mesh
+
+    rng = np.random.default_rng(5)
+    values = []
+    for _ in range(4):
+        values.append(mesh(((3, 5), None, np.dtype('complex128'))))
+        values[-1][:] = rng.random((3, 5)) + 1j * rng.random((3, 5))
+    assert sweeper.compute_norms(values) == [abs(me) for me in values]
+    assert mesh.batched_abs(values) == [abs(me) for me in values]
+
+    values = [imex_mesh(((4,), None, np.dtype('float64')), val=-2.0), mesh(((4,), None, np.dtype('float64')), val=1)]
+    assert sweeper.compute_norms(values) == [2.0, 1.0]
@@ -0,0 +1,125 @@
+import pytest
+
+
+def run_problem(problem_name, matrix_sweep, QI, num_levels=1, num_procs=1, stacked_nodes=False):
+    from pySDC.implementations.controller_classes.controller_nonMPI import controller_nonMPI
+    from pySDC.implementations.transfer_classes.TransferMesh import mesh_to_mesh
+    from pySDC.implementations.sweeper_classes.generic_implicit import generic_implicit
+    from pySDC.implementations.sweeper_classes.imex_1st_order import imex_1st_order
+    from pySDC.implementations.problem_classes.TestEquation_0D import testequation0d
+    from pySDC.implementations.problem_classes.HeatEquation_ND_FD import heatNd_unforced, heatNd_forced
+    from pySDC.implementations.problem_classes.AdvectionEquation_ND_FD import advectionNd
+    from pySDC.helpers.stats_helper import get_sorted
+
+    if problem_name == 'testequation0d':
+        problem_class, sweeper_class = testequation0d, generic_implicit
+        problem_params = {'lambdas': [[-1.0, -10.0 + 3j, -1e3]], 'u0': 1.0}
+    elif problem_name == 'heat':
+        problem_class, sweeper_class = heatNd_unforced, generic_implicit
+        problem_params = {'nvars': [64, 32][:num_levels], 'bc': 'periodic'}
+    elif problem_name == 'heat_forced':
+        problem_class, sweeper_class = heatNd_forced, imex_1st_order
+        problem_params = {'nvars': [64, 32][:num_levels], 'bc': 'periodic'}
+    elif problem_name == 'advection2D':
+        problem_class, sweeper_class = advectionNd, generic_implicit
+        problem_params = {'nvars': [(16, 16), (8, 8)][:num_levels], 'order': 4, 'bc': 'periodic'}
+    else:
+        raise NotImplementedError(f'No test setup for problem {problem_name}')
+
+    description = {
+        'problem_class': problem_class,
+        'problem_params': problem_params,
+        'sweeper_class': sweeper_class,
+        'sweeper_params': {
+            'num_nodes': [3, 2][:num_levels],
+            'quad_type': 'RADAU-RIGHT',
+            'QI': QI,
+            'matrix_sweep': matrix_sweep,
+        },
+        'level_params': {'dt': 1e-2, 'restol': 1e-10, 'stacked_nodes': stacked_nodes},
+        'step_params': {'maxiter': 20},
+        'space_transfer_class': mesh_to_mesh,
+    }
+
+    controller = controller_nonMPI(num_procs=num_procs, controller_params={'logger_level': 30}, description=description)
+    P = controller.MS[0].levels[0].prob
+    uend, stats = controller.run(u0=P.u_exact(0), t0=0, Tend=4e-2)
+    niter = [me[1] for me in get_sorted(stats, type='niter')]
+    sweepers = [L.sweep for S in controller.MS for L in S.levels]
+    return uend, niter, sweepers
+
+
+@pytest.mark.base
+@pytest.mark.parametrize('num_levels', [1, 2])
+@pytest.mark.parametrize('QI', ['LU', 'MIN-SR-S'])
+@pytest.mark.parametrize('problem_name', ['testequation0d', 'heat', 'heat_forced', 'advection2D'])
+def test_matrix_sweep(problem_name, QI, num_levels):
+    """
+    Test that the precomputed sweep for linear problems gives the same results as sweeping node by node and that the
+    solvers are computed only once
+    """
+    import numpy as np
+
+    if problem_name == 'testequation0d' and num_levels > 1:
+        pytest.skip('No spatial coarsening for the test equation')
+
+    uend, niter, _ = run_problem(problem_name, False, QI, num_levels)
+    uend_matrix, niter_matrix, sweepers = run_problem(problem_name, True, QI, num_levels)
+
+    assert np.allclose(uend, uend_matrix, rtol=1e-12, atol=1e-12), 'Precomputed sweep gives different solution!'
+    assert niter == niter_matrix, 'Precomputed sweep needs different number of iterations!'
+    for sweeper in sweepers:
+        assert sweeper.params.matrix_sweep, 'Precomputed sweep has been switched off!'
+        assert sweeper.sweep_solvers.misses.niter == 1, 'Expected exactly one precomputed solver per level!'
+        assert sweeper.sweep_solvers.hits.niter > 0, 'Precomputed solver has not been reused!'
+
+
+@pytest.mark.base
+def test_matrix_sweep_stacked():
+    """
+    Test that the precomputed sweep works with stacked storage of the values at the nodes and with multiple steps
+    """
+    import numpy as np
+
+    uend, niter, _ = run_problem('heat', False, 'LU', num_procs=2)
+    uend_matrix, niter_matrix, _ = run_problem('heat', True, 'LU', num_procs=2, stacked_nodes=True)
+
+    assert np.allclose(uend, uend_matrix, rtol=1e-12, atol=1e-12), 'Precomputed sweep gives different solution!'
+    assert niter == niter_matrix, 'Precomputed sweep needs different number of iterations!'
+
+
+@pytest.mark.base
+def test_matrix_sweep_fallback():
+    """
+    Test that we sweep node by node if the problem does not provide a linear operator
+    """
+    import numpy as np
+    from pySDC.core.Step import step
+    from pySDC.implementations.sweeper_classes.generic_implicit import generic_implicit
+    from pySDC.implementations.problem_classes.HeatEquation_ND_FD import heatNd_unforced
+
+    class heat_with_reaction(heatNd_unforced):
+        def eval_f(self, u, t):
+            f = super().eval_f(u, t)
+            f -= u**3
+            return f
+
+    S = step(
+        description={
+            'problem_class': heat_with_reaction,
+            'problem_params': {'nvars': 16},
+            'sweeper_class': generic_implicit,
+            'sweeper_params': {'num_nodes': 2, 'quad_type': 'RADAU-RIGHT', 'matrix_sweep': True},
+            'level_params': {'dt': 1e-2},
+        }
+    )
+    assert heat_with_reaction().get_linear_operator() is None, 'Got linear operator for nonlinear problem!'
+
+    L = S.levels[0]
+    L.u[0] = L.prob.u_exact(0)
+    L.status.time = 0.0
+    L.sweep.predict()
+    L.sweep.update_nodes()
+    assert not L.sweep.params.matrix_sweep, 'Did not switch off the precomputed sweep!'
+    assert len(L.sweep.sweep_solvers) == 0, 'Precomputed a sweep for a nonlinear problem!'
+    assert np.all(np.isfinite(L.u[-1])), 'Sweep failed!'
@@ -121,6 +121,39 @@ def test_PIC(node_type, quad_type, M):
     assert np.all(QDelta == 0), "not a null matrix"
 
 
+@pytest.mark.base
+@pytest.mark.parametrize("qd_type", ['MIN', 'MIN-SR-S', 'LU', 'IEpar'])
+def test_Qdelta_cache(qd_type, tmp_path):
+    from pySDC.helpers.qdelta_cache import Qdelta_cache, precompute
+
+    params = {'num_nodes': 3, 'quad_type': 'RADAU-RIGHT', 'node_type': 'LEGENDRE'}
+    reference = Sweeper(params)
+    QDelta_ref = reference.compute_Qdelta_implicit(reference.coll, qd_type)
+
+    cache_dir = Qdelta_cache.cache_dir
+    Qdelta_cache.cache_dir = str(tmp_path)
+    Qdelta_cache.clear()
+    try:
+        assert precompute([3], [qd_type], quad_types=['RADAU-RIGHT']) == 1
+
+        # the matrix is taken from memory, modifying it does not change the cache
+        sweeper = Sweeper(params)
+        QDelta = sweeper.get_Qdelta_implicit(sweeper.coll, qd_type)
+        assert np.allclose(QDelta, QDelta_ref)
+        assert sweeper.parallelizable == reference.parallelizable
+        QDelta[:] = 0
+        assert np.allclose(sweeper.get_Qdelta_implicit(sweeper.coll, qd_type), QDelta_ref)
+
+        # the matrices from optimization are taken from disk in new processes
+        Qdelta_cache.clear()
+        misses = Qdelta_cache.misses.niter
+        assert np.allclose(Sweeper(params).get_Qdelta_implicit(sweeper.coll, qd_type), QDelta_ref)
+        assert (Qdelta_cache.misses.niter == misses) == (qd_type in Qdelta_cache.persistent_types)
+    finally:
+        Qdelta_cache.cache_dir = cache_dir
+        Qdelta_cache.clear()
+
+
 if __name__ == '__main__':
     test_MIN_SR('LEGENDRE', 'RADAU-RIGHT', 4)
     test_MIN_SR('EQUID', 'LOBATTO', 5)
@@ -0,0 +1,141 @@
+import pytest
+
+
+def run_problem(problem_class, problem_params, stacked_nodes, QI='LU', num_procs=1, Tend=4e-2):
+    from pySDC.implementations.sweeper_classes.generic_implicit import generic_implicit
+    from pySDC.implementations.controller_classes.controller_nonMPI import controller_nonMPI
+    from pySDC.helpers.stats_helper import get_sorted
+
+    description = {
+        'problem_class': problem_class,
+        'problem_params': problem_params,
+        'sweeper_class': generic_implicit,
+        'sweeper_params': {'num_nodes': 3, 'quad_type': 'RADAU-RIGHT', 'QI': QI, 'do_coll_update': True},
+        'level_params': {'dt': 1e-2, 'restol': 1e-10, 'stacked_nodes': stacked_nodes},
+        'step_params': {'maxiter': 8},
+    }
+    controller = controller_nonMPI(num_procs=num_procs, controller_params={'logger_level': 30}, description=description)
+    P = controller.MS[0].levels[0].prob
+    uend, stats = controller.run(u0=P.u_exact(0), t0=0, Tend=Tend)
+    return uend, get_sorted(stats, type='niter'), controller
+
+
+@pytest.mark.base
+@pytest.mark.parametrize('QI', ['LU', 'TRAP', 'MIN-SR-FLEX'])
+@pytest.mark.parametrize('num_procs', [1, 2])
+def test_stacked_nodes_heat(QI, num_procs):
+    import numpy as np
+    from pySDC.core.Level import StackedNodes
+    from pySDC.implementations.problem_classes.HeatEquation_ND_FD import heatNd_unforced
+
+    problem_params = {'nvars': 64}
+    uend, niter, _ = run_problem(heatNd_unforced, problem_params, False, QI=QI, num_procs=num_procs)
+    uend_stacked, niter_stacked, controller = run_problem(
+        heatNd_unforced, problem_params, True, QI=QI, num_procs=num_procs
+    )
+
+    L = controller.MS[0].levels[0]
+    assert isinstance(L.u, StackedNodes) and L.u.stacked
+    assert L.u.data.shape == (4, 64)
+    assert np.shares_memory(L.u[1], L.u.data)
+
+    assert type(uend_stacked) == type(uend)
+    assert np.allclose(uend, uend_stacked, atol=1e-13), 'Stacked nodes give different solution!'
+    assert niter == niter_stacked, 'Stacked nodes need different number of iterations!'
+
+
+@pytest.mark.base
+def test_stacked_nodes_complex():
+    import numpy as np
+    from pySDC.implementations.problem_classes.TestEquation_0D import testequation0d
+
+    problem_params = {'lambdas': np.array([-1.0 + 1.0j, -2.0, -10.0j]), 'u0': 1.0}
+    uend, niter, _ = run_problem(testequation0d, problem_params, False)
+    uend_stacked, niter_stacked, _ = run_problem(testequation0d, problem_params, True)
+
+    assert np.allclose(uend, uend_stacked, atol=1e-14), 'Stacked nodes give different solution!'
+    assert niter == niter_stacked, 'Stacked nodes need different number of iterations!'
+
+
+@pytest.mark.base
+def test_stacked_nodes_semantics():
+    import numpy as np
+    from pySDC.core.Level import StackedNodes
+    from pySDC.implementations.datatype_classes.mesh import mesh
+
+    init = ((4,), None, np.dtype('float64'))
+    nodes = StackedNodes(3)
+    assert not nodes.stacked
+
+    nodes[0] = mesh(init, val=1.0)
+    assert nodes.stacked and nodes.data.shape == (3, 4)
+    assert type(nodes[0]) == mesh and nodes[1] is None
+
+    # slices are copies, which makes rebinding like `uold[:] = u[:]` keep old values
+    old = nodes[:]
+    nodes[0] = mesh(init, val=2.0)
+    assert np.allclose(old[0], 1.0) and np.allclose(nodes[0], 2.0)
+
+    nodes[1:] = [mesh(init, val=3.0), mesh(init, val=4.0)]
+    assert np.allclose(nodes.data[:, 0], [2.0, 3.0, 4.0])
+
+    # assigning complex values upcasts the storage
+    nodes[2] = mesh(((4,), None, np.dtype('complex128')), val=1j)
+    assert nodes.data.dtype == np.dtype('complex128')
+    assert np.allclose(nodes.data[:, 0], [2.0, 3.0, 1j])
+    assert np.shares_memory(nodes[0], nodes.data)
+
+    with pytest.raises(ValueError):
+        nodes[:] = [None]
+
+
+@pytest.mark.base
+@pytest.mark.parametrize('finter', [False, True])
+@pytest.mark.parametrize('ndim', [1, 2])
+def test_stacked_nodes_multilevel(finter, ndim):
+    import numpy as np
+    from pySDC.implementations.problem_classes.HeatEquation_ND_FD import heatNd_unforced
+    from pySDC.implementations.sweeper_classes.generic_implicit import generic_implicit
+    from pySDC.implementations.controller_classes.controller_nonMPI import controller_nonMPI
+    from pySDC.implementations.transfer_classes.TransferMesh import mesh_to_mesh
+    from pySDC.helpers.stats_helper import get_sorted
+
+    results = {}
+    for stacked_nodes in [False, True]:
+        description = {
+            'problem_class': heatNd_unforced,
+            'problem_params': {'nvars': [(31,) * ndim, (15,) * ndim], 'bc': 'dirichlet-zero'},
+            'sweeper_class': generic_implicit,
+            'sweeper_params': {'num_nodes': [4, 2], 'quad_type': 'RADAU-RIGHT', 'QI': 'LU'},
+            'level_params': {'dt': 5e-2, 'restol': 1e-10, 'stacked_nodes': stacked_nodes},
+            'step_params': {'maxiter': 20},
+            'space_transfer_class': mesh_to_mesh,
+            'base_transfer_params': {'finter': finter},
+        }
+        controller = controller_nonMPI(num_procs=2, controller_params={'logger_level': 30}, description=description)
+        P = controller.MS[0].levels[0].prob
+        uend, stats = controller.run(u0=P.u_exact(0), t0=0, Tend=2e-1)
+        results[stacked_nodes] = (uend, get_sorted(stats, type='niter'))
+
+    assert np.allclose(results[True][0], results[False][0], atol=1e-13), 'Stacked transfer gives different solution!'
+    assert results[True][1] == results[False][1], 'Stacked transfer needs different number of iterations!'
+
+
+@pytest.mark.base
+def test_stacked_space_transfer():
+    import numpy as np
+    from pySDC.core.SpaceTransfer import space_transfer
+    from pySDC.implementations.problem_classes.HeatEquation_ND_FD import heatNd_unforced
+    from pySDC.implementations.transfer_classes.TransferMesh import mesh_to_mesh
+
+    fine = heatNd_unforced(nvars=(15, 15), bc='dirichlet-zero')
+    coarse = heatNd_unforced(nvars=(7, 7), bc='dirichlet-zero')
+    transfer = mesh_to_mesh(fine_prob=fine, coarse_prob=coarse, params={})
+
+    rng = np.random.default_rng(seed=0)
+    F = rng.random((3, 15, 15)).view(type(fine.u_init))
+    G = rng.random((3, 7, 7)).view(type(coarse.u_init))
+
+    # compare the single sparse matrix product with the generic implementation transferring one node after the other
+    assert np.allclose(transfer.restrict_stacked(F), space_transfer.restrict_stacked(transfer, F))
+    assert np.allclose(transfer.prolong_stacked(G), space_transfer.prolong_stacked(transfer, G))
@@ -0,0 +1,72 @@
+import pytest
+
+
+def run_problem(sweeper_name, QI, num_threads, stacked_nodes=False):
+    from pySDC.implementations.controller_classes.controller_nonMPI import controller_nonMPI
+    from pySDC.implementations.sweeper_classes.generic_implicit import generic_implicit
+    from pySDC.implementations.sweeper_classes.imex_1st_order import imex_1st_order
+    from pySDC.implementations.problem_classes.HeatEquation_ND_FD import heatNd_unforced, heatNd_forced
+    from pySDC.implementations.hooks.log_work import LogWork
+    from pySDC.helpers.stats_helper import get_sorted
+
+    sweeper_params = {'num_nodes': 4, 'quad_type': 'RADAU-RIGHT', 'QI': QI, 'num_threads': num_threads}
+    if sweeper_name == 'generic_implicit':
+        sweeper_class, problem_class = generic_implicit, heatNd_unforced
+    else:
+        sweeper_class, problem_class = imex_1st_order, heatNd_forced
+        sweeper_params['QE'] = 'PIC'
+
+    description = {
+        'problem_class': problem_class,
+        'problem_params': {'nvars': 64, 'bc': 'periodic'},
+        'sweeper_class': sweeper_class,
+        'sweeper_params': sweeper_params,
+        'level_params': {'dt': 1e-2, 'restol': 1e-10, 'stacked_nodes': stacked_nodes},
+        'step_params': {'maxiter': 30},
+    }
+
+    controller = controller_nonMPI(
+        num_procs=1, controller_params={'logger_level': 30, 'hook_class': LogWork}, description=description
+    )
+    P = controller.MS[0].levels[0].prob
+    uend, stats = controller.run(u0=P.u_exact(0), t0=0, Tend=5e-2)
+    niter = [me[1] for me in get_sorted(stats, type='niter')]
+    work = sum(me[1] for me in get_sorted(stats, type='work_factorization_hits'))
+    return uend, niter, work
+
+
+@pytest.mark.base
+@pytest.mark.parametrize('stacked_nodes', [False, True])
+@pytest.mark.parametrize('QI', ['MIN-SR-S', 'IEpar', 'LU'])
+@pytest.mark.parametrize('sweeper_name', ['generic_implicit', 'imex_1st_order'])
+def test_threaded_nodes(sweeper_name, QI, stacked_nodes):
+    """
+    Test that solving at the nodes in threads gives the same results and counts the same work as solving in serial
+    """
+    import numpy as np
+
+    if stacked_nodes and sweeper_name != 'generic_implicit':
+        pytest.skip('Stacked nodes are only implemented for generic_implicit')
+
+    uend, niter, work = run_problem(sweeper_name, QI, 1, stacked_nodes)
+    uend_threads, niter_threads, work_threads = run_problem(sweeper_name, QI, 4, stacked_nodes)
+
+    assert np.allclose(uend, uend_threads, rtol=1e-14, atol=1e-14), 'Threads give different solution!'
+    assert niter == niter_threads, 'Threads need different number of iterations!'
+    assert work == work_threads, 'Threads counted different work!'
+
+
+@pytest.mark.base
+def test_thread_safe_work_counter():
+    from concurrent.futures import ThreadPoolExecutor
+    from pySDC.core.Problem import WorkCounter
+
+    counter = WorkCounter()
+
+    def count(n):
+        for _ in range(n):
+            counter()
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(count, [10000] * 8))
+    assert counter.niter == 80000, f'Lost increments of the work counter, got {counter.niter}'
@@ -104,6 +104,37 @@ def test_fft_to_fft(L, spectral, x0):
     single_test('fft_to_fft', -1, L, mpifft=True, spectral=spectral, x0=x0)
 
 
+@pytest.mark.mpi4py
+def test_fft_to_fft_spectral_without_transforms():
+    """
+    Test that transfer in spectral space on a single process is done by truncating and padding the Fourier
+    coefficients without any FFTs and agrees with transfer via real space.
+    """
+    import numpy as np
+
+    fine = get_problem(64, np, 1.0, mpifft=True, spectral=True)
+    coarse = get_problem(32, np, 1.0, mpifft=True, spectral=True)
+    transfer = get_transfer_class('fft_to_fft')(fine, coarse, {})
+    transfer_real_space = get_transfer_class('fft_to_fft')(fine, coarse, {})
+    transfer_real_space.transfer_in_spectral_space = False
+    assert transfer.transfer_in_spectral_space
+
+    for function_name in ['u_exact', 'eval_f']:
+        fine_exact = fine.__getattribute__(function_name)(t=0)
+        coarse_exact = coarse.__getattribute__(function_name)(t=0)
+        fine.work_counters['fft'].niter = 0
+        coarse.work_counters['fft'].niter = 0
+
+        restricted = transfer.restrict(fine_exact)
+        prolonged = transfer.prolong(coarse_exact)
+        assert fine.work_counters['fft'].niter == 0, 'FFTs on the fine level during transfer in spectral space!'
+        assert coarse.work_counters['fft'].niter == 0, 'FFTs on the coarse level during transfer in spectral space!'
+
+        assert np.allclose(restricted, transfer_real_space.restrict(fine_exact), atol=1e-14)
+        assert np.allclose(prolonged, transfer_real_space.prolong(coarse_exact), atol=1e-14)
+        assert fine.work_counters['fft'].niter > 0
+
+
 @pytest.mark.cupy
 @pytest.mark.parametrize('L', [1.0, 6.283185307179586])
 @pytest.mark.parametrize('spectral', [True, False])